@@ -4,12 +4,14 @@ import os
 from django.conf import settings as django_settings
 from django.db import connection
 from django.db.models import Count, Max
+from django.http import HttpResponse
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
+from . import metrics
 from .config import ES_HOST, es_client
 from .ingestion_manager import IngestionManager
 from .models import Law, LawVersion
@@ -25,6 +27,11 @@ from .schema import (
 from .tasks import PIPELINE_STATUS_FILE
 
 
+def prometheus_metrics(request):
+    """Pod metrics in the Prometheus text format, for the scraper."""
+    return HttpResponse(metrics.render(), content_type=metrics.CONTENT_TYPE)
+
+
 @extend_schema(
     tags=["Admin"],
     summary="Health check",
@@ -324,10 +331,9 @@ def pipeline_status(request):
 @api_view(["GET"])
 def coverage_summary(request):
     """DataOps coverage report across federal, state, and municipal tiers."""
-    from apps.scraper.dataops.coverage_dashboard import CoverageDashboard
+    from .snapshots import get_snapshot
 
-    dashboard = CoverageDashboard()
-    return Response(dashboard.full_report())
+    return Response(get_snapshot("coverage_report"))
 
 
 @api_view(["GET"])
@@ -351,10 +357,9 @@ def gap_records(request):
 @api_view(["GET"])
 def coverage_dashboard(request):
     """Consolidated coverage dashboard with tier progress, state coverage, gaps, and health."""
-    from apps.scraper.dataops.coverage_dashboard import CoverageDashboard
+    from .snapshots import get_snapshot
 
-    dashboard = CoverageDashboard()
-    return Response(dashboard.dashboard_report())
+    return Response(get_snapshot("coverage_dashboard"))
 
 
 @api_view(["GET"])
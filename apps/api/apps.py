@@ -4,3 +4,29 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.api"
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from django.db.models.signals import post_delete, post_save
+
+        from . import diffs
+        from .metrics import install_db_wrapper
+        from .models import Law, LawVersion, sync_version_stats
+        from .suggest_index import invalidate
+
+        connection_created.connect(
+            install_db_wrapper, dispatch_uid="metrics_db_wrapper"
+        )
+        post_save.connect(invalidate, sender=Law, dispatch_uid="suggest_index_save")
+        post_delete.connect(invalidate, sender=Law, dispatch_uid="suggest_index_delete")
+        post_save.connect(
+            sync_version_stats, sender=LawVersion, dispatch_uid="law_version_stats_save"
+        )
+        post_delete.connect(
+            sync_version_stats,
+            sender=LawVersion,
+            dispatch_uid="law_version_stats_delete",
+        )
+        post_save.connect(
+            diffs.invalidate, sender=LawVersion, dispatch_uid="law_version_diff_save"
+        )
@@ -0,0 +1,142 @@
+"""
+Batched article reads across laws.
+"""
+
+import logging
+
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from . import es_queries, fts_index
+from .article_packs import get_pack
+from .config import es_client
+from .es_circuit import SearchUnavailable, call_es
+from .law_views import _search_unavailable
+from .models import Law
+from .schema import ArticleBatchRequestSchema, ArticleBatchResponseSchema, ErrorSchema
+
+logger = logging.getLogger(__name__)
+
+# Most (law_id, article_id) pairs one article_batch request may ask for
+ARTICLE_BATCH_LIMIT = 100
+
+
+def _batch_refs(data):
+    """The request's (law_id, article_id) pairs, or None if malformed."""
+    refs = data.get("articles") if isinstance(data, dict) else None
+    if not isinstance(refs, list) or not 0 < len(refs) <= ARTICLE_BATCH_LIMIT:
+        return None
+    pairs = []
+    for ref in refs:
+        if not isinstance(ref, dict):
+            return None
+        law_id, article_id = ref.get("law_id"), ref.get("article_id")
+        if not isinstance(law_id, str) or not isinstance(article_id, str):
+            return None
+        pairs.append((law_id, article_id))
+    return pairs
+
+
+def _batch_texts(pairs):
+    """
+    {(law_id, article_id): text} for the pairs that exist. Laws with an
+    article pack are answered from it (it holds all of the law's articles);
+    the rest take one ES mget, or the SQLite index while ES is down.
+    """
+    texts = {}
+    remaining = []
+    packs = {}
+    for law_id, article_id in pairs:
+        if law_id not in packs:
+            packs[law_id] = get_pack(law_id)
+        pack = packs[law_id]
+        if pack is None:
+            remaining.append((law_id, article_id))
+            continue
+        position = pack.index_of(article_id)
+        if position is not None:
+            texts[(law_id, article_id)] = pack.text(position)
+
+    if not remaining:
+        return texts
+    if fts_index.preferred():
+        texts.update(fts_index.articles_by_id(remaining))
+        return texts
+    try:
+        res = call_es(es_client.mget, **es_queries.articles_mget(remaining))
+    except SearchUnavailable:
+        if not fts_index.available():
+            raise
+        texts.update(fts_index.articles_by_id(remaining))
+        return texts
+    for pair, doc in zip(remaining, res["docs"]):
+        if doc.get("found"):
+            texts[pair] = doc["_source"].get("text")
+    return texts
+
+
+@extend_schema(
+    tags=["Laws"],
+    summary="Get articles in batch",
+    description=(
+        f"Fetch up to {ARTICLE_BATCH_LIMIT} articles of any laws in one request, "
+        "e.g. for cross-reference popovers. Results follow the request order; "
+        "articles that do not exist are listed in `missing`."
+    ),
+    request=ArticleBatchRequestSchema,
+    responses={200: ArticleBatchResponseSchema, 400: ErrorSchema, 503: ErrorSchema},
+)
+@api_view(["POST"])
+def article_batch(request):
+    """
+    Resolve many (law_id, article_id) pairs in one round trip.
+
+    Article docs have deterministic ids ("{law_id}-{article_id}", see
+    index_laws), so articles missing from the packs are fetched with a
+    single mget instead of one search each.
+    """
+    pairs = _batch_refs(request.data)
+    if pairs is None:
+        return Response(
+            {
+                "error": "Body must be {'articles': [{'law_id', 'article_id'}, ...]} "
+                f"with 1 to {ARTICLE_BATCH_LIMIT} items."
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    unique = list(dict.fromkeys(pairs))
+    try:
+        texts = _batch_texts(unique)
+    except SearchUnavailable:
+        return _search_unavailable()
+    except Exception:
+        logger.exception("article_batch failed")
+        return Response(
+            {"error": "An internal error occurred while retrieving articles."},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    names = dict(
+        Law.objects.filter(
+            official_id__in={law_id for law_id, _ in unique}
+        ).values_list("official_id", "name")
+    )
+    results = []
+    missing = []
+    for law_id, article_id in pairs:
+        text = texts.get((law_id, article_id))
+        if text is None:
+            missing.append({"law_id": law_id, "article_id": article_id})
+        results.append(
+            {
+                "law_id": law_id,
+                "article_id": article_id,
+                "law_name": names.get(law_id),
+                "found": text is not None,
+                "text": text,
+            }
+        )
+    return Response({"results": results, "missing": missing})
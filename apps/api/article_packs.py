@@ -0,0 +1,247 @@
+"""
+Compact per-law article packs for reads that do not need Elasticsearch.
+
+Article text only changes when a law is re-indexed, so index_laws also
+writes one pack per law through the StorageBackend:
+
+    header   magic "AKPK", format, codec, article count, LawVersion pk,
+             length of the ids block (struct HEADER, 24 bytes)
+    ids      JSON list of article ids, padded to 8 bytes
+    offsets  count + 1 little-endian uint64 offsets into the bodies block
+    bodies   each article's text, compressed on its own
+
+Article i is bodies[offsets[i]:offsets[i + 1]], so serving a range only
+decompresses the articles in it. Local packs are memory-mapped and sliced
+through memoryviews without copying; remote (R2) packs are fetched once
+and cached in process.
+
+Bodies are zstd-compressed when the optional `zstandard` package is
+installed, zlib otherwise; the codec is recorded per pack.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from .metrics import record_cache
+from .storage import LocalStorageBackend, get_storage_backend
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"AKPK"
+FORMAT = 1
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+# magic, format, codec, reserved, count, version_id, ids_len
+HEADER = struct.Struct("<4sBBHIQI")
+
+PACK_PREFIX = "article_packs"
+CACHE_SIZE = 64
+# Remote packs are re-fetched after this long; local ones are re-opened as
+# soon as the file is replaced
+REMOTE_TTL_SECONDS = 600
+
+
+class InvalidPack(ValueError):
+    """The bytes are not an article pack this code can read."""
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def _compressor(codec):
+    if codec == CODEC_ZSTD:
+        return _zstd().ZstdCompressor(level=10).compress
+    return lambda data: zlib.compress(data, 9)
+
+
+def _decompressor(codec):
+    if codec == CODEC_ZSTD:
+        zstandard = _zstd()
+        if zstandard is None:
+            raise InvalidPack("Pack is zstd-compressed but zstandard is missing")
+        return zstandard.ZstdDecompressor().decompress
+    return zlib.decompress
+
+
+def pack_key(law_id):
+    return f"{PACK_PREFIX}/{law_id}.akp"
+
+
+def build_pack(articles, version_id=0, codec=None):
+    """
+    Serialize [{"article_id", "text"}, ...] in document order.
+
+    A repeated article_id keeps its first position and its last text, which
+    matches what the ES index (one doc per article_id) ends up holding.
+    """
+    if codec is None:
+        codec = CODEC_ZSTD if _zstd() is not None else CODEC_ZLIB
+    texts = {}
+    for article in articles:
+        texts[article["article_id"]] = article.get("text") or ""
+
+    compress = _compressor(codec)
+    bodies = [compress(text.encode("utf-8")) for text in texts.values()]
+
+    ids = json.dumps(list(texts), ensure_ascii=False).encode("utf-8")
+    ids += b" " * (-(HEADER.size + len(ids)) % 8)
+
+    offsets = [0]
+    for body in bodies:
+        offsets.append(offsets[-1] + len(body))
+
+    return b"".join(
+        [
+            HEADER.pack(MAGIC, FORMAT, codec, 0, len(bodies), version_id, len(ids)),
+            ids,
+            struct.pack(f"<{len(offsets)}Q", *offsets),
+            *bodies,
+        ]
+    )
+
+
+class ArticlePack:
+    """Read-only view over pack bytes (bytes, or an mmap of the file)."""
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        if len(view) < HEADER.size:
+            raise InvalidPack("Truncated article pack")
+        magic, fmt, codec, _, count, version_id, ids_len = HEADER.unpack_from(view)
+        if magic != MAGIC or fmt != FORMAT:
+            raise InvalidPack("Not an article pack (or unsupported format)")
+
+        self.version_id = version_id
+        self.codec = codec
+        self._decompress = _decompressor(codec)
+
+        ids_end = HEADER.size + ids_len
+        self.article_ids = json.loads(bytes(view[HEADER.size : ids_end]))
+        if len(self.article_ids) != count:
+            raise InvalidPack("Article id table does not match the header")
+        self._positions = {aid: i for i, aid in enumerate(self.article_ids)}
+
+        offsets_end = ids_end + 8 * (count + 1)
+        if sys.byteorder == "little":
+            self._offsets = view[ids_end:offsets_end].cast("Q")
+        else:
+            self._offsets = struct.unpack_from(f"<{count + 1}Q", view, ids_end)
+        self._bodies = view[offsets_end:]
+
+    def __len__(self):
+        return len(self.article_ids)
+
+    def index_of(self, article_id):
+        """Position of an article, or None if the pack does not have it."""
+        return self._positions.get(article_id)
+
+    def text(self, i):
+        body = self._bodies[self._offsets[i] : self._offsets[i + 1]]
+        return self._decompress(body).decode("utf-8")
+
+    def articles(self, start=0, stop=None):
+        """[{"article_id", "text"}] for positions start..stop, in order."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        return [
+            {"article_id": self.article_ids[i], "text": self.text(i)}
+            for i in range(max(start, 0), stop)
+        ]
+
+
+def write_pack(law_id, articles, version_id=0):
+    """Build a law's pack and store it. Returns the storage key."""
+    key = pack_key(law_id)
+    get_storage_backend().put(key, build_pack(articles, version_id))
+    return key
+
+
+# ---------------------------------------------------------------------------
+# Cached readers
+# ---------------------------------------------------------------------------
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _open_local(path):
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _load(storage, key):
+    """Return (pack, stamp) or (None, stamp); stamp tells when to reload."""
+    if isinstance(storage, LocalStorageBackend):
+        path = storage.url(key)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None, None
+        stamp = (st.st_ino, st.st_mtime_ns)
+        if not st.st_size:
+            return None, stamp
+        return ArticlePack(_open_local(path)), stamp
+
+    stamp = time.monotonic()
+    if not storage.exists(key):
+        return None, stamp
+    return ArticlePack(storage.get(key)), stamp
+
+
+def _is_fresh(storage, key, stamp):
+    if isinstance(storage, LocalStorageBackend):
+        try:
+            st = os.stat(storage.url(key))
+        except FileNotFoundError:
+            return stamp is None
+        return stamp == (st.st_ino, st.st_mtime_ns)
+    return time.monotonic() - stamp < REMOTE_TTL_SECONDS
+
+
+def get_pack(law_id):
+    """
+    The law's ArticlePack, or None when it has not been built (callers then
+    fall back to Elasticsearch). A corrupt pack is logged and treated as
+    missing.
+    """
+    storage = get_storage_backend()
+    key = pack_key(law_id)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and _is_fresh(storage, key, cached[1]):
+            _cache.move_to_end(key)
+            record_cache("article_pack", hit=True)
+            return cached[0]
+    record_cache("article_pack", hit=False)
+
+    try:
+        pack, stamp = _load(storage, key)
+    except (InvalidPack, OSError):
+        logger.warning("Unreadable article pack %s", key, exc_info=True)
+        pack, stamp = None, None
+
+    with _cache_lock:
+        _cache[key] = (pack, stamp)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return pack
+
+
+def clear_cache():
+    """Drop cached packs (tests, or after bulk re-indexing in-process)."""
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,377 @@
+"""
+Async search and law-read views, for ASGI deployments (apps.indigo.asgi).
+
+Search and law reads spend nearly all their time waiting on Elasticsearch.
+Under WSGI each waiting request holds a gunicorn thread; here it holds a
+coroutine, so one uvicorn worker keeps many requests in flight. With
+API_ASYNC_VIEWS on, apps.api.urls mounts these at the URLs and names of
+SearchView, law_search, law_articles, LawDetailView and RelatedLawsView.
+
+- Elasticsearch goes through AsyncElasticsearch (aes_client), behind the
+  same circuit breaker as the sync views
+- the ORM goes through its async API. Lookups that do not depend on each
+  other are gathered, so an ES request overlaps the DB queries (law_search
+  sends its search while the law row is fetched). The queries of one
+  request still run one after another on that request's DB thread.
+- the SQLite fallback and the other sync helpers run in threads
+
+Response bodies are built by the sync views' helpers, so the two variants
+cannot drift apart. DRF has no async views: async_api_view does what
+@api_view does for them (throttles, exception handling, JSON rendering).
+"""
+
+import asyncio
+import logging
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.db.models import Prefetch
+from django.http import Http404
+from django.shortcuts import aget_object_or_404
+from rest_framework import status
+from rest_framework.exceptions import APIException, MethodNotAllowed, Throttled
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from . import es_queries, fts_index
+from .article_packs import get_pack
+from .conditional import law_conditional
+from .config import aes_client
+from .cursors import InvalidCursor, decode_cursor, encode_cursor, offset_exceeds_window
+from .es_circuit import SearchUnavailable, call_es_async, ping_es_async
+from .law_views import (
+    _es_articles_response,
+    _es_law_search_response,
+    _fts_articles_response,
+    _fts_law_search_response,
+    _law_detail_response,
+    _pack_articles_response,
+    _related_fallback,
+    _related_response,
+    _search_unavailable,
+)
+from .models import Law, LawVersion
+from .related_laws import live_related_async, stored_related
+from .search_views import SearchView, _es_results, _page_response
+from .throttles import SearchRateThrottle
+
+logger = logging.getLogger(__name__)
+
+# get_pack may stat the pack in remote storage; it is thread-safe
+_get_pack = sync_to_async(get_pack, thread_sensitive=False)
+
+
+def _check_throttles(request, throttle_classes):
+    """APIView.check_throttles: raises Throttled with the longest wait."""
+    durations = []
+    for throttle_class in throttle_classes:
+        throttle = throttle_class()
+        if not throttle.allow_request(request, None):
+            durations.append(throttle.wait())
+    if durations:
+        waits = [d for d in durations if d is not None]
+        raise Throttled(max(waits, default=None))
+
+
+def _render(response):
+    if not isinstance(response, Response):
+        # e.g. 304 Not Modified from law_conditional
+        return response
+    response.accepted_renderer = JSONRenderer()
+    response.accepted_media_type = JSONRenderer.media_type
+    response.renderer_context = {}
+    return response.render()
+
+
+def async_api_view(throttle_classes=None):
+    """
+    @api_view(["GET"]) for an async view: the view gets a DRF Request and
+    returns a DRF Response, throttled and rendered as JSON.
+    """
+    if throttle_classes is None:
+        throttle_classes = api_settings.DEFAULT_THROTTLE_CLASSES
+
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            request = Request(request)
+            try:
+                if request.method not in ("GET", "HEAD"):
+                    raise MethodNotAllowed(request.method)
+                # Throttle counters live in the cache, which is sync
+                await sync_to_async(_check_throttles)(request, throttle_classes)
+                response = await view(request, *args, **kwargs)
+            except (Http404, APIException) as exc:
+                response = api_settings.EXCEPTION_HANDLER(exc, {"request": request})
+            return _render(response)
+
+        return wrapper
+
+    return decorator
+
+
+@async_api_view(throttle_classes=[SearchRateThrottle])
+async def search(request):
+    """SearchView.get on AsyncElasticsearch."""
+    fts_search = sync_to_async(SearchView()._fts_search)
+    query = request.query_params.get("q", "")
+    if not query:
+        return Response({"results": [], "total": 0})
+
+    try:
+        sort_by = request.query_params.get("sort", "relevance")
+        page = max(1, int(request.query_params.get("page", 1)))
+        page_size = min(max(1, int(request.query_params.get("page_size", 10))), 100)
+
+        cursor = request.query_params.get("cursor")
+        cursor_mode = cursor is not None
+        search_after, pit_id = decode_cursor(cursor) if cursor else (None, None)
+        fts_args = (
+            request,
+            query,
+            sort_by,
+            page,
+            page_size,
+            cursor_mode,
+            search_after,
+            pit_id,
+        )
+
+        if fts_index.preferred():
+            return await fts_search(*fts_args)
+
+        es = aes_client
+        if not await ping_es_async(es):
+            raise SearchUnavailable("Elasticsearch ping failed")
+
+        if search_after is not None and not pit_id:
+            if not fts_index.available():
+                raise InvalidCursor("Cursor was not issued by Elasticsearch")
+            return await fts_search(*fts_args)
+
+        if cursor_mode:
+            if not pit_id:
+                pit_id = (
+                    await call_es_async(
+                        es.open_point_in_time, **es_queries.point_in_time()
+                    )
+                )["id"]
+            offset = 0
+        else:
+            offset = (page - 1) * page_size
+            if offset_exceeds_window(offset, page_size):
+                return Response(
+                    {
+                        "error": "Page too deep for offset pagination. "
+                        "Use the 'cursor' parameter to walk large result sets."
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        res = await call_es_async(
+            es.search,
+            **es_queries.search(
+                query,
+                request.query_params,
+                sort_by,
+                page_size,
+                offset,
+                search_after,
+                pit_id,
+            ),
+        )
+        hits = res["hits"]["hits"]
+        results, facets = _es_results(res)
+
+        next_cursor = None
+        if cursor_mode:
+            pit_id = res.get("pit_id", pit_id)
+            if len(hits) == page_size:
+                next_cursor = encode_cursor(hits[-1]["sort"], pit_id)
+            else:
+                await _close_point_in_time(es, pit_id)
+
+        return _page_response(
+            results,
+            res["hits"]["total"]["value"],
+            facets,
+            page,
+            page_size,
+            cursor_mode,
+            next_cursor,
+        )
+
+    except SearchUnavailable:
+        if fts_index.available() and not pit_id:
+            response = await fts_search(*fts_args)
+            response["Cache-Control"] = "no-store"
+            return response
+        return Response(
+            {"results": [], "warning": "Search Engine offline"},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+    except ValueError:
+        return Response(
+            {
+                "error": "Invalid parameter value. Check page, page_size and cursor are valid."
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    except Exception:
+        logger.exception("Async search failed")
+        return Response(
+            {"error": "An internal error occurred while searching."},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+async def _close_point_in_time(es, pit_id):
+    try:
+        await es.close_point_in_time(**es_queries.close_point_in_time(pit_id))
+    except Exception:
+        logger.debug("Could not close PIT", exc_info=True)
+
+
+@async_api_view()
+async def law_search(request, law_id):
+    """law_search on AsyncElasticsearch."""
+    q = request.query_params.get("q", "").strip()
+    if not q:
+        return Response(
+            {"error": "Query parameter 'q' is required"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    if fts_index.preferred():
+        law = await aget_object_or_404(Law, official_id=law_id)
+        return await sync_to_async(_fts_law_search_response)(law, q)
+
+    # The search needs only the law_id from the URL: send it while the law
+    # row is fetched
+    law, res = await asyncio.gather(
+        aget_object_or_404(Law, official_id=law_id),
+        call_es_async(aes_client.search, **es_queries.law_text_search(law_id, q)),
+        return_exceptions=True,
+    )
+    if isinstance(law, BaseException):
+        raise law
+    if isinstance(res, SearchUnavailable):
+        if fts_index.available():
+            return await sync_to_async(_fts_law_search_response)(law, q)
+        return _search_unavailable()
+    if isinstance(res, BaseException):
+        logger.error("law_search failed for %s", law_id, exc_info=res)
+        return Response(
+            {"error": "An internal error occurred while searching."},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+    return _es_law_search_response(law_id, q, res)
+
+
+@async_api_view()
+@law_conditional("articles")
+async def law_articles(request, law_id):
+    """law_articles on AsyncElasticsearch; packs and FTS read in threads."""
+    try:
+        page = max(1, int(request.query_params.get("page", 1)))
+        page_size = min(max(1, int(request.query_params.get("page_size", 500))), 1000)
+        offset = (page - 1) * page_size
+        cursor = request.query_params.get("cursor")
+        cursor_mode = cursor is not None
+
+        law, pack = await asyncio.gather(
+            aget_object_or_404(
+                Law.objects.only("official_id", "name"), official_id=law_id
+            ),
+            _get_pack(law_id),
+        )
+        if pack is not None:
+            return _pack_articles_response(
+                law, pack, page_size, offset, cursor_mode, cursor
+            )
+        if fts_index.preferred():
+            return await sync_to_async(_fts_articles_response)(
+                law, page_size, offset, cursor_mode, cursor
+            )
+
+        search_after = None
+        if cursor_mode:
+            if cursor:
+                search_after, _ = decode_cursor(cursor)
+        elif offset_exceeds_window(offset, page_size):
+            return Response(
+                {
+                    "error": "Page too deep for offset pagination. "
+                    "Use the 'cursor' parameter instead."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        res = await call_es_async(
+            aes_client.search,
+            **es_queries.law_articles(
+                law.official_id,
+                page_size,
+                offset=None if cursor_mode else offset,
+                search_after=search_after,
+            ),
+        )
+        return _es_articles_response(law, res, page_size, cursor_mode)
+
+    except Http404:
+        raise
+    except InvalidCursor:
+        return Response(
+            {"error": "Invalid cursor."}, status=status.HTTP_400_BAD_REQUEST
+        )
+    except SearchUnavailable:
+        if fts_index.available():
+            return await sync_to_async(_fts_articles_response)(
+                law, page_size, offset, cursor_mode, cursor
+            )
+        return _search_unavailable()
+    except Exception:
+        logger.exception("law_articles failed for %s", law_id)
+        return Response(
+            {"error": "An internal error occurred while retrieving articles."},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+@async_api_view()
+@law_conditional("detail")
+async def law_detail(request, law_id):
+    """LawDetailView.get with the async ORM."""
+    # One trip to the DB thread for the law and its versions
+    law = await aget_object_or_404(
+        Law.objects.prefetch_related(
+            Prefetch(
+                "versions", queryset=LawVersion.objects.order_by("-publication_date")
+            )
+        ),
+        official_id=law_id,
+    )
+    return _law_detail_response(law, law.versions.all())
+
+
+@async_api_view()
+async def related_laws(request, law_id):
+    """RelatedLawsView.get on AsyncElasticsearch."""
+    law, related = await asyncio.gather(
+        aget_object_or_404(Law, official_id=law_id),
+        sync_to_async(stored_related)(law_id),
+    )
+    if related is None:
+        related = []
+        try:
+            es = aes_client
+            if await es.ping():
+                related = await live_related_async(es, law)
+        except Exception:
+            logger.warning("ES unavailable for related laws %s", law_id, exc_info=True)
+
+    if not related:
+        related = await sync_to_async(_related_fallback)(law)
+    return _related_response(law_id, related)
@@ -0,0 +1,240 @@
+"""
+Precomputed citation graph over CrossReference rows.
+
+A rebuild loads every resolved reference once, builds two weighted graphs
+in compressed sparse row form (laws, and articles), and computes in/out
+degree and a PageRank authority score for every node:
+
+- laws:     Law.citations_in / citations_out / authority_score, and the
+            ten laws each one cites and is cited by most
+- articles: ArticleAuthority rows
+
+Scores are normalized so the mean over nodes that appear in the graph is
+1.0; laws with no citation data keep 0. Views and the search index read
+these columns instead of aggregating CrossReference per request.
+
+Only NumPy is needed: the CSR arrays are built with argsort/bincount and
+each PageRank iteration is a single weighted bincount over the edges.
+"""
+
+import logging
+import time
+
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+
+from .models import ArticleAuthority, CrossReference, Law
+
+logger = logging.getLogger(__name__)
+
+DAMPING = 0.85
+TOLERANCE = 1e-10
+MAX_ITERATIONS = 100
+TOP_LAWS = 10
+
+
+class CSRGraph:
+    """Directed weighted graph; parallel edges are merged by summing weights."""
+
+    def __init__(self, src, dst, n, weights=None):
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        if weights is None:
+            weights = np.ones(len(src), dtype=np.float64)
+
+        # Sort by (src, dst) as one int64 key and merge duplicates
+        key = src * max(n, 1) + dst
+        order = np.argsort(key)
+        key, weights = key[order], np.asarray(weights, dtype=np.float64)[order]
+        if len(key):
+            starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+            weights = np.add.reduceat(weights, starts)
+            key = key[starts]
+        src, dst = np.divmod(key, max(n, 1))
+
+        self.n = n
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=self.indptr[1:])
+        self.indices = dst
+        self.data = weights.astype(np.float64)
+
+    @property
+    def rows(self):
+        """Source node of each stored edge."""
+        return np.repeat(np.arange(self.n), np.diff(self.indptr))
+
+    def out_weight(self):
+        return np.bincount(self.rows, weights=self.data, minlength=self.n)
+
+
+def pagerank(graph, damping=DAMPING, tol=TOLERANCE, max_iter=MAX_ITERATIONS):
+    """
+    Weighted PageRank by power iteration. Returns scores summing to 1.
+
+    Mass from dangling nodes (no outgoing edges) is spread uniformly.
+    """
+    n = graph.n
+    if n == 0:
+        return np.zeros(0)
+
+    rows = graph.rows
+    out = graph.out_weight()
+    dangling = out == 0
+    # Per-edge transition probability, fixed across iterations
+    edge_p = graph.data / np.where(dangling, 1.0, out)[rows]
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        flow = np.bincount(graph.indices, weights=rank[rows] * edge_p, minlength=n)
+        new = (1.0 - damping) / n + damping * (flow + rank[dangling].sum() / n)
+        delta = np.abs(new - rank).sum()
+        rank = new
+        if delta < tol:
+            break
+    return rank / rank.sum()
+
+
+def _node_index(index, key):
+    i = index.get(key)
+    if i is None:
+        i = index[key] = len(index)
+    return i
+
+
+def load_edges():
+    """
+    Read resolved references as integer edge lists.
+
+    Returns (law_keys, law_src, law_dst, article_keys, art_src, art_dst);
+    article edges only exist where the target article is known.
+    """
+    laws, articles = {}, {}
+    law_src, law_dst, art_src, art_dst = [], [], [], []
+
+    rows = (
+        CrossReference.objects.filter(target_law_slug__isnull=False)
+        .values_list(
+            "source_law_slug",
+            "source_article_id",
+            "target_law_slug",
+            "target_article_num",
+        )
+        .iterator(chunk_size=10_000)
+    )
+    for src_law, src_art, dst_law, dst_art in rows:
+        law_src.append(_node_index(laws, src_law))
+        law_dst.append(_node_index(laws, dst_law))
+        if dst_art:
+            art_src.append(_node_index(articles, (src_law, src_art)))
+            art_dst.append(_node_index(articles, (dst_law, dst_art)))
+
+    return list(laws), law_src, law_dst, list(articles), art_src, art_dst
+
+
+def score_graph(keys, src, dst):
+    """Return (in_degree, out_degree, normalized_score) arrays for a graph."""
+    n = len(keys)
+    src, dst = np.asarray(src, dtype=np.int64), np.asarray(dst, dtype=np.int64)
+    in_degree = np.bincount(dst, minlength=n)
+    out_degree = np.bincount(src, minlength=n)
+
+    # Self-citations ("el artículo anterior", "esta Ley") carry no authority
+    external = src != dst
+    scores = pagerank(CSRGraph(src[external], dst[external], n)) * n
+    return in_degree, out_degree, scores
+
+
+def top_neighbours(keys, src, dst, limit=TOP_LAWS):
+    """
+    For each node, the `limit` nodes it has most edges to, as
+    [{"slug", "count"}] (ties by slug). Swap src/dst for the sources.
+    """
+    graph = CSRGraph(src, dst, len(keys))
+    top = []
+    for i in range(graph.n):
+        lo, hi = graph.indptr[i], graph.indptr[i + 1]
+        pairs = sorted(zip(-graph.data[lo:hi], (keys[j] for j in graph.indices[lo:hi])))
+        top.append([{"slug": slug, "count": int(-w)} for w, slug in pairs[:limit]])
+    return top
+
+
+@transaction.atomic
+def _store(law_keys, law_scores, article_keys, article_scores):
+    Law.objects.update(
+        citations_in=0,
+        citations_out=0,
+        authority_score=0.0,
+        most_referenced_laws=[],
+        most_citing_laws=[],
+        citations_computed_at=timezone.now(),
+    )
+    by_slug = dict(zip(law_keys, zip(*law_scores)))
+    laws = [
+        law
+        for law in Law.objects.only("id", "official_id")
+        if law.official_id in by_slug
+    ]
+    for law in laws:
+        in_degree, out_degree, score, cited, citing = by_slug[law.official_id]
+        law.citations_in = int(in_degree)
+        law.citations_out = int(out_degree)
+        law.authority_score = float(score)
+        law.most_referenced_laws = cited
+        law.most_citing_laws = citing
+    Law.objects.bulk_update(
+        laws,
+        [
+            "citations_in",
+            "citations_out",
+            "authority_score",
+            "most_referenced_laws",
+            "most_citing_laws",
+        ],
+        batch_size=1000,
+    )
+
+    ArticleAuthority.objects.all().delete()
+    ArticleAuthority.objects.bulk_create(
+        (
+            ArticleAuthority(
+                law_slug=law_slug,
+                article_id=article_id,
+                citations_in=int(in_degree),
+                citations_out=int(out_degree),
+                score=float(score),
+            )
+            for (law_slug, article_id), in_degree, out_degree, score in zip(
+                article_keys, *article_scores
+            )
+        ),
+        batch_size=5000,
+    )
+
+
+def rebuild_citation_graph():
+    """Recompute and store every law and article score. Returns stats."""
+    start = time.perf_counter()
+    law_keys, law_src, law_dst, article_keys, art_src, art_dst = load_edges()
+    loaded = time.perf_counter()
+
+    law_scores = (
+        *score_graph(law_keys, law_src, law_dst),
+        top_neighbours(law_keys, law_src, law_dst),
+        top_neighbours(law_keys, law_dst, law_src),
+    )
+    article_scores = score_graph(article_keys, art_src, art_dst)
+    scored = time.perf_counter()
+
+    _store(law_keys, law_scores, article_keys, article_scores)
+
+    stats = {
+        "edges": len(law_src),
+        "laws": len(law_keys),
+        "articles": len(article_keys),
+        "load_seconds": round(loaded - start, 3),
+        "score_seconds": round(scored - loaded, 3),
+        "total_seconds": round(time.perf_counter() - start, 3),
+    }
+    logger.info("Citation graph rebuilt: %s", stats)
+    return stats
@@ -0,0 +1,176 @@
+"""
+Conditional GET (ETag / Last-Modified) for law endpoints.
+
+A law's detail, articles, structure, cross-references and exports only
+change when:
+- a LawVersion is added or removed (ingestion)
+- index_laws re-indexes the law (index_generation, indexed_at)
+- the Law row itself is edited (updated_at)
+- the nightly citation graph rebuild runs (citations_computed_at)
+
+law_validators() reads all of that in one query, without building the
+body or touching Elasticsearch. law_conditional() answers a matching
+If-None-Match / If-Modified-Since with 304 before the view runs, and adds
+a strong ETag and Last-Modified to the view's 200 responses.
+
+Usage:
+    @api_view(["GET"])
+    @law_conditional("articles")
+    def law_articles(request, law_id): ...
+
+Views that authorize the caller (exports) must not answer 304 before the
+check, so they call law_validators(), not_modified() and add_validators()
+themselves after it.
+"""
+
+import hashlib
+from datetime import date, datetime, time, timezone
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.db.models import Count, Max, Q
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from .models import CrossReference, Law
+
+# Bump when a law endpoint's body changes shape, so ETags issued by the
+# previous release stop matching
+FORMAT_VERSION = 1
+
+
+def cross_reference_state(law_id):
+    """
+    The law's references, incoming ones changing when other laws are
+    ingested. Ingestion replaces references by delete + insert: inserts
+    move the highest id, deletes the count.
+    """
+    refs = CrossReference.objects.filter(
+        Q(source_law_slug=law_id) | Q(target_law_slug=law_id)
+    ).aggregate(count=Count("id"), latest=Max("id"))
+    return refs["count"], refs["latest"]
+
+
+def citation_graph_state(law_id):
+    """
+    Reference statistics come from the nightly rebuild, which writes them
+    with bulk updates that leave updated_at alone.
+    """
+    return (
+        Law.objects.filter(official_id=law_id)
+        .values_list("citations_computed_at", flat=True)
+        .first()
+    )
+
+
+def export_state(law_id):
+    """Exports print the day they were generated."""
+    return date.today()
+
+
+def law_validators(law_id, scope, extra=None):
+    """
+    (etag, last_modified timestamp) for `scope`'s view of a law, or None
+    when there is no such law. `extra(law_id)` adds state the Law row
+    does not cover.
+    """
+    state = (
+        Law.objects.filter(official_id=law_id)
+        .annotate(
+            latest_version=Max("versions__id"),
+            version_added=Max("versions__created_at"),
+        )
+        .values_list(
+            "pk",
+            "updated_at",
+            "indexed_at",
+            "index_generation",
+            "version_count",
+            "latest_version",
+            "version_added",
+        )
+        .first()
+    )
+    if state is None:
+        return None
+
+    parts = [FORMAT_VERSION, scope, *state]
+    modified = [dt for dt in (state[1], state[2], state[6]) if dt is not None]
+    if extra is not None:
+        value = extra(law_id)
+        parts.append(value)
+        if isinstance(value, datetime):
+            modified.append(value)
+        elif isinstance(value, date):
+            # Content generated today is no older than midnight
+            modified.append(datetime.combine(value, time.min, tzinfo=timezone.utc))
+
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode(), digest_size=12
+    ).hexdigest()
+    last_modified = int(max(modified).timestamp()) if modified else None
+    return f'"{digest}"', last_modified
+
+
+def not_modified(request, validators):
+    """304 response when the request's validators match, else None."""
+    if validators is None:
+        return None
+    etag, last_modified = validators
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        response["ETag"] = etag
+    return response
+
+
+def add_validators(response, validators):
+    """ETag and Last-Modified on full 200 responses that may be cached."""
+    if (
+        validators is None
+        or response.status_code != 200
+        or "no-store" in response.get("Cache-Control", "")
+    ):
+        return response
+    etag, last_modified = validators
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+def law_conditional(scope, extra=None):
+    """
+    Conditional GET for a view taking a `law_id` URL kwarg (sync or async).
+
+    Args:
+        scope: Endpoint name, so each endpoint's ETags differ
+        extra: Optional callable(law_id) of state beyond the Law row
+    """
+
+    def decorator(view):
+        if iscoroutinefunction(view):
+
+            @wraps(view)
+            async def async_inner(request, *args, **kwargs):
+                validators = await sync_to_async(law_validators)(
+                    kwargs["law_id"], scope, extra
+                )
+                response = not_modified(request, validators)
+                if response is not None:
+                    return response
+                response = await view(request, *args, **kwargs)
+                return add_validators(response, validators)
+
+            return async_inner
+
+        @wraps(view)
+        def inner(request, *args, **kwargs):
+            validators = law_validators(kwargs["law_id"], scope, extra)
+            response = not_modified(request, validators)
+            if response is not None:
+                return response
+            return add_validators(view(request, *args, **kwargs), validators)
+
+        return inner
+
+    return decorator
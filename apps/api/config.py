@@ -1,26 +1,112 @@
 """Centralized configuration for the API app."""
 
 import logging
+import math
 import os
+from pathlib import Path
 
-from elasticsearch import Elasticsearch
+from django.utils.functional import SimpleLazyObject
 
 logger = logging.getLogger(__name__)
 
 ES_HOST = os.getenv("ES_HOST", "http://elasticsearch:9200")
 INDEX_NAME = "articles"
 
+# Engine for search and article reads: "elasticsearch" (the SQLite FTS5
+# index in apps.api.fts_index takes over while the ES circuit is open) or
+# "sqlite" (single-node mode, Elasticsearch is never contacted)
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "elasticsearch").lower()
+FTS_INDEX_PATH = Path(
+    os.getenv(
+        "FTS_INDEX_PATH",
+        Path(__file__).resolve().parent.parent.parent
+        / "data"
+        / "search"
+        / "articles.db",
+    )
+)
+
+# Relevance boost from citation-graph authority (apps.api.citation_graph):
+# score * ln(2 + authority); articles without graph data count as 0
+AUTHORITY_BOOST = {"field": "authority", "modifier": "ln2p", "missing": 0}
+
+
+def authority_boost(score):
+    """DB-side equivalent of AUTHORITY_BOOST for ranking law lists."""
+    return math.log(2.0 + (score or 0.0))
+
+
 # ES client configuration for production resilience
 ES_TIMEOUT = int(os.getenv("ES_TIMEOUT", "30"))
 ES_MAX_RETRIES = int(os.getenv("ES_MAX_RETRIES", "3"))
 ES_RETRY_ON_TIMEOUT = os.getenv("ES_RETRY_ON_TIMEOUT", "true").lower() == "true"
 
-# Singleton ES client with retry, timeout, and connection pooling
-es_client = Elasticsearch(
-    [ES_HOST],
-    request_timeout=ES_TIMEOUT,
-    max_retries=ES_MAX_RETRIES,
-    retry_on_timeout=ES_RETRY_ON_TIMEOUT,
-    connections_per_node=10,
-    sniff_on_start=False,
-)
+# Circuit breaker (apps.api.es_circuit): open after this many consecutive
+# connection failures, probe again after the cool-down
+ES_CIRCUIT_FAILURES = int(os.getenv("ES_CIRCUIT_FAILURES", "3"))
+ES_CIRCUIT_RESET_SECONDS = float(os.getenv("ES_CIRCUIT_RESET_SECONDS", "30"))
+
+# Article docs are routed by law_id (index_laws), so single-law reads pass
+# routing and search one shard. Turn off while an index built before routing
+# is still live: run `manage.py reindex_articles` first.
+ES_ROUTE_BY_LAW = os.getenv("ES_ROUTE_BY_LAW", "true").lower() == "true"
+
+# Primary shards of a new articles index (index_laws --create-indices,
+# reindex_articles). Routing only narrows a single-law read when there is
+# more than one shard; the production cluster is one node holding a few GB
+# of articles, where one shard is the right size. Raise it with the node
+# count, then run reindex_articles.
+ES_ARTICLE_SHARDS = int(os.getenv("ES_ARTICLE_SHARDS", "1"))
+
+
+def _build_es_client():
+    # elasticsearch takes ~100 ms to import; only pay for it on first use
+    from elasticsearch import Elasticsearch
+
+    from .metrics import instrumented_transport
+
+    return Elasticsearch(
+        [ES_HOST],
+        transport_class=instrumented_transport(),
+        request_timeout=ES_TIMEOUT,
+        max_retries=ES_MAX_RETRIES,
+        retry_on_timeout=ES_RETRY_ON_TIMEOUT,
+        connections_per_node=10,
+        sniff_on_start=False,
+    )
+
+
+# Singleton ES client with retry, timeout, and connection pooling, created
+# on first attribute access. Every request it sends is recorded in
+# apps.api.metrics.
+es_client = SimpleLazyObject(_build_es_client)
+
+# Serve search and law reads from the async views (apps.api.async_views).
+# Only for ASGI servers (apps.indigo.asgi): under WSGI each async view would
+# run in an event loop of its own and be slower than its sync counterpart.
+API_ASYNC_VIEWS = os.getenv("API_ASYNC_VIEWS", "false").lower() == "true"
+
+# Connection pool of the async client. One worker has many ES requests in
+# flight at once, so it needs more than the sync client's per-thread pool.
+ES_ASYNC_CONNECTIONS = int(os.getenv("ES_ASYNC_CONNECTIONS", "50"))
+
+
+def _build_async_es_client():
+    # AsyncElasticsearch needs aiohttp (the `asgi` extra)
+    from elasticsearch import AsyncElasticsearch
+
+    from .metrics import instrumented_async_transport
+
+    return AsyncElasticsearch(
+        [ES_HOST],
+        transport_class=instrumented_async_transport(),
+        request_timeout=ES_TIMEOUT,
+        max_retries=ES_MAX_RETRIES,
+        retry_on_timeout=ES_RETRY_ON_TIMEOUT,
+        maxsize=ES_ASYNC_CONNECTIONS,
+    )
+
+
+# AsyncElasticsearch for the async views. Its aiohttp session binds to the
+# event loop of its first request: the ASGI server's loop for the worker.
+aes_client = SimpleLazyObject(_build_async_es_client)
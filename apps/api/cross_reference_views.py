@@ -2,12 +2,18 @@
 API views for cross-references.
 """
 
+from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
-from apps.api.models import CrossReference
+from apps.api.conditional import (
+    citation_graph_state,
+    cross_reference_state,
+    law_conditional,
+)
+from apps.api.models import CrossReference, Law
 from apps.api.schema import ArticleCrossRefsSchema, LawCrossRefsSchema
 
 
@@ -18,6 +24,7 @@ from apps.api.schema import ArticleCrossRefsSchema, LawCrossRefsSchema
     responses={200: ArticleCrossRefsSchema},
 )
 @api_view(["GET"])
+@law_conditional("article-references", extra=cross_reference_state)
 def article_cross_references(request, law_id, article_id):
     """
     Get cross-references for a specific article.
@@ -82,54 +89,35 @@ def article_cross_references(request, law_id, article_id):
     responses={200: LawCrossRefsSchema},
 )
 @api_view(["GET"])
+@law_conditional("references", extra=citation_graph_state)
 def law_cross_references(request, law_id):
     """
     Get all cross-references for a law.
 
-    Returns statistics and top references.
+    Returns statistics and top references, precomputed nightly by
+    apps.api.citation_graph.
 
     Example: GET /api/v1/laws/amparo/references/
     """
-    # Get all outgoing references for this law
-    outgoing = CrossReference.objects.filter(source_law_slug=law_id)
-
-    # Get all incoming references to this law
-    incoming = CrossReference.objects.filter(target_law_slug=law_id)
-
-    # Calculate statistics
-    total_outgoing = outgoing.count()
-    total_incoming = incoming.count()
-
-    # Get top referenced laws (outgoing)
-    from django.db.models import Count
-
-    top_targets = (
-        outgoing.values("target_law_slug")
-        .annotate(count=Count("id"))
-        .order_by("-count")[:10]
-    )
-
-    # Get top citing laws (incoming)
-    top_sources = (
-        incoming.values("source_law_slug")
-        .annotate(count=Count("id"))
-        .order_by("-count")[:10]
+    law = get_object_or_404(
+        Law.objects.only(
+            "citations_in",
+            "citations_out",
+            "authority_score",
+            "most_referenced_laws",
+            "most_citing_laws",
+        ),
+        official_id=law_id,
     )
 
     return Response(
         {
             "statistics": {
-                "total_outgoing": total_outgoing,
-                "total_incoming": total_incoming,
-                "most_referenced_laws": [
-                    {"slug": item["target_law_slug"], "count": item["count"]}
-                    for item in top_targets
-                    if item["target_law_slug"]
-                ],
-                "most_citing_laws": [
-                    {"slug": item["source_law_slug"], "count": item["count"]}
-                    for item in top_sources
-                ],
+                "total_outgoing": law.citations_out,
+                "total_incoming": law.citations_in,
+                "most_referenced_laws": law.most_referenced_laws,
+                "most_citing_laws": law.most_citing_laws,
+                "authority_score": law.authority_score,
             }
         }
     )
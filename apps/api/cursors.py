@@ -0,0 +1,56 @@
+"""
+Opaque cursors for deep pagination over Elasticsearch.
+
+Offset pagination (``from``/``size``) makes every shard collect and sort
+``from + size`` hits and fails past ``index.max_result_window`` (10k).
+Cursor mode uses ``search_after`` with the sort values of the last hit of
+the previous page, optionally pinned to a point-in-time (PIT) so that a
+client walking all results sees a consistent snapshot.
+
+Cursors are URL-safe base64 JSON so clients treat them as opaque strings.
+"""
+
+import base64
+import binascii
+import json
+
+# ES default index.max_result_window — offset pages beyond this fail.
+MAX_RESULT_WINDOW = 10000
+
+# How long ES keeps a point-in-time alive between two page requests.
+PIT_KEEP_ALIVE = "2m"
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor cannot be decoded."""
+
+
+def encode_cursor(search_after: list, pit_id: str | None = None) -> str:
+    """Encode the last hit's sort values (and PIT id) as an opaque cursor."""
+    payload = {"sa": search_after}
+    if pit_id:
+        payload["pit"] = pit_id
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[list, str | None]:
+    """
+    Decode a cursor into ``(search_after, pit_id)``.
+
+    Raises InvalidCursor for anything that was not produced by encode_cursor.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise InvalidCursor("Malformed cursor") from e
+
+    if not isinstance(payload, dict) or not isinstance(payload.get("sa"), list):
+        raise InvalidCursor("Malformed cursor")
+    return payload["sa"], payload.get("pit")
+
+
+def offset_exceeds_window(offset: int, size: int) -> bool:
+    """True when an offset page would fall outside the ES result window."""
+    return offset + size > MAX_RESULT_WINDOW
@@ -0,0 +1,93 @@
+"""
+API view for article-level diffs between two versions of a law.
+"""
+
+from datetime import date
+
+from django.shortcuts import get_object_or_404
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from apps.api.diffs import DiffSourceMissing, get_version_diff
+from apps.api.models import Law
+from apps.api.schema import DIFF_PARAMETERS, ErrorSchema, LawDiffSchema
+
+
+def _date_param(request, name):
+    value = request.query_params.get(name)
+    return date.fromisoformat(value) if value else None
+
+
+def _version_on(versions, day):
+    # Several versions can share a DOF date; the last one ingested wins
+    return versions.filter(publication_date=day).order_by("-id").first()
+
+
+@extend_schema(
+    tags=["Laws"],
+    summary="Diff two versions of a law",
+    description="Article-level changes between two versions, aligned by article "
+    "eId, with a word-level diff for each modified article. Unchanged articles "
+    "are only counted.",
+    parameters=DIFF_PARAMETERS,
+    responses={200: LawDiffSchema, 400: ErrorSchema, 404: ErrorSchema},
+)
+@api_view(["GET"])
+def law_diff(request, law_id):
+    """
+    Diff two versions of a law, identified by publication date.
+
+    Example: GET /api/v1/laws/lft/diff/?from=2019-05-01&to=2024-01-10
+    """
+    law = get_object_or_404(Law, official_id=law_id)
+    versions = law.versions.all()
+
+    try:
+        from_day = _date_param(request, "from")
+        to_day = _date_param(request, "to")
+    except ValueError:
+        return Response(
+            {"error": "'from' and 'to' must be dates (YYYY-MM-DD)."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    if to_day is not None:
+        to_version = _version_on(versions, to_day)
+    else:
+        to_version = versions.order_by("-publication_date", "-id").first()
+    if to_version is None:
+        return Response(
+            {"error": "Version not found."}, status=status.HTTP_404_NOT_FOUND
+        )
+
+    if from_day is not None:
+        from_version = _version_on(versions, from_day)
+    else:
+        from_version = (
+            versions.filter(publication_date__lt=to_version.publication_date)
+            .order_by("-publication_date", "-id")
+            .first()
+        )
+    if from_version is None:
+        return Response(
+            {"error": "No earlier version to compare against."},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    try:
+        diff = get_version_diff(from_version, to_version)
+    except DiffSourceMissing as exc:
+        return Response({"error": str(exc)}, status=status.HTTP_404_NOT_FOUND)
+
+    return Response(
+        {
+            "law_id": law.official_id,
+            "from_date": from_version.publication_date,
+            "to_date": to_version.publication_date,
+            "computed_at": diff.computed_at,
+            "summary": diff.data["summary"],
+            "articles": diff.data["articles"],
+        }
+    )
@@ -0,0 +1,197 @@
+"""
+Article-level diffs between two LawVersion snapshots.
+
+Articles are aligned by their AKN eId. Each article body is hashed, so the
+unchanged majority (a DOF reform decree usually touches well under 1% of a
+code's articles) is skipped in one O(n) pass; only articles whose hashes
+differ get a word-level diff.
+
+Diffs are persisted in LawVersionDiff per (from, to) version pair. Saving
+a LawVersion drops the diffs that involve it; rows stored under an older
+DIFF_FORMAT are recomputed on read.
+"""
+
+import difflib
+import hashlib
+import re
+
+from django.db.models import Q
+from lxml import etree
+
+from .models import LawVersionDiff
+from .utils.paths import read_data_content
+
+# Bump when the stored payload shape changes; stale rows are recomputed
+DIFF_FORMAT = 1
+
+NS = {"akn": "http://docs.oasis-open.org/legaldocml/ns/akn/3.0"}
+
+_ARTICLE_PREFIX = re.compile(r"^(?:Art[ií]culo|ARTÍCULO)\s*")
+# A word plus the whitespace after it, so "".join(tokens) == text
+_WORD = re.compile(r"\S+\s*")
+
+
+class DiffSourceMissing(Exception):
+    """A version has no XML to diff (no xml_file_path, or file not found)."""
+
+
+def _article_text(node):
+    paragraphs = [
+        "".join(p.itertext()).strip()
+        for p in node.xpath(".//akn:p[not(ancestor::akn:note)]", namespaces=NS)
+    ]
+    paragraphs = [p for p in paragraphs if p]
+    if paragraphs:
+        return "\n\n".join(paragraphs)
+    return "".join(node.itertext()).strip()
+
+
+def extract_articles(xml_content):
+    """
+    Return {key: {"article_id", "text", "hash"}} in document order.
+
+    The key is the article's eId (its number if it has none); repeated keys
+    get a "#n" suffix so no article is silently dropped.
+    """
+    root = etree.fromstring(xml_content.encode("utf-8"))
+    articles = {}
+    for node in root.iter(f"{{{NS['akn']}}}article"):
+        num = node.find("akn:num", NS)
+        raw_num = num.text.strip() if num is not None and num.text else ""
+        article_id = _ARTICLE_PREFIX.sub("", raw_num).rstrip(".").strip()
+
+        key = node.get("eId") or article_id
+        if key in articles:
+            n = 2
+            while f"{key}#{n}" in articles:
+                n += 1
+            key = f"{key}#{n}"
+
+        text = _article_text(node)
+        articles[key] = {
+            "article_id": article_id or key,
+            "text": text,
+            "hash": hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),
+        }
+    return articles
+
+
+def word_diff(old, new):
+    """
+    Word-level diff as a list of [op, text] with op one of "=", "-", "+".
+
+    Joining the "=" and "-" texts gives back `old`; "=" and "+" give `new`.
+    """
+    a, b = _WORD.findall(old), _WORD.findall(new)
+    ops = []
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(["=", "".join(a[i1:i2])])
+            continue
+        if i2 > i1:
+            ops.append(["-", "".join(a[i1:i2])])
+        if j2 > j1:
+            ops.append(["+", "".join(b[j1:j2])])
+    return ops
+
+
+def diff_articles(old_articles, new_articles):
+    """
+    Compare two extract_articles() results.
+
+    Returns {"summary": {...}, "articles": [...]} listing only added, removed
+    and modified articles (new-version order, then removals in old order).
+    """
+    changes = []
+    unchanged = modified = added = 0
+    for key, new in new_articles.items():
+        old = old_articles.get(key)
+        if old is None:
+            added += 1
+            changes.append(
+                {
+                    "eId": key,
+                    "article_id": new["article_id"],
+                    "status": "added",
+                    "text": new["text"],
+                }
+            )
+        elif old["hash"] == new["hash"]:
+            unchanged += 1
+        else:
+            modified += 1
+            changes.append(
+                {
+                    "eId": key,
+                    "article_id": new["article_id"],
+                    "status": "modified",
+                    "changes": word_diff(old["text"], new["text"]),
+                }
+            )
+
+    removed = 0
+    for key, old in old_articles.items():
+        if key not in new_articles:
+            removed += 1
+            changes.append(
+                {
+                    "eId": key,
+                    "article_id": old["article_id"],
+                    "status": "removed",
+                    "text": old["text"],
+                }
+            )
+
+    return {
+        "summary": {
+            "added": added,
+            "removed": removed,
+            "modified": modified,
+            "unchanged": unchanged,
+        },
+        "articles": changes,
+    }
+
+
+def _version_articles(version):
+    content = (
+        read_data_content(version.xml_file_path) if version.xml_file_path else None
+    )
+    if not content:
+        raise DiffSourceMissing(
+            f"No XML available for version {version.publication_date}"
+        )
+    return extract_articles(content)
+
+
+def compute_version_diff(from_version, to_version):
+    """Diff two versions from their XML files. Returns the stored payload."""
+    data = diff_articles(_version_articles(from_version), _version_articles(to_version))
+    data["format"] = DIFF_FORMAT
+    return data
+
+
+def get_version_diff(from_version, to_version):
+    """
+    Return the persisted diff for a version pair, computing and storing it on
+    first request (or when it was stored in an older DIFF_FORMAT).
+    """
+    stored = LawVersionDiff.objects.filter(
+        from_version=from_version, to_version=to_version
+    ).first()
+    if stored is not None and stored.data.get("format") == DIFF_FORMAT:
+        return stored
+
+    data = compute_version_diff(from_version, to_version)
+    stored, _ = LawVersionDiff.objects.update_or_create(
+        from_version=from_version, to_version=to_version, defaults={"data": data}
+    )
+    return stored
+
+
+def invalidate(sender, instance, **kwargs):
+    """Drop stored diffs touching a version whose content may have changed."""
+    LawVersionDiff.objects.filter(
+        Q(from_version=instance) | Q(to_version=instance)
+    ).delete()
@@ -0,0 +1,160 @@
+"""
+Circuit breaker around Elasticsearch reads.
+
+With ES down, every search request used to wait for the client's timeout
+and retries before failing. After ES_CIRCUIT_FAILURES consecutive
+connection failures the circuit opens: callers are told ES is unavailable
+immediately and serve from the SQLite index (apps.api.fts_index) instead.
+Once ES_CIRCUIT_RESET_SECONDS have passed, one request is let through as a
+probe (half-open). Its success closes the circuit and its failure re-opens it.
+
+Only connection-level failures count. Query errors (a bad request, a
+missing index) are not outages and propagate unchanged.
+"""
+
+import logging
+import threading
+import time
+
+from .config import ES_CIRCUIT_FAILURES, ES_CIRCUIT_RESET_SECONDS
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class SearchUnavailable(Exception):
+    """Elasticsearch is unreachable, or its circuit is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker shared by all threads of a process."""
+
+    def __init__(self, failure_threshold, reset_seconds, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._opened_at = 0.0
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state
+
+    def allow(self):
+        """True if a call may go to ES; moves open -> half-open after cool-down."""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and (
+                self._clock() - self._opened_at >= self.reset_seconds
+            ):
+                # Let exactly one probe through
+                self._state = HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    logger.warning(
+                        "Elasticsearch circuit opened after %d failure(s)",
+                        self._failures,
+                    )
+                self._state = OPEN
+                self._opened_at = self._clock()
+
+
+es_circuit = CircuitBreaker(ES_CIRCUIT_FAILURES, ES_CIRCUIT_RESET_SECONDS)
+
+
+def _is_connection_error(exc):
+    # elasticsearch is imported on first use (apps.api.config); by the time
+    # a call has failed it is already loaded
+    from elasticsearch.exceptions import ConnectionError as ESConnectionError
+
+    return isinstance(exc, ESConnectionError)
+
+
+def call_es(method, *args, **kwargs):
+    """
+    Call an ES client method through the circuit.
+
+    Raises SearchUnavailable when the circuit is open or the call fails to
+    connect. Any other exception is re-raised as is.
+    """
+    if not es_circuit.allow():
+        raise SearchUnavailable("Elasticsearch circuit is open")
+    try:
+        result = method(*args, **kwargs)
+    except Exception as e:
+        if not _is_connection_error(e):
+            # ES answered, so it is up even though the query failed
+            es_circuit.record_success()
+            raise
+        es_circuit.record_failure()
+        raise SearchUnavailable(str(e)) from e
+    es_circuit.record_success()
+    return result
+
+
+def ping_es(es):
+    """ES health check through the circuit: False when down or open."""
+    if not es_circuit.allow():
+        return False
+    try:
+        ok = es.ping()
+    except Exception:
+        ok = False
+    if ok:
+        es_circuit.record_success()
+    else:
+        es_circuit.record_failure()
+    return ok
+
+
+async def call_es_async(method, *args, **kwargs):
+    """call_es for AsyncElasticsearch methods (apps.api.async_views)."""
+    if not es_circuit.allow():
+        raise SearchUnavailable("Elasticsearch circuit is open")
+    try:
+        result = await method(*args, **kwargs)
+    except Exception as e:
+        if not _is_connection_error(e):
+            es_circuit.record_success()
+            raise
+        es_circuit.record_failure()
+        raise SearchUnavailable(str(e)) from e
+    es_circuit.record_success()
+    return result
+
+
+async def ping_es_async(es):
+    """ping_es for AsyncElasticsearch."""
+    if not es_circuit.allow():
+        return False
+    try:
+        ok = await es.ping()
+    except Exception:
+        ok = False
+    if ok:
+        es_circuit.record_success()
+    else:
+        es_circuit.record_failure()
+    return ok
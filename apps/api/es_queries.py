@@ -0,0 +1,338 @@
+"""
+Elasticsearch request builders.
+
+Every ES query body the API sends is built here. Each builder returns the
+keyword arguments for the client call (`call_es(es.search, **kwargs)`).
+
+Conventions:
+- Exact constraints (law_id, tier, state, category, status, ...) go in
+  `bool.filter`, not in scoring clauses. Filter clauses skip scoring and
+  are cached per segment by ES. `law_id` is a keyword field, so a `term`
+  clause matches exactly what `match_phrase` did.
+- Aggregation-only requests are size-0 searches with `request_cache` on,
+  so repeats are answered from the shard request cache until the next
+  refresh. (Article counts are not queried at all: index_laws stores them
+  on Law.)
+- `_source` is limited to the fields the endpoint reads.
+- Article docs are routed by law_id, so single-law requests pass
+  `routing` and search one shard (ES_ROUTE_BY_LAW). Cross-law requests
+  fan out to every shard.
+"""
+
+from .config import AUTHORITY_BOOST, ES_ROUTE_BY_LAW, INDEX_NAME
+from .cursors import PIT_KEEP_ALIVE
+from .fts_index import date_range_bounds
+
+# _source fields per endpoint
+SEARCH_SOURCE = [
+    "law_id",
+    "law_name",
+    "article",
+    "text",
+    "publication_date",
+    "tier",
+    "law_type",
+    "state",
+    "municipality",
+    "hierarchy",
+    "book",
+    "title",
+    "chapter",
+]
+ARTICLE_SOURCE = ["article", "text"]
+RELATED_SOURCE = ["law_name", "tier", "category", "state"]
+
+SEARCH_FACETS = {
+    "by_tier": {"terms": {"field": "tier"}},
+    "by_category": {"terms": {"field": "category", "size": 20}},
+    "by_status": {"terms": {"field": "status"}},
+    "by_law_type": {"terms": {"field": "law_type"}},
+    "by_state": {"terms": {"field": "state", "size": 35}},
+}
+
+SEARCH_SORTS = {
+    "date_desc": [{"publication_date": {"order": "desc"}}],
+    "date_asc": [{"publication_date": {"order": "asc"}}],
+    "name": [{"law_id": {"order": "asc"}}],
+}
+
+
+def law_filter(law_id):
+    return {"term": {"law_id": law_id}}
+
+
+def _routed(law_id, request_kwargs):
+    """Send a single-law request to the shard holding the law's articles."""
+    if ES_ROUTE_BY_LAW:
+        request_kwargs["routing"] = law_id
+    return request_kwargs
+
+
+def _filtered(filters, must=None):
+    query = {"bool": {"filter": filters}}
+    if must:
+        query["bool"]["must"] = must
+    return query
+
+
+def msearch_body(requests):
+    """Combine builder kwargs into one msearch body (header, body pairs)."""
+    lines = []
+    for request_kwargs in requests:
+        header = {"index": request_kwargs.get("index", INDEX_NAME)}
+        for param in ("routing", "request_cache"):
+            if param in request_kwargs:
+                header[param] = request_kwargs[param]
+        lines.extend([header, request_kwargs["body"]])
+    return lines
+
+
+# ---------------------------------------------------------------------------
+# Single-law requests
+# ---------------------------------------------------------------------------
+
+
+def law_articles(law_id, size, offset=None, search_after=None):
+    """A page of a law's articles in `article` order (law_articles)."""
+    body = {
+        "query": _filtered([law_filter(law_id)]),
+        "sort": [{"article": {"order": "asc"}}],
+        "_source": ARTICLE_SOURCE,
+        "size": size,
+    }
+    if search_after is not None:
+        body["search_after"] = search_after
+    elif offset is not None:
+        body["from"] = offset
+    return _routed(law_id, {"index": INDEX_NAME, "body": body})
+
+
+def law_seed_texts(law_id, size=3):
+    """The first article texts of a law, the like-text of related_laws."""
+    return _routed(
+        law_id,
+        {
+            "index": INDEX_NAME,
+            "body": {
+                "query": _filtered([law_filter(law_id)]),
+                "sort": [{"article": "asc"}],
+                "_source": ["text"],
+                "size": size,
+            },
+        },
+    )
+
+
+def law_hierarchy(law_id, size=10000):
+    """Hierarchy breadcrumbs of every article of a law (law_structure)."""
+    return _routed(
+        law_id,
+        {
+            "index": INDEX_NAME,
+            "body": {
+                "query": _filtered([law_filter(law_id)]),
+                "sort": [{"article": "asc"}],
+                "_source": ["hierarchy"],
+                "size": size,
+            },
+        },
+    )
+
+
+def law_text_search(law_id, q, size=50):
+    """Fuzzy full-text search within one law (law_search)."""
+    return _routed(
+        law_id,
+        {
+            "index": INDEX_NAME,
+            "body": {
+                "query": _filtered(
+                    [law_filter(law_id)],
+                    must=[{"match": {"text": {"query": q, "fuzziness": "AUTO"}}}],
+                ),
+                "highlight": {"fields": {"text": {"fragment_size": 200}}},
+                "_source": ARTICLE_SOURCE,
+                "size": size,
+            },
+        },
+    )
+
+
+def related_laws(law_id, like_text, size=8):
+    """
+    Laws whose articles are most like `like_text`, excluding `law_id`,
+    as `by_law` buckets with one top hit each (RelatedLawsView).
+    """
+    return {
+        "index": INDEX_NAME,
+        "body": {
+            "query": {
+                "bool": {
+                    "must": [
+                        {
+                            "more_like_this": {
+                                "fields": ["law_name", "text"],
+                                "like": like_text,
+                                "min_term_freq": 1,
+                                "min_doc_freq": 1,
+                                "max_query_terms": 25,
+                            }
+                        }
+                    ],
+                    "must_not": [law_filter(law_id)],
+                }
+            },
+            "aggs": {
+                "by_law": {
+                    "terms": {"field": "law_id", "size": size},
+                    "aggs": {
+                        "top_hit": {"top_hits": {"_source": RELATED_SOURCE, "size": 1}}
+                    },
+                }
+            },
+            "size": 0,
+        },
+        "request_cache": True,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Cross-law reads
+# ---------------------------------------------------------------------------
+
+
+def articles_mget(pairs):
+    """
+    Article docs for (law_id, article_id) pairs by their ids, in one mget
+    (article_batch). Each doc carries its law's routing.
+    """
+    docs = []
+    for law_id, article_id in pairs:
+        doc = {"_id": f"{law_id}-{article_id}", "_source": ARTICLE_SOURCE}
+        if ES_ROUTE_BY_LAW:
+            doc["routing"] = law_id
+        docs.append(doc)
+    return {"index": INDEX_NAME, "body": {"docs": docs}}
+
+
+# ---------------------------------------------------------------------------
+# Cross-law search
+# ---------------------------------------------------------------------------
+
+
+def search_filters(params):
+    """bool.filter clauses for SearchView's filter parameters."""
+
+    def active(name):
+        value = params.get(name)
+        return value if value and value != "all" else None
+
+    clauses = []
+    for name in ("category", "municipality", "status", "law_type"):
+        if active(name):
+            clauses.append({"term": {name: params[name]}})
+
+    if active("jurisdiction"):
+        tiers = [
+            t
+            for t in ("federal", "state", "municipal")
+            if t in params["jurisdiction"].split(",")
+        ]
+        if tiers:
+            clauses.append({"terms": {"tier": tiers}})
+
+    # Structural filters (?title=Titulo Primero&chapter=Capitulo I) are
+    # analyzed text fields, so they stay `match`, but unscored
+    for name in ("title", "chapter"):
+        if params.get(name):
+            clauses.append({"match": {name: params[name]}})
+
+    if active("state"):
+        # State ID prefix (e.g., "Colima" -> "colima_"), as in the SQLite index
+        clauses.append({"prefix": {"law_id": f"{params['state'].lower()}_"}})
+
+    if active("date_range"):
+        lower, upper, inclusive = date_range_bounds(params["date_range"])
+        bounds = {}
+        if lower:
+            bounds["gte"] = lower
+        if upper:
+            bounds["lte" if inclusive else "lt"] = upper
+        if bounds:
+            clauses.append({"range": {"publication_date": bounds}})
+
+    return clauses
+
+
+def point_in_time():
+    """Arguments of open_point_in_time for a SearchView cursor walk."""
+    return {"index": INDEX_NAME, "keep_alive": PIT_KEEP_ALIVE}
+
+
+def close_point_in_time(pit_id):
+    return {"body": {"id": pit_id}}
+
+
+def search(
+    query,
+    params,
+    sort_by="relevance",
+    size=10,
+    offset=0,
+    search_after=None,
+    pit_id=None,
+):
+    """
+    SearchView's request: an offset page, or a cursor page inside the PIT
+    `pit_id` continuing after `search_after`.
+
+    Relevance order multiplies the text score by the article's
+    citation-graph authority (apps.api.citation_graph). Facets are only
+    computed for the first page of a cursor walk so that the cost of each
+    later page stays constant.
+    """
+    es_query = _filtered(
+        search_filters(params),
+        must=[
+            {
+                "multi_match": {
+                    "query": query,
+                    "fields": ["text", "tags"],
+                    "fuzziness": "AUTO",
+                }
+            }
+        ],
+    )
+    sort = SEARCH_SORTS.get(sort_by)
+    if not sort:
+        es_query = {
+            "function_score": {
+                "query": es_query,
+                "field_value_factor": AUTHORITY_BOOST,
+                "boost_mode": "multiply",
+            }
+        }
+
+    body = {
+        "query": es_query,
+        "highlight": {"fields": {"text": {}}},
+        "_source": SEARCH_SOURCE,
+        "size": size,
+    }
+    if search_after is None:
+        body["aggs"] = SEARCH_FACETS
+
+    if pit_id:
+        # Point-in-time keeps the walk consistent while the index is being
+        # refreshed; ES adds an implicit _shard_doc tiebreaker.
+        body["pit"] = {"id": pit_id, "keep_alive": PIT_KEEP_ALIVE}
+        body["sort"] = sort or [{"_score": {"order": "desc"}}]
+        if search_after is not None:
+            body["search_after"] = search_after
+        # PIT searches must not name an index
+        return {"body": body}
+
+    body["from"] = offset
+    if sort:
+        body["sort"] = sort
+    return {"index": INDEX_NAME, "body": body}
@@ -1,33 +1,148 @@
 """
-Custom throttle classes for export endpoints.
+Export quota tracking.
 
-Uses ExportLog for persistent, auditable quota tracking instead of cache.
 Three tiers: anon (10/hr by IP), free (30/hr by user), premium (100/hr by user).
+
+With Redis (EXPORT_QUOTA_REDIS_URL, the Celery broker by default), quotas
+use a sliding-window counter: one counter per fixed hour window, and the
+previous window's count weighted by how much of it still overlaps the last
+hour. A check is two counter reads and a recorded export one increment, so
+the cost does not grow with traffic. ExportLog rows are pushed to a pending
+list and bulk-inserted by the flush_export_logs Celery task.
+
+Without Redis, or while it is unreachable, ExportLog rows are written
+synchronously and quotas are counted from them, so every worker still
+shares the same count. When Redis goes away mid-window, exports still in
+its pending list (up to one flush interval, a minute) are not in the
+ExportLog count, so quotas undercount by that much until it is back.
 """
 
+import contextlib
+import json
+import logging
+import math
+import time
 from datetime import timedelta
 
+from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
-from rest_framework.throttling import BaseThrottle
+from django.utils.dateparse import parse_datetime
 
 from .models import ExportLog
 
+logger = logging.getLogger(__name__)
+
 TIER_LIMITS = {
     "anon": 10,
     "free": 30,
     "premium": 100,
 }
 
+WINDOW_SECONDS = 3600
+COUNTER_PREFIX = "export_quota"
+PENDING_LOG_KEY = "export_log:pending"
+FLUSH_LOCK_KEY = "export_log:flush"
+FLUSH_BATCH_SIZE = 500
+FLUSH_LOCK_SECONDS = 300
 
-def get_export_count(*, user_id: str = "", ip_address: str = "") -> int:
-    """Count exports in the last hour for a user or IP."""
-    one_hour_ago = timezone.now() - timedelta(hours=1)
+_redis_state = {"url": None, "client": None}
+
+
+def _get_redis():
+    """Return a Redis client for EXPORT_QUOTA_REDIS_URL, or None if unset."""
+    url = getattr(settings, "EXPORT_QUOTA_REDIS_URL", "")
+    if not url:
+        return None
+    if _redis_state["url"] != url:
+        import redis
+
+        _redis_state["client"] = redis.Redis.from_url(
+            url, socket_connect_timeout=0.5, socket_timeout=0.5
+        )
+        _redis_state["url"] = url
+    return _redis_state["client"]
+
+
+def _redis_errors():
+    import redis
+
+    return (redis.RedisError, OSError)
+
+
+def _now() -> float:
+    return time.time()
+
+
+def _identity(user_id: str, ip_address: str) -> str:
+    return f"u:{user_id}" if user_id else f"ip:{ip_address}"
+
+
+def _window_keys(identity: str, now: float) -> tuple[list[str], float]:
+    """Keys for the previous and current window, and seconds into the current one."""
+    window = int(now // WINDOW_SECONDS)
+    keys = [f"{COUNTER_PREFIX}:{identity}:{w}" for w in (window - 1, window)]
+    return keys, now - window * WINDOW_SECONDS
+
+
+def _read_counters(identity: str, now: float) -> tuple[int, int, float] | None:
+    """(previous, current, seconds into window) from Redis, or None without it."""
+    client = _get_redis()
+    if client is None:
+        return None
+    keys, elapsed = _window_keys(identity, now)
+    try:
+        prev, curr = (int(v or 0) for v in client.mget(keys))
+    except _redis_errors():
+        logger.warning("Export quota Redis unavailable, counting ExportLog rows")
+        return None
+    return prev, curr, elapsed
+
+
+def _logged_exports(user_id: str, ip_address: str):
+    """ExportLog rows of the last hour for a user or IP."""
+    one_hour_ago = timezone.now() - timedelta(seconds=WINDOW_SECONDS)
     qs = ExportLog.objects.filter(created_at__gte=one_hour_ago)
     if user_id:
-        qs = qs.filter(user_id=user_id)
-    else:
-        qs = qs.filter(ip_address=ip_address, user_id="")
-    return qs.count()
+        return qs.filter(user_id=user_id)
+    return qs.filter(ip_address=ip_address, user_id="")
+
+
+def _weighted_count(prev: int, curr: int, elapsed: float) -> float:
+    return prev * (1 - elapsed / WINDOW_SECONDS) + curr
+
+
+def _seconds_until_below(prev: int, curr: int, elapsed: float, limit: int) -> float:
+    """Seconds until the weighted count drops below `limit` with no new exports."""
+    remaining = WINDOW_SECONDS - elapsed
+    # Still in the current window: only the previous window's weight decays
+    if curr < limit and prev > 0:
+        wait = WINDOW_SECONDS * (1 - (limit - curr) / prev) - elapsed
+        if wait < remaining:
+            return max(wait, 0)
+    # Next window: the current count becomes the decaying previous one
+    if curr <= 0:
+        return remaining
+    return remaining + WINDOW_SECONDS * max(1 - limit / curr, 0)
+
+
+def get_export_count(*, user_id: str = "", ip_address: str = "") -> int:
+    """Exports in the last hour for a user or IP (sliding-window estimate)."""
+    counters = _read_counters(_identity(user_id, ip_address), _now())
+    if counters is None:
+        return _logged_exports(user_id, ip_address).count()
+    return int(_weighted_count(*counters))
+
+
+def _check_logged_quota(limit: int, user_id: str, ip_address: str):
+    qs = _logged_exports(user_id, ip_address)
+    if qs.count() < limit:
+        return True, 0
+    oldest = qs.order_by("created_at").first()
+    if oldest is None:
+        return False, WINDOW_SECONDS
+    retry_after = oldest.created_at + timedelta(seconds=WINDOW_SECONDS)
+    return False, max(int((retry_after - timezone.now()).total_seconds()), 1)
 
 
 def check_export_quota(tier: str, user_id: str, ip_address: str) -> tuple[bool, int]:
@@ -37,39 +152,93 @@ def check_export_quota(tier: str, user_id: str, ip_address: str) -> tuple[bool,
     Returns (allowed, seconds_until_retry).
     """
     limit = TIER_LIMITS.get(tier, TIER_LIMITS["anon"])
+    counters = _read_counters(_identity(user_id, ip_address), _now())
+    if counters is None:
+        return _check_logged_quota(limit, user_id, ip_address)
 
-    if user_id:
-        count = get_export_count(user_id=user_id)
-    else:
-        count = get_export_count(ip_address=ip_address)
-
-    if count >= limit:
-        # Find oldest export in window to calculate retry-after
-        one_hour_ago = timezone.now() - timedelta(hours=1)
-        qs = ExportLog.objects.filter(created_at__gte=one_hour_ago)
-        if user_id:
-            qs = qs.filter(user_id=user_id)
-        else:
-            qs = qs.filter(ip_address=ip_address, user_id="")
-        oldest = qs.order_by("created_at").first()
-        if oldest:
-            retry_after = int(
-                (
-                    oldest.created_at + timedelta(hours=1) - timezone.now()
-                ).total_seconds()
-            )
-            return False, max(retry_after, 1)
-        return False, 3600
+    prev, curr, elapsed = counters
+    if int(_weighted_count(prev, curr, elapsed)) >= limit:
+        retry_after = _seconds_until_below(prev, curr, elapsed, limit)
+        return False, max(math.ceil(retry_after), 1)
 
     return True, 0
 
 
 def log_export(user_id: str, ip_address: str, law_id: str, fmt: str, tier: str) -> None:
-    """Record an export for quota tracking."""
-    ExportLog.objects.create(
-        user_id=user_id,
-        ip_address=ip_address,
-        law_id=law_id,
-        format=fmt,
-        tier=tier,
-    )
+    """Record an export for quota tracking and auditing."""
+    row = {
+        "user_id": user_id,
+        "ip_address": ip_address,
+        "law_id": law_id,
+        "format": fmt,
+        "tier": tier,
+        "created_at": timezone.now().isoformat(),
+    }
+    client = _get_redis()
+    if client is not None:
+        keys, _ = _window_keys(_identity(user_id, ip_address), _now())
+        try:
+            pipe = client.pipeline()
+            pipe.incr(keys[1])
+            pipe.expire(keys[1], 2 * WINDOW_SECONDS)
+            pipe.rpush(PENDING_LOG_KEY, json.dumps(row))
+            pipe.execute()
+            return
+        except _redis_errors():
+            logger.warning("Export log queue unavailable, writing synchronously")
+    row["created_at"] = parse_datetime(row["created_at"])
+    ExportLog.objects.create(**row)
+
+
+def _decode_rows(raw_rows) -> list[ExportLog]:
+    objs = []
+    for raw in raw_rows:
+        try:
+            row = json.loads(raw)
+            row["created_at"] = parse_datetime(row["created_at"])
+            objs.append(ExportLog(**row))
+        except (ValueError, KeyError, TypeError):
+            logger.error("Dropping malformed queued ExportLog row: %r", raw)
+    return objs
+
+
+def flush_pending_export_logs() -> int:
+    """
+    Bulk-insert queued ExportLog rows. Returns the number of rows written.
+
+    Called by the flush_export_logs Celery task; a no-op without Redis.
+    Each batch is read with LRANGE and trimmed from the list only after its
+    rows are committed, so a failed insert leaves them queued for the next
+    run. A lock, renewed per batch, keeps overlapping runs from inserting a
+    batch twice; a run that outlives it stops and leaves the rest queued.
+    """
+    client = _get_redis()
+    if client is None:
+        return 0
+
+    from redis.exceptions import LockNotOwnedError
+
+    lock = client.lock(FLUSH_LOCK_KEY, timeout=FLUSH_LOCK_SECONDS)
+    if not lock.acquire(blocking=False):
+        return 0
+    written = 0
+    try:
+        while True:
+            raw_rows = client.lrange(PENDING_LOG_KEY, 0, FLUSH_BATCH_SIZE - 1)
+            if not raw_rows:
+                break
+            objs = _decode_rows(raw_rows)
+            with transaction.atomic():
+                ExportLog.objects.bulk_create(objs, batch_size=FLUSH_BATCH_SIZE)
+            # New rows are appended at the tail, so the batch is still the head
+            client.ltrim(PENDING_LOG_KEY, len(raw_rows), -1)
+            written += len(objs)
+            lock.reacquire()
+    except LockNotOwnedError:
+        # A batch took longer than the lock timeout and another run may
+        # hold it now; that run picks up what is still queued
+        logger.warning("Export log flush lost its lock after %d rows", written)
+    finally:
+        with contextlib.suppress(LockNotOwnedError):
+            lock.release()
+    return written
@@ -23,43 +23,19 @@ from rest_framework.decorators import api_view
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.response import Response
 
-from .config import INDEX_NAME, es_client
+from . import es_queries, fts_index
+from .article_packs import get_pack
+from .conditional import add_validators, export_state, law_validators, not_modified
+from .config import es_client
+from .es_circuit import SearchUnavailable, call_es, ping_es
 from .export_throttles import TIER_LIMITS, check_export_quota, log_export
+from .metrics import timed_render
 from .middleware.janua_auth import JanuaJWTAuthentication
 from .models import Law
+from .utils.imports import optional_import
 
 logger = logging.getLogger(__name__)
 
-# Optional dependencies
-try:
-    from weasyprint import HTML as WeasyHTML
-
-    _has_weasyprint = True
-except ImportError:
-    _has_weasyprint = False
-
-try:
-    import jinja2
-
-    _has_jinja2 = True
-except ImportError:
-    _has_jinja2 = False
-
-try:
-    from docx import Document as DocxDocument
-    from docx.shared import Inches, Pt
-
-    _has_docx = True
-except ImportError:
-    _has_docx = False
-
-try:
-    from ebooklib import epub
-
-    _has_ebooklib = True
-except ImportError:
-    _has_ebooklib = False
-
 # ── Format → minimum tier mapping ──────────────────────────────────────
 
 FORMAT_TIERS = {
@@ -163,29 +139,50 @@ def _check_access(request, fmt: str):
     return tier, user_id, ip, None
 
 
+def _export_validators(request, law_id: str, fmt: str):
+    """
+    (validators, 304 response or None) for an export request.
+
+    Call only after _check_access: a matching If-None-Match or
+    If-Modified-Since must not skip the tier and quota checks.
+    """
+    validators = law_validators(law_id, f"export-{fmt}", extra=export_state)
+    return validators, not_modified(request, validators)
+
+
+def _cache_control(fmt: str) -> str:
+    """Exports behind an account must not be stored by shared caches."""
+    if FORMAT_TIERS.get(fmt, "premium") == "anon":
+        return "public, max-age=3600"
+    return "private, max-age=3600"
+
+
 def _get_articles(law_id: str, max_articles: int = 10000) -> list[dict]:
-    """Fetch all articles for a law from Elasticsearch."""
+    """
+    Fetch all articles for a law from its article pack, else Elasticsearch,
+    else the SQLite fallback index.
+    """
+    pack = get_pack(law_id)
+    if pack is not None:
+        return pack.articles(0, max_articles)
+    if fts_index.preferred():
+        return fts_index.law_articles(law_id, 0, max_articles)
+
     try:
         es = es_client
-        if not es.ping():
-            return []
-
-        result = es.search(
-            index=INDEX_NAME,
-            body={
-                "query": {"match_phrase": {"law_id": law_id}},
-                "size": max_articles,
-                "sort": [{"article_id.keyword": {"order": "asc"}}],
-                "_source": ["article_id", "text"],
-            },
-        )
+        if not ping_es(es):
+            raise SearchUnavailable("Elasticsearch ping failed")
+
+        result = call_es(es.search, **es_queries.law_articles(law_id, max_articles))
         return [
             {
-                "article_id": hit["_source"].get("article_id", ""),
+                "article_id": hit["_source"].get("article", ""),
                 "text": hit["_source"].get("text", ""),
             }
             for hit in result["hits"]["hits"]
         ]
+    except SearchUnavailable:
+        return fts_index.law_articles(law_id, 0, max_articles)
     except Exception:
         logger.warning("ES unavailable for export %s", law_id, exc_info=True)
         return []
@@ -240,6 +237,9 @@ def export_txt(request, law_id):
     tier, user_id, ip, error = _check_access(request, "txt")
     if error:
         return error
+    validators, unchanged = _export_validators(request, law_id, "txt")
+    if unchanged is not None:
+        return unchanged
 
     law = get_object_or_404(Law, official_id=law_id)
     articles = _get_articles(law_id)
@@ -247,50 +247,52 @@ def export_txt(request, law_id):
     if not articles:
         return Response({"error": "No articles found for this law."}, status=404)
 
-    lines = []
-    lines.append("=" * 72)
-    lines.append(law.name.center(72))
-    lines.append("=" * 72)
-    lines.append("")
+    with timed_render("txt"):
+        lines = []
+        lines.append("=" * 72)
+        lines.append(law.name.center(72))
+        lines.append("=" * 72)
+        lines.append("")
 
-    tier_label = _tier_label(law.tier)
-    lines.append(f"Tipo: {tier_label}")
-    if law.category:
-        lines.append(f"Categoría: {law.category}")
-    if law.status:
-        lines.append(f"Estado: {law.status}")
+        tier_label = _tier_label(law.tier)
+        lines.append(f"Tipo: {tier_label}")
+        if law.category:
+            lines.append(f"Categoría: {law.category}")
+        if law.status:
+            lines.append(f"Estado: {law.status}")
 
-    latest_version = law.versions.order_by("-publication_date").first()
-    if latest_version and latest_version.publication_date:
-        lines.append(f"Publicado: {latest_version.publication_date}")
-
-    lines.append(f"Artículos: {len(articles)}")
-    lines.append("")
-    lines.append("-" * 72)
-    lines.append("")
+        latest_version = law.versions.order_by("-publication_date").first()
+        if latest_version and latest_version.publication_date:
+            lines.append(f"Publicado: {latest_version.publication_date}")
 
-    for article in articles:
-        lines.append(article["article_id"])
+        lines.append(f"Artículos: {len(articles)}")
         lines.append("")
-        lines.append(article["text"])
+        lines.append("-" * 72)
         lines.append("")
+
+        for article in articles:
+            lines.append(article["article_id"])
+            lines.append("")
+            lines.append(article["text"])
+            lines.append("")
+            lines.append("")
+
+        lines.append("-" * 72)
+        lines.append(
+            f"Generado por Tezca — El Espejo de la Ley | {datetime.now().strftime('%Y-%m-%d')} | tezca.mx"
+        )
         lines.append("")
 
-    lines.append("-" * 72)
-    lines.append(
-        f"Generado por Tezca — El Espejo de la Ley | {datetime.now().strftime('%Y-%m-%d')} | tezca.mx"
-    )
-    lines.append("")
+        content = "\n".join(lines)
 
-    content = "\n".join(lines)
     safe_name = _safe_filename(law_id)
 
     log_export(user_id, ip, law_id, "txt", tier)
 
     response = HttpResponse(content, content_type="text/plain; charset=utf-8")
     response["Content-Disposition"] = f'attachment; filename="{safe_name}.txt"'
-    response["Cache-Control"] = "public, max-age=3600"
-    return response
+    response["Cache-Control"] = _cache_control("txt")
+    return add_validators(response, validators)
 
 
 @extend_schema(
@@ -304,8 +306,12 @@ def export_pdf(request, law_id):
     tier, user_id, ip, error = _check_access(request, "pdf")
     if error:
         return error
+    validators, unchanged = _export_validators(request, law_id, "pdf")
+    if unchanged is not None:
+        return unchanged
 
-    if not _has_weasyprint:
+    weasyprint = optional_import("weasyprint")
+    if weasyprint is None:
         return Response(
             {"error": "PDF export is not available. WeasyPrint is not installed."},
             status=501,
@@ -317,17 +323,18 @@ def export_pdf(request, law_id):
     if not articles:
         return Response({"error": "No articles found for this law."}, status=404)
 
-    ctx = _law_context(law, articles)
-    html_string = render_to_string("export/law_pdf.html", ctx)
-    pdf_bytes = WeasyHTML(string=html_string).write_pdf()
+    with timed_render("pdf"):
+        ctx = _law_context(law, articles)
+        html_string = render_to_string("export/law_pdf.html", ctx)
+        pdf_bytes = weasyprint.HTML(string=html_string).write_pdf()
 
     safe_name = _safe_filename(law_id)
     log_export(user_id, ip, law_id, "pdf", tier)
 
     response = HttpResponse(pdf_bytes, content_type="application/pdf")
     response["Content-Disposition"] = f'attachment; filename="{safe_name}.pdf"'
-    response["Cache-Control"] = "public, max-age=3600"
-    return response
+    response["Cache-Control"] = _cache_control("pdf")
+    return add_validators(response, validators)
 
 
 @extend_schema(
@@ -341,8 +348,12 @@ def export_latex(request, law_id):
     tier, user_id, ip, error = _check_access(request, "latex")
     if error:
         return error
+    validators, unchanged = _export_validators(request, law_id, "latex")
+    if unchanged is not None:
+        return unchanged
 
-    if not _has_jinja2:
+    jinja2 = optional_import("jinja2")
+    if jinja2 is None:
         return Response(
             {"error": "LaTeX export is not available. Jinja2 is not installed."},
             status=501,
@@ -390,9 +401,10 @@ def export_latex(request, law_id):
 
     env.filters["latex_escape"] = latex_escape
 
-    ctx = _law_context(law, articles)
-    template = env.get_template("law_latex.tex")
-    tex_content = template.render(**ctx)
+    with timed_render("latex"):
+        ctx = _law_context(law, articles)
+        template = env.get_template("law_latex.tex")
+        tex_content = template.render(**ctx)
 
     safe_name = _safe_filename(law_id)
     log_export(user_id, ip, law_id, "latex", tier)
@@ -401,8 +413,8 @@ def export_latex(request, law_id):
         tex_content, content_type="application/x-tex; charset=utf-8"
     )
     response["Content-Disposition"] = f'attachment; filename="{safe_name}.tex"'
-    response["Cache-Control"] = "public, max-age=3600"
-    return response
+    response["Cache-Control"] = _cache_control("latex")
+    return add_validators(response, validators)
 
 
 @extend_schema(
@@ -416,8 +428,12 @@ def export_docx(request, law_id):
     tier, user_id, ip, error = _check_access(request, "docx")
     if error:
         return error
+    validators, unchanged = _export_validators(request, law_id, "docx")
+    if unchanged is not None:
+        return unchanged
 
-    if not _has_docx:
+    docx = optional_import("docx")
+    if docx is None:
         return Response(
             {"error": "DOCX export is not available. python-docx is not installed."},
             status=501,
@@ -429,47 +445,50 @@ def export_docx(request, law_id):
     if not articles:
         return Response({"error": "No articles found for this law."}, status=404)
 
-    doc = DocxDocument()
+    with timed_render("docx"):
+        from docx.shared import Pt
 
-    # Title
-    title = doc.add_heading(law.name, level=0)
-    title.alignment = 1  # center
+        doc = docx.Document()
 
-    # Metadata
-    tier_label = _tier_label(law.tier)
-    meta_parts = [f"Tipo: {tier_label}"]
-    if law.category:
-        meta_parts.append(f"Categoría: {law.category}")
-    if law.status:
-        meta_parts.append(f"Estado: {law.status}")
-    meta_parts.append(f"Artículos: {len(articles)}")
+        # Title
+        title = doc.add_heading(law.name, level=0)
+        title.alignment = 1  # center
 
-    latest_version = law.versions.order_by("-publication_date").first()
-    if latest_version and latest_version.publication_date:
-        meta_parts.append(f"Publicado: {latest_version.publication_date}")
+        # Metadata
+        tier_label = _tier_label(law.tier)
+        meta_parts = [f"Tipo: {tier_label}"]
+        if law.category:
+            meta_parts.append(f"Categoría: {law.category}")
+        if law.status:
+            meta_parts.append(f"Estado: {law.status}")
+        meta_parts.append(f"Artículos: {len(articles)}")
 
-    meta_para = doc.add_paragraph(" | ".join(meta_parts))
-    meta_para.alignment = 1
+        latest_version = law.versions.order_by("-publication_date").first()
+        if latest_version and latest_version.publication_date:
+            meta_parts.append(f"Publicado: {latest_version.publication_date}")
 
-    doc.add_paragraph("")  # spacer
+        meta_para = doc.add_paragraph(" | ".join(meta_parts))
+        meta_para.alignment = 1
 
-    # Articles
-    for article in articles:
-        doc.add_heading(article["article_id"], level=2)
-        doc.add_paragraph(article["text"])
+        doc.add_paragraph("")  # spacer
 
-    # Footer
-    doc.add_paragraph("")
-    footer = doc.add_paragraph(
-        f"Generado por Tezca — El Espejo de la Ley | {datetime.now().strftime('%Y-%m-%d')} | tezca.mx"
-    )
-    footer.alignment = 1
-    for run in footer.runs:
-        run.font.size = Pt(8)
+        # Articles
+        for article in articles:
+            doc.add_heading(article["article_id"], level=2)
+            doc.add_paragraph(article["text"])
+
+        # Footer
+        doc.add_paragraph("")
+        footer = doc.add_paragraph(
+            f"Generado por Tezca — El Espejo de la Ley | {datetime.now().strftime('%Y-%m-%d')} | tezca.mx"
+        )
+        footer.alignment = 1
+        for run in footer.runs:
+            run.font.size = Pt(8)
 
-    buf = io.BytesIO()
-    doc.save(buf)
-    buf.seek(0)
+        buf = io.BytesIO()
+        doc.save(buf)
+        buf.seek(0)
 
     safe_name = _safe_filename(law_id)
     log_export(user_id, ip, law_id, "docx", tier)
@@ -479,8 +498,8 @@ def export_docx(request, law_id):
         content_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
     )
     response["Content-Disposition"] = f'attachment; filename="{safe_name}.docx"'
-    response["Cache-Control"] = "public, max-age=3600"
-    return response
+    response["Cache-Control"] = _cache_control("docx")
+    return add_validators(response, validators)
 
 
 @extend_schema(
@@ -494,8 +513,12 @@ def export_epub(request, law_id):
     tier, user_id, ip, error = _check_access(request, "epub")
     if error:
         return error
+    validators, unchanged = _export_validators(request, law_id, "epub")
+    if unchanged is not None:
+        return unchanged
 
-    if not _has_ebooklib:
+    epub = optional_import("ebooklib.epub")
+    if epub is None:
         return Response(
             {"error": "EPUB export is not available. ebooklib is not installed."},
             status=501,
@@ -507,80 +530,81 @@ def export_epub(request, law_id):
     if not articles:
         return Response({"error": "No articles found for this law."}, status=404)
 
-    book = epub.EpubBook()
-    book.set_identifier(f"tezca-{law_id}")
-    book.set_title(law.name)
-    book.set_language("es")
-    book.add_author("Tezca — El Espejo de la Ley")
-
-    style = epub.EpubItem(
-        uid="style",
-        file_name="style/default.css",
-        media_type="text/css",
-        content=b"body { font-family: serif; line-height: 1.6; } "
-        b"h1 { text-align: center; } "
-        b"h2 { color: #2a2a6e; margin-top: 1.5em; } "
-        b".meta { text-align: center; color: #666; font-size: 0.9em; } "
-        b".footer { text-align: center; color: #999; font-size: 0.8em; margin-top: 2em; }",
-    )
-    book.add_item(style)
-
-    # Cover chapter
-    tier_label = _tier_label(law.tier)
-    cover_html = f"<h1>{_epub_escape(law.name)}</h1>"
-    cover_html += f'<p class="meta">Tipo: {_epub_escape(tier_label)}'
-    if law.category:
-        cover_html += f" | Categoría: {_epub_escape(law.category)}"
-    cover_html += f" | {len(articles)} artículos</p>"
-
-    cover = epub.EpubHtml(title="Portada", file_name="cover.xhtml", lang="es")
-    cover.content = cover_html
-    cover.add_item(style)
-    book.add_item(cover)
-
-    # Split articles into chapters (~50 per chapter)
-    chapters = []
-    chunk_size = 50
-    for i in range(0, len(articles), chunk_size):
-        chunk = articles[i : i + chunk_size]
-        first_id = chunk[0]["article_id"]
-        last_id = chunk[-1]["article_id"]
-        ch_title = f"{first_id} — {last_id}" if len(chunk) > 1 else first_id
-
-        html_parts = [f"<h1>{_epub_escape(ch_title)}</h1>"]
-        for art in chunk:
-            html_parts.append(
-                f"<h2>{_epub_escape(art['article_id'])}</h2>"
-                f"<p>{_epub_escape(art['text'])}</p>"
-            )
-
-        ch = epub.EpubHtml(
-            title=ch_title,
-            file_name=f"chapter_{i // chunk_size + 1}.xhtml",
-            lang="es",
+    with timed_render("epub"):
+        book = epub.EpubBook()
+        book.set_identifier(f"tezca-{law_id}")
+        book.set_title(law.name)
+        book.set_language("es")
+        book.add_author("Tezca — El Espejo de la Ley")
+
+        style = epub.EpubItem(
+            uid="style",
+            file_name="style/default.css",
+            media_type="text/css",
+            content=b"body { font-family: serif; line-height: 1.6; } "
+            b"h1 { text-align: center; } "
+            b"h2 { color: #2a2a6e; margin-top: 1.5em; } "
+            b".meta { text-align: center; color: #666; font-size: 0.9em; } "
+            b".footer { text-align: center; color: #999; font-size: 0.8em; margin-top: 2em; }",
         )
-        ch.content = "\n".join(html_parts)
-        ch.add_item(style)
-        book.add_item(ch)
-        chapters.append(ch)
+        book.add_item(style)
+
+        # Cover chapter
+        tier_label = _tier_label(law.tier)
+        cover_html = f"<h1>{_epub_escape(law.name)}</h1>"
+        cover_html += f'<p class="meta">Tipo: {_epub_escape(tier_label)}'
+        if law.category:
+            cover_html += f" | Categoría: {_epub_escape(law.category)}"
+        cover_html += f" | {len(articles)} artículos</p>"
+
+        cover = epub.EpubHtml(title="Portada", file_name="cover.xhtml", lang="es")
+        cover.content = cover_html
+        cover.add_item(style)
+        book.add_item(cover)
+
+        # Split articles into chapters (~50 per chapter)
+        chapters = []
+        chunk_size = 50
+        for i in range(0, len(articles), chunk_size):
+            chunk = articles[i : i + chunk_size]
+            first_id = chunk[0]["article_id"]
+            last_id = chunk[-1]["article_id"]
+            ch_title = f"{first_id} — {last_id}" if len(chunk) > 1 else first_id
+
+            html_parts = [f"<h1>{_epub_escape(ch_title)}</h1>"]
+            for art in chunk:
+                html_parts.append(
+                    f"<h2>{_epub_escape(art['article_id'])}</h2>"
+                    f"<p>{_epub_escape(art['text'])}</p>"
+                )
+
+            ch = epub.EpubHtml(
+                title=ch_title,
+                file_name=f"chapter_{i // chunk_size + 1}.xhtml",
+                lang="es",
+            )
+            ch.content = "\n".join(html_parts)
+            ch.add_item(style)
+            book.add_item(ch)
+            chapters.append(ch)
 
-    # TOC and spine
-    book.toc = [cover] + chapters
-    book.add_item(epub.EpubNcx())
-    book.add_item(epub.EpubNav())
-    book.spine = ["nav", cover] + chapters
+        # TOC and spine
+        book.toc = [cover] + chapters
+        book.add_item(epub.EpubNcx())
+        book.add_item(epub.EpubNav())
+        book.spine = ["nav", cover] + chapters
 
-    buf = io.BytesIO()
-    epub.write_epub(buf, book, {})
-    buf.seek(0)
+        buf = io.BytesIO()
+        epub.write_epub(buf, book, {})
+        buf.seek(0)
 
     safe_name = _safe_filename(law_id)
     log_export(user_id, ip, law_id, "epub", tier)
 
     response = HttpResponse(buf.getvalue(), content_type="application/epub+zip")
     response["Content-Disposition"] = f'attachment; filename="{safe_name}.epub"'
-    response["Cache-Control"] = "public, max-age=3600"
-    return response
+    response["Cache-Control"] = _cache_control("epub")
+    return add_validators(response, validators)
 
 
 def _epub_escape(s: str) -> str:
@@ -606,6 +630,9 @@ def export_json(request, law_id):
     tier, user_id, ip, error = _check_access(request, "json")
     if error:
         return error
+    validators, unchanged = _export_validators(request, law_id, "json")
+    if unchanged is not None:
+        return unchanged
 
     law = get_object_or_404(Law, official_id=law_id)
     articles = _get_articles(law_id)
@@ -613,39 +640,40 @@ def export_json(request, law_id):
     if not articles:
         return Response({"error": "No articles found for this law."}, status=404)
 
-    latest_version = law.versions.order_by("-publication_date").first()
-    pub_date = None
-    if latest_version and latest_version.publication_date:
-        pub_date = str(latest_version.publication_date)
-
-    data = {
-        "meta": {
-            "official_id": law.official_id,
-            "name": law.name,
-            "short_name": law.short_name,
-            "tier": law.tier,
-            "category": law.category,
-            "state": law.state,
-            "status": law.status,
-            "law_type": law.law_type,
-            "publication_date": pub_date,
-            "source_url": law.source_url,
-            "article_count": len(articles),
-            "exported_at": datetime.now().isoformat(),
-            "source": "Tezca — El Espejo de la Ley | tezca.mx",
-        },
-        "articles": articles,
-    }
+    with timed_render("json"):
+        latest_version = law.versions.order_by("-publication_date").first()
+        pub_date = None
+        if latest_version and latest_version.publication_date:
+            pub_date = str(latest_version.publication_date)
+
+        data = {
+            "meta": {
+                "official_id": law.official_id,
+                "name": law.name,
+                "short_name": law.short_name,
+                "tier": law.tier,
+                "category": law.category,
+                "state": law.state,
+                "status": law.status,
+                "law_type": law.law_type,
+                "publication_date": pub_date,
+                "source_url": law.source_url,
+                "article_count": len(articles),
+                "exported_at": datetime.now().isoformat(),
+                "source": "Tezca — El Espejo de la Ley | tezca.mx",
+            },
+            "articles": articles,
+        }
 
-    json_str = json_module.dumps(data, ensure_ascii=False, indent=2)
+        json_str = json_module.dumps(data, ensure_ascii=False, indent=2)
 
     safe_name = _safe_filename(law_id)
     log_export(user_id, ip, law_id, "json", tier)
 
     response = HttpResponse(json_str, content_type="application/json; charset=utf-8")
     response["Content-Disposition"] = f'attachment; filename="{safe_name}.json"'
-    response["Cache-Control"] = "public, max-age=3600"
-    return response
+    response["Cache-Control"] = _cache_control("json")
+    return add_validators(response, validators)
 
 
 @extend_schema(
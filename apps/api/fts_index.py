@@ -0,0 +1,480 @@
+"""
+Embedded SQLite FTS5 index of law articles.
+
+index_laws writes every law's articles here as well as to Elasticsearch.
+Reads switch to it while the ES circuit is open (apps.api.es_circuit).
+With SEARCH_BACKEND=sqlite they use it permanently, which runs the API
+without Elasticsearch for dev, CI and small deployments.
+
+    articles      one row per (law_id, article) in document order, with the
+                  filter columns of the ES articles index
+    articles_fts  external-content FTS5 table over text and tags, kept in
+                  sync by triggers; unicode61 with remove_diacritics folds
+                  accents, so "articulo" matches "artículo"
+
+Queries approximate the ES ones:
+- Query words are OR-ed together.
+- A word of five or more letters matches by prefix once a plural ending
+  is dropped, as a cheap stand-in for the Spanish analyzer.
+- Ranking is BM25 times the authority boost of apps.api.config.
+- Snippets use the same <em> tags as ES highlighting.
+
+The index is a local file (FTS_INDEX_PATH). Readers open it read-only with
+one connection per thread.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+from .config import FTS_INDEX_PATH, SEARCH_BACKEND, authority_boost
+from .cursors import InvalidCursor
+from .suggest_index import normalize
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    law_id TEXT NOT NULL,
+    article TEXT NOT NULL,
+    law_name TEXT,
+    text TEXT,
+    category TEXT,
+    tier TEXT,
+    state TEXT,
+    municipality TEXT,
+    status TEXT,
+    law_type TEXT,
+    book TEXT,
+    title TEXT,
+    chapter TEXT,
+    hierarchy TEXT,
+    publication_date TEXT,
+    tags TEXT,
+    authority REAL NOT NULL DEFAULT 0,
+    boost REAL NOT NULL DEFAULT 1,
+    UNIQUE (law_id, article)
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5 (
+    text, tags,
+    content='articles', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, text, tags)
+    VALUES (new.id, new.text, new.tags);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, text, tags)
+    VALUES ('delete', old.id, old.text, old.tags);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, text, tags)
+    VALUES ('delete', old.id, old.text, old.tags);
+    INSERT INTO articles_fts (rowid, text, tags)
+    VALUES (new.id, new.text, new.tags);
+END;
+"""
+
+# Same fields as the ES article _source written by index_laws
+COLUMNS = (
+    "law_id",
+    "article",
+    "law_name",
+    "text",
+    "category",
+    "tier",
+    "state",
+    "municipality",
+    "status",
+    "law_type",
+    "book",
+    "title",
+    "chapter",
+    "hierarchy",
+    "publication_date",
+    "tags",
+    "authority",
+    "boost",
+)
+
+_INSERT = (
+    f"INSERT INTO articles ({', '.join(COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(COLUMNS))}) "
+    # A repeated article id keeps its first position and its last text, as
+    # in the ES index and the article packs
+    "ON CONFLICT (law_id, article) DO UPDATE SET "
+    + ", ".join(f"{c} = excluded.{c}" for c in COLUMNS[2:])
+)
+
+STOPWORDS = frozenset(
+    "a al con de del el en la las lo los o para por que se su sus u un una y".split()
+)
+_PLURAL_RE = re.compile(r"(?:es|s)$")
+
+# BM25 (negated: higher is better) times the citation authority boost,
+# which is computed once at index time
+SCORE = "-bm25(articles_fts) * a.boost"
+
+# sort param -> (key expression, direction); ties break on document order.
+# Articles without a date sort last either way, as in ES.
+SORTS = {
+    "relevance": ("score", "DESC"),
+    "date_desc": ("COALESCE(publication_date, '')", "DESC"),
+    "date_asc": ("COALESCE(publication_date, '~')", "ASC"),
+    "name": ("law_id", "ASC"),
+}
+
+# Facet name -> (column, max buckets), mirroring SearchView's aggregations
+FACETS = {
+    "by_tier": ("tier", 10),
+    "by_category": ("category", 20),
+    "by_status": ("status", 10),
+    "by_law_type": ("law_type", 10),
+    "by_state": ("state", 35),
+}
+
+SNIPPET = "snippet(articles_fts, 0, '<em>', '</em>', '…', 32)"
+
+
+def preferred():
+    """True when reads should skip Elasticsearch altogether."""
+    return SEARCH_BACKEND == "sqlite"
+
+
+def available():
+    """True when the index file has been built."""
+    return os.path.exists(FTS_INDEX_PATH)
+
+
+# ---------------------------------------------------------------------------
+# Writing (index_laws)
+# ---------------------------------------------------------------------------
+
+
+def connect_writer(path=None):
+    """Open the index for writing, creating the file and schema if needed."""
+    path = path or FTS_INDEX_PATH
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _row(law, source):
+    return (
+        law.official_id,
+        source["article"],
+        source.get("law_name"),
+        source.get("text") or "",
+        source.get("category"),
+        source.get("tier"),
+        source.get("state"),
+        source.get("municipality"),
+        law.status,
+        law.law_type,
+        source.get("book"),
+        source.get("title"),
+        source.get("chapter"),
+        json.dumps(source.get("hierarchy") or [], ensure_ascii=False),
+        source.get("publication_date"),
+        " ".join(source.get("tags") or []),
+        source.get("authority") or 0.0,
+        authority_boost(source.get("authority")),
+    )
+
+
+def index_law(law, sources, conn=None):
+    """
+    Replace a law's articles with the ES _source dicts index_laws built for
+    it, in document order.
+    """
+    own = conn is None
+    conn = conn or connect_writer()
+    try:
+        with conn:
+            conn.execute("DELETE FROM articles WHERE law_id = ?", (law.official_id,))
+            conn.executemany(_INSERT, (_row(law, src) for src in sources))
+    finally:
+        if own:
+            conn.close()
+
+
+def optimize(conn=None):
+    """Merge FTS segments after a bulk run (faster queries, smaller file)."""
+    own = conn is None
+    conn = conn or connect_writer()
+    try:
+        with conn:
+            conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('optimize')")
+    finally:
+        if own:
+            conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+_local = threading.local()
+
+
+def _reader():
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.path != FTS_INDEX_PATH:
+        if conn is not None:
+            conn.close()
+        uri = Path(FTS_INDEX_PATH).resolve().as_uri()
+        conn = sqlite3.connect(f"{uri}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        _local.conn, _local.path = conn, FTS_INDEX_PATH
+    return conn
+
+
+def close():
+    """Close this thread's reader (tests, or after replacing the file)."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+
+def match_expression(query):
+    """FTS5 MATCH expression for a user query, or None if it has no words."""
+    words = normalize(query).split()
+    kept = [w for w in words if w not in STOPWORDS] or words
+    terms = []
+    for word in dict.fromkeys(kept):
+        if len(word) >= 5:
+            terms.append(f'"{_PLURAL_RE.sub("", word)}"*')
+        else:
+            terms.append(f'"{word}"')
+    return " OR ".join(terms) or None
+
+
+def date_range_bounds(date_range):
+    """(lower, upper, upper_inclusive) publication_date bounds for date_range."""
+    from django.utils import timezone
+
+    year = timezone.now().year
+    if date_range == "this_year":
+        return f"{year}-01-01", f"{year}-12-31", True
+    if date_range == "last_year":
+        return f"{year - 1}-01-01", f"{year - 1}-12-31", True
+    if date_range == "last_5_years":
+        return f"{year - 5}-01-01", None, True
+    if date_range == "older":
+        return None, f"{year - 5}-01-01", False
+    return None, None, True
+
+
+def _filter_sql(filters):
+    """WHERE clauses and parameters for SearchView's filter parameters."""
+    clauses, params = [], []
+
+    def active(name):
+        value = filters.get(name)
+        return value if value and value != "all" else None
+
+    for name in ("category", "municipality", "status", "law_type"):
+        if active(name):
+            clauses.append(f"a.{name} = ?")
+            params.append(filters[name])
+
+    if active("jurisdiction"):
+        tiers = [
+            t
+            for t in ("federal", "state", "municipal")
+            if t in filters["jurisdiction"].split(",")
+        ]
+        if tiers:
+            clauses.append(f"a.tier IN ({', '.join('?' * len(tiers))})")
+            params.extend(tiers)
+
+    for name in ("title", "chapter"):
+        if filters.get(name):
+            clauses.append(f"a.{name} LIKE ?")
+            params.append(f"%{filters[name]}%")
+
+    if active("state"):
+        # law_id prefix, e.g. "Colima" -> "colima_", as in the ES query
+        prefix = re.sub(r"([\\%_])", r"\\\1", f"{filters['state'].lower()}_")
+        clauses.append("a.law_id LIKE ? ESCAPE '\\'")
+        params.append(f"{prefix}%")
+
+    if active("date_range"):
+        lower, upper, inclusive = date_range_bounds(filters["date_range"])
+        if lower:
+            clauses.append("a.publication_date >= ?")
+            params.append(lower)
+        if upper:
+            clauses.append(f"a.publication_date {'<=' if inclusive else '<'} ?")
+            params.append(upper)
+
+    return "".join(f" AND {c}" for c in clauses), params
+
+
+def search(query, filters=None, sort="relevance", size=10, offset=0, after=None):
+    """
+    Search articles across laws.
+
+    Args:
+        query: user query text
+        filters: SearchView filter parameters (jurisdiction, category, ...)
+        sort: a key of SORTS
+        size: page size
+        offset: offset pagination start (ignored when `after` is given)
+        after: sort values of the previous page's last hit (cursor mode)
+
+    Returns:
+        {"total", "hits", "facets"}. Each hit holds the article's columns
+        plus "snippet", "score" and "sort" (the values for the next cursor).
+        Facets are computed only for first pages, as in SearchView.
+    """
+    match = match_expression(query)
+    if match is None or not available():
+        return {"total": 0, "hits": [], "facets": {}}
+
+    key, direction = SORTS.get(sort, SORTS["relevance"])
+    where, params = _filter_sql(filters or {})
+    # CROSS JOIN pins the join order: the MATCH drives, filters are checked
+    # per hit. Otherwise SQLite may scan by a filter column and run the full
+    # text query once per row.
+    source = (
+        "FROM articles_fts CROSS JOIN articles a ON a.id = articles_fts.rowid "
+        f"WHERE articles_fts MATCH ?{where}"
+    )
+    params = [match, *params]
+    conn = _reader()
+
+    # Rank narrow (id, score, sort key) rows; full rows only for the page
+    page_sql = (
+        f"SELECT id, score, {key} AS sort_key FROM ("
+        f"SELECT a.id, a.law_id, a.publication_date, {SCORE} AS score {source})"
+    )
+    page_params = list(params)
+    if after is not None:
+        if len(after) != 2:
+            raise InvalidCursor("Cursor does not match this search")
+        op = "<" if direction == "DESC" else ">"
+        page_sql += f" WHERE {key} {op} ? OR ({key} = ? AND id > ?)"
+        page_params += [after[0], after[0], after[1]]
+    page_sql += f" ORDER BY sort_key {direction}, id LIMIT ?"
+    page_params.append(size)
+    if after is None:
+        page_sql += " OFFSET ?"
+        page_params.append(offset)
+    ranked = conn.execute(page_sql, page_params).fetchall()
+
+    hits = []
+    if ranked:
+        ids = [row["id"] for row in ranked]
+        marks = ", ".join("?" * len(ids))
+        rows = {
+            row["id"]: row
+            for row in conn.execute(
+                f"SELECT * FROM articles WHERE id IN ({marks})", ids
+            )
+        }
+        snippets = dict(
+            conn.execute(
+                f"SELECT rowid, {SNIPPET} FROM articles_fts "
+                f"WHERE articles_fts MATCH ? AND rowid IN ({marks})",
+                [match, *ids],
+            ).fetchall()
+        )
+        for rank in ranked:
+            hit = dict(rows[rank["id"]])
+            hit["hierarchy"] = json.loads(hit["hierarchy"] or "[]")
+            hit["snippet"] = snippets.get(hit["id"]) or hit["text"][:200]
+            hit["score"] = rank["score"]
+            hit["sort"] = [rank["sort_key"], hit["id"]]
+            hits.append(hit)
+
+    if after is not None:
+        total = conn.execute(f"SELECT COUNT(*) {source}", params).fetchone()[0]
+        return {"total": total, "hits": hits, "facets": {}}
+
+    # One pass over the matches gives every facet and the total
+    columns = [column for column, _ in FACETS.values()]
+    groups = conn.execute(
+        f"SELECT {', '.join(f'a.{c}' for c in columns)}, COUNT(*) {source} "
+        f"GROUP BY {', '.join(f'a.{c}' for c in columns)}",
+        params,
+    ).fetchall()
+    facets = {}
+    for i, (name, (_, limit)) in enumerate(FACETS.items()):
+        counts = {}
+        for group in groups:
+            if group[i] is not None:
+                counts[group[i]] = counts.get(group[i], 0) + group[-1]
+        buckets = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]
+        facets[name] = [{"key": k, "count": n} for k, n in buckets]
+
+    return {"total": sum(group[-1] for group in groups), "hits": hits, "facets": facets}
+
+
+def search_law(law_id, query, size=50):
+    """Search within one law: {"total", "hits": [{article, snippet, score}]}."""
+    match = match_expression(query)
+    if match is None or not available():
+        return {"total": 0, "hits": []}
+
+    conn = _reader()
+    source = (
+        "FROM articles_fts CROSS JOIN articles a ON a.id = articles_fts.rowid "
+        "WHERE articles_fts MATCH ? AND a.law_id = ?"
+    )
+    rows = conn.execute(
+        f"SELECT a.article, {SNIPPET} AS snippet, -bm25(articles_fts) AS score "
+        f"{source} ORDER BY score DESC, a.id LIMIT ?",
+        [match, law_id, size],
+    ).fetchall()
+    total = conn.execute(f"SELECT COUNT(*) {source}", [match, law_id]).fetchone()[0]
+    return {"total": total, "hits": [dict(row) for row in rows]}
+
+
+def law_articles(law_id, offset=0, limit=500, after=None):
+    """
+    A law's articles in document order, as [{"article_id", "text"}].
+
+    `after` is the article id the previous page ended on (cursor mode);
+    InvalidCursor if the law has no such article.
+    """
+    if not available():
+        return []
+
+    conn = _reader()
+    start = 0
+    if after is not None:
+        row = conn.execute(
+            "SELECT id FROM articles WHERE law_id = ? AND article = ?",
+            [law_id, after],
+        ).fetchone()
+        if row is None:
+            raise InvalidCursor("Cursor does not match an article")
+        start, offset = row[0], 0
+    rows = conn.execute(
+        "SELECT article, text FROM articles WHERE law_id = ? AND id > ? "
+        "ORDER BY id LIMIT ? OFFSET ?",
+        [law_id, start, limit, offset],
+    ).fetchall()
+    return [{"article_id": article, "text": text} for article, text in rows]
+
+
+def articles_by_id(pairs):
+    """{(law_id, article_id): text} for the (law_id, article_id) pairs found."""
+    if not pairs or not available():
+        return {}
+    conn = _reader()
+    values = ", ".join(["(?, ?)"] * len(pairs))
+    rows = conn.execute(
+        "SELECT law_id, article, text FROM articles "
+        f"WHERE (law_id, article) IN (VALUES {values})",
+        [value for pair in pairs for value in pair],
+    ).fetchall()
+    return {(law_id, article): text for law_id, article, text in rows}
@@ -0,0 +1,187 @@
+"""
+Law listing with filters, page-number and keyset pagination.
+"""
+
+from datetime import date
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q, Value
+from django.db.models.functions import Lower
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .cursors import InvalidCursor, decode_cursor, encode_cursor
+from .models import Law
+from .schema import LawListItemSchema
+
+
+class LawListPagination(PageNumberPagination):
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+
+# sort param -> (field, descending). Every ordering ends with official_id so
+# keyset cursors have a unique tie-breaker.
+LAW_LIST_SORTS = {
+    "name_asc": ("official_id", False),
+    "name_desc": ("official_id", True),
+    "date_desc": ("latest_publication_date", True),
+    "date_asc": ("latest_publication_date", False),
+    "article_count": ("version_count", True),
+}
+
+LAW_LIST_FIELDS = (
+    "official_id",
+    "name",
+    "short_name",
+    "tier",
+    "law_type",
+    "category",
+    "status",
+    "version_count",
+    "latest_publication_date",
+)
+
+
+def _law_list_ordering(field, descending):
+    if field == "official_id":
+        return ["-official_id" if descending else "official_id"]
+    expr = (
+        F(field).desc(nulls_last=True) if descending else F(field).asc(nulls_last=True)
+    )
+    return [expr, "official_id"]
+
+
+def _law_list_cursor_value(law, field):
+    value = getattr(law, field)
+    return value.isoformat() if isinstance(value, date) else value
+
+
+def _law_list_keyset(field, descending, cursor):
+    """
+    Build the WHERE clause for rows after the cursor.
+
+    Rows with a NULL sort value are ordered last, after every non-NULL row.
+    """
+    search_after, _ = decode_cursor(cursor)
+    if field == "official_id":
+        if len(search_after) != 1 or not isinstance(search_after[0], str):
+            raise InvalidCursor("Cursor does not match sort")
+        last_id = search_after[0]
+        return Q(official_id__lt=last_id) if descending else Q(official_id__gt=last_id)
+
+    if len(search_after) != 2 or not isinstance(search_after[1], str):
+        raise InvalidCursor("Cursor does not match sort")
+    value, last_id = search_after
+    if value is None:
+        return Q(**{f"{field}__isnull": True, "official_id__gt": last_id})
+    try:
+        value = Law._meta.get_field(field).to_python(value)
+    except ValidationError as e:
+        raise InvalidCursor("Cursor does not match sort") from e
+
+    op = "lt" if descending else "gt"
+    return (
+        Q(**{f"{field}__{op}": value})
+        | Q(**{field: value, "official_id__gt": last_id})
+        | Q(**{f"{field}__isnull": True})
+    )
+
+
+class LawListView(APIView):
+    pagination_class = LawListPagination
+
+    @extend_schema(
+        tags=["Laws"],
+        summary="List all laws",
+        description=(
+            "Returns paginated list of laws with basic metadata. Supports filtering "
+            "by tier, state, category, status, and name search. Pass `cursor` "
+            "(empty to start, then `next_cursor`) for keyset pagination."
+        ),
+        responses={200: LawListItemSchema(many=True)},
+    )
+    def get(self, request):
+        qs = Law.objects.only(*LAW_LIST_FIELDS)
+
+        sort = request.query_params.get("sort", "name_asc")
+        field, descending = LAW_LIST_SORTS.get(sort, LAW_LIST_SORTS["name_asc"])
+        qs = qs.order_by(*_law_list_ordering(field, descending))
+
+        # Filtering
+        tier = request.query_params.get("tier")
+        if tier:
+            qs = qs.filter(tier=tier)
+
+        # Case-insensitive equality via LOWER() so the functional indexes apply
+        state = request.query_params.get("state")
+        if state:
+            qs = qs.alias(state_lower=Lower("state")).filter(
+                state_lower=Lower(Value(state))
+            )
+
+        category = request.query_params.get("category")
+        if category:
+            qs = qs.alias(category_lower=Lower("category")).filter(
+                category_lower=Lower(Value(category))
+            )
+
+        law_status = request.query_params.get("status")
+        if law_status:
+            qs = qs.filter(status=law_status)
+
+        law_type = request.query_params.get("law_type")
+        if law_type and law_type != "all":
+            qs = qs.filter(law_type=law_type)
+
+        q = request.query_params.get("q")
+        if q:
+            qs = qs.filter(name__icontains=q)
+
+        paginator = self.pagination_class()
+
+        cursor = request.query_params.get("cursor")
+        if cursor is not None:
+            # Keyset mode: no COUNT(*) and no OFFSET scan, constant cost per page
+            page_size = paginator.get_page_size(request)
+            try:
+                if cursor:
+                    qs = qs.filter(_law_list_keyset(field, descending, cursor))
+            except InvalidCursor:
+                return Response(
+                    {"error": "Invalid cursor."}, status=status.HTTP_400_BAD_REQUEST
+                )
+            page = list(qs[:page_size])
+            next_cursor = None
+            if len(page) == page_size:
+                last = page[-1]
+                search_after = [last.official_id]
+                if field != "official_id":
+                    search_after.insert(0, _law_list_cursor_value(last, field))
+                next_cursor = encode_cursor(search_after)
+            return Response(
+                {
+                    "results": [self._serialize(law) for law in page],
+                    "next_cursor": next_cursor,
+                }
+            )
+
+        page = paginator.paginate_queryset(qs, request)
+        data = [self._serialize(law) for law in page]
+        return paginator.get_paginated_response(data)
+
+    @staticmethod
+    def _serialize(law):
+        return {
+            "id": law.official_id,
+            "name": law.short_name or law.name,
+            "tier": law.tier,
+            "law_type": law.law_type,
+            "category": law.category,
+            "status": law.status,
+            "versions": law.version_count,
+        }
@@ -2,12 +2,12 @@ import json
 import os
 import re
 
-from django.db.models import Count
+from django.db.models import Count, Sum
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.decorators import api_view
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
@@ -16,7 +16,6 @@ from .schema import (
     ErrorSchema,
     LawArticlesSchema,
     LawDetailSchema,
-    LawListItemSchema,
     LawStatsSchema,
     LawStructureSchema,
     StatesListSchema,
@@ -32,7 +31,14 @@ def _natural_sort_key(text: str):
     return [int(p) if p.isdigit() else p.lower() for p in parts]
 
 
-from .config import ES_HOST, INDEX_NAME, es_client
+from . import es_queries, fts_index
+from .article_packs import get_pack
+from .conditional import law_conditional
+from .config import ES_HOST, es_client
+from .cursors import InvalidCursor, decode_cursor, encode_cursor, offset_exceeds_window
+from .es_circuit import SearchUnavailable, call_es
+from .metrics import record_cache
+from .related_laws import live_related, stored_related
 
 
 class LawDetailView(APIView):
@@ -42,267 +48,112 @@ class LawDetailView(APIView):
         description="Retrieve full metadata for a single law including versions.",
         responses={200: LawDetailSchema, 404: ErrorSchema},
     )
+    @method_decorator(law_conditional("detail"))
     def get(self, request, law_id):
-        # 1. Get Law
         law = get_object_or_404(Law, official_id=law_id)
-
-        # 2. Get Versions
         versions = law.versions.all().order_by("-publication_date")
-
-        # 3. Extract state from official_id (for state laws)
-        state = None
-        if law.tier == "state" and "_" in law_id:
-            state = law_id.split("_")[0].replace("_", " ").title()
-
-        # 4. Get article count from Elasticsearch
-        article_count = 0
-        es_degraded = False
-        try:
-            es = es_client
-            if es.ping():
-                count_res = es.count(
-                    index=INDEX_NAME,
-                    body={"query": {"match_phrase": {"law_id": law.official_id}}},
-                )
-                article_count = count_res.get("count", 0)
-            else:
-                es_degraded = True
-        except Exception:
-            import logging
-
-            logging.getLogger(__name__).warning(
-                "ES unavailable for law detail %s", law_id, exc_info=True
-            )
-            es_degraded = True
-
-        # 5. Format Response
-        data = {
-            "id": law.official_id,
-            "name": law.name,
-            "short_name": law.short_name,
-            "category": law.category,
-            "tier": law.tier,
-            "law_type": law.law_type,
-            "state": state,
-            "status": law.status,
-            "last_verified": law.last_verified,
-            "source_url": law.source_url,
-            "versions": [
-                {
-                    "publication_date": v.publication_date,
-                    "valid_from": v.valid_from,
-                    "valid_to": v.valid_to,
-                    "dof_url": v.dof_url,
-                    "change_summary": v.change_summary,
-                    "xml_file": (
-                        v.xml_file_path.split("/")[-1] if v.xml_file_path else None
-                    ),
-                }
-                for v in versions
-            ],
-            "articles": article_count,
-            "grade": None,
-            "score": None,
-        }
-
-        if es_degraded:
-            data["degraded"] = True
-
-        response = Response(data)
-        response["Cache-Control"] = "public, max-age=3600"
-        return response
-
-
-class LawListPagination(PageNumberPagination):
-    page_size = 50
-    page_size_query_param = "page_size"
-    max_page_size = 200
-
-
-class LawListView(APIView):
-    pagination_class = LawListPagination
-
-    @extend_schema(
-        tags=["Laws"],
-        summary="List all laws",
-        description="Returns paginated list of laws with basic metadata. Supports filtering by tier, state, category, status, and name search.",
-        responses={200: LawListItemSchema(many=True)},
-    )
-    def get(self, request):
-        qs = Law.objects.annotate(version_count=Count("versions"))
-
-        # Sort param
-        sort = request.query_params.get("sort", "name_asc")
-        sort_map = {
-            "name_asc": "official_id",
-            "name_desc": "-official_id",
-            "date_desc": "-versions__publication_date",
-            "date_asc": "versions__publication_date",
-            "article_count": "-version_count",
-        }
-        ordering = sort_map.get(sort, "official_id")
-        qs = qs.order_by(ordering)
-
-        # Filtering
-        tier = request.query_params.get("tier")
-        if tier:
-            qs = qs.filter(tier=tier)
-
-        state = request.query_params.get("state")
-        if state:
-            qs = qs.filter(state__iexact=state)
-
-        category = request.query_params.get("category")
-        if category:
-            qs = qs.filter(category__iexact=category)
-
-        law_status = request.query_params.get("status")
-        if law_status:
-            qs = qs.filter(status=law_status)
-
-        law_type = request.query_params.get("law_type")
-        if law_type and law_type != "all":
-            qs = qs.filter(law_type=law_type)
-
-        q = request.query_params.get("q")
-        if q:
-            qs = qs.filter(name__icontains=q)
-
-        paginator = self.pagination_class()
-        page = paginator.paginate_queryset(qs, request)
-
-        data = [
+        return _law_detail_response(law, versions)
+
+
+def _law_detail_response(law, versions):
+    """LawDetailView body from the law and its versions, newest first."""
+    law_id = law.official_id
+
+    # Extract state from official_id (for state laws)
+    state = None
+    if law.tier == "state" and "_" in law_id:
+        state = law_id.split("_")[0].replace("_", " ").title()
+
+    # Article count stored by index_laws
+    data = {
+        "id": law.official_id,
+        "name": law.name,
+        "short_name": law.short_name,
+        "category": law.category,
+        "tier": law.tier,
+        "law_type": law.law_type,
+        "state": state,
+        "status": law.status,
+        "last_verified": law.last_verified,
+        "source_url": law.source_url,
+        "versions": [
             {
-                "id": law.official_id,
-                "name": law.short_name or law.name,
-                "tier": law.tier,
-                "law_type": law.law_type,
-                "category": law.category,
-                "status": law.status,
-                "versions": law.version_count,
+                "publication_date": v.publication_date,
+                "valid_from": v.valid_from,
+                "valid_to": v.valid_to,
+                "dof_url": v.dof_url,
+                "change_summary": v.change_summary,
+                "xml_file": (
+                    v.xml_file_path.split("/")[-1] if v.xml_file_path else None
+                ),
             }
-            for law in page
-        ]
-        return paginator.get_paginated_response(data)
+            for v in versions
+        ],
+        "articles": law.article_count,
+        "grade": None,
+        "score": None,
+    }
+
+    response = Response(data)
+    response["Cache-Control"] = "public, max-age=3600"
+    return response
 
 
 class RelatedLawsView(APIView):
     @extend_schema(
         tags=["Laws"],
         summary="Get related laws",
-        description="Find thematically related laws using Elasticsearch more_like_this.",
+        description="Thematically related laws (Elasticsearch more_like_this, precomputed nightly).",
         responses={200: dict, 404: ErrorSchema},
     )
     def get(self, request, law_id):
         law = get_object_or_404(Law, official_id=law_id)
 
-        related = []
-        try:
-            es = es_client
-            if es.ping():
-                # Get first 3 article texts for similarity context
-                articles_body = {
-                    "query": {"match_phrase": {"law_id": law.official_id}},
-                    "sort": [{"article": "asc"}],
-                    "_source": ["text"],
-                    "size": 3,
-                }
-                articles_res = es.search(index=INDEX_NAME, body=articles_body)
-                article_texts = [
-                    hit["_source"]["text"][:500]
-                    for hit in articles_res["hits"]["hits"]
-                    if hit["_source"].get("text")
-                ]
-
-                like_text = f"{law.name} {' '.join(article_texts)}"
-
-                mlt_body = {
-                    "query": {
-                        "bool": {
-                            "must": [
-                                {
-                                    "more_like_this": {
-                                        "fields": ["law_name", "text"],
-                                        "like": like_text,
-                                        "min_term_freq": 1,
-                                        "min_doc_freq": 1,
-                                        "max_query_terms": 25,
-                                    }
-                                }
-                            ],
-                            "must_not": [{"match_phrase": {"law_id": law.official_id}}],
-                        }
-                    },
-                    "aggs": {
-                        "by_law": {
-                            "terms": {"field": "law_id", "size": 8},
-                            "aggs": {
-                                "top_hit": {
-                                    "top_hits": {
-                                        "_source": [
-                                            "law_name",
-                                            "tier",
-                                            "category",
-                                            "state",
-                                        ],
-                                        "size": 1,
-                                    }
-                                }
-                            },
-                        }
-                    },
-                    "size": 0,
-                }
-
-                mlt_res = es.search(index=INDEX_NAME, body=mlt_body)
-                buckets = (
-                    mlt_res.get("aggregations", {}).get("by_law", {}).get("buckets", [])
+        # Precomputed nightly (apps.api.related_laws); laws indexed since
+        # the last rebuild are queried live
+        related = stored_related(law.official_id)
+        if related is None:
+            related = []
+            try:
+                es = es_client
+                if es.ping():
+                    related = live_related(es, law)
+            except Exception:
+                import logging
+
+                logging.getLogger(__name__).warning(
+                    "ES unavailable for related laws %s", law_id, exc_info=True
                 )
 
-                for bucket in buckets:
-                    top = bucket["top_hit"]["hits"]["hits"]
-                    if not top:
-                        continue
-                    src = top[0]["_source"]
-                    related.append(
-                        {
-                            "law_id": bucket["key"],
-                            "name": src.get("law_name", bucket["key"]),
-                            "tier": src.get("tier", ""),
-                            "category": src.get("category", ""),
-                            "state": src.get("state"),
-                            "score": round(bucket["doc_count"], 1),
-                        }
-                    )
-        except Exception:
-            import logging
-
-            logging.getLogger(__name__).warning(
-                "ES unavailable for related laws %s", law_id, exc_info=True
-            )
-
-        # Fallback: if ES returned nothing, use DB same-category same-tier laws
         if not related:
-            fallback_qs = (
-                Law.objects.filter(category=law.category, tier=law.tier)
-                .exclude(official_id=law.official_id)
-                .order_by("name")[:8]
-            )
-            related = [
-                {
-                    "law_id": r.official_id,
-                    "name": r.short_name or r.name,
-                    "tier": r.tier,
-                    "category": r.category,
-                    "state": None,
-                    "score": 0,
-                }
-                for r in fallback_qs
-            ]
+            related = _related_fallback(law)
+        return _related_response(law_id, related)
 
-        response = Response({"law_id": law_id, "related": related})
-        response["Cache-Control"] = "public, max-age=3600"
-        return response
+
+def _related_fallback(law):
+    """Same-category same-tier laws, most cited first (ES returned nothing)."""
+    fallback_qs = (
+        Law.objects.filter(category=law.category, tier=law.tier)
+        .exclude(official_id=law.official_id)
+        .order_by("-authority_score", "name")[:8]
+    )
+    return [
+        {
+            "law_id": r.official_id,
+            "name": r.short_name or r.name,
+            "tier": r.tier,
+            "category": r.category,
+            "state": None,
+            "score": 0,
+        }
+        for r in fallback_qs
+    ]
+
+
+def _related_response(law_id, related):
+    response = Response({"law_id": law_id, "related": related})
+    response["Cache-Control"] = "public, max-age=3600"
+    return response
 
 
 @api_view(["GET"])
@@ -359,53 +210,177 @@ def law_search(request, law_id):
     law = get_object_or_404(Law, official_id=law_id)
 
     try:
+        if fts_index.preferred():
+            return _fts_law_search_response(law, q)
+
         es = es_client
-        body = {
-            "query": {
-                "bool": {
-                    "must": [
-                        {"match_phrase": {"law_id": law.official_id}},
-                        {"match": {"text": {"query": q, "fuzziness": "AUTO"}}},
-                    ]
-                }
-            },
-            "highlight": {"fields": {"text": {"fragment_size": 200}}},
-            "size": 50,
+        res = call_es(es.search, **es_queries.law_text_search(law.official_id, q))
+        return _es_law_search_response(law_id, q, res)
+    except SearchUnavailable:
+        if fts_index.available():
+            return _fts_law_search_response(law, q)
+        return _search_unavailable()
+    except Exception:
+        import logging
+
+        logging.getLogger(__name__).exception("law_search failed for %s", law_id)
+        return Response(
+            {"error": "An internal error occurred while searching."},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+def _es_law_search_response(law_id, q, res):
+    """law_search body from an ES law_text_search response."""
+    results = []
+    for hit in res["hits"]["hits"]:
+        source = hit["_source"]
+        highlights = hit.get("highlight", {}).get("text", [])
+        results.append(
+            {
+                "article_id": source.get("article"),
+                "snippet": (
+                    highlights[0] if highlights else source.get("text", "")[:200]
+                ),
+                "score": hit["_score"],
+            }
+        )
+
+    return Response(
+        {
+            "law_id": law_id,
+            "query": q,
+            "total": res["hits"]["total"]["value"],
+            "results": results,
         }
+    )
 
-        res = es.search(index=INDEX_NAME, body=body)
 
-        results = []
-        for hit in res["hits"]["hits"]:
-            source = hit["_source"]
-            highlights = hit.get("highlight", {}).get("text", [])
-            results.append(
+def _search_unavailable():
+    return Response(
+        {"error": "Search engine unavailable. Try again shortly."},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
+
+def _fts_law_search_response(law, q):
+    """law_search from the SQLite FTS5 index (ES down or not deployed)."""
+    res = fts_index.search_law(law.official_id, q)
+    response = Response(
+        {
+            "law_id": law.official_id,
+            "query": q,
+            "total": res["total"],
+            "results": [
                 {
-                    "article_id": source.get("article"),
-                    "snippet": (
-                        highlights[0] if highlights else source.get("text", "")[:200]
-                    ),
-                    "score": hit["_score"],
+                    "article_id": hit["article"],
+                    "snippet": hit["snippet"],
+                    "score": hit["score"],
                 }
-            )
+                for hit in res["hits"]
+            ],
+        }
+    )
+    response["X-Search-Engine"] = "sqlite"
+    return response
+
 
+def _fts_articles_response(law, page_size, offset, cursor_mode, cursor):
+    """law_articles from the SQLite FTS5 index: document order, pack cursors."""
+    try:
+        after = None
+        if cursor:
+            search_after, _ = decode_cursor(cursor)
+            if len(search_after) != 1:
+                raise InvalidCursor("Cursor does not match an article")
+            after = search_after[0]
+        articles = fts_index.law_articles(law.official_id, offset, page_size, after)
+    except InvalidCursor:
         return Response(
+            {"error": "Invalid cursor."}, status=status.HTTP_400_BAD_REQUEST
+        )
+
+    data = {
+        "law_id": law.official_id,
+        "law_name": law.name,
+        "total": len(articles),
+        "articles": articles,
+    }
+    if cursor_mode:
+        data["next_cursor"] = (
+            encode_cursor([articles[-1]["article_id"]])
+            if len(articles) == page_size
+            else None
+        )
+
+    response = Response(data)
+    response["X-Search-Engine"] = "sqlite"
+    return response
+
+
+def _pack_articles_response(law, pack, page_size, offset, cursor_mode, cursor):
+    """law_articles from an ArticlePack: document order, same cursor format."""
+    if cursor:
+        search_after, _ = decode_cursor(cursor)
+        position = pack.index_of(search_after[0]) if len(search_after) == 1 else None
+        if position is None:
+            raise InvalidCursor("Cursor does not match an article")
+        offset = position + 1
+
+    articles = pack.articles(offset, offset + page_size)
+    data = {
+        "law_id": law.official_id,
+        "law_name": law.name,
+        "total": len(articles),
+        "articles": articles,
+    }
+    if cursor_mode:
+        more = offset + page_size < len(pack)
+        data["next_cursor"] = (
+            encode_cursor([articles[-1]["article_id"]]) if more else None
+        )
+
+    response = Response(data)
+    response["Cache-Control"] = "public, max-age=3600"
+    return response
+
+
+def _es_articles_response(law, res, page_size, cursor_mode):
+    """law_articles from an ES law_articles response, in natural article order."""
+    hits = res["hits"]["hits"]
+
+    articles = []
+    seen = set()
+    for hit in hits:
+        source = hit["_source"]
+        aid = source.get("article")
+        if aid in seen:
+            continue
+        seen.add(aid)
+        articles.append(
             {
-                "law_id": law_id,
-                "query": q,
-                "total": res["hits"]["total"]["value"],
-                "results": results,
+                "article_id": aid,
+                "text": source.get("text"),
             }
         )
-    except Exception:
-        import logging
 
-        logging.getLogger(__name__).exception("law_search failed for %s", law_id)
-        return Response(
-            {"error": "An internal error occurred while searching."},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    articles.sort(key=lambda a: _natural_sort_key(a.get("article_id", "")))
+
+    data = {
+        "law_id": law.official_id,
+        "law_name": law.name,
+        "total": len(articles),
+        "articles": articles,
+    }
+    if cursor_mode:
+        data["next_cursor"] = (
+            encode_cursor(hits[-1]["sort"]) if len(hits) == page_size else None
         )
 
+    response = Response(data)
+    response["Cache-Control"] = "public, max-age=3600"
+    return response
+
 
 @extend_schema(
     tags=["Laws"],
@@ -414,6 +389,7 @@ def law_search(request, law_id):
     responses={200: LawArticlesSchema, 500: ErrorSchema},
 )
 @api_view(["GET"])
+@law_conditional("articles")
 def law_articles(request, law_id):
     """Get all articles for a law from Elasticsearch."""
     try:
@@ -425,46 +401,55 @@ def law_articles(request, law_id):
         page_size = min(max(1, int(request.query_params.get("page_size", 500))), 1000)
         offset = (page - 1) * page_size
 
-        # Query Elasticsearch
-        es = es_client
+        # Cursor mode: `article` is unique within a law (doc ids are
+        # "{law_id}-{article}"), so it is a stable search_after key on its own.
+        cursor = request.query_params.get("cursor")
+        cursor_mode = cursor is not None
 
-        body = {
-            "query": {"match_phrase": {"law_id": law.official_id}},
-            "sort": [{"article": {"order": "asc"}}],
-            "from": offset,
-            "size": page_size,
-        }
+        # Served from the law's article pack when index_laws has built one
+        pack = get_pack(law.official_id)
+        if pack is not None:
+            return _pack_articles_response(
+                law, pack, page_size, offset, cursor_mode, cursor
+            )
+        if fts_index.preferred():
+            return _fts_articles_response(law, page_size, offset, cursor_mode, cursor)
 
-        res = es.search(index=INDEX_NAME, body=body)
+        # Query Elasticsearch
+        es = es_client
 
-        articles = []
-        seen = set()
-        for hit in res["hits"]["hits"]:
-            source = hit["_source"]
-            aid = source.get("article")
-            if aid in seen:
-                continue
-            seen.add(aid)
-            articles.append(
+        search_after = None
+        if cursor_mode:
+            if cursor:
+                search_after, _ = decode_cursor(cursor)
+        elif offset_exceeds_window(offset, page_size):
+            return Response(
                 {
-                    "article_id": aid,
-                    "text": source.get("text"),
-                }
+                    "error": "Page too deep for offset pagination. "
+                    "Use the 'cursor' parameter instead."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-        articles.sort(key=lambda a: _natural_sort_key(a.get("article_id", "")))
-
-        response = Response(
-            {
-                "law_id": law_id,
-                "law_name": law.name,
-                "total": len(articles),
-                "articles": articles,
-            }
+        res = call_es(
+            es.search,
+            **es_queries.law_articles(
+                law.official_id,
+                page_size,
+                offset=None if cursor_mode else offset,
+                search_after=search_after,
+            ),
         )
-        response["Cache-Control"] = "public, max-age=3600"
-        return response
+        return _es_articles_response(law, res, page_size, cursor_mode)
 
+    except InvalidCursor:
+        return Response(
+            {"error": "Invalid cursor."}, status=status.HTTP_400_BAD_REQUEST
+        )
+    except SearchUnavailable:
+        if fts_index.available():
+            return _fts_articles_response(law, page_size, offset, cursor_mode, cursor)
+        return _search_unavailable()
     except Exception:
         import logging
 
@@ -482,6 +467,7 @@ def law_articles(request, law_id):
     responses={200: LawStructureSchema, 500: ErrorSchema},
 )
 @api_view(["GET"])
+@law_conditional("structure")
 def law_structure(request, law_id):
     """
     Get the hierarchical structure (Book > Title > Chapter) of a law.
@@ -500,14 +486,7 @@ def law_structure(request, law_id):
         # Fix: We will rely on simple aggregation? No, aggregation buckets keys are sorted alphanumeric.
 
         # Strategy: Fetch *all* hits (up to 10k), and build tree.
-        body = {
-            "query": {"match_phrase": {"law_id": law.official_id}},
-            "sort": [{"article": "asc"}],  # Imperfect but needed for consistency
-            "_source": ["hierarchy", "text", "article"],
-            "size": 10000,
-        }
-
-        res = es.search(index=INDEX_NAME, body=body)
+        res = es.search(**es_queries.law_hierarchy(law.official_id))
 
         # Build Tree
         root = []
@@ -595,24 +574,19 @@ def municipalities_list(request):
 
 @api_view(["GET"])
 def suggest(request):
-    """Lightweight law-name autocomplete. Returns top 8 matches."""
+    """
+    Law-name autocomplete. Returns top 8 matches.
+
+    Accent-insensitive prefix and word-prefix matching against the
+    in-process suggest index (no DB scan per keystroke).
+    """
+    from .suggest_index import get_index
+
     q = request.query_params.get("q", "").strip()
     if len(q) < 2:
         return Response({"suggestions": []})
 
-    laws = (
-        Law.objects.filter(name__icontains=q)
-        .values("official_id", "name", "tier")
-        .order_by("name")[:8]
-    )
-    response = Response(
-        {
-            "suggestions": [
-                {"id": law["official_id"], "name": law["name"], "tier": law["tier"]}
-                for law in laws
-            ]
-        }
-    )
+    response = Response({"suggestions": get_index().search(q, limit=8)})
     response["Cache-Control"] = "public, max-age=300"
     return response
 
@@ -639,7 +613,9 @@ def _load_universe_registry():
     try:
         mtime = os.path.getmtime(REGISTRY_PATH)
         if _registry_cache["data"] is not None and _registry_cache["mtime"] == mtime:
+            record_cache("universe_registry", hit=True)
             return _registry_cache["data"]
+        record_cache("universe_registry", hit=False)
         with open(REGISTRY_PATH, "r", encoding="utf-8") as f:
             data = json.load(f)
         _registry_cache["data"] = data
@@ -657,7 +633,21 @@ def _load_universe_registry():
 )
 @api_view(["GET"])
 def law_stats(request):
-    """Get global statistics for the dashboard."""
+    """Get global statistics for the dashboard (served from the snapshot)."""
+    from .snapshots import get_snapshot
+
+    response = Response(get_snapshot("law_stats"))
+    response["Cache-Control"] = "public, max-age=300"
+    return response
+
+
+def compute_law_stats():
+    """
+    Aggregate the homepage statistics.
+
+    Expensive (DB counts and sums, registry read); only called by the
+    snapshot refresh task, never per request.
+    """
     total_laws = Law.objects.count()
     federal_count = Law.objects.filter(tier="federal").count()
     state_count = Law.objects.filter(tier="state").count()
@@ -665,23 +655,8 @@ def law_stats(request):
     legislative_count = Law.objects.filter(law_type="legislative").count()
     non_legislative_count = Law.objects.filter(law_type="non_legislative").count()
 
-    # Article count from Elasticsearch
-    total_articles = 0
-    es_degraded = False
-    try:
-        es = es_client
-        if es.ping():
-            count_res = es.count(index=INDEX_NAME)
-            total_articles = count_res.get("count", 0)
-        else:
-            es_degraded = True
-    except Exception:
-        import logging
-
-        logging.getLogger(__name__).warning(
-            "ES unavailable for law_stats", exc_info=True
-        )
-        es_degraded = True
+    # Article total from the per-law counts index_laws stores
+    total_articles = Law.objects.aggregate(total=Sum("article_count"))["total"] or 0
 
     # Load universe registry for honest coverage numbers
     registry = _load_universe_registry()
@@ -793,7 +768,4 @@ def law_stats(request):
     if coverage is not None:
         response_data["coverage"] = coverage
 
-    if es_degraded:
-        response_data["degraded"] = True
-
-    return Response(response_data)
+    return response_data
@@ -2,6 +2,12 @@
 Management command to index ALL laws (Federal, State, Municipal) in Elasticsearch.
 Parses V2 AKN XML to extract rich hierarchy (Book, Title, Chapter).
 Falls back to raw text indexing for laws without AKN XML.
+Articles are also written to the SQLite FTS5 fallback index
+(apps.api.fts_index); with SEARCH_BACKEND=sqlite, ES is skipped entirely.
+Article docs are routed by law_id; `articles` is an alias that
+reindex_articles moves to a rebuilt index. Into a legacy concrete
+`articles` index (built before routing) docs are written unrouted until
+reindex_articles has migrated it.
 
 Usage:
     python manage.py index_laws --all
@@ -10,24 +16,117 @@ Usage:
     python manage.py index_laws --all --tier state
 """
 
+import io
 import re
+import sqlite3
+from datetime import datetime
+from datetime import timezone as dt_timezone
 
 from django.core.management.base import BaseCommand
+from django.db.models import Max
+from django.utils import timezone
 from elasticsearch import Elasticsearch, helpers
 from lxml import etree
 
-from apps.api.models import Law
-from apps.api.utils.paths import ES_HOST, read_data_content
+from apps.api import fts_index
+from apps.api.article_packs import write_pack
+from apps.api.config import ES_ARTICLE_SHARDS
+from apps.api.models import ArticleAuthority, Law
+from apps.api.utils.paths import ES_HOST, open_data_stream
+from apps.parsers.patterns.registry import register
 
 INDEX_LAWS = "laws"
 INDEX_ARTICLES = "articles"
 
+ARTICLES_INDEX_BODY = {
+    "settings": {
+        "number_of_shards": ES_ARTICLE_SHARDS,
+        "analysis": {
+            "analyzer": {
+                "spanish_legal": {
+                    "type": "spanish",
+                    "stopwords": "_spanish_",
+                }
+            }
+        },
+    },
+    "mappings": {
+        # Article docs are routed by law_id so that single-law reads and
+        # counts hit one shard; cross-law search still fans out
+        "_routing": {"required": True},
+        "properties": {
+            "law_id": {"type": "keyword"},
+            "law_name": {"type": "text", "analyzer": "spanish"},
+            "article": {"type": "keyword"},
+            "text": {"type": "text", "analyzer": "spanish"},
+            "category": {"type": "keyword"},
+            "tier": {"type": "keyword"},
+            "state": {"type": "keyword"},
+            "municipality": {"type": "keyword"},
+            "book": {"type": "text"},
+            "title": {"type": "text"},
+            "chapter": {"type": "text"},
+            "hierarchy": {"type": "keyword"},
+            "publication_date": {"type": "date"},
+            "tags": {"type": "keyword"},
+            "authority": {"type": "float"},
+        },
+    },
+}
+
+
+# Law fields index_laws writes back at the end of a run
+LAW_INDEX_FIELDS = [
+    "article_count",
+    "transitorio_count",
+    "indexed_at",
+    "index_generation",
+]
+
+
+def new_articles_index_name():
+    """Versioned name for a new index behind the `articles` alias."""
+    return f"{INDEX_ARTICLES}_{datetime.now(dt_timezone.utc):%Y%m%d%H%M%S}"
+
+
 NS = {"akn": "http://docs.oasis-open.org/legaldocml/ns/akn/3.0"}
+AKN = "{%s}" % NS["akn"]
+HIERARCHY_TAGS = ("book", "title", "chapter", "part", "section")
+
+# Repeated article number at the start of a paragraph
+_ARTICLE_PREFIX_RE = register(
+    "index.article_prefix", r"^(?:Art[ií]culo|ARTÍCULO)\s+\d+[\w\s]*\.\s*"
+)
+# Mid-sentence hard line break (column wraps from PDF)
+_SOFT_BREAK_RE = register(
+    "index.soft_break",
+    r"(?<=[a-záéíóúñü,;])\n(?=[a-záéíóúñü])",
+    re.IGNORECASE,
+)
+_MULTI_SPACE_RE = register("index.multi_space", r" {2,}")
+_ARTICLE_LABEL_RE = register("index.article_label", r"^(?:Art[ií]culo|ARTÍCULO)\s*")
+
+_RELEASABLE = {AKN + tag for tag in HIERARCHY_TAGS + ("article",)}
+
+
+def _release(node):
+    """Free a fully processed element and the processed siblings before it."""
+    node.clear(keep_tail=True)
+    parent = node.getparent()
+    while (prev := node.getprevious()) is not None and prev.tag in _RELEASABLE:
+        parent.remove(prev)
 
 
 class Command(BaseCommand):
     help = "Index laws in Elasticsearch with V2 hierarchy structure"
 
+    # SQLite fallback index connection, shared by a whole run
+    _fts_conn = None
+    # Laws indexed in this run, for _write_law_metadata (set by handle)
+    _indexed = None
+    # Whether article docs carry _routing (see _articles_routed)
+    _route_by_law = True
+
     def add_arguments(self, parser):
         group = parser.add_mutually_exclusive_group(required=True)
         group.add_argument("--all", action="store_true", help="Index all laws")
@@ -75,50 +174,36 @@ class Command(BaseCommand):
             )
             self.stdout.write(self.style.SUCCESS(f"Created index: {INDEX_LAWS}"))
 
-        # Articles index
+        # Articles index: `articles` is an alias over a versioned index
+        # (see reindex_articles), so a rebuild can be swapped in atomically
         if not es.indices.exists(index=INDEX_ARTICLES):
+            name = new_articles_index_name()
             es.indices.create(
-                index=INDEX_ARTICLES,
-                body={
-                    "settings": {
-                        "analysis": {
-                            "analyzer": {
-                                "spanish_legal": {
-                                    "type": "spanish",
-                                    "stopwords": "_spanish_",
-                                }
-                            }
-                        }
-                    },
-                    "mappings": {
-                        "properties": {
-                            "law_id": {"type": "keyword"},
-                            "law_name": {"type": "text", "analyzer": "spanish"},
-                            "article": {"type": "keyword"},
-                            "text": {"type": "text", "analyzer": "spanish"},
-                            "category": {"type": "keyword"},
-                            "tier": {"type": "keyword"},
-                            "state": {"type": "keyword"},
-                            "municipality": {"type": "keyword"},
-                            "book": {"type": "text"},
-                            "title": {"type": "text"},
-                            "chapter": {"type": "text"},
-                            "hierarchy": {"type": "keyword"},
-                            "publication_date": {"type": "date"},
-                            "tags": {"type": "keyword"},
-                        }
-                    },
-                },
+                index=name,
+                body={**ARTICLES_INDEX_BODY, "aliases": {INDEX_ARTICLES: {}}},
+            )
+            self.stdout.write(
+                self.style.SUCCESS(f"Created index: {name} (alias {INDEX_ARTICLES})")
             )
-            self.stdout.write(self.style.SUCCESS(f"Created index: {INDEX_ARTICLES}"))
 
-    def _get_element_metadata(self, element, tag_name):
-        """Extract num and heading from an ancestor tag (e.g., chapter)."""
-        ancestor = element.xpath(f"ancestor::akn:{tag_name}", namespaces=NS)
-        if not ancestor:
-            return None
+    def _articles_routed(self, es):
+        """
+        False while `articles` is a concrete index built before routing.
+        Routed writes there would put a re-indexed law's docs on other
+        shards next to the unrouted copies, and reindex_articles could then
+        never match doc counts.
+        """
+        if es.indices.exists_alias(name=INDEX_ARTICLES):
+            return True
+        self.stderr.write(
+            f"'{INDEX_ARTICLES}' is a concrete index built before routing; "
+            "writing article docs without routing. Run reindex_articles to "
+            "migrate it."
+        )
+        return False
 
-        node = ancestor[0]
+    def _element_metadata(self, node):
+        """Extract num and heading from a hierarchy element (e.g., chapter)."""
         num = node.find("akn:num", NS)
         heading = node.find("akn:heading", NS)
 
@@ -147,16 +232,11 @@ class Command(BaseCommand):
             if not raw:
                 continue
             # Remove repeated article number from paragraph start
-            cleaned = re.sub(r"^(?:Art[ií]culo|ARTÍCULO)\s+\d+[\w\s]*\.\s*", "", raw)
+            cleaned = _ARTICLE_PREFIX_RE.sub("", raw, count=1)
             # Rejoin mid-sentence hard line breaks (column wraps from PDF)
-            cleaned = re.sub(
-                r"(?<=[a-záéíóúñü,;])\n(?=[a-záéíóúñü])",
-                " ",
-                cleaned,
-                flags=re.IGNORECASE,
-            )
+            cleaned = _SOFT_BREAK_RE.sub(" ", cleaned)
             # Collapse multiple spaces
-            cleaned = re.sub(r" {2,}", " ", cleaned)
+            cleaned = _MULTI_SPACE_RE.sub(" ", cleaned)
             paragraphs.append(cleaned.strip())
 
         if not paragraphs:
@@ -170,45 +250,87 @@ class Command(BaseCommand):
         return "\n\n".join(paragraphs)
 
     def extract_articles_from_xml(self, xml_content, law_official_id):
-        """Parse AKN XML and extract articles with hierarchy."""
+        """Parse AKN XML (str, bytes or binary file) and extract articles."""
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode("utf-8")
+        if isinstance(xml_content, bytes):
+            xml_content = io.BytesIO(xml_content)
         try:
-            root = etree.fromstring(xml_content.encode("utf-8"))
-        except Exception as e:
+            return list(self.iter_articles(xml_content))
+        except (etree.XMLSyntaxError, ValueError) as e:
             self.stderr.write(f"XML Parse Error for {law_official_id}: {e}")
             return []
 
-        articles = []
-        article_nodes = root.xpath("//akn:article", namespaces=NS)
+    def iter_articles(self, source):
+        """
+        Stream articles with their hierarchy out of an AKN file in one pass.
 
-        for node in article_nodes:
-            eid = node.get("eId")
-            num = node.find("akn:num", NS)
+        `source` is a binary file object or path. iterparse keeps one
+        stack per hierarchy level (book, title, chapter, part, section) as
+        it enters and leaves those elements, so each article's breadcrumbs
+        are read off the stacks instead of ancestor:: XPath. Articles and
+        hierarchy elements are cleared and detached once processed, which
+        keeps memory flat regardless of law size.
 
-            # Clean article_id: strip "Artículo " prefix and trailing period
-            raw_num = num.text.strip() if num is not None and num.text else eid
-            article_id = (
-                re.sub(r"^(?:Art[ií]culo|ARTÍCULO)\s*", "", raw_num).rstrip(".").strip()
-            )
+        Raises etree.XMLSyntaxError for malformed XML, possibly after some
+        articles were already yielded.
+        """
+        open_levels = {tag: [] for tag in HIERARCHY_TAGS}
+        events = etree.iterparse(
+            source,
+            events=("start", "end"),
+            tag=[AKN + tag for tag in HIERARCHY_TAGS + ("article",)],
+        )
+        for event, node in events:
+            tag = node.tag[len(AKN) :]
+
+            if tag != "article":
+                if event == "start":
+                    # [element, metadata]; metadata is read on first use,
+                    # once the element's num/heading have been parsed
+                    open_levels[tag].append([node, None])
+                else:
+                    open_levels[tag].pop()
+                    _release(node)
+                continue
+            if event == "start":
+                continue
 
-            # Extract structured text
-            text_content = self._extract_article_text(node)
+            article = self._article_data(node)
+            if article is not None:
+                for level, stack in open_levels.items():
+                    # Outermost element of each level, as ancestor::akn:x[0]
+                    if stack:
+                        if stack[0][1] is None:
+                            stack[0][1] = self._element_metadata(stack[0][0])
+                        article[level] = stack[0][1]
+                    else:
+                        article[level] = None
+                yield article
+            _release(node)
+
+    def _article_data(self, node):
+        """Article fields without hierarchy, or None if it has no text."""
+        eid = node.get("eId")
+        num = node.find("akn:num", NS)
 
-            if not text_content:
-                continue
+        # Clean article_id: strip "Artículo " prefix and trailing period
+        raw_num = num.text.strip() if num is not None and num.text else eid
+        article_id = _ARTICLE_LABEL_RE.sub("", raw_num, count=1).rstrip(".").strip()
 
-            article_data = {
-                "article_id": article_id,
-                "eId": eid,
-                "text": text_content,
-                "book": self._get_element_metadata(node, "book"),
-                "title": self._get_element_metadata(node, "title"),
-                "chapter": self._get_element_metadata(node, "chapter"),
-                "part": self._get_element_metadata(node, "part"),
-                "section": self._get_element_metadata(node, "section"),
-            }
-            articles.append(article_data)
+        # Extract structured text
+        text_content = self._extract_article_text(node)
 
-        return articles
+        if not text_content:
+            return None
+
+        return {
+            "article_id": article_id,
+            "eId": eid,
+            "text": text_content,
+            # Transitory articles carry "trans-" ids (AkomaNtosoGeneratorV2)
+            "transitorio": (eid or node.get("id") or "").startswith("trans"),
+        }
 
     def _index_law_doc(self, law, version, article_count, es, dry_run=False):
         """Index the law-level document into the laws index."""
@@ -234,7 +356,7 @@ class Command(BaseCommand):
                 "total_articles": article_count,
             },
         }
-        helpers.bulk(es, [doc])
+        self._bulk(es, [doc])
 
     def _index_raw_text(self, law, version, text, es, dry_run=False):
         """Index raw text as a single article (degraded but searchable)."""
@@ -248,6 +370,7 @@ class Command(BaseCommand):
         doc = {
             "_index": INDEX_ARTICLES,
             "_id": f"{law.official_id}-full_text",
+            "_routing": law.official_id,
             "_source": {
                 "law_id": law.official_id,
                 "law_name": law.name,
@@ -273,22 +396,82 @@ class Command(BaseCommand):
                 ],
             },
         }
-        helpers.bulk(es, [doc])
+        self._bulk(es, [doc])
+        self._write_article_pack(law, version, [doc["_source"]])
+        self._write_fts(law, [doc["_source"]])
+        self._record_indexed(law, 1, 0)
 
         # Also index law-level doc
         self._index_law_doc(law, version, 0, es, dry_run)
 
         return 1
 
+    def _bulk(self, es, actions):
+        """Write to ES unless running without it (SEARCH_BACKEND=sqlite)."""
+        if es is None:
+            return
+        if not self._route_by_law:
+            actions = [
+                {k: v for k, v in action.items() if k != "_routing"}
+                for action in actions
+            ]
+        helpers.bulk(es, actions)
+
+    def _record_indexed(self, law, article_count, transitorio_count):
+        """Queue the law's index metadata for the bulk write in handle()."""
+        law.article_count = article_count
+        law.transitorio_count = transitorio_count
+        if self._indexed is not None:
+            self._indexed.append(law)
+
+    def _write_law_metadata(self, generation):
+        """Write article counts and the run's generation to the indexed laws."""
+        indexed_at = timezone.now()
+        for law in self._indexed:
+            law.indexed_at = indexed_at
+            law.index_generation = generation
+        Law.objects.bulk_update(self._indexed, LAW_INDEX_FIELDS, batch_size=1000)
+        self.stdout.write(
+            f"Index metadata written for {len(self._indexed)} laws "
+            f"(generation {generation})"
+        )
+        self._indexed = None
+
+    def _write_fts(self, law, sources):
+        """Mirror the law's articles into the SQLite fallback index."""
+        try:
+            fts_index.index_law(law, sources, conn=self._fts_conn)
+        except Exception as e:
+            # Search still works from ES; the fallback is stale for this law
+            self.stderr.write(f"SQLite index failed for {law.official_id}: {e}")
+
+    def _write_article_pack(self, law, version, sources):
+        """Store the compact article pack API reads use instead of ES."""
+        try:
+            write_pack(
+                law.official_id,
+                [
+                    {"article_id": src["article"], "text": src["text"]}
+                    for src in sources
+                ],
+                version_id=version.pk,
+            )
+        except Exception as e:
+            # Readers fall back to ES when a pack is missing
+            self.stderr.write(f"Article pack failed for {law.official_id}: {e}")
+
     def index_law(self, law, es, dry_run=False):
         """Index a single law with articles or raw text fallback."""
         version = law.versions.last()
         if not version or not version.xml_file_path:
             return 0
 
-        text = read_data_content(version.xml_file_path)
+        stream = open_data_stream(version.xml_file_path)
+        head = stream.read(4096).decode("utf-8", errors="ignore") if stream else ""
 
-        if not text:
+        if not head:
+            if stream:
+                stream.close()
             self.stdout.write(
                 self.style.WARNING(
                     f"File not found for {law.official_id}: {version.xml_file_path}"
@@ -296,14 +479,18 @@ class Command(BaseCommand):
             )
             return 0
 
-        # Check if this is AKN XML or raw text
-        is_akn = text.strip().startswith("<?xml") or "<akomaNtoso" in text[:500]
+        with stream:
+            stream.seek(0)
+
+            # Check if this is AKN XML or raw text
+            is_akn = head.lstrip().startswith("<?xml") or "<akomaNtoso" in head[:500]
 
-        if not is_akn:
-            return self._index_raw_text(law, version, text, es, dry_run)
+            if not is_akn:
+                text = stream.read().decode("utf-8", errors="ignore")
+                return self._index_raw_text(law, version, text, es, dry_run)
 
-        # Extract articles from AKN XML
-        extracted_articles = self.extract_articles_from_xml(text, law.official_id)
+            # Extract articles from AKN XML, streaming straight from the file
+            extracted_articles = self.extract_articles_from_xml(stream, law.official_id)
 
         if dry_run:
             self.stdout.write(
@@ -312,6 +499,13 @@ class Command(BaseCommand):
             )
             return len(extracted_articles)
 
+        # Citation-graph authority per article (search relevance boost)
+        authority = dict(
+            ArticleAuthority.objects.filter(law_slug=law.official_id).values_list(
+                "article_id", "score"
+            )
+        )
+
         # Prepare ES article docs
         actions = []
         for art in extracted_articles:
@@ -328,6 +522,7 @@ class Command(BaseCommand):
             doc = {
                 "_index": INDEX_ARTICLES,
                 "_id": f"{law.official_id}-{art['article_id']}",
+                "_routing": law.official_id,
                 "_source": {
                     "law_id": law.official_id,
                     "law_name": law.name,
@@ -350,12 +545,21 @@ class Command(BaseCommand):
                         law.tier or "federal",
                         (law.category or "unknown").lower(),
                     ],
+                    "authority": authority.get(art["article_id"], 0.0),
                 },
             }
             actions.append(doc)
 
         if actions:
-            helpers.bulk(es, actions)
+            self._bulk(es, actions)
+        # Written even when empty, so a law that lost its articles stops
+        # serving the previous run's pack and FTS rows
+        sources = [action["_source"] for action in actions]
+        self._write_article_pack(law, version, sources)
+        self._write_fts(law, sources)
+        self._record_indexed(
+            law, len(actions), sum(art["transitorio"] for art in extracted_articles)
+        )
 
         # Index law-level document
         self._index_law_doc(law, version, len(actions), es, dry_run)
@@ -363,17 +567,23 @@ class Command(BaseCommand):
         return len(actions)
 
     def handle(self, *args, **options):
-        # Connect ES
-        if not options["dry_run"]:
+        # Connect ES (skipped in single-node SQLite mode)
+        if not options["dry_run"] and fts_index.preferred():
+            es = None
+            self.stdout.write("SEARCH_BACKEND=sqlite: indexing without Elasticsearch")
+        elif not options["dry_run"]:
             es = Elasticsearch([ES_HOST])
             if not es.ping():
                 self.stderr.write(f"Elasticsearch offline at {ES_HOST}")
                 return
             self.stdout.write(f"Connected to Elasticsearch at {ES_HOST}")
 
-            # Create indices if requested
-            if options["create_indices"]:
+            # Create indices if requested. A missing articles index is always
+            # created as a routed alias: bulk writes would otherwise
+            # auto-create a concrete one with dynamic mappings
+            if options["create_indices"] or not es.indices.exists(index=INDEX_ARTICLES):
                 self._create_indices(es)
+            self._route_by_law = self._articles_routed(es)
         else:
             es = None
 
@@ -394,6 +604,16 @@ class Command(BaseCommand):
         total = laws.count()
         self.stdout.write(f"Indexing {total} laws (tier={tier})...")
 
+        self._indexed = []
+        if not options["dry_run"]:
+            generation = (
+                Law.objects.aggregate(latest=Max("index_generation"))["latest"] or 0
+            ) + 1
+            try:
+                self._fts_conn = fts_index.connect_writer()
+            except (OSError, sqlite3.Error) as e:
+                self.stderr.write(f"SQLite index unavailable: {e}")
+
         count = 0
         total_articles = 0
         skipped = 0
@@ -425,3 +645,19 @@ class Command(BaseCommand):
         if skipped:
             self.stdout.write(f"Skipped {skipped} laws (no file found)")
         self.stdout.write("=" * 60)
+
+        if self._fts_conn is not None:
+            fts_index.optimize(self._fts_conn)
+            self._fts_conn.close()
+            self._fts_conn = None
+
+        if not options["dry_run"]:
+            self._write_law_metadata(generation)
+            self._refresh_stats_snapshot()
+
+    def _refresh_stats_snapshot(self):
+        """Recompute dashboard stats inline (article totals just changed)."""
+        from apps.api.snapshots import refresh_snapshots
+
+        results = refresh_snapshots(["law_stats"])
+        self.stdout.write(f"Stats snapshot refresh: {results['law_stats']}")
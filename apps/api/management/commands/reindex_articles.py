@@ -0,0 +1,133 @@
+"""
+Management command to rebuild the articles index behind its alias.
+
+`articles` is an alias over a versioned index (articles_<timestamp>).
+This copies every article doc into a new versioned index created with the
+current mapping (ARTICLES_INDEX_BODY), routing each doc by its law_id, and
+then moves the alias in one atomic update_aliases call, so readers never
+see a half-built index.
+
+A legacy install where `articles` is a concrete index (built before
+routing) is migrated the same way: the concrete index is removed in the
+same atomic call that creates the alias. Until then, run the API with
+ES_ROUTE_BY_LAW=false; index_laws writes to it without routing.
+
+The new index gets ES_ARTICLE_SHARDS primary shards, so this is also how
+a shard count change is applied.
+
+Docs written to the old index while the copy runs are not carried over;
+pause index_laws during a reindex.
+
+Usage:
+    python manage.py reindex_articles
+    python manage.py reindex_articles --dry-run
+    python manage.py reindex_articles --keep-old
+"""
+
+from django.core.management.base import BaseCommand
+from elasticsearch import Elasticsearch
+
+from apps.api.management.commands.index_laws import (
+    ARTICLES_INDEX_BODY,
+    INDEX_ARTICLES,
+    new_articles_index_name,
+)
+from apps.api.utils.paths import ES_HOST
+
+# Route each copied doc to the shard of its law
+ROUTE_BY_LAW_SCRIPT = {
+    "source": "ctx._routing = ctx._source.law_id",
+    "lang": "painless",
+}
+
+
+class Command(BaseCommand):
+    help = "Rebuild the articles index with law_id routing and swap the alias"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Show the plan without writing"
+        )
+        parser.add_argument(
+            "--keep-old",
+            action="store_true",
+            help="Keep the previous versioned index after the alias moves",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=int,
+            default=3600,
+            help="Seconds to wait for the copy (default: 3600)",
+        )
+
+    def _current_indices(self, es):
+        """(indices behind `articles`, whether `articles` is a concrete index)."""
+        if es.indices.exists_alias(name=INDEX_ARTICLES):
+            return sorted(es.indices.get_alias(name=INDEX_ARTICLES)), False
+        if es.indices.exists(index=INDEX_ARTICLES):
+            return [INDEX_ARTICLES], True
+        return [], False
+
+    def handle(self, *args, **options):
+        es = Elasticsearch([ES_HOST])
+        if not es.ping():
+            self.stderr.write(f"Elasticsearch offline at {ES_HOST}")
+            return
+
+        sources, legacy = self._current_indices(es)
+        if not sources:
+            self.stderr.write(
+                f"No '{INDEX_ARTICLES}' index or alias; "
+                "run index_laws --create-indices instead"
+            )
+            return
+
+        target = new_articles_index_name()
+        self.stdout.write(
+            f"Reindexing {', '.join(sources)} -> {target} "
+            f"(alias {INDEX_ARTICLES}{', replacing concrete index' if legacy else ''})"
+        )
+        if options["dry_run"]:
+            return
+
+        es.indices.create(index=target, body=ARTICLES_INDEX_BODY)
+        result = es.reindex(
+            body={
+                "source": {"index": sources},
+                "dest": {"index": target},
+                "script": ROUTE_BY_LAW_SCRIPT,
+            },
+            refresh=True,
+            wait_for_completion=True,
+            request_timeout=options["timeout"],
+        )
+
+        expected = es.count(index=sources)["count"]
+        copied = es.count(index=target)["count"]
+        if result.get("failures") or copied != expected:
+            self.stderr.write(
+                f"Reindex incomplete ({copied}/{expected} docs, "
+                f"{len(result.get('failures', []))} failures); "
+                f"alias left on {', '.join(sources)}"
+            )
+            es.indices.delete(index=target)
+            return
+
+        if legacy:
+            # An alias cannot share its name with an index; drop the index
+            # in the same atomic call
+            actions = [{"remove_index": {"index": INDEX_ARTICLES}}]
+        else:
+            actions = [
+                {"remove": {"index": index, "alias": INDEX_ARTICLES}}
+                for index in sources
+            ]
+        actions.append({"add": {"index": target, "alias": INDEX_ARTICLES}})
+        es.indices.update_aliases(body={"actions": actions})
+        self.stdout.write(
+            self.style.SUCCESS(f"Alias {INDEX_ARTICLES} -> {target} ({copied} docs)")
+        )
+
+        if not legacy and not options["keep_old"]:
+            es.indices.delete(index=",".join(sources))
+            self.stdout.write(f"Deleted {', '.join(sources)}")
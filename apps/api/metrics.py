@@ -0,0 +1,258 @@
+"""
+Prometheus metrics and per-request timings.
+
+Metrics are prometheus_client collectors, rendered at /metrics. Under
+gunicorn every worker is its own process, so the API runs prometheus_client
+in multiprocess mode: apps/indigo/gunicorn.conf.py sets
+PROMETHEUS_MULTIPROC_DIR, each worker writes its samples to files there and
+render() sums them, so a scrape sees the whole pod whichever worker answers
+it. Without that variable (runserver, tests) the process's own registry is
+served.
+
+MetricsMiddleware (apps.api.middleware.metrics) opens a RequestTimings for
+each request. The instrumented code paths add to it through the record_*
+helpers:
+- DB queries, via an execute_wrapper installed on every connection as it
+  opens (the async ORM queries from other threads, on other connections;
+  the request's timings follow it there in a contextvar)
+- Elasticsearch requests, via InstrumentedTransport under es_client (and
+  its async twin under aes_client), with the `took` ES reports next to the
+  wall time the client saw
+- cache hits and misses of the in-process and stored caches
+- export rendering per format (timed_render)
+
+At the end of the request the middleware observes the per-view metrics and
+sends the totals in a Server-Timing header, which browser dev tools show
+next to the request.
+"""
+
+import contextvars
+import os
+import time
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Seconds; covers a cached 5 ms response up to a slow PDF export
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+REQUEST_SECONDS = Histogram(
+    "tezca_http_request_duration_seconds",
+    "Request latency by view.",
+    ("view", "method", "status"),
+    buckets=DEFAULT_BUCKETS,
+)
+DB_QUERIES = Counter("tezca_db_queries_total", "Database queries by view.", ("view",))
+DB_SECONDS = Counter(
+    "tezca_db_query_seconds_total", "Time spent in database queries.", ("view",)
+)
+ES_REQUESTS = Counter(
+    "tezca_es_requests_total",
+    "Elasticsearch requests by API operation and outcome.",
+    ("operation", "outcome"),
+)
+ES_SECONDS = Histogram(
+    "tezca_es_request_duration_seconds",
+    "Elasticsearch request latency as seen by the client.",
+    ("operation",),
+    buckets=DEFAULT_BUCKETS,
+)
+ES_TOOK_SECONDS = Histogram(
+    "tezca_es_took_seconds",
+    "Server-side time Elasticsearch reports in `took`.",
+    ("operation",),
+    buckets=DEFAULT_BUCKETS,
+)
+CACHE_LOOKUPS = Counter(
+    "tezca_cache_lookups_total", "Cache lookups by result.", ("cache", "result")
+)
+EXPORT_RENDER_SECONDS = Histogram(
+    "tezca_export_render_seconds",
+    "Export rendering time by format.",
+    ("format",),
+    buckets=DEFAULT_BUCKETS,
+)
+
+
+def render():
+    """Metrics in the Prometheus text format, summed over gunicorn workers."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry)
+
+
+# ---------------------------------------------------------------------------
+# Per-request timings
+# ---------------------------------------------------------------------------
+
+
+class RequestTimings:
+    """Totals for one request, sent back in the Server-Timing header."""
+
+    def __init__(self):
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.es_requests = 0
+        self.es_seconds = 0.0
+        self.es_took_ms = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.render_seconds = 0.0
+
+    def server_timing(self, total_seconds):
+        entries = [f'db;dur={self.db_seconds * 1000:.1f};desc="{self.db_queries} q"']
+        if self.es_requests:
+            entries.append(
+                f'es;dur={self.es_seconds * 1000:.1f};desc="{self.es_requests} req"'
+            )
+            entries.append(f"es-took;dur={self.es_took_ms}")
+        if self.cache_hits or self.cache_misses:
+            entries.append(
+                f'cache;desc="{self.cache_hits} hit {self.cache_misses} miss"'
+            )
+        if self.render_seconds:
+            entries.append(f"render;dur={self.render_seconds * 1000:.1f}")
+        entries.append(f"total;dur={total_seconds * 1000:.1f}")
+        return ", ".join(entries)
+
+
+_current = contextvars.ContextVar("request_timings", default=None)
+
+
+def begin_request():
+    """Start collecting timings for the current request. Returns (timings, token)."""
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def end_request(token):
+    _current.reset(token)
+
+
+def observe_request(view, method, status, seconds, timings):
+    REQUEST_SECONDS.labels(view=view, method=method, status=status).observe(seconds)
+    DB_QUERIES.labels(view=view).inc(timings.db_queries)
+    DB_SECONDS.labels(view=view).inc(timings.db_seconds)
+
+
+# ---------------------------------------------------------------------------
+# Instrumentation hooks
+# ---------------------------------------------------------------------------
+
+
+def db_wrapper(execute, sql, params, many, context):
+    """connection.execute_wrapper hook timing the queries of a request."""
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.db_queries += 1
+        timings.db_seconds += time.perf_counter() - start
+
+
+def install_db_wrapper(sender, connection, **kwargs):
+    """connection_created receiver adding db_wrapper to each connection."""
+    # Fired again on reconnects of the same wrapper object
+    if db_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(db_wrapper)
+
+
+def es_operation(url):
+    """API name of an ES request path: /articles/_search -> search, / -> info."""
+    for part in url.split("?", 1)[0].split("/"):
+        if part.startswith("_"):
+            return part[1:]
+    return "info" if url.strip("/") == "" else "index"
+
+
+def record_es(operation, seconds, took_ms=None, ok=True):
+    ES_REQUESTS.labels(operation=operation, outcome="ok" if ok else "error").inc()
+    ES_SECONDS.labels(operation=operation).observe(seconds)
+    if took_ms is not None:
+        ES_TOOK_SECONDS.labels(operation=operation).observe(took_ms / 1000)
+    timings = _current.get()
+    if timings is not None:
+        timings.es_requests += 1
+        timings.es_seconds += seconds
+        timings.es_took_ms += took_ms or 0
+
+
+def record_cache(cache, hit):
+    CACHE_LOOKUPS.labels(cache=cache, result="hit" if hit else "miss").inc()
+    timings = _current.get()
+    if timings is not None:
+        if hit:
+            timings.cache_hits += 1
+        else:
+            timings.cache_misses += 1
+
+
+@contextmanager
+def timed_render(fmt):
+    """Time the rendering of an export in format `fmt`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        EXPORT_RENDER_SECONDS.labels(format=fmt).observe(seconds)
+        timings = _current.get()
+        if timings is not None:
+            timings.render_seconds += seconds
+
+
+def instrumented_transport():
+    """
+    Transport class for the Elasticsearch client that records every
+    request. Built on call: elasticsearch is only imported with the client.
+    """
+    from elasticsearch import Transport
+
+    class InstrumentedTransport(Transport):
+        def perform_request(self, method, url, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = super().perform_request(method, url, *args, **kwargs)
+            except Exception:
+                record_es(es_operation(url), time.perf_counter() - start, ok=False)
+                raise
+            took = result.get("took") if isinstance(result, dict) else None
+            record_es(es_operation(url), time.perf_counter() - start, took)
+            return result
+
+    return InstrumentedTransport
+
+
+def instrumented_async_transport():
+    """instrumented_transport for AsyncElasticsearch (needs aiohttp)."""
+    from elasticsearch import AsyncTransport
+
+    class InstrumentedAsyncTransport(AsyncTransport):
+        async def perform_request(self, method, url, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = await super().perform_request(method, url, *args, **kwargs)
+            except Exception:
+                record_es(es_operation(url), time.perf_counter() - start, ok=False)
+                raise
+            took = result.get("took") if isinstance(result, dict) else None
+            record_es(es_operation(url), time.perf_counter() - start, took)
+            return result
+
+    return InstrumentedAsyncTransport
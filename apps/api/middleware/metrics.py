@@ -0,0 +1,62 @@
+"""
+Request metrics middleware.
+
+Times every request and records it, with its database query count and
+time, per view (the URL pattern name, so /laws/<id>/ is one series, not one
+per law). The request's totals, including the Elasticsearch, cache and
+render timings collected by apps.api.metrics, are returned in a
+Server-Timing header.
+
+Both sync and async capable, so the async views (apps.api.async_views)
+stay on the event loop under ASGI.
+"""
+
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from apps.api import metrics
+
+
+def _view_name(request):
+    match = getattr(request, "resolver_match", None)
+    # Unmatched paths (404s) share one series to keep the label set bounded
+    return match.view_name if match and match.view_name else "unmatched"
+
+
+class MetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings, token = metrics.begin_request()
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics.end_request(token)
+        return self._finish(request, response, timings, start)
+
+    async def __acall__(self, request):
+        timings, token = metrics.begin_request()
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics.end_request(token)
+        return self._finish(request, response, timings, start)
+
+    def _finish(self, request, response, timings, start):
+        elapsed = time.perf_counter() - start
+        metrics.observe_request(
+            _view_name(request), request.method, response.status_code, elapsed, timings
+        )
+        response["Server-Timing"] = timings.server_timing(elapsed)
+        return response
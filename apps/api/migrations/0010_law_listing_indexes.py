@@ -0,0 +1,94 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:14
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+# Django renders name__icontains on PostgreSQL as
+# UPPER("api_law"."name"::text) LIKE UPPER(%s), so the trigram index is built
+# on that exact expression for the planner to use it.
+TRIGRAM_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS api_law_name_trgm_idx "
+    "ON api_law USING gin ((UPPER(name::text)) gin_trgm_ops)"
+)
+
+
+def backfill_version_stats(apps, schema_editor):
+    """Populate latest_publication_date/version_count from existing versions."""
+    Law = apps.get_model("api", "Law")
+    LawVersion = apps.get_model("api", "LawVersion")
+    versions = LawVersion.objects.filter(law=OuterRef("pk")).order_by()
+    Law.objects.update(
+        version_count=Coalesce(
+            Subquery(versions.values("law").annotate(n=Count("pk")).values("n")[:1]),
+            0,
+        ),
+        latest_publication_date=Subquery(
+            versions.order_by("-publication_date").values("publication_date")[:1]
+        ),
+    )
+
+
+def create_trigram_index(apps, schema_editor):
+    """pg_trgm GIN index for name search (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(TRIGRAM_INDEX_SQL)
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS api_law_name_trgm_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0009_statssnapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="law",
+            name="latest_publication_date",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="law",
+            name="version_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="law",
+            index=models.Index(
+                django.db.models.functions.text.Lower("state"),
+                name="api_law_state_lower_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="law",
+            index=models.Index(
+                django.db.models.functions.text.Lower("category"),
+                name="api_law_category_lower_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="law",
+            index=models.Index(
+                fields=["latest_publication_date", "official_id"],
+                name="api_law_latest_pub_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="law",
+            index=models.Index(
+                fields=["-version_count", "official_id"],
+                name="api_law_version_count_idx",
+            ),
+        ),
+        migrations.RunPython(backfill_version_stats, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
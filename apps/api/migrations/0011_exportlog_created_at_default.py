@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:19
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0010_law_listing_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="exportlog",
+            name="created_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
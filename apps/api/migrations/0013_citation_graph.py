@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0012_lawversiondiff"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="law",
+            name="authority_score",
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.AddField(
+            model_name="law",
+            name="citations_in",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="law",
+            name="citations_out",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name="ArticleAuthority",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("law_slug", models.CharField(max_length=255)),
+                ("article_id", models.CharField(max_length=100)),
+                ("citations_in", models.PositiveIntegerField(default=0)),
+                ("citations_out", models.PositiveIntegerField(default=0)),
+                ("score", models.FloatField(default=0.0)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("law_slug", "article_id"),
+                        name="unique_article_authority",
+                    )
+                ],
+            },
+        ),
+    ]
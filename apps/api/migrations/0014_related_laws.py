@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0013_citation_graph"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RelatedLaws",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("law_slug", models.CharField(max_length=255, unique=True)),
+                ("related", models.JSONField(default=list)),
+                ("computed_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0014_related_laws"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="law",
+            name="article_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="law",
+            name="index_generation",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="law",
+            name="indexed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="law",
+            name="transitorio_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0015_law_index_metadata"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="law",
+            name="most_citing_laws",
+            field=models.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name="law",
+            name="most_referenced_laws",
+            field=models.JSONField(default=list),
+        ),
+    ]
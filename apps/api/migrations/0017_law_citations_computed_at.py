@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0016_law_top_citations"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="law",
+            name="citations_computed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -1,4 +1,8 @@
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Lower
+from django.utils import timezone
 
 
 class Law(models.Model):
@@ -61,12 +65,78 @@ class Law(models.Model):
         help_text="Legislative (from Congress) or Non-Legislative (executive, judicial, autonomous)",
     )
 
+    # Denormalized from LawVersion so listings can filter, sort and paginate
+    # without joining or aggregating versions. Kept in sync by
+    # sync_version_stats (LawVersion post_save/post_delete).
+    latest_publication_date = models.DateField(null=True, blank=True)
+    version_count = models.PositiveIntegerField(default=0)
+
+    # Citation graph, written by apps.api.citation_graph (references counted
+    # from/to this law, PageRank normalized to mean 1.0; 0 = no citation data,
+    # top-10 cited/citing laws as [{"slug", "count"}]). citations_computed_at
+    # is the last rebuild, which writes these in bulk without updated_at.
+    citations_in = models.PositiveIntegerField(default=0)
+    citations_out = models.PositiveIntegerField(default=0)
+    authority_score = models.FloatField(default=0.0)
+    most_referenced_laws = models.JSONField(default=list)
+    most_citing_laws = models.JSONField(default=list)
+    citations_computed_at = models.DateTimeField(null=True, blank=True)
+
+    # Search index metadata, written in bulk by index_laws at the end of each
+    # run so views read counts from the row instead of counting in ES.
+    # index_generation is the number of the index_laws run that last indexed
+    # the law (0 = never indexed).
+    article_count = models.PositiveIntegerField(default=0)
+    transitorio_count = models.PositiveIntegerField(default=0)
+    indexed_at = models.DateTimeField(null=True, blank=True)
+    index_generation = models.PositiveIntegerField(default=0)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Match the Lower() lookups LawListView uses for state/category
+            models.Index(Lower("state"), name="api_law_state_lower_idx"),
+            models.Index(Lower("category"), name="api_law_category_lower_idx"),
+            # Keyset pagination orderings (official_id is the tie-breaker)
+            models.Index(
+                fields=["latest_publication_date", "official_id"],
+                name="api_law_latest_pub_idx",
+            ),
+            models.Index(
+                fields=["-version_count", "official_id"],
+                name="api_law_version_count_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.official_id} - {self.short_name or self.name}"
 
+    @classmethod
+    def refresh_version_stats(cls, law_ids=None):
+        """
+        Recompute latest_publication_date and version_count from LawVersion.
+
+        Uses a single UPDATE so updated_at (and Law post_save) are untouched.
+        Pass law_ids to limit the refresh, or None for the whole table.
+        """
+        versions = LawVersion.objects.filter(law=OuterRef("pk")).order_by()
+        qs = (
+            cls.objects.all() if law_ids is None else cls.objects.filter(pk__in=law_ids)
+        )
+        return qs.update(
+            version_count=Coalesce(
+                Subquery(
+                    versions.values("law").annotate(n=Count("pk")).values("n")[:1]
+                ),
+                0,
+            ),
+            latest_publication_date=Subquery(
+                versions.order_by("-publication_date").values("publication_date")[:1]
+            ),
+        )
+
 
 class LawVersion(models.Model):
     law = models.ForeignKey(Law, on_delete=models.CASCADE, related_name="versions")
@@ -101,6 +171,39 @@ class LawVersion(models.Model):
         return f"{self.law.official_id} ({self.publication_date})"
 
 
+class LawVersionDiff(models.Model):
+    """
+    Persisted article-level diff between two versions of a law.
+
+    Built by apps.api.diffs on first request for a version pair; `data`
+    holds the summary counts and the changed articles only.
+    """
+
+    from_version = models.ForeignKey(
+        LawVersion, on_delete=models.CASCADE, related_name="diffs_from"
+    )
+    to_version = models.ForeignKey(
+        LawVersion, on_delete=models.CASCADE, related_name="diffs_to"
+    )
+    data = models.JSONField()
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["from_version", "to_version"], name="unique_version_diff"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.from_version} -> {self.to_version.publication_date}"
+
+
+def sync_version_stats(sender, instance, **kwargs):
+    """Keep Law's denormalized version fields current (LawVersion signals)."""
+    Law.refresh_version_stats([instance.law_id])
+
+
 class CrossReference(models.Model):
     """
     Stores detected cross-references between articles and laws.
@@ -161,6 +264,44 @@ class CrossReference(models.Model):
         return url
 
 
+class ArticleAuthority(models.Model):
+    """
+    Citation-graph scores for one article, rebuilt wholesale by
+    apps.api.citation_graph. Keyed like CrossReference targets.
+    """
+
+    law_slug = models.CharField(max_length=255)
+    article_id = models.CharField(max_length=100)
+    citations_in = models.PositiveIntegerField(default=0)
+    citations_out = models.PositiveIntegerField(default=0)
+    score = models.FloatField(default=0.0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["law_slug", "article_id"], name="unique_article_authority"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.law_slug}:{self.article_id} ({self.score:.2f})"
+
+
+class RelatedLaws(models.Model):
+    """
+    Precomputed related-laws list for one law, rebuilt wholesale by
+    apps.api.related_laws so RelatedLawsView reads one row instead of
+    running more_like_this per request.
+    """
+
+    law_slug = models.CharField(max_length=255, unique=True)
+    related = models.JSONField(default=list)
+    computed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.law_slug} ({len(self.related)} related)"
+
+
 class ExportLog(models.Model):
     """Tracks export requests for quota enforcement."""
 
@@ -169,7 +310,8 @@ class ExportLog(models.Model):
     law_id = models.CharField(max_length=50)
     format = models.CharField(max_length=10)
     tier = models.CharField(max_length=20, default="anon")
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Not auto_now_add: rows are bulk-inserted later with the request time
+    created_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         indexes = [
@@ -179,3 +321,19 @@ class ExportLog(models.Model):
 
     def __str__(self):
         return f"{self.tier}:{self.format} {self.law_id} ({self.created_at})"
+
+
+class StatsSnapshot(models.Model):
+    """
+    Precomputed dashboard payloads (homepage stats, coverage reports).
+
+    Refreshed by a Celery task after ingestion/indexing and on a beat
+    schedule, so dashboards read one row instead of aggregating the corpus.
+    """
+
+    key = models.CharField(max_length=50, unique=True)
+    data = models.JSONField(encoder=DjangoJSONEncoder)
+    computed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.key} ({self.computed_at})"
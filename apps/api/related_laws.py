@@ -0,0 +1,215 @@
+"""
+Precomputed related laws.
+
+Finding a law's related laws takes two ES requests: its first articles as
+seed text, then a more_like_this query with a terms + top_hits
+aggregation. MLT is among the most expensive query types. A nightly
+rebuild (after the citation graph, whose authority scores it uses) runs
+the same queries for every law in msearch batches and stores each ranked
+list in a RelatedLaws row. RelatedLawsView reads that one row, and only
+laws indexed since the last rebuild take the live path.
+
+Similarity is the number of the other law's articles that MLT matched,
+multiplied by that law's citation-graph authority boost, so heavily cited
+laws rank above equally similar obscure ones.
+"""
+
+import logging
+import time
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+
+from . import es_queries
+from .article_packs import get_pack
+from .config import authority_boost, es_client
+from .metrics import record_cache
+from .models import Law, RelatedLaws
+
+logger = logging.getLogger(__name__)
+
+# Laws per msearch request during a rebuild
+BATCH_SIZE = 50
+# Characters of each seed article used as like-text
+SEED_CHARS = 500
+
+
+def like_text(law, seed_texts):
+    return f"{law.name} {' '.join(text[:SEED_CHARS] for text in seed_texts if text)}"
+
+
+def _seed_texts(response):
+    return [hit["_source"].get("text") for hit in response["hits"]["hits"]]
+
+
+def parse_buckets(response):
+    """Unranked related-law entries from a related_laws aggregation."""
+    related = []
+    buckets = response.get("aggregations", {}).get("by_law", {}).get("buckets", [])
+    for bucket in buckets:
+        top = bucket["top_hit"]["hits"]["hits"]
+        if not top:
+            continue
+        src = top[0]["_source"]
+        related.append(
+            {
+                "law_id": bucket["key"],
+                "name": src.get("law_name", bucket["key"]),
+                "tier": src.get("tier", ""),
+                "category": src.get("category", ""),
+                "state": src.get("state"),
+                "score": round(bucket["doc_count"], 1),
+            }
+        )
+    return related
+
+
+def rank(related, authority):
+    """Apply the authority boost ({law_id: authority_score}) and sort."""
+    for r in related:
+        r["score"] = round(r["score"] * authority_boost(authority.get(r["law_id"])), 2)
+    related.sort(key=lambda r: r["score"], reverse=True)
+    return related
+
+
+def live_related(es, law):
+    """Related laws of one law, queried now (laws missing from the table)."""
+    # Seed text from the article pack when there is one
+    pack = get_pack(law.official_id)
+    if pack is not None:
+        seed_texts = [a["text"] for a in pack.articles(0, 3)]
+    else:
+        seed_texts = _seed_texts(
+            es.search(**es_queries.law_seed_texts(law.official_id))
+        )
+    related = parse_buckets(
+        es.search(
+            **es_queries.related_laws(law.official_id, like_text(law, seed_texts))
+        )
+    )
+    if not related:
+        return related
+    authority = dict(
+        Law.objects.filter(official_id__in=[r["law_id"] for r in related]).values_list(
+            "official_id", "authority_score"
+        )
+    )
+    return rank(related, authority)
+
+
+async def live_related_async(es, law):
+    """live_related with an AsyncElasticsearch client (apps.api.async_views)."""
+    # get_pack may stat the pack in remote storage
+    pack = await sync_to_async(get_pack, thread_sensitive=False)(law.official_id)
+    if pack is not None:
+        seed_texts = [a["text"] for a in pack.articles(0, 3)]
+    else:
+        seed_texts = _seed_texts(
+            await es.search(**es_queries.law_seed_texts(law.official_id))
+        )
+    related = parse_buckets(
+        await es.search(
+            **es_queries.related_laws(law.official_id, like_text(law, seed_texts))
+        )
+    )
+    if not related:
+        return related
+    authority = {
+        official_id: score
+        async for official_id, score in Law.objects.filter(
+            official_id__in=[r["law_id"] for r in related]
+        ).values_list("official_id", "authority_score")
+    }
+    return rank(related, authority)
+
+
+def stored_related(law_id):
+    """The precomputed list for a law, or None if it has not been computed."""
+    related = (
+        RelatedLaws.objects.filter(law_slug=law_id)
+        .values_list("related", flat=True)
+        .first()
+    )
+    record_cache("related_laws", hit=related is not None)
+    return related
+
+
+def _msearch(es, requests):
+    return es.msearch(body=es_queries.msearch_body(requests))["responses"]
+
+
+def _compute_batch(es, laws, authority):
+    """{law_slug: ranked related list} for a batch of laws."""
+    seeds = {}
+    missing = []
+    for law in laws:
+        pack = get_pack(law.official_id)
+        if pack is not None:
+            seeds[law.official_id] = [a["text"] for a in pack.articles(0, 3)]
+        else:
+            missing.append(law)
+    if missing:
+        responses = _msearch(
+            es, [es_queries.law_seed_texts(law.official_id) for law in missing]
+        )
+        for law, response in zip(missing, responses):
+            seeds[law.official_id] = (
+                [] if "error" in response else _seed_texts(response)
+            )
+
+    responses = _msearch(
+        es,
+        [
+            es_queries.related_laws(
+                law.official_id, like_text(law, seeds[law.official_id])
+            )
+            for law in laws
+        ],
+    )
+    results = {}
+    for law, response in zip(laws, responses):
+        if "error" in response:
+            logger.warning(
+                "Related laws query failed for %s: %s",
+                law.official_id,
+                response["error"],
+            )
+            continue
+        results[law.official_id] = rank(parse_buckets(response), authority)
+    return results
+
+
+@transaction.atomic
+def _store(results):
+    RelatedLaws.objects.all().delete()
+    RelatedLaws.objects.bulk_create(
+        (
+            RelatedLaws(law_slug=law_slug, related=related)
+            for law_slug, related in results.items()
+        ),
+        batch_size=1000,
+    )
+
+
+def rebuild_related_laws(es=None, batch_size=BATCH_SIZE):
+    """Recompute and store every law's related laws. Returns stats."""
+    es = es if es is not None else es_client
+    start = time.perf_counter()
+    if not es.ping():
+        logger.warning("Related laws not rebuilt: Elasticsearch is unreachable")
+        return {"laws": 0, "error": "elasticsearch unreachable"}
+
+    authority = dict(Law.objects.values_list("official_id", "authority_score"))
+    laws = list(Law.objects.only("id", "official_id", "name").order_by("id"))
+    results = {}
+    for i in range(0, len(laws), batch_size):
+        results.update(_compute_batch(es, laws[i : i + batch_size], authority))
+    _store(results)
+
+    stats = {
+        "laws": len(results),
+        "failed": len(laws) - len(results),
+        "total_seconds": round(time.perf_counter() - start, 3),
+    }
+    logger.info("Related laws rebuilt: %s", stats)
+    return stats
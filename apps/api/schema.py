@@ -32,7 +32,6 @@ class LawDetailSchema(serializers.Serializer):
     articles = serializers.IntegerField()
     grade = serializers.CharField(allow_null=True)
     score = serializers.FloatField(allow_null=True)
-    degraded = serializers.BooleanField(required=False)
 
 
 class LawListItemSchema(serializers.Serializer):
@@ -55,6 +54,27 @@ class LawArticlesSchema(serializers.Serializer):
     law_name = serializers.CharField()
     total = serializers.IntegerField()
     articles = ArticleSchema(many=True)
+    next_cursor = serializers.CharField(required=False, allow_null=True)
+
+
+class ArticleRefSchema(serializers.Serializer):
+    law_id = serializers.CharField()
+    article_id = serializers.CharField()
+
+
+class ArticleBatchRequestSchema(serializers.Serializer):
+    articles = ArticleRefSchema(many=True)
+
+
+class BatchArticleSchema(ArticleRefSchema):
+    law_name = serializers.CharField(allow_null=True)
+    found = serializers.BooleanField()
+    text = serializers.CharField(allow_null=True)
+
+
+class ArticleBatchResponseSchema(serializers.Serializer):
+    results = BatchArticleSchema(many=True)
+    missing = ArticleRefSchema(many=True)
 
 
 class StructureNodeSchema(serializers.Serializer):
@@ -94,7 +114,6 @@ class LawStatsSchema(serializers.Serializer):
     last_update = serializers.DateField(allow_null=True)
     recent_laws = RecentLawSchema(many=True)
     coverage = serializers.DictField(required=False, allow_null=True)
-    degraded = serializers.BooleanField(required=False)
 
 
 # ── Related laws ────────────────────────────────────────────────────────
@@ -147,9 +166,10 @@ class SearchResultSchema(serializers.Serializer):
 class SearchResponseSchema(serializers.Serializer):
     results = SearchResultSchema(many=True)
     total = serializers.IntegerField()
-    page = serializers.IntegerField()
+    page = serializers.IntegerField(required=False)
     page_size = serializers.IntegerField()
-    total_pages = serializers.IntegerField()
+    total_pages = serializers.IntegerField(required=False)
+    next_cursor = serializers.CharField(required=False, allow_null=True)
 
 
 SEARCH_PARAMETERS = [
@@ -188,6 +208,58 @@ SEARCH_PARAMETERS = [
     ),
     OpenApiParameter("page", int, description="Page number (default: 1)"),
     OpenApiParameter("page_size", int, description="Results per page (default: 10)"),
+    OpenApiParameter(
+        "cursor",
+        str,
+        description="Cursor pagination: pass empty to start, then next_cursor. "
+        "Required past the first 10,000 results.",
+    ),
+]
+
+
+# ── Version diff endpoint ────────────────────────────────────────────────
+
+
+class DiffSummarySchema(serializers.Serializer):
+    added = serializers.IntegerField()
+    removed = serializers.IntegerField()
+    modified = serializers.IntegerField()
+    unchanged = serializers.IntegerField()
+
+
+class ArticleDiffSchema(serializers.Serializer):
+    eId = serializers.CharField()
+    article_id = serializers.CharField()
+    status = serializers.ChoiceField(choices=["added", "removed", "modified"])
+    text = serializers.CharField(required=False)
+    changes = serializers.ListField(
+        child=serializers.ListField(child=serializers.CharField()),
+        required=False,
+        help_text='Word-level ops: ["=", text], ["-", text] or ["+", text]',
+    )
+
+
+class LawDiffSchema(serializers.Serializer):
+    law_id = serializers.CharField()
+    from_date = serializers.DateField()
+    to_date = serializers.DateField()
+    computed_at = serializers.DateTimeField()
+    summary = DiffSummarySchema()
+    articles = ArticleDiffSchema(many=True)
+
+
+DIFF_PARAMETERS = [
+    OpenApiParameter(
+        "from",
+        OpenApiTypes.DATE,
+        description="Publication date of the older version "
+        "(default: the version before `to`)",
+    ),
+    OpenApiParameter(
+        "to",
+        OpenApiTypes.DATE,
+        description="Publication date of the newer version (default: latest)",
+    ),
 ]
 
 
@@ -230,6 +302,9 @@ class LawRefStatsSchema(serializers.Serializer):
     total_incoming = serializers.IntegerField()
     most_referenced_laws = RefCountSchema(many=True)
     most_citing_laws = RefCountSchema(many=True)
+    authority_score = serializers.FloatField(
+        allow_null=True, help_text="Citation PageRank, 1.0 = average cited law"
+    )
 
 
 class LawCrossRefsSchema(serializers.Serializer):
@@ -5,7 +5,10 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .config import INDEX_NAME, es_client
+from . import es_queries, fts_index
+from .config import es_client
+from .cursors import InvalidCursor, decode_cursor, encode_cursor, offset_exceeds_window
+from .es_circuit import SearchUnavailable, call_es, ping_es
 from .schema import SEARCH_PARAMETERS, ErrorSchema, SearchResponseSchema
 from .throttles import SearchRateThrottle
 
@@ -26,238 +29,118 @@ class SearchView(APIView):
             return Response({"results": [], "total": 0})
 
         try:
-            es = es_client
-            if not es.ping():
-                # Fallback for dev/demo if ES is down
-                return Response(
-                    {"results": [], "warning": "Search Engine offline"},
-                    status=status.HTTP_503_SERVICE_UNAVAILABLE,
-                )
-
-            # Get filter parameters
-            jurisdiction = request.query_params.get("jurisdiction", "all")
-            category = request.query_params.get("category", None)
-            search_status = request.query_params.get("status", "all")
             sort_by = request.query_params.get("sort", "relevance")
             page = max(1, int(request.query_params.get("page", 1)))
             page_size = min(max(1, int(request.query_params.get("page_size", 10))), 100)
 
-            # Build Elasticsearch query
-            must_clauses = [
-                {
-                    "multi_match": {
-                        "query": query,
-                        "fields": ["text", "tags"],
-                        "fuzziness": "AUTO",
-                    }
-                }
-            ]
-
-            # Add filter clauses
-            filter_clauses = []
-
-            # Category filter
-            if category and category != "all":
-                filter_clauses.append({"term": {"category": category}})
-
-            # Municipality filter
-            municipality = request.query_params.get("municipality", None)
-            if municipality and municipality != "all":
-                filter_clauses.append({"term": {"municipality": municipality}})
-
-            # Jurisdiction filter (Enhanced for municipal)
-            if jurisdiction and jurisdiction != "all":
-                jurisdictions = jurisdiction.split(",")
-
-                # Build should clauses for selected jurisdictions
-                tier_should = []
-                if "federal" in jurisdictions:
-                    tier_should.append({"term": {"tier": "federal"}})
-                if "state" in jurisdictions:
-                    tier_should.append({"term": {"tier": "state"}})
-                if "municipal" in jurisdictions:
-                    tier_should.append({"term": {"tier": "municipal"}})
-
-                # If we have specific tiers selected, enforce at least one matches
-                if tier_should:
-                    filter_clauses.append(
-                        {"bool": {"should": tier_should, "minimum_should_match": 1}}
-                    )
+            # Cursor mode: ?cursor= (empty) starts a walk, later pages pass
+            # the next_cursor of the previous response.
+            cursor = request.query_params.get("cursor")
+            cursor_mode = cursor is not None
+            search_after, pit_id = decode_cursor(cursor) if cursor else (None, None)
+
+            if fts_index.preferred():
+                return self._fts_search(
+                    request,
+                    query,
+                    sort_by,
+                    page,
+                    page_size,
+                    cursor_mode,
+                    search_after,
+                    pit_id,
+                )
 
-            # Structural/Hierarchy Filters (New in V2)
-            # Example: ?title=Titulo Primero&chapter=Capitulo I
-            structural_title = request.query_params.get("title", None)
-            structural_chapter = request.query_params.get("chapter", None)
-
-            if structural_title:
-                filter_clauses.append({"match": {"title": structural_title}})
-            if structural_chapter:
-                filter_clauses.append({"match": {"chapter": structural_chapter}})
-
-            # State filter
-            state_filter = request.query_params.get("state", None)
-            if state_filter and state_filter != "all":
-                # State ID prefix (e.g., "Colima" -> "colima_")
-                prefix = f"{state_filter.lower()}_"
-                filter_clauses.append({"prefix": {"law_id": prefix}})
-
-            # Date Range Filter
-            date_range = request.query_params.get("date_range", None)
-            if date_range and date_range != "all":
-                from datetime import timedelta
-
-                from django.utils import timezone
-
-                now = timezone.now()
-
-                if date_range == "this_year":
-                    current_year = now.year
-                    start_date = f"{current_year}-01-01"
-                    end_date = f"{current_year}-12-31"
-                    filter_clauses.append(
-                        {
-                            "range": {
-                                "publication_date": {"gte": start_date, "lte": end_date}
-                            }
-                        }
-                    )
+            es = es_client
+            if not ping_es(es):
+                raise SearchUnavailable("Elasticsearch ping failed")
+
+            # ES cursors always carry a PIT. A walk that started on the
+            # SQLite index during an outage finishes there.
+            if search_after is not None and not pit_id:
+                if not fts_index.available():
+                    raise InvalidCursor("Cursor was not issued by Elasticsearch")
+                return self._fts_search(
+                    request,
+                    query,
+                    sort_by,
+                    page,
+                    page_size,
+                    cursor_mode,
+                    search_after,
+                    pit_id,
+                )
 
-                elif date_range == "last_year":
-                    last_year = now.year - 1
-                    start_date = f"{last_year}-01-01"
-                    end_date = f"{last_year}-12-31"
-                    filter_clauses.append(
+            if cursor_mode:
+                if not pit_id:
+                    pit_id = call_es(
+                        es.open_point_in_time, **es_queries.point_in_time()
+                    )["id"]
+                offset = 0
+            else:
+                offset = (page - 1) * page_size
+                if offset_exceeds_window(offset, page_size):
+                    return Response(
                         {
-                            "range": {
-                                "publication_date": {"gte": start_date, "lte": end_date}
-                            }
-                        }
-                    )
-
-                elif date_range == "last_5_years":
-                    start_year = now.year - 5
-                    start_date = f"{start_year}-01-01"
-                    filter_clauses.append(
-                        {"range": {"publication_date": {"gte": start_date}}}
-                    )
-
-                elif date_range == "older":
-                    # Older than 5 years
-                    end_year = now.year - 5
-                    end_date = f"{end_year}-01-01"
-                    filter_clauses.append(
-                        {"range": {"publication_date": {"lt": end_date}}}
+                            "error": "Page too deep for offset pagination. "
+                            "Use the 'cursor' parameter to walk large result sets."
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
                     )
 
-            # Search status (vigente/abrogado)
-            if search_status and search_status != "all":
-                filter_clauses.append({"term": {"status": search_status}})
-
-            # Law type filter (legislative / non_legislative)
-            law_type = request.query_params.get("law_type", "all")
-            if law_type and law_type != "all":
-                filter_clauses.append({"term": {"law_type": law_type}})
-
-            # Build the full query
-            es_query = {"bool": {"must": must_clauses}}
-
-            if filter_clauses:
-                es_query["bool"]["filter"] = filter_clauses
-
-            # Determine sort order
-            sort_option = []
-            if sort_by == "date_desc":
-                sort_option = [{"publication_date": {"order": "desc"}}]
-            elif sort_by == "date_asc":
-                sort_option = [{"publication_date": {"order": "asc"}}]
-            elif sort_by == "name":
-                sort_option = [{"law_id": {"order": "asc"}}]
-            # Default to relevance (no explicit sort, uses _score)
-
-            # Calculate pagination
-            offset = (page - 1) * page_size
-
-            # Build request body
-            body = {
-                "query": es_query,
-                "highlight": {"fields": {"text": {}}},
-                "from": offset,
-                "size": page_size,
-                "aggs": {
-                    "by_tier": {"terms": {"field": "tier"}},
-                    "by_category": {"terms": {"field": "category", "size": 20}},
-                    "by_status": {"terms": {"field": "status"}},
-                    "by_law_type": {"terms": {"field": "law_type"}},
-                    "by_state": {"terms": {"field": "state", "size": 35}},
-                },
-            }
-
-            if sort_option:
-                body["sort"] = sort_option
+            res = call_es(
+                es.search,
+                **es_queries.search(
+                    query,
+                    request.query_params,
+                    sort_by,
+                    page_size,
+                    offset,
+                    search_after,
+                    pit_id,
+                ),
+            )
 
-            # Execute search
-            res = es.search(index=INDEX_NAME, body=body)
             hits = res["hits"]["hits"]
             total = res["hits"]["total"]["value"]
+            results, facets = _es_results(res)
+
+            next_cursor = None
+            if cursor_mode:
+                pit_id = res.get("pit_id", pit_id)
+                if len(hits) == page_size:
+                    next_cursor = encode_cursor(hits[-1]["sort"], pit_id)
+                else:
+                    _close_point_in_time(es, pit_id)
+
+            return _page_response(
+                results, total, facets, page, page_size, cursor_mode, next_cursor
+            )
 
-            # Parse aggregation facets
-            facets = {
-                key: [
-                    {"key": b["key"], "count": b["doc_count"]} for b in agg["buckets"]
-                ]
-                for key, agg in res.get("aggregations", {}).items()
-            }
-
-            # Format results
-            results = []
-            for hit in hits:
-                source = hit["_source"]
-                highlight = hit.get("highlight", {}).get(
-                    "text", [source["text"][:200]]
-                )[0]
-                results.append(
-                    {
-                        "id": hit["_id"],
-                        "law_id": source.get("law_id"),
-                        "law_name": source.get(
-                            "law_name", source.get("law_id")
-                        ),  # Fallback to ID if name missing
-                        "article": f"Art. {source.get('article', source.get('article_id'))}",
-                        "snippet": highlight,
-                        "date": source.get("publication_date"),
-                        "score": hit["_score"],
-                        "tier": source.get("tier"),
-                        "law_type": source.get("law_type"),
-                        "state": source.get("state"),
-                        "municipality": source.get("municipality"),
-                        # V2 Hierarchy fields
-                        "hierarchy": source.get("hierarchy", []),
-                        "book": source.get("book"),
-                        "title": source.get("title"),
-                        "chapter": source.get("chapter"),
-                    }
+        except SearchUnavailable:
+            # A PIT cursor cannot be continued anywhere else
+            if fts_index.available() and not pit_id:
+                response = self._fts_search(
+                    request,
+                    query,
+                    sort_by,
+                    page,
+                    page_size,
+                    cursor_mode,
+                    search_after,
+                    pit_id,
                 )
-
-            # Calculate pagination metadata
-            total_pages = math.ceil(total / page_size) if total > 0 else 0
-
-            response = Response(
-                {
-                    "results": results,
-                    "total": total,
-                    "page": page,
-                    "page_size": page_size,
-                    "total_pages": total_pages,
-                    "facets": facets,
-                }
+                # Degraded results must not outlive the outage in caches
+                response["Cache-Control"] = "no-store"
+                return response
+            return Response(
+                {"results": [], "warning": "Search Engine offline"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
             )
-            response["Cache-Control"] = "public, max-age=300"
-            return response
-
         except ValueError:
             return Response(
                 {
-                    "error": "Invalid parameter value. Check page and page_size are valid numbers."
+                    "error": "Invalid parameter value. Check page, page_size and cursor are valid."
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
@@ -269,3 +152,138 @@ class SearchView(APIView):
                 {"error": "An internal error occurred while searching."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    def _fts_search(
+        self,
+        request,
+        query,
+        sort_by,
+        page,
+        page_size,
+        cursor_mode,
+        search_after,
+        pit_id,
+    ):
+        """SearchView over the SQLite FTS5 index (apps.api.fts_index)."""
+        if pit_id:
+            raise InvalidCursor("Cursor was issued by Elasticsearch")
+        offset = (page - 1) * page_size
+        if not cursor_mode and offset_exceeds_window(offset, page_size):
+            return Response(
+                {
+                    "error": "Page too deep for offset pagination. "
+                    "Use the 'cursor' parameter to walk large result sets."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        res = fts_index.search(
+            query,
+            filters=request.query_params,
+            sort=sort_by,
+            size=page_size,
+            offset=0 if cursor_mode else offset,
+            after=search_after,
+        )
+        hits = res["hits"]
+        results = [
+            _format_result(
+                f"{hit['law_id']}-{hit['article']}", hit, hit["score"], hit["snippet"]
+            )
+            for hit in hits
+        ]
+
+        next_cursor = None
+        if cursor_mode and len(hits) == page_size:
+            next_cursor = encode_cursor(hits[-1]["sort"])
+
+        response = _page_response(
+            results,
+            res["total"],
+            res["facets"],
+            page,
+            page_size,
+            cursor_mode,
+            next_cursor,
+        )
+        response["X-Search-Engine"] = "sqlite"
+        return response
+
+
+def _format_result(doc_id, source, score, snippet):
+    """One search result from an ES _source or an FTS hit (same fields)."""
+    return {
+        "id": doc_id,
+        "law_id": source.get("law_id"),
+        "law_name": source.get(
+            "law_name", source.get("law_id")
+        ),  # Fallback to ID if name missing
+        "article": f"Art. {source.get('article', source.get('article_id'))}",
+        "snippet": snippet,
+        "date": source.get("publication_date"),
+        "score": score,
+        "tier": source.get("tier"),
+        "law_type": source.get("law_type"),
+        "state": source.get("state"),
+        "municipality": source.get("municipality"),
+        # V2 Hierarchy fields
+        "hierarchy": source.get("hierarchy", []),
+        "book": source.get("book"),
+        "title": source.get("title"),
+        "chapter": source.get("chapter"),
+    }
+
+
+def _es_results(res):
+    """Formatted results and aggregation facets of an ES search response."""
+    facets = {
+        key: [{"key": b["key"], "count": b["doc_count"]} for b in agg["buckets"]]
+        for key, agg in res.get("aggregations", {}).items()
+    }
+
+    results = []
+    for hit in res["hits"]["hits"]:
+        source = hit["_source"]
+        highlight = hit.get("highlight", {}).get("text", [source["text"][:200]])[0]
+        results.append(_format_result(hit["_id"], source, hit["_score"], highlight))
+    return results, facets
+
+
+def _page_response(results, total, facets, page, page_size, cursor_mode, next_cursor):
+    if cursor_mode:
+        response_data = {
+            "results": results,
+            "total": total,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+        }
+        if facets:
+            response_data["facets"] = facets
+        # Cursors embed a short-lived PIT; never cache them
+        return Response(response_data)
+
+    # Calculate pagination metadata
+    total_pages = math.ceil(total / page_size) if total > 0 else 0
+
+    response = Response(
+        {
+            "results": results,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+            "facets": facets,
+        }
+    )
+    response["Cache-Control"] = "public, max-age=300"
+    return response
+
+
+def _close_point_in_time(es, pit_id):
+    """Release a PIT once a cursor walk reaches its last page."""
+    try:
+        es.close_point_in_time(**es_queries.close_point_in_time(pit_id))
+    except Exception:
+        import logging
+
+        logging.getLogger(__name__).debug("Could not close PIT", exc_info=True)
@@ -0,0 +1,81 @@
+"""
+Materialized dashboard snapshots.
+
+The homepage stats and the admin coverage reports aggregate the whole
+corpus (DB counts, ES count, registry file, data directory walks). They
+only change when ingestion or indexing runs, so they are computed by a
+Celery task and stored in StatsSnapshot; views read a single row.
+
+If a snapshot has never been computed (fresh install, tests) the first
+read builds it inline and stores it.
+"""
+
+import logging
+
+from .metrics import record_cache
+from .models import StatsSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+def _build_law_stats():
+    from .law_views import compute_law_stats
+
+    return compute_law_stats()
+
+
+def _build_coverage_report():
+    from apps.scraper.dataops.coverage_dashboard import CoverageDashboard
+
+    return CoverageDashboard().full_report()
+
+
+def _build_coverage_dashboard():
+    from apps.scraper.dataops.coverage_dashboard import CoverageDashboard
+
+    return CoverageDashboard().dashboard_report()
+
+
+SNAPSHOT_BUILDERS = {
+    "law_stats": _build_law_stats,
+    "coverage_report": _build_coverage_report,
+    "coverage_dashboard": _build_coverage_dashboard,
+}
+
+
+def build_snapshot(key: str) -> dict:
+    """Compute a snapshot payload and store it. Returns the stored data."""
+    data = SNAPSHOT_BUILDERS[key]()
+    snapshot, _ = StatsSnapshot.objects.update_or_create(
+        key=key, defaults={"data": data}
+    )
+    # Return the JSON round-tripped payload so callers see what readers see
+    snapshot.refresh_from_db(fields=["data"])
+    return snapshot.data
+
+
+def get_snapshot(key: str) -> dict:
+    """Read a snapshot, building it on first access."""
+    data = StatsSnapshot.objects.filter(key=key).values_list("data", flat=True).first()
+    record_cache("snapshot", hit=data is not None)
+    if data is None:
+        data = build_snapshot(key)
+    return data
+
+
+def refresh_snapshots(keys=None) -> dict:
+    """
+    Recompute snapshots. A failing builder is logged and skipped so one
+    broken data source does not leave every dashboard stale.
+
+    Returns {key: "ok" | "error"}.
+    """
+    results = {}
+    for key in keys or SNAPSHOT_BUILDERS:
+        try:
+            build_snapshot(key)
+            results[key] = "ok"
+        except Exception:
+            logger.exception("Failed to refresh snapshot %s", key)
+            results[key] = "error"
+    return results
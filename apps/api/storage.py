@@ -11,6 +11,7 @@ Backend selection via STORAGE_BACKEND env var:
 
 import logging
 import os
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional
@@ -70,7 +71,13 @@ class LocalStorageBackend(StorageBackend):
     def put(self, key: str, data: bytes) -> str:
         path = self._resolve(key)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_bytes(data)
+        # Write-then-rename so readers (including mmaps of the old file)
+        # never see a partially written object
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600
+        os.replace(tmp, path)
         return key
 
     def put_file(self, key: str, local_path: Path) -> str:
@@ -0,0 +1,163 @@
+"""
+In-process autocomplete index for law names.
+
+`name__icontains` is a sequential scan on every keystroke. Law names change
+only when ingestion runs, so each worker keeps a sorted array of
+accent-folded name keys and answers prefix queries with two bisections.
+
+Every word position of a name is indexed ("ley federal del trabajo" is also
+stored as "federal del trabajo", "del trabajo", "trabajo"), which gives
+both whole-name prefix and word-prefix matching with the same lookup.
+
+Freshness: saving or deleting a Law in this process marks the index dirty;
+other processes (ingestion commands) are picked up by a cheap signature
+check at most every REFRESH_SECONDS.
+"""
+
+import bisect
+import re
+import threading
+import time
+import unicodedata
+
+from django.db.models import Count, Max
+
+REFRESH_SECONDS = 300
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase, strip accents and punctuation: 'Código Civil' -> 'codigo civil'."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    folded = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(" ", folded.lower()).strip()
+
+
+class SuggestIndex:
+    """Immutable prefix index over (law, word offset) keys."""
+
+    def __init__(self, laws, popularity=None):
+        """
+        Args:
+            laws: iterable of dicts with official_id, name, tier
+            popularity: optional {official_id: score} used to rank ties
+        """
+        popularity = popularity or {}
+        self.laws = []
+        entries = []
+        for law in laws:
+            idx = len(self.laws)
+            self.laws.append(
+                {
+                    "id": law["official_id"],
+                    "name": law["name"],
+                    "tier": law["tier"],
+                    "popularity": popularity.get(law["official_id"], 0),
+                }
+            )
+            words = normalize(law["name"]).split()
+            for pos in range(len(words)):
+                entries.append((" ".join(words[pos:]), pos, idx))
+        entries.sort()
+        self._keys = [e[0] for e in entries]
+        self._entries = entries
+
+    def __len__(self):
+        return len(self.laws)
+
+    def search(self, query: str, limit: int = 8) -> list[dict]:
+        """
+        Return up to `limit` laws whose name, or any word in it, starts with
+        the query. Whole-name prefix matches rank first, then popularity.
+        """
+        prefix = normalize(query)
+        if not prefix:
+            return []
+
+        lo = bisect.bisect_left(self._keys, prefix)
+        hi = bisect.bisect_left(self._keys, prefix + "\uffff", lo)
+
+        best = {}
+        for _, pos, idx in self._entries[lo:hi]:
+            # Keep the earliest word position per law
+            if idx not in best or pos < best[idx]:
+                best[idx] = pos
+
+        ranked = sorted(
+            best.items(),
+            key=lambda item: (
+                item[1] > 0,
+                -self.laws[item[0]]["popularity"],
+                self.laws[item[0]]["name"],
+            ),
+        )
+        return [
+            {k: self.laws[idx][k] for k in ("id", "name", "tier")}
+            for idx, _ in ranked[:limit]
+        ]
+
+
+_lock = threading.Lock()
+_state = {"index": None, "signature": None, "checked_at": 0.0, "dirty": True}
+
+
+def _signature():
+    from .models import Law
+
+    agg = Law.objects.aggregate(n=Count("id"), latest=Max("updated_at"))
+    return (agg["n"], agg["latest"])
+
+
+def _popularity():
+    """Incoming cross-reference counts per law as a popularity signal."""
+    from .models import CrossReference
+
+    rows = (
+        CrossReference.objects.exclude(target_law_slug__isnull=True)
+        .values_list("target_law_slug")
+        .annotate(c=Count("id"))
+        .values_list("target_law_slug", "c")
+    )
+    return dict(rows)
+
+
+def build_index() -> SuggestIndex:
+    from .models import Law
+
+    laws = Law.objects.values("official_id", "name", "tier").iterator()
+    return SuggestIndex(laws, popularity=_popularity())
+
+
+def get_index() -> SuggestIndex:
+    """Return the current index, rebuilding it when stale."""
+    now = time.monotonic()
+    state = _state
+    if (
+        state["index"] is not None
+        and not state["dirty"]
+        and now - state["checked_at"] < REFRESH_SECONDS
+    ):
+        return state["index"]
+
+    with _lock:
+        if state["index"] is not None and not state["dirty"]:
+            if now - state["checked_at"] < REFRESH_SECONDS:
+                return state["index"]
+            signature = _signature()
+            state["checked_at"] = now
+            if signature == state["signature"]:
+                return state["index"]
+        else:
+            signature = _signature()
+
+        state["dirty"] = False
+        state["index"] = build_index()
+        state["signature"] = signature
+        state["checked_at"] = now
+        return state["index"]
+
+
+def invalidate(**kwargs):
+    """Mark the index stale (connected to Law post_save/post_delete)."""
+    _state["dirty"] = True
@@ -16,6 +16,8 @@ STATUS_FILE = DATA_DIR / "ingestion_status.json"
 LOG_FILE = DATA_DIR / "logs" / "ingestion.log"
 PIPELINE_STATUS_FILE = DATA_DIR / "pipeline_status.json"
 PIPELINE_LOG_FILE = DATA_DIR / "logs" / "pipeline.log"
+# Per-stage trace reports of the nightly parse and ingest phases
+TRACE_DIR = DATA_DIR / "logs"
 
 
 def _ensure_paths():
@@ -147,6 +149,7 @@ def run_ingestion(self, params=None):
         if process.returncode == 0:
             status_data["status"] = "completed"
             status_data["message"] = "Ingestion finished successfully"
+            refresh_stats_snapshot.delay()
 
             if results_file.exists():
                 try:
@@ -262,6 +265,8 @@ def _build_pipeline_phases(params):
                         "--all",
                         "--workers",
                         str(workers),
+                        "--trace-report",
+                        str(TRACE_DIR / "trace_state_parse.json"),
                     ],
                     "cwd": str(BASE_DIR),
                 }
@@ -277,6 +282,8 @@ def _build_pipeline_phases(params):
                         "--all",
                         "--workers",
                         str(workers),
+                        "--trace-report",
+                        str(TRACE_DIR / "trace_municipal_parse.json"),
                     ],
                     "cwd": str(BASE_DIR),
                 }
@@ -296,6 +303,8 @@ def _build_pipeline_phases(params):
                 str(workers),
                 "--output",
                 results_file,
+                "--trace-report",
+                str(TRACE_DIR / "trace_federal.json"),
             ],
             "cwd": str(BASE_DIR),
         }
@@ -524,9 +533,48 @@ def run_full_pipeline(self, params=None):
     # Finalize DataOps log
     _finish_acquisition_log(pipeline_log, succeeded, failed, total_phases)
 
+    # Dashboards read materialized stats; recompute after the corpus changed
+    refresh_stats_snapshot.delay()
+
     return status_data
 
 
+@shared_task(name="apps.api.tasks.refresh_stats_snapshot")
+def refresh_stats_snapshot(keys=None):
+    """
+    Recompute the materialized homepage/coverage snapshots.
+
+    Runs after ingestion and indexing and on a beat schedule.
+    """
+    from .snapshots import refresh_snapshots
+
+    return refresh_snapshots(keys)
+
+
+@shared_task(name="apps.api.tasks.flush_export_logs")
+def flush_export_logs():
+    """Bulk-insert ExportLog rows queued in Redis by export requests."""
+    from .export_throttles import flush_pending_export_logs
+
+    return flush_pending_export_logs()
+
+
+@shared_task(name="apps.api.tasks.rebuild_citation_graph")
+def rebuild_citation_graph():
+    """Recompute citation degrees and authority scores for laws and articles."""
+    from .citation_graph import rebuild_citation_graph as rebuild
+
+    return rebuild()
+
+
+@shared_task(name="apps.api.tasks.rebuild_related_laws")
+def rebuild_related_laws():
+    """Recompute and store every law's related laws (more_like_this)."""
+    from .related_laws import rebuild_related_laws as rebuild
+
+    return rebuild()
+
+
 def _create_acquisition_log(operation, params):
     """Create a DataOps AcquisitionLog entry (fails gracefully)."""
     try:
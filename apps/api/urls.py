@@ -16,7 +16,10 @@ from .admin_views import (
     system_config,
     system_metrics,
 )
+from .article_batch_views import article_batch
+from .config import API_ASYNC_VIEWS
 from .cross_reference_views import article_cross_references, law_cross_references
+from .diff_views import law_diff
 from .export_views import (
     export_docx,
     export_epub,
@@ -26,9 +29,9 @@ from .export_views import (
     export_quota,
     export_txt,
 )
+from .law_list_views import LawListView
 from .law_views import (
     LawDetailView,
-    LawListView,
     RelatedLawsView,
     categories_list,
     law_articles,
@@ -43,6 +46,22 @@ from .middleware.janua_auth import JanuaJWTAuthentication
 from .search_views import SearchView
 from .views import IngestionView
 
+if API_ASYNC_VIEWS:
+    # ASGI deployments: same URLs and names, served by coroutines
+    from . import async_views
+
+    search_view = async_views.search
+    law_detail_view = async_views.law_detail
+    law_search_view = async_views.law_search
+    law_articles_view = async_views.law_articles
+    law_related_view = async_views.related_laws
+else:
+    search_view = SearchView.as_view()
+    law_detail_view = LawDetailView.as_view()
+    law_search_view = law_search
+    law_articles_view = law_articles
+    law_related_view = RelatedLawsView.as_view()
+
 
 def _protected(view_func):
     """Apply Janua JWT authentication to an admin view."""
@@ -79,12 +98,12 @@ urlpatterns = [
     path("admin/roadmap/", _protected(roadmap), name="admin-roadmap"),
     path("ingest/", _protected(IngestionView.as_view()), name="ingest"),
     # ── Public endpoints (no auth) ────────────────────────────────────
-    path("search/", SearchView.as_view(), name="search"),
+    path("search/", search_view, name="search"),
     path("stats/", law_stats, name="law-stats"),
     path("laws/", LawListView.as_view(), name="law-list"),
-    path("laws/<str:law_id>/", LawDetailView.as_view(), name="law-detail"),
-    path("laws/<str:law_id>/search/", law_search, name="law-search"),
-    path("laws/<str:law_id>/articles/", law_articles, name="law-articles"),
+    path("laws/<str:law_id>/", law_detail_view, name="law-detail"),
+    path("laws/<str:law_id>/search/", law_search_view, name="law-search"),
+    path("laws/<str:law_id>/articles/", law_articles_view, name="law-articles"),
     path(
         "laws/<str:law_id>/articles/<str:article_id>/references/",
         article_cross_references,
@@ -92,7 +111,8 @@ urlpatterns = [
     ),
     path("laws/<str:law_id>/structure/", law_structure, name="law-structure"),
     path("laws/<str:law_id>/references/", law_cross_references, name="law-references"),
-    path("laws/<str:law_id>/related/", RelatedLawsView.as_view(), name="law-related"),
+    path("laws/<str:law_id>/related/", law_related_view, name="law-related"),
+    path("laws/<str:law_id>/diff/", law_diff, name="law-diff"),
     path("laws/<str:law_id>/export/pdf/", export_pdf, name="law-export-pdf"),
     path("laws/<str:law_id>/export/txt/", export_txt, name="law-export-txt"),
     path("laws/<str:law_id>/export/latex/", export_latex, name="law-export-latex"),
@@ -100,6 +120,7 @@ urlpatterns = [
     path("laws/<str:law_id>/export/epub/", export_epub, name="law-export-epub"),
     path("laws/<str:law_id>/export/json/", export_json, name="law-export-json"),
     path("laws/<str:law_id>/export/quota/", export_quota, name="law-export-quota"),
+    path("articles/batch/", article_batch, name="article-batch"),
     path("categories/", categories_list, name="categories-list"),
     path("states/", states_list, name="states-list"),
     path("municipalities/", municipalities_list, name="municipalities-list"),
@@ -0,0 +1,19 @@
+"""
+On-demand imports for optional, heavy dependencies.
+
+Export formats and embeddings pull in large libraries (WeasyPrint, torch)
+that most processes never use. Importing them on first use instead of at
+module load keeps API and worker startup fast.
+"""
+
+import importlib
+from functools import cache
+
+
+@cache
+def optional_import(name):
+    """Import and return module `name`, or None if it is not installed."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
@@ -5,9 +5,11 @@ Resolves relative data paths (from metadata JSON files) to absolute paths,
 checking Docker prefix (/app/) first, then project BASE_DIR, then cwd.
 """
 
+import io
 import json
 import os
 from pathlib import Path
+from typing import BinaryIO
 
 # Project root: 3 levels up from this file (utils/ -> api/ -> apps/ -> project root)
 BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
@@ -217,3 +219,38 @@ def read_data_content(relative_path: str, encoding: str = "utf-8") -> str | None
             return None
 
     return None
+
+
+def open_data_stream(relative_path: str) -> BinaryIO | None:
+    """
+    Open a data file for incremental binary reads.
+
+    Same lookup as read_data_content(), but returns a seekable binary file
+    instead of decoding everything into a string, so large XML can be
+    parsed as a stream. Local files are opened directly; R2 objects are
+    fetched into memory once. The caller closes the stream.
+
+    Returns:
+        Binary file object, or None if not found anywhere.
+    """
+    if not relative_path:
+        return None
+
+    local_path = resolve_data_path_or_none(relative_path)
+    if local_path:
+        return open(local_path, "rb")
+
+    if os.environ.get("STORAGE_BACKEND") == "r2":
+        from apps.api.storage import get_storage_backend
+
+        storage = get_storage_backend()
+        key = relative_path.lstrip("/")
+        if key.startswith("data/"):
+            key = key[5:]
+
+        try:
+            return io.BytesIO(storage.get(key))
+        except Exception:
+            return None
+
+    return None
@@ -0,0 +1,10 @@
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "apps.indigo.settings")
+
+# Served by uvicorn workers under gunicorn (see the Dockerfile) with
+# API_ASYNC_VIEWS=true, which mounts the async search and law-read views
+# (apps.api.async_views). Needs the `asgi` extra (uvicorn, aiohttp).
+application = get_asgi_application()
@@ -0,0 +1,28 @@
+"""
+Gunicorn settings for the API image (see CMD in apps/indigo/Dockerfile).
+
+Workers are separate processes, so Prometheus metrics run in
+prometheus_client's multiprocess mode: each worker writes its samples to
+files in PROMETHEUS_MULTIPROC_DIR and /metrics sums them over the pod.
+The variable is set here, before the workers fork and import the app.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+PROMETHEUS_DIR = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", "/tmp/tezca-prometheus"
+)
+
+
+def on_starting(server):
+    # Files left by a previous master would be summed into the new counters
+    shutil.rmtree(PROMETHEUS_DIR, ignore_errors=True)
+    Path(PROMETHEUS_DIR).mkdir(parents=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -75,6 +75,8 @@ SPECTACULAR_SETTINGS = {
 }
 
 MIDDLEWARE = [
+    # First, so its timings cover the rest of the stack
+    "apps.api.middleware.metrics.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -103,6 +105,7 @@ TEMPLATES = [
 
 ROOT_URLCONF = "apps.indigo.urls"
 WSGI_APPLICATION = "apps.indigo.wsgi.application"
+ASGI_APPLICATION = "apps.indigo.asgi.application"
 
 if os.environ.get("DATABASE_URL") or os.environ.get("DB_ENGINE", "").startswith(
     "django.db.backends.postgresql"
@@ -214,6 +217,12 @@ CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_TRACK_STARTED = True
 
+# ── Export quotas ───────────────────────────────────────────────────────
+# Redis shared by all workers for export quota counters and the pending
+# ExportLog queue; defaults to the Celery broker. Set to "" to count quotas
+# from ExportLog rows with synchronous writes.
+EXPORT_QUOTA_REDIS_URL = os.environ.get("EXPORT_QUOTA_REDIS_URL", CELERY_BROKER_URL)
+
 # ── Celery Beat Schedule ────────────────────────────────────────────────
 from celery.schedules import crontab  # noqa: E402
 
@@ -244,4 +253,21 @@ CELERY_BEAT_SCHEDULE = {
         "task": "dataops.check_dof_daily",
         "schedule": crontab(hour=7, minute=0),
     },
+    "stats-snapshot-refresh": {
+        "task": "apps.api.tasks.refresh_stats_snapshot",
+        "schedule": crontab(minute="*/30"),
+    },
+    "export-log-flush": {
+        "task": "apps.api.tasks.flush_export_logs",
+        "schedule": crontab(),  # every minute
+    },
+    "citation-graph-rebuild": {
+        "task": "apps.api.tasks.rebuild_citation_graph",
+        "schedule": crontab(hour=2, minute=30),
+    },
+    # After the citation graph: related-law scores use its authority
+    "related-laws-rebuild": {
+        "task": "apps.api.tasks.rebuild_related_laws",
+        "schedule": crontab(hour=3, minute=30),
+    },
 }
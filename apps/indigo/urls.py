@@ -6,8 +6,12 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
+from apps.api.admin_views import prometheus_metrics
+
 urlpatterns = [
     path("admin/", admin.site.urls),
+    # Prometheus scrape target
+    path("metrics", prometheus_metrics, name="metrics"),
     path("api/v1/", include("apps.api.urls")),
     # OpenAPI schema
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
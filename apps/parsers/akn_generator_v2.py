@@ -9,12 +9,13 @@ Improvements over v1:
 - Better error reporting
 """
 
+import itertools
 import re
 import sys
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, List, Tuple, Union
 
 from lxml import etree
 
@@ -33,6 +34,20 @@ from apps.parsers.patterns import (
 
 # Import ordinal mapping helper
 from apps.parsers.patterns.articles import ordinal_to_number
+from apps.parsers.patterns.registry import register
+from apps.parsers.patterns.structure import ORDINAL_PATTERNS
+
+_PUNCTUATION_RE = register("akn.punctuation", r"[.;:]")
+_LEGAL_PHRASE_RE = register(
+    "akn.legal_phrase",
+    r"(en términos|conforme|de acuerdo|lo dispuesto)",
+    re.IGNORECASE,
+)
+_LEADING_NUMBER_RE = register("akn.leading_number", r"(\d+)")
+
+# Streaming writer: pretty-print indent, and the element types placed in <body>
+_INDENT = "  "
+_BODY_TYPES = {"book", "title", "chapter", "article", "transitorio"}
 
 
 @dataclass
@@ -149,9 +164,11 @@ class AkomaNtosoGeneratorV2:
 
         return elements
 
-    # Regex for detecting TRANSITORIOS headers (compiled once at class level)
-    _TRANSITORIOS_RE = re.compile(
-        r"^\s*(ART[ÍI]CULOS?\s+)?TRANSITORIOS?\s*$", re.IGNORECASE
+    # Regex for detecting TRANSITORIOS headers
+    _TRANSITORIOS_RE = register(
+        "akn.transitorios_boundary",
+        r"^\s*(ART[ÍI]CULOS?\s+)?TRANSITORIOS?\s*$",
+        re.IGNORECASE,
     )
 
     def _find_articles(self, lines: List[str]) -> List[Dict]:
@@ -278,13 +295,9 @@ class AkomaNtosoGeneratorV2:
         trans_text = text[trans_start:]
 
         # Find ordinal articles
-        from apps.parsers.patterns.structure import ORDINAL_PATTERNS
-
+        entries = self.transitorios_patterns["entries"]
         for ordinal_pattern, number in ORDINAL_PATTERNS.items():
-            pattern = re.compile(
-                f"^({ordinal_pattern})\\.-\\s+(.+?)(?=^[A-ZÚÉÍÓÁ]+\\.-|\\Z)",
-                re.MULTILINE | re.DOTALL | re.IGNORECASE,
-            )
+            pattern = entries[ordinal_pattern]
 
             for match in pattern.finditer(trans_text):
                 content = match.group(2).strip()
@@ -319,13 +332,11 @@ class AkomaNtosoGeneratorV2:
             score -= 0.1
 
         # Reduce score if no punctuation (likely incomplete)
-        if not re.search(r"[.;:]", content):
+        if not _PUNCTUATION_RE.search(content):
             score -= 0.2
 
         # Boost score for typical legal language
-        if re.search(
-            r"(en términos|conforme|de acuerdo|lo dispuesto)", content, re.IGNORECASE
-        ):
+        if _LEGAL_PHRASE_RE.search(content):
             score += 0.05
 
         return max(0.0, min(1.0, score))
@@ -343,7 +354,7 @@ class AkomaNtosoGeneratorV2:
         nums = []
         for art_num in article_numbers:
             # Extract number part (before dash or letter)
-            match = re.match(r"(\d+)", art_num)
+            match = _LEADING_NUMBER_RE.match(art_num)
             if match:
                 nums.append(int(match.group(1)))
 
@@ -417,11 +428,21 @@ class AkomaNtosoGeneratorV2:
         return result
 
     def generate_xml(
-        self, text: str, metadata: Dict[str, Any], output_path: Path
-    ) -> Tuple[Path, ParseResult]:
+        self,
+        text: str,
+        metadata: Dict[str, Any],
+        output_path: Union[Path, BinaryIO],
+        streaming: bool = False,
+    ) -> Tuple[Union[Path, BinaryIO], ParseResult]:
         """
         Generate Akoma Ntoso XML from text.
 
+        With streaming=True the document is written incrementally with
+        etree.xmlfile instead of building the whole tree first, so memory
+        for the XML stays flat however large the law is. output_path may
+        then also be a writable binary stream (e.g. a storage upload).
+        Both modes produce byte-identical output.
+
         Returns:
             (output_path, parse_result)
         """
@@ -441,12 +462,43 @@ class AkomaNtosoGeneratorV2:
             for warning in result.warnings[:5]:  # Show first 5
                 print(f"   - {warning}")
 
+        if streaming:
+            if isinstance(output_path, (str, Path)):
+                output_path = Path(output_path)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(output_path, "wb") as f:
+                    self.write_xml_stream(f, result.elements, metadata)
+            else:
+                self.write_xml_stream(output_path, result.elements, metadata)
+            print(f"\n✅ Generated Akoma Ntoso XML: {output_path}")
+            return output_path, result
+
         # Create XML structure (same as v1 for now)
         root = etree.Element("akomaNtoso", nsmap=self.nsmap)
         act = etree.SubElement(root, "act", name="law")
 
         # Meta section
-        meta = etree.SubElement(act, "meta")
+        act.append(self._build_meta(metadata))
+
+        # Body
+        body = etree.SubElement(act, "body")
+
+        # Build hierarchical structure
+        self._build_xml_hierarchy(body, result.elements)
+
+        # Write to file
+        tree = etree.ElementTree(root)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tree.write(
+            str(output_path), encoding="utf-8", xml_declaration=True, pretty_print=True
+        )
+
+        print(f"\n✅ Generated Akoma Ntoso XML: {output_path}")
+        return output_path, result
+
+    def _build_meta(self, metadata: Dict[str, Any]) -> etree.Element:
+        """Build the <meta> FRBR identification block."""
+        meta = etree.Element("meta")
         identification = etree.SubElement(meta, "identification", source="#antigravity")
 
         # FRBR Work
@@ -481,45 +533,63 @@ class AkomaNtosoGeneratorV2:
             manifestation, "FRBRdate", date=str(date.today()), name="Generation"
         )
         etree.SubElement(manifestation, "FRBRauthor", href="#antigravity")
-
-        # Body
-        body = etree.SubElement(act, "body")
-
-        # Build hierarchical structure
-        self._build_xml_hierarchy(body, result.elements)
-
-        # Write to file
-        tree = etree.ElementTree(root)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        tree.write(
-            str(output_path), encoding="utf-8", xml_declaration=True, pretty_print=True
-        )
-
-        print(f"\n✅ Generated Akoma Ntoso XML: {output_path}")
-        return output_path, result
+        return meta
+
+    def _build_heading(self, elem: Dict) -> etree.Element:
+        """Build a book/title/chapter element holding only its <num>."""
+        node = etree.Element(elem["type"], id=elem["id"])
+        num = etree.SubElement(node, "num")
+        num.text = elem["full_text"]
+        return node
+
+    def _build_article(self, elem: Dict) -> etree.Element:
+        """Build an <article> (regular or transitorio) with its reform notes."""
+        article_elem = etree.Element("article", id=elem["id"])
+        num_elem = etree.SubElement(article_elem, "num")
+
+        if elem["type"] == "transitorio":
+            num_elem.text = elem["ordinal"]
+        else:
+            num_elem.text = f"Artículo {elem['number']}"
+
+        # Content
+        para = etree.SubElement(article_elem, "paragraph", id=f"{elem['id']}-para-1")
+        content = etree.SubElement(para, "content")
+        p = etree.SubElement(content, "p")
+        p.text = elem["content"]
+
+        # Add reform metadata as notes
+        if elem.get("reforms"):
+            for reform in elem["reforms"]:
+                note = etree.SubElement(
+                    article_elem,
+                    "note",
+                    placementBase=f"#{elem['id']}",
+                    placement="bottom",
+                )
+                note_p = etree.SubElement(note, "p")
+                note_p.text = reform["full_text"]
+        return article_elem
 
     def _build_xml_hierarchy(self, body: etree.Element, elements: List[Dict]):
         """Build hierarchical XML structure from parsed elements."""
         current_book = None
         current_title = None
         current_chapter = None
-        current_section = None
 
         for elem in elements:
             elem_type = elem["type"]
 
             if elem_type == "book":
-                current_book = etree.SubElement(body, "book", id=elem["id"])
-                num = etree.SubElement(current_book, "num")
-                num.text = elem["full_text"]
+                current_book = self._build_heading(elem)
+                body.append(current_book)
                 current_title = None
                 current_chapter = None
 
             elif elem_type == "title":
                 parent = current_book if current_book is not None else body
-                current_title = etree.SubElement(parent, "title", id=elem["id"])
-                num = etree.SubElement(current_title, "num")
-                num.text = elem["full_text"]
+                current_title = self._build_heading(elem)
+                parent.append(current_title)
                 current_chapter = None
 
             elif elem_type == "chapter":
@@ -530,9 +600,8 @@ class AkomaNtosoGeneratorV2:
                 else:
                     parent = body
 
-                current_chapter = etree.SubElement(parent, "chapter", id=elem["id"])
-                num = etree.SubElement(current_chapter, "num")
-                num.text = elem["full_text"]
+                current_chapter = self._build_heading(elem)
+                parent.append(current_chapter)
 
             elif elem_type in ["article", "transitorio"]:
                 # Determine parent
@@ -545,33 +614,99 @@ class AkomaNtosoGeneratorV2:
                 else:
                     parent = body
 
-                article_elem = etree.SubElement(parent, "article", id=elem["id"])
-                num_elem = etree.SubElement(article_elem, "num")
+                parent.append(self._build_article(elem))
 
-                if elem_type == "transitorio":
-                    num_elem.text = elem["ordinal"]
-                else:
-                    num_elem.text = f"Artículo {elem['number']}"
+    # ------------------------------------------------------------------
+    # Streaming writer
+    # ------------------------------------------------------------------
 
-                # Content
-                para = etree.SubElement(
-                    article_elem, "paragraph", id=f"{elem['id']}-para-1"
-                )
-                content = etree.SubElement(para, "content")
-                p = etree.SubElement(content, "p")
-                p.text = elem["content"]
-
-                # Add reform metadata as notes
-                if elem.get("reforms"):
-                    for reform in elem["reforms"]:
-                        note = etree.SubElement(
-                            article_elem,
-                            "note",
-                            placementBase=f"#{elem['id']}",
-                            placement="bottom",
-                        )
-                        note_p = etree.SubElement(note, "p")
-                        note_p.text = reform["full_text"]
+    # Nesting rank of the containers _build_xml_hierarchy opens; an element
+    # closes every open container of the same or a deeper rank
+    _CONTAINER_RANK = {"book": 1, "title": 2, "chapter": 3}
+
+    def write_xml_stream(
+        self, stream: BinaryIO, elements: Iterable[Dict], metadata: Dict[str, Any]
+    ) -> None:
+        """
+        Write the AKN document for `elements` to a binary stream.
+
+        Elements are consumed one at a time and each article is serialized
+        as soon as it is seen, so only the open book/title/chapter chain is
+        ever held. Nesting and whitespace reproduce generate_xml's
+        pretty-printed tree output byte for byte.
+        """
+        elements = (e for e in elements if e["type"] in _BODY_TYPES)
+        first = next(elements, None)
+
+        stream.write(b"<?xml version='1.0' encoding='UTF-8'?>\n")
+        with etree.xmlfile(stream, encoding="utf-8") as xf:
+            with xf.element("akomaNtoso", nsmap=self.nsmap):
+                xf.write("\n" + _INDENT)
+                with xf.element("act", name="law"):
+                    xf.write("\n" + _INDENT * 2)
+                    _write_pretty(xf, self._build_meta(metadata), 2)
+                    xf.write("\n" + _INDENT * 2)
+                    if first is None:
+                        xf.write(etree.Element("body"))
+                    else:
+                        with xf.element("body"):
+                            xf.write("\n")
+                            self._stream_body(xf, itertools.chain([first], elements))
+                            xf.write(_INDENT * 2)
+                    xf.write("\n" + _INDENT)
+                xf.write("\n")
+        stream.write(b"\n")
+
+    def _stream_body(self, xf, elements: Iterable[Dict]) -> None:
+        """Stream <body> children, nested as _build_xml_hierarchy does."""
+        body_level = 2
+        open_containers = []  # [(rank, element context)], outermost first
+
+        def close_last():
+            _, context = open_containers.pop()
+            xf.write(_INDENT * (body_level + 1 + len(open_containers)))
+            context.__exit__(None, None, None)
+            xf.write("\n")
+
+        for elem in elements:
+            rank = self._CONTAINER_RANK.get(elem["type"])
+            if rank is not None:
+                while open_containers and open_containers[-1][0] >= rank:
+                    close_last()
+                level = body_level + 1 + len(open_containers)
+                xf.write(_INDENT * level)
+                context = xf.element(elem["type"], id=elem["id"])
+                context.__enter__()
+                open_containers.append((rank, context))
+                # The heading's <num>, as its first child
+                xf.write("\n" + _INDENT * (level + 1))
+                xf.write(self._build_heading(elem)[0])
+                xf.write("\n")
+            else:
+                level = body_level + 1 + len(open_containers)
+                xf.write(_INDENT * level)
+                _write_pretty(xf, self._build_article(elem), level)
+                xf.write("\n")
+
+        while open_containers:
+            close_last()
+
+
+def _write_pretty(xf, node: etree.Element, level: int) -> None:
+    """
+    Write `node` as lxml's pretty_print would at depth `level`.
+
+    Elements with children get one child per line, indented two spaces per
+    level; leaf elements are written as-is (text inline, or self-closing).
+    """
+    if len(node) == 0:
+        xf.write(node)
+        return
+    with xf.element(node.tag, dict(node.attrib)):
+        for child in node:
+            xf.write("\n" + _INDENT * (level + 1))
+            _write_pretty(xf, child, level + 1)
+        xf.write("\n" + _INDENT * level)
 
 
 def main():
@@ -9,6 +9,11 @@ import re
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
+from apps.parsers.patterns.registry import register
+
+_ARTICLE_NUM_RE = register("xref.article_num", r"^\d+[A-Z]?(?:-[A-Z])?$")
+_ROMAN_RE = register("xref.roman", r"^[IVXLCDM]+$")
+
 
 @dataclass
 class LegalReference:
@@ -64,8 +69,11 @@ class CrossReferenceDetector:
     def __init__(self):
         """Initialize detector with compiled regex patterns."""
         self.compiled_patterns = [
-            (re.compile(pattern, re.IGNORECASE | re.MULTILINE), weight)
-            for pattern, weight in self.PATTERNS
+            (
+                register(f"xref.reference.{i}", pattern, re.IGNORECASE | re.MULTILINE),
+                weight,
+            )
+            for i, (pattern, weight) in enumerate(self.PATTERNS)
         ]
 
     def detect(self, text: str) -> List[LegalReference]:
@@ -108,10 +116,10 @@ class CrossReferenceDetector:
                 continue
 
             # Check if it's an article number (digits, possibly with letter)
-            if re.match(r"^\d+[A-Z]?(?:-[A-Z])?$", group):
+            if _ARTICLE_NUM_RE.match(group):
                 article_num = group
             # Check if it's a fraction (Roman numerals)
-            elif re.match(r"^[IVXLCDM]+$", group.upper()):
+            elif _ROMAN_RE.match(group.upper()):
                 fraction = group.upper()
             # Otherwise, it's likely a law name
             elif len(group) > 5:  # Avoid short strings
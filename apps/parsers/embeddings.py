@@ -8,7 +8,6 @@ import logging
 from typing import List, Optional
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +28,9 @@ class EmbeddingGenerator:
             model_name: Name of sentence-transformer model to use.
                        Default: paraphrase-multilingual-mpnet-base-v2 (768-dim)
         """
+        # Deferred: sentence_transformers imports torch, which takes seconds
+        from sentence_transformers import SentenceTransformer
+
         logger.info(f"Loading embedding model: {model_name}")
         self.model = SentenceTransformer(model_name)
         self.dimensions = self.model.get_sentence_embedding_dimension()
@@ -6,10 +6,51 @@ Handles standard articles, lettered articles (27-A), ordinal articles, and other
 import re
 from typing import List, Optional, Pattern, Tuple
 
+from .registry import register, register_all
+
+ARTICLE_PATTERNS = [
+    # Bis with optional number: Artículo 5 Bis, Artículo 5o. Bis 1
+    r"^Art[íi]culo\s+(\d+[o]?\.?)\s+(Bis\s*\d*)",
+    # Lettered with dash: Artículo 27-A, Artículo 45-A.
+    r"^Art[íi]culo\s+(\d+)-([A-Z])\.?",
+    # Standard: Artículo 5, Artículo 5., Artículo 1o.-, Artículo 5o
+    r"^Art[íi]culo\s+(\d+[o]?\.?)",
+    # Uppercase Bis: ARTICULO 5 Bis
+    r"^ART[ÍI]CULO\s+(\d+[o]?\.?)\s+(Bis\s*\d*)",
+    # Uppercase: ARTICULO 5
+    r"^ART[ÍI]CULO\s+(\d+[o]?\.?)",
+    # Abbreviated: Art. 5
+    r"^Art\.\s+(\d+)",
+]
+
+ORDINAL_ARTICLE_PATTERNS = [
+    r"^(PRIMER[OA]|Primer[oa])\.?\s*-?\s*",
+    r"^(SEGUND[OA]|Segund[oa])\.?\s*-?\s*",
+    r"^(TERCER[OA]|Tercer[oa])\.?\s*-?\s*",
+    r"^(CUART[OA]|Cuart[oa])\.?\s*-?\s*",
+    r"^(QUINT[OA]|Quint[oa])\.?\s*-?\s*",
+    r"^(SEXT[OA]|Sext[oa])\.?\s*-?\s*",
+    r"^(S[ÉE]PTIM[OA]|S[ée]ptim[oa])\.?\s*-?\s*",
+    r"^(OCTAV[OA]|Octav[oa])\.?\s*-?\s*",
+    r"^(NOVEN[OA]|Noven[oa])\.?\s*-?\s*",
+    r"^(D[ÉE]CIM[OA]|D[ée]cim[oa])\.?\s*-?\s*",
+    r"^(UND[ÉE]CIM[OA]|Und[ée]cim[oa])\.?\s*-?\s*",
+    r"^(DUOD[ÉE]CIM[OA]|Duod[ée]cim[oa])\.?\s*-?\s*",
+    r"^(DECIM[OA]\s+PRIMER[OA]|D[ée]cim[oa]\s+primer[oa])\.?\s*-?\s*",
+    r"^(DECIM[OA]\s+SEGUND[OA]|D[ée]cim[oa]\s+segund[oa])\.?\s*-?\s*",
+    r"^(DECIM[OA]\s+TERCER[OA]|D[ée]cim[oa]\s+tercer[oa])\.?\s*-?\s*",
+    r"^(VIGESIM[OA]|Vig[ée]sim[oa])\.?\s*-?\s*",
+]
+
+_ARTICLE_RES = register_all("articles.article", ARTICLE_PATTERNS, re.MULTILINE)
+_ORDINAL_ARTICLE_RES = register_all(
+    "articles.ordinal", ORDINAL_ARTICLE_PATTERNS, re.MULTILINE
+)
+
 
 def compile_article_patterns() -> List[Pattern]:
     """
-    Compile list of regex patterns for article detection.
+    Compiled regex patterns for article detection.
 
     Patterns ordered from most specific to least specific so that
     ``_try_patterns`` returns the best match first.
@@ -17,51 +58,17 @@ def compile_article_patterns() -> List[Pattern]:
     Returns:
         List of compiled regex objects
     """
-    patterns = [
-        # Bis with optional number: Artículo 5 Bis, Artículo 5o. Bis 1
-        r"^Art[íi]culo\s+(\d+[o]?\.?)\s+(Bis\s*\d*)",
-        # Lettered with dash: Artículo 27-A, Artículo 45-A.
-        r"^Art[íi]culo\s+(\d+)-([A-Z])\.?",
-        # Standard: Artículo 5, Artículo 5., Artículo 1o.-, Artículo 5o
-        r"^Art[íi]culo\s+(\d+[o]?\.?)",
-        # Uppercase Bis: ARTICULO 5 Bis
-        r"^ART[ÍI]CULO\s+(\d+[o]?\.?)\s+(Bis\s*\d*)",
-        # Uppercase: ARTICULO 5
-        r"^ART[ÍI]CULO\s+(\d+[o]?\.?)",
-        # Abbreviated: Art. 5
-        r"^Art\.\s+(\d+)",
-    ]
-
-    return [re.compile(p, re.MULTILINE) for p in patterns]
+    return list(_ARTICLE_RES)
 
 
 def compile_ordinal_article_patterns() -> List[Pattern]:
     """
-    Compile ordinal article patterns for municipal regulations.
+    Compiled ordinal article patterns for municipal regulations.
 
     Separated from main article patterns because ordinals (Primero, Segundo)
     collide with TRANSITORIOS entries in federal/state laws.
     """
-    patterns = [
-        r"^(PRIMER[OA]|Primer[oa])\.?\s*-?\s*",
-        r"^(SEGUND[OA]|Segund[oa])\.?\s*-?\s*",
-        r"^(TERCER[OA]|Tercer[oa])\.?\s*-?\s*",
-        r"^(CUART[OA]|Cuart[oa])\.?\s*-?\s*",
-        r"^(QUINT[OA]|Quint[oa])\.?\s*-?\s*",
-        r"^(SEXT[OA]|Sext[oa])\.?\s*-?\s*",
-        r"^(S[ÉE]PTIM[OA]|S[ée]ptim[oa])\.?\s*-?\s*",
-        r"^(OCTAV[OA]|Octav[oa])\.?\s*-?\s*",
-        r"^(NOVEN[OA]|Noven[oa])\.?\s*-?\s*",
-        r"^(D[ÉE]CIM[OA]|D[ée]cim[oa])\.?\s*-?\s*",
-        r"^(UND[ÉE]CIM[OA]|Und[ée]cim[oa])\.?\s*-?\s*",
-        r"^(DUOD[ÉE]CIM[OA]|Duod[ée]cim[oa])\.?\s*-?\s*",
-        r"^(DECIM[OA]\s+PRIMER[OA]|D[ée]cim[oa]\s+primer[oa])\.?\s*-?\s*",
-        r"^(DECIM[OA]\s+SEGUND[OA]|D[ée]cim[oa]\s+segund[oa])\.?\s*-?\s*",
-        r"^(DECIM[OA]\s+TERCER[OA]|D[ée]cim[oa]\s+tercer[oa])\.?\s*-?\s*",
-        r"^(VIGESIM[OA]|Vig[ée]sim[oa])\.?\s*-?\s*",
-    ]
-
-    return [re.compile(p, re.MULTILINE) for p in patterns]
+    return list(_ORDINAL_ARTICLE_RES)
 
 
 # Mapping from Spanish ordinals to numbers
@@ -199,15 +206,17 @@ DEROGATION_PATTERNS = [
     r"^se\s+abroga\.?$",
 ]
 
+# One alternation: a single scan instead of one search per pattern
+_DEROGATION_RE = register(
+    "articles.derogation",
+    "|".join(f"(?:{p})" for p in DEROGATION_PATTERNS),
+    re.IGNORECASE | re.MULTILINE,
+)
+
 
 def is_derogated(text: str) -> bool:
     """
     Check if article content indicates it is derogated.
     """
     # Check for short content that matches derogation patterns
-    if len(text.strip()) < 100:
-        for pattern in DEROGATION_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE | re.MULTILINE):
-                return True
-
-    return False
+    return len(text.strip()) < 100 and _DEROGATION_RE.search(text) is not None
@@ -8,6 +8,8 @@ import re
 from datetime import datetime
 from typing import Dict, List, Optional, Pattern
 
+from .registry import register, register_all
+
 # Reform/amendment patterns
 REFORM_ACTIONS = [
     "reformad[oa]",
@@ -29,9 +31,12 @@ REFORM_PATTERN = (
 )
 
 
+_REFORM_RE = register("metadata.reform", REFORM_PATTERN, re.IGNORECASE)
+
+
 def compile_reform_pattern() -> Pattern:
-    """Compile reform metadata pattern."""
-    return re.compile(REFORM_PATTERN, re.IGNORECASE)
+    """Compiled reform metadata pattern."""
+    return _REFORM_RE
 
 
 def extract_reforms(text: str) -> tuple[str, List[Dict]]:
@@ -43,10 +48,9 @@ def extract_reforms(text: str) -> tuple[str, List[Dict]]:
         - cleaned_text: Text with reform annotations removed
         - reforms: List of reform metadata dicts
     """
-    pattern = compile_reform_pattern()
     reforms = []
 
-    for match in pattern.finditer(text):
+    for match in _REFORM_RE.finditer(text):
         reforms.append(
             {
                 "element": match.group(1),  # Artículo, Fracción, etc.
@@ -57,7 +61,7 @@ def extract_reforms(text: str) -> tuple[str, List[Dict]]:
         )
 
     # Remove reform annotations from content
-    cleaned_text = pattern.sub("", text)
+    cleaned_text = _REFORM_RE.sub("", text)
 
     return cleaned_text, reforms
 
@@ -81,6 +85,9 @@ EFFECTIVE_DATE_PATTERNS = [
     r"entra\s+en\s+vigor\s+a\s+partir\s+del?\s+(\d{1,2})\s+de\s+(\w+)\s+de\s+(\d{4})",
     r"vigencia\s+a\s+partir\s+del?\s+(\d{1,2})\s+de\s+(\w+)\s+de\s+(\d{4})",
 ]
+_EFFECTIVE_DATE_RES = register_all(
+    "metadata.effective_date", EFFECTIVE_DATE_PATTERNS, re.IGNORECASE
+)
 
 SPANISH_MONTHS = {
     "enero": 1,
@@ -105,8 +112,8 @@ def extract_effective_date(text: str) -> Optional[datetime]:
     Returns:
         datetime object or None if not found
     """
-    for pattern in EFFECTIVE_DATE_PATTERNS:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _EFFECTIVE_DATE_RES:
+        match = pattern.search(text)
         if match:
             day = int(match.group(1))
             month_name = match.group(2).lower()
@@ -126,6 +133,9 @@ CROSS_REFERENCE_PATTERNS = [
     r"de\s+acuerdo\s+con\s+el\s+art[íi]culo\s+(\d+[A-Z]?)",
     r"lo\s+dispuesto\s+en\s+el\s+art[íi]culo\s+(\d+[A-Z]?)",
 ]
+_CROSS_REFERENCE_RES = register_all(
+    "metadata.cross_reference", CROSS_REFERENCE_PATTERNS, re.IGNORECASE
+)
 
 
 def extract_cross_references(text: str) -> List[Dict]:
@@ -137,8 +147,8 @@ def extract_cross_references(text: str) -> List[Dict]:
     """
     references = []
 
-    for pattern in CROSS_REFERENCE_PATTERNS:
-        for match in re.finditer(pattern, text, re.IGNORECASE):
+    for pattern in _CROSS_REFERENCE_RES:
+        for match in pattern.finditer(text):
             references.append(
                 {
                     "article": match.group(1),
@@ -0,0 +1,49 @@
+"""
+Compiled regex registry shared by the parser, indexer and cross-reference code.
+
+Every pattern on a parsing or indexing hot path is compiled once per
+process, when the module that owns it is imported:
+
+    REFORM_RE = register("metadata.reform", REFORM_PATTERN, re.IGNORECASE)
+
+Hot paths then use the compiled object directly, never `re.search(...)`
+with a literal or `re.compile` per call. Names are namespaced by module.
+Registering the same name twice returns the existing pattern, and
+registering a different pattern under an existing name is an error.
+tests/parsers/test_pattern_registry.py fails on new inline `re.*` calls
+in the modules that use this registry.
+"""
+
+import re
+from typing import Dict, Iterable, List, Pattern, Tuple
+
+_patterns: Dict[str, Pattern] = {}
+_sources: Dict[str, Tuple[str, int]] = {}
+
+
+def register(name: str, regex: str, flags: int = 0) -> Pattern:
+    """Compile `regex` under `name` (once) and return the compiled pattern."""
+    source = (regex, int(flags))
+    if name in _patterns:
+        if _sources[name] != source:
+            raise ValueError(f"Pattern {name!r} is already registered differently")
+        return _patterns[name]
+    compiled = re.compile(regex, flags)
+    _patterns[name] = compiled
+    _sources[name] = source
+    return compiled
+
+
+def register_all(name: str, regexes: Iterable[str], flags: int = 0) -> List[Pattern]:
+    """Register an ordered group of patterns as name.0, name.1, ..."""
+    return [register(f"{name}.{i}", regex, flags) for i, regex in enumerate(regexes)]
+
+
+def get(name: str) -> Pattern:
+    """Return a registered pattern; KeyError if `name` is unknown."""
+    return _patterns[name]
+
+
+def registered() -> Dict[str, Pattern]:
+    """Snapshot of every registered pattern, by name."""
+    return dict(_patterns)
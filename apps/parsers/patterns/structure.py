@@ -7,6 +7,8 @@ Reusable regex patterns for parsing different structural elements.
 import re
 from typing import List, Pattern
 
+from .registry import register, register_all
+
 # Article patterns moved to articles.py
 
 
@@ -38,20 +40,19 @@ SECTION_PATTERNS = [
     r"^SECCI[ÓO]N\s+(PRIMERA|SEGUNDA|TERCERA|CUARTA|QUINTA)",
 ]
 
+_STRUCTURE_FLAGS = re.IGNORECASE | re.MULTILINE
+_STRUCTURE_RES = {
+    "title": register_all("structure.title", TITLE_PATTERNS, _STRUCTURE_FLAGS),
+    "book": register_all("structure.book", BOOK_PATTERNS, _STRUCTURE_FLAGS),
+    "part": register_all("structure.part", PART_PATTERNS, _STRUCTURE_FLAGS),
+    "chapter": register_all("structure.chapter", CHAPTER_PATTERNS, _STRUCTURE_FLAGS),
+    "section": register_all("structure.section", SECTION_PATTERNS, _STRUCTURE_FLAGS),
+}
+
 
 def compile_structure_patterns() -> dict:
-    """Compile all structure patterns."""
-    return {
-        "title": [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in TITLE_PATTERNS],
-        "book": [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in BOOK_PATTERNS],
-        "part": [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in PART_PATTERNS],
-        "chapter": [
-            re.compile(p, re.IGNORECASE | re.MULTILINE) for p in CHAPTER_PATTERNS
-        ],
-        "section": [
-            re.compile(p, re.IGNORECASE | re.MULTILINE) for p in SECTION_PATTERNS
-        ],
-    }
+    """Compiled structure patterns, by element type."""
+    return {kind: list(patterns) for kind, patterns in _STRUCTURE_RES.items()}
 
 
 # Transitory article patterns
@@ -77,17 +78,30 @@ ORDINAL_PATTERNS = {
     "[ÚU]LTIM[OA]": 999,  # Special case for last
 }
 
+_TRANSITORIOS_HEADER_RES = register_all(
+    "structure.transitorios_header", TRANSITORIOS_HEADER, _STRUCTURE_FLAGS
+)
+_ORDINAL_RES = {
+    k: register(f"structure.ordinal.{k}", f"^({k})\\.-", _STRUCTURE_FLAGS)
+    for k in ORDINAL_PATTERNS
+}
+# A whole transitory entry: the ordinal, then its text up to the next one
+_TRANSITORIO_ENTRY_RES = {
+    k: register(
+        f"structure.transitorio_entry.{k}",
+        f"^({k})\\.-\\s+(.+?)(?=^[A-ZÚÉÍÓÁ]+\\.-|\\Z)",
+        re.MULTILINE | re.DOTALL | re.IGNORECASE,
+    )
+    for k in ORDINAL_PATTERNS
+}
+
 
 def compile_transitorios_patterns() -> dict:
-    """Compile transitory article patterns."""
+    """Compiled transitory article patterns."""
     return {
-        "header": [
-            re.compile(p, re.IGNORECASE | re.MULTILINE) for p in TRANSITORIOS_HEADER
-        ],
-        "ordinals": {
-            k: re.compile(f"^({k})\\.-", re.IGNORECASE | re.MULTILINE)
-            for k in ORDINAL_PATTERNS.keys()
-        },
+        "header": list(_TRANSITORIOS_HEADER_RES),
+        "ordinals": dict(_ORDINAL_RES),
+        "entries": dict(_TRANSITORIO_ENTRY_RES),
     }
 
 
@@ -141,6 +155,9 @@ FRACTION_PATTERNS = [
 ]
 
 
+_FRACTION_RES = register_all("structure.fraction", FRACTION_PATTERNS, re.MULTILINE)
+
+
 def compile_fraction_patterns() -> List[Pattern]:
-    """Compile fraction patterns."""
-    return [re.compile(p, re.MULTILINE) for p in FRACTION_PATTERNS]
+    """Compiled fraction patterns."""
+    return list(_FRACTION_RES)
@@ -18,6 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from apps.parsers.akn_generator_v2 import AkomaNtosoGeneratorV2
 from apps.parsers.quality import QualityCalculator, QualityMetrics
+from apps.parsers.tracing import LawTrace, Tracer, file_size
 
 
 @dataclass
@@ -46,6 +47,9 @@ class IngestionResult:
     # Stages completed
     stages_completed: list = None
 
+    # Per-stage resource use (apps.parsers.tracing)
+    trace: Optional[LawTrace] = None
+
     def __post_init__(self):
         if self.stages_completed is None:
             self.stages_completed = []
@@ -86,7 +90,11 @@ class IngestionPipeline:
     """
 
     def __init__(
-        self, data_dir: Path = None, skip_download: bool = False, storage=None
+        self,
+        data_dir: Path = None,
+        skip_download: bool = False,
+        storage=None,
+        tracer: Tracer = None,
     ):
         """
         Initialize pipeline.
@@ -95,12 +103,14 @@ class IngestionPipeline:
             data_dir: Base directory for data storage (local backend only)
             skip_download: If True, use existing PDFs
             storage: Optional StorageBackend override (defaults to get_storage_backend())
+            tracer: Optional Tracer (stage logging, profiling); a plain one by default
         """
         if data_dir is None:
             data_dir = Path(__file__).parent.parent.parent / "data"
 
         self.data_dir = Path(data_dir)
         self.skip_download = skip_download
+        self.tracer = tracer or Tracer()
 
         # Storage backend (local or R2)
         if storage is not None:
@@ -148,13 +158,28 @@ class IngestionPipeline:
             max_retries: Maximum retry attempts on failure
 
         Returns:
-            IngestionResult with success/failure details
+            IngestionResult with success/failure details, and its trace
         """
-        start_time = time.time()
         law_id = law_metadata["id"]
         law_name = law_metadata.get("short_name", law_metadata["name"])
 
         result = IngestionResult(law_id=law_id, law_name=law_name, success=False)
+        with self.tracer.law(law_id) as trace:
+            result.trace = trace
+            self._ingest_with_retries(law_metadata, result, trace, max_retries)
+            trace.success = result.success
+        return result
+
+    def _ingest_with_retries(
+        self,
+        law_metadata: Dict[str, Any],
+        result: IngestionResult,
+        trace: LawTrace,
+        max_retries: int,
+    ) -> IngestionResult:
+        start_time = time.time()
+        law_id = result.law_id
+        law_name = result.law_name
 
         # Retry loop
         for attempt in range(max_retries + 1):
@@ -166,26 +191,38 @@ class IngestionPipeline:
                 print(f"{'='*70}")
 
                 # Stage 1: Download PDF
-                pdf_path = self._download_pdf(law_metadata)
+                with self.tracer.stage(trace, "download") as span:
+                    pdf_path = self._download_pdf(law_metadata)
+                    span.bytes_out = file_size(pdf_path)
                 result.pdf_path = pdf_path
                 result.stages_completed.append("download")
                 print(f"✅ Downloaded PDF: {pdf_path.name}")
 
                 # Stage 2: Extract text
-                text_path, text = self._extract_text(law_metadata, pdf_path)
+                with self.tracer.stage(trace, "extract") as span:
+                    span.bytes_in = file_size(pdf_path)
+                    text_path, text = self._extract_text(law_metadata, pdf_path)
+                    span.bytes_out = file_size(text_path)
                 result.text_path = text_path
                 result.stages_completed.append("extract")
                 print(f"✅ Extracted text: {len(text):,} characters")
 
                 # Stage 3: Parse to XML
-                xml_path = self._parse_to_xml(law_metadata, text)
+                with self.tracer.stage(trace, "parse") as span:
+                    span.bytes_in = file_size(text_path)
+                    xml_path = self._parse_to_xml(law_metadata, text)
+                    span.bytes_out = file_size(xml_path)
                 result.xml_path = xml_path
                 result.stages_completed.append("parse")
                 print(f"✅ Generated XML: {xml_path.name}")
 
                 # Stage 4: Calculate quality
                 parse_time = time.time() - start_time
-                metrics = self._calculate_quality(xml_path, law_metadata, parse_time)
+                with self.tracer.stage(trace, "quality") as span:
+                    span.bytes_in = file_size(xml_path)
+                    metrics = self._calculate_quality(
+                        xml_path, law_metadata, parse_time
+                    )
                 result.quality_metrics = metrics
                 result.stages_completed.append("quality")
                 print(
@@ -198,7 +235,9 @@ class IngestionPipeline:
                         detect_and_store_cross_references,
                     )
 
-                    ref_count = detect_and_store_cross_references(law_id, xml_path)
+                    with self.tracer.stage(trace, "cross_references") as span:
+                        span.bytes_in = file_size(xml_path)
+                        ref_count = detect_and_store_cross_references(law_id, xml_path)
                     if ref_count > 0:
                         print(f"✅ Detected {ref_count} cross-references")
                     result.stages_completed.append("cross_references")
@@ -212,7 +251,11 @@ class IngestionPipeline:
                 # Save to Database
                 if self.db_saver:
                     try:
-                        self.db_saver.save_law_version(law_metadata, xml_path, pdf_path)
+                        with self.tracer.stage(trace, "db_save") as span:
+                            span.bytes_in = file_size(xml_path)
+                            self.db_saver.save_law_version(
+                                law_metadata, xml_path, pdf_path
+                            )
                         print("✅ Metadata saved to database")
                     except Exception as e:
                         print(f"⚠️  Failed to save to DB: {e}")
@@ -220,7 +263,11 @@ class IngestionPipeline:
                 # Sync outputs to storage backend (R2 in production)
                 if self.storage:
                     try:
-                        self._sync_to_storage(law_id, pdf_path, text_path, xml_path)
+                        with self.tracer.stage(trace, "storage_sync") as span:
+                            self._sync_to_storage(law_id, pdf_path, text_path, xml_path)
+                            span.bytes_out = sum(
+                                file_size(p) for p in (pdf_path, text_path, xml_path)
+                            )
                         result.stages_completed.append("storage_sync")
                         print("✅ Synced to storage backend")
                     except Exception as e:
@@ -322,7 +369,7 @@ class IngestionPipeline:
 
         # Generate XML using V2 (which handles multi-pass and internal metadata extraction)
         # Note: metadata dictionary passed here overrides/supplements internal extraction
-        self.parser.generate_xml(text, metadata, xml_path)
+        self.parser.generate_xml(text, metadata, xml_path, streaming=True)
 
         return xml_path
 
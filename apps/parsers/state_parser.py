@@ -16,6 +16,7 @@ from typing import Any, Dict, Optional
 
 from apps.parsers.akn_generator_v2 import AkomaNtosoGeneratorV2
 from apps.parsers.quality import QualityCalculator, QualityMetrics
+from apps.parsers.tracing import LawTrace, Tracer, file_size
 
 
 @dataclass
@@ -32,6 +33,7 @@ class StateParseResult:
     quality_metrics: Optional[QualityMetrics] = None
     duration_seconds: float = 0.0
     article_count: int = 0
+    trace: Optional[LawTrace] = None
 
     def summary(self) -> str:
         status = "OK" if self.success else "FAIL"
@@ -51,10 +53,11 @@ class StateLawParser:
     calculates quality, and saves AKN XML alongside source files.
     """
 
-    def __init__(self, base_dir: Path = None):
+    def __init__(self, base_dir: Path = None, tracer: Tracer = None):
         if base_dir is None:
             base_dir = Path(__file__).resolve().parent.parent.parent
         self.base_dir = base_dir
+        self.tracer = tracer or Tracer()
         self.parser = AkomaNtosoGeneratorV2()
         self.quality_calc = QualityCalculator()
 
@@ -152,13 +155,24 @@ class StateLawParser:
                          publication_date (optional), municipality (optional)
 
         Returns:
-            StateParseResult with paths and quality info
+            StateParseResult with paths, quality info and the stage trace
         """
-        start_time = time.time()
         official_id = law_metadata.get("official_id", "unknown")
         law_name = law_metadata.get("law_name", "Unknown")
 
         result = StateParseResult(official_id=official_id, law_name=law_name)
+        with self.tracer.law(official_id) as trace:
+            result.trace = trace
+            self._parse(law_metadata, result, trace)
+            trace.success = result.success
+        return result
+
+    def _parse(
+        self, law_metadata: Dict[str, Any], result: StateParseResult, trace: LawTrace
+    ) -> StateParseResult:
+        start_time = time.time()
+        official_id = result.official_id
+        law_name = result.law_name
 
         try:
             # 1. Locate source text file
@@ -178,54 +192,62 @@ class StateLawParser:
             result.text_path = text_path
 
             # 2. Read text content
-            # For .doc files, look for pre-extracted .txt in *_processed/ dirs
-            if text_path.suffix.lower() == ".doc":
-                text_path_str = str(text_path)
-                candidates = [
-                    Path(
-                        text_path_str.replace(
-                            "/state_laws/", "/state_laws_processed/"
-                        ).replace(".doc", ".txt")
-                    ),
-                    Path(
-                        text_path_str.replace(
-                            "/state_laws_non_legislative/",
-                            "/state_laws_non_legislative_processed/",
-                        ).replace(".doc", ".txt")
-                    ),
-                ]
-                txt_path = None
-                for candidate in candidates:
-                    if candidate.exists():
-                        txt_path = candidate
-                        break
-                if txt_path:
-                    text = txt_path.read_text(encoding="utf-8", errors="ignore")
+            with self.tracer.stage(trace, "extract") as span:
+                span.bytes_in = file_size(text_path)
+                # For .doc files, look for pre-extracted .txt in *_processed/ dirs
+                if text_path.suffix.lower() == ".doc":
+                    text_path_str = str(text_path)
+                    candidates = [
+                        Path(
+                            text_path_str.replace(
+                                "/state_laws/", "/state_laws_processed/"
+                            ).replace(".doc", ".txt")
+                        ),
+                        Path(
+                            text_path_str.replace(
+                                "/state_laws_non_legislative/",
+                                "/state_laws_non_legislative_processed/",
+                            ).replace(".doc", ".txt")
+                        ),
+                    ]
+                    txt_path = None
+                    for candidate in candidates:
+                        if candidate.exists():
+                            txt_path = candidate
+                            break
+                    if txt_path:
+                        text = txt_path.read_text(encoding="utf-8", errors="ignore")
+                    else:
+                        result.error = (
+                            f"Text file not found: {text_file} "
+                            f"(no .txt in *_processed/ directory)"
+                        )
+                        return result
+                elif text_path.suffix.lower() == ".pdf":
+                    text = self._extract_pdf_text(text_path)
                 else:
-                    result.error = (
-                        f"Text file not found: {text_file} "
-                        f"(no .txt in *_processed/ directory)"
-                    )
-                    return result
-            elif text_path.suffix.lower() == ".pdf":
-                text = self._extract_pdf_text(text_path)
-            else:
-                text = text_path.read_text(encoding="utf-8", errors="ignore")
+                    text = text_path.read_text(encoding="utf-8", errors="ignore")
 
-            # Strip NULL bytes and control characters (common in .doc extracts)
-            import re as _re
+                # Strip NULL bytes and control characters (common in .doc extracts)
+                import re as _re
 
-            text = _re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", text)
+                text = _re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", text)
 
-            if not text or len(text.strip()) < 100:
-                result.error = f"Text too short ({len(text.strip())} chars)"
-                return result
+                if not text or len(text.strip()) < 100:
+                    result.error = f"Text too short ({len(text.strip())} chars)"
+                    return result
+                span.bytes_out = len(text.encode("utf-8"))
 
             # 3. Generate AKN XML
             akn_path = self._determine_akn_output_path(law_metadata)
             metadata = self._create_state_frbr_metadata(law_metadata)
 
-            _, parse_result = self.parser.generate_xml(text, metadata, akn_path)
+            with self.tracer.stage(trace, "parse") as span:
+                span.bytes_in = len(text.encode("utf-8"))
+                _, parse_result = self.parser.generate_xml(
+                    text, metadata, akn_path, streaming=True
+                )
+                span.bytes_out = file_size(akn_path)
 
             result.akn_path = akn_path
             result.article_count = parse_result.metadata.get("articles", 0)
@@ -234,14 +256,16 @@ class StateLawParser:
             parse_time = time.time() - start_time
             slug = self._slugify(law_name)
             try:
-                quality = self.quality_calc.calculate(
-                    xml_path=akn_path,
-                    law_name=law_name,
-                    law_slug=slug,
-                    articles_expected=None,
-                    parse_time=parse_time,
-                    parser_confidence=parse_result.confidence,
-                )
+                with self.tracer.stage(trace, "quality") as span:
+                    span.bytes_in = file_size(akn_path)
+                    quality = self.quality_calc.calculate(
+                        xml_path=akn_path,
+                        law_name=law_name,
+                        law_slug=slug,
+                        articles_expected=None,
+                        parse_time=parse_time,
+                        parser_confidence=parse_result.confidence,
+                    )
                 result.quality_metrics = quality
             except Exception as e:
                 # Quality calc failure is non-fatal
@@ -253,7 +277,9 @@ class StateLawParser:
                     detect_and_store_cross_references,
                 )
 
-                detect_and_store_cross_references(official_id, akn_path)
+                with self.tracer.stage(trace, "cross_references") as span:
+                    span.bytes_in = file_size(akn_path)
+                    detect_and_store_cross_references(official_id, akn_path)
             except Exception:
                 pass
 
@@ -0,0 +1,307 @@
+"""
+Stage tracing for IngestionPipeline and StateLawParser.
+
+Each law run is a LawTrace holding one StageSpan per stage (download,
+extract, parse, quality, cross_references, db_save, storage_sync) with:
+- wall and CPU time (process CPU, so lxml and pdfplumber work counts)
+- bytes into and out of the stage
+- peak RSS of the process when the stage ended. It is a high-water mark,
+  so the stage where it jumps is the one that grew the process.
+
+Spans are also sent to the StructuredLogger when one is given, and to
+OpenTelemetry when the opentelemetry API is installed (a no-op until the
+process configures an SDK and exporter).
+
+Bulk runs collect traces into a RunReport: per-stage totals and the
+slowest laws, written as JSON with the run's results. With profiling on
+(`cprofile` or `tracemalloc`) every law is profiled in its worker, and the
+report keeps the profiles of the slowest N.
+
+Usage:
+    tracer = Tracer(logger=StructuredLogger("ingestion"), profile="cprofile")
+    with tracer.law("amparo") as trace:
+        with tracer.stage(trace, "parse") as span:
+            span.bytes_in = len(text)
+            ...
+    report = RunReport()
+    report.add(trace)
+    report.write(Path("data/logs/trace_federal.json"))
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from apps.api.utils.imports import optional_import
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROFILE_MODES = ("cprofile", "tracemalloc")
+# Lines kept from each law's profile
+PROFILE_LINES = 25
+
+
+def peak_rss_mb() -> Optional[float]:
+    """The process's peak resident set size so far, in MiB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # KiB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def file_size(path: Optional[Path]) -> int:
+    """Size of `path` in bytes, 0 if it is missing."""
+    try:
+        return path.stat().st_size
+    except (AttributeError, OSError):
+        return 0
+
+
+@dataclass
+class StageSpan:
+    """Resources used by one stage of one law."""
+
+    stage: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    peak_rss_mb: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class LawTrace:
+    """Stage spans of one law run (including retried stages)."""
+
+    law_id: str
+    spans: List[StageSpan] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    success: bool = False
+    profile: Optional[str] = None
+
+    def stage_seconds(self) -> Dict[str, float]:
+        """Wall seconds per stage, summed over retries."""
+        totals = {}
+        for span in self.spans:
+            totals[span.stage] = totals.get(span.stage, 0.0) + span.wall_seconds
+        return {stage: round(seconds, 3) for stage, seconds in totals.items()}
+
+
+class Tracer:
+    """
+    Records LawTraces. One per pipeline; cheap enough to be always on
+    (two clock reads and a getrusage per stage). Profiling is opt-in.
+    """
+
+    def __init__(self, logger=None, profile: Optional[str] = None):
+        """
+        Args:
+            logger: Optional StructuredLogger that receives stage events
+            profile: None, "cprofile" or "tracemalloc"
+        """
+        if profile is not None and profile not in PROFILE_MODES:
+            raise ValueError(f"profile must be one of {PROFILE_MODES}")
+        self.logger = logger
+        self.profile = profile
+        otel = optional_import("opentelemetry.trace")
+        self._otel = otel.get_tracer(__name__) if otel else None
+
+    @contextmanager
+    def _otel_span(self, name, attributes):
+        if self._otel is None:
+            yield None
+            return
+        with self._otel.start_as_current_span(name, attributes=attributes) as span:
+            yield span
+
+    @contextmanager
+    def law(self, law_id: str):
+        """Trace one law; yields its LawTrace."""
+        trace = LawTrace(law_id=law_id)
+        profiler = self._start_profile()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            with self._otel_span("ingest_law", {"law.id": law_id}):
+                yield trace
+        finally:
+            trace.wall_seconds = round(time.perf_counter() - wall, 3)
+            trace.cpu_seconds = round(time.process_time() - cpu, 3)
+            trace.profile = self._stop_profile(profiler)
+
+    @contextmanager
+    def stage(self, trace: LawTrace, name: str):
+        """Trace one stage of `trace`; yields its StageSpan for byte counts."""
+        span = StageSpan(stage=name)
+        trace.spans.append(span)
+        if self.logger:
+            self.logger.log_stage_start(trace.law_id, name)
+        wall, cpu = time.perf_counter(), time.process_time()
+        with self._otel_span(name, {"law.id": trace.law_id}) as otel_span:
+            try:
+                yield span
+            except Exception as e:
+                span.error = str(e)
+                if self.logger:
+                    self.logger.log_error(trace.law_id, name, span.error)
+                raise
+            finally:
+                span.wall_seconds = round(time.perf_counter() - wall, 4)
+                span.cpu_seconds = round(time.process_time() - cpu, 4)
+                span.peak_rss_mb = peak_rss_mb()
+                if otel_span is not None:
+                    otel_span.set_attributes(
+                        {
+                            "cpu_seconds": span.cpu_seconds,
+                            "bytes_in": span.bytes_in,
+                            "bytes_out": span.bytes_out,
+                        }
+                    )
+        if self.logger:
+            self.logger.log_stage_complete(trace.law_id, name, span.wall_seconds)
+
+    def _start_profile(self):
+        if self.profile == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+            return profiler
+        if self.profile == "tracemalloc":
+            tracemalloc.start()
+        return None
+
+    def _stop_profile(self, profiler) -> Optional[str]:
+        if self.profile == "cprofile":
+            profiler.disable()
+            out = io.StringIO()
+            stats = pstats.Stats(profiler, stream=out)
+            stats.sort_stats("cumulative").print_stats(PROFILE_LINES)
+            return out.getvalue()
+        if self.profile == "tracemalloc":
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            lines = [f"Peak traced memory: {peak / (1024 * 1024):.1f} MiB"]
+            lines.extend(
+                str(stat) for stat in snapshot.statistics("lineno")[:PROFILE_LINES]
+            )
+            return "\n".join(lines)
+        return None
+
+
+class RunReport:
+    """Per-stage totals and the slowest laws of a bulk run."""
+
+    def __init__(self, top: int = 20):
+        """
+        Args:
+            top: Number of slowest laws listed (with their profiles)
+        """
+        self.top = top
+        self.traces: List[LawTrace] = []
+
+    def add(self, trace: Optional[LawTrace]):
+        if trace is not None:
+            self.traces.append(trace)
+
+    def stages(self) -> Dict[str, dict]:
+        """Totals per stage, in first-seen stage order."""
+        stages = {}
+        for trace in self.traces:
+            for span in trace.spans:
+                s = stages.setdefault(
+                    span.stage,
+                    {
+                        "runs": 0,
+                        "errors": 0,
+                        "wall_seconds": 0.0,
+                        "cpu_seconds": 0.0,
+                        "bytes_in": 0,
+                        "bytes_out": 0,
+                        "max_seconds": 0.0,
+                        "max_law": None,
+                        "peak_rss_mb": None,
+                    },
+                )
+                s["runs"] += 1
+                s["errors"] += span.error is not None
+                s["wall_seconds"] += span.wall_seconds
+                s["cpu_seconds"] += span.cpu_seconds
+                s["bytes_in"] += span.bytes_in
+                s["bytes_out"] += span.bytes_out
+                if span.wall_seconds > s["max_seconds"]:
+                    s["max_seconds"] = span.wall_seconds
+                    s["max_law"] = trace.law_id
+                if span.peak_rss_mb is not None:
+                    s["peak_rss_mb"] = max(s["peak_rss_mb"] or 0, span.peak_rss_mb)
+        for s in stages.values():
+            s["wall_seconds"] = round(s["wall_seconds"], 3)
+            s["cpu_seconds"] = round(s["cpu_seconds"], 3)
+        return stages
+
+    def slowest(self) -> List[LawTrace]:
+        return sorted(self.traces, key=lambda t: t.wall_seconds, reverse=True)[
+            : self.top
+        ]
+
+    def to_dict(self) -> dict:
+        return {
+            "laws": len(self.traces),
+            "failed": sum(1 for t in self.traces if not t.success),
+            "wall_seconds": round(sum(t.wall_seconds for t in self.traces), 3),
+            "cpu_seconds": round(sum(t.cpu_seconds for t in self.traces), 3),
+            "stages": self.stages(),
+            "slowest": [
+                {
+                    "law_id": t.law_id,
+                    "success": t.success,
+                    "wall_seconds": t.wall_seconds,
+                    "cpu_seconds": t.cpu_seconds,
+                    "stages": t.stage_seconds(),
+                    "spans": [asdict(span) for span in t.spans],
+                    "profile": t.profile,
+                }
+                for t in self.slowest()
+            ],
+        }
+
+    def write(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+    def format(self) -> str:
+        """Plain-text summary for the end of a CLI run."""
+        stages = self.stages()
+        total = sum(s["wall_seconds"] for s in stages.values()) or 1
+        lines = [
+            f"{'stage':<18}{'runs':>6}{'wall s':>10}{'share':>8}"
+            f"{'cpu s':>10}{'max s':>9}  slowest law"
+        ]
+        for name, s in stages.items():
+            lines.append(
+                f"{name:<18}{s['runs']:>6}{s['wall_seconds']:>10.1f}"
+                f"{s['wall_seconds'] / total:>8.0%}{s['cpu_seconds']:>10.1f}"
+                f"{s['max_seconds']:>9.1f}  {s['max_law'] or '-'}"
+            )
+        lines.append("")
+        lines.append(f"Slowest {min(self.top, len(self.traces))} laws:")
+        for t in self.slowest():
+            breakdown = ", ".join(
+                f"{stage} {seconds:.1f}s"
+                for stage, seconds in t.stage_seconds().items()
+            )
+            lines.append(f"  {t.law_id:<30}{t.wall_seconds:>8.1f}s  ({breakdown})")
+        return "\n".join(lines)
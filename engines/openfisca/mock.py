@@ -1,4 +1,17 @@
 # engines/openfisca/mock.py
+"""
+Minimal columnar stand-in for openfisca_core's Simulation.
+
+Persons are stored as one NumPy array per input variable. Formulas receive a
+population view whose calls return whole columns, so every variable is
+evaluated once for all persons. Results are memoized per (variable, period),
+which makes the dependency graph (recorded as formulas request other
+variables) evaluate each node at most once per period.
+"""
+
+import numpy as np
+
+DTYPES = {float: np.float64, bool: np.bool_, int: np.int64}
 
 
 class Person:
@@ -14,46 +27,135 @@ class Variable:
     definition_period = "MONTH"
 
 
+class CircularDependencyError(ValueError):
+    """Raised when a variable's formula (indirectly) requires itself."""
+
+
 class TaxBenefitSystem:
-    def __init__(self, variables):
+    def __init__(self, variables, parameters=None):
         self.variables = {v.__name__: v for v in variables}
+        self.parameters = parameters or {}
 
     def new_simulation(self):
         return Simulation(self)
 
 
+class PopulationView:
+    """What formulas receive as `person`: person(var, period) -> column."""
+
+    def __init__(self, simulation, requester):
+        self.simulation = simulation
+        self.requester = requester
+
+    def __call__(self, variable_name, period):
+        return self.simulation._compute(variable_name, period, self.requester)
+
+    def __len__(self):
+        return self.simulation.count
+
+
 class Simulation:
     def __init__(self, system):
         self.system = system
         self.persons = {}
-        self.inputs = {}
+        self._columns = {}
+        self._cache = {}
+        self._in_progress = set()
+        # variable -> set of variables its formula requested
+        self.dependencies = {}
+
+    # -- Inputs -------------------------------------------------------------
 
     def add_person(self, name, period, **kwargs):
+        """Add one person (row-wise). Columns are rebuilt on next calculate."""
         self.persons[name] = kwargs
-
-    def calculate(self, variable_name, period):
-        # specific mock implementation for our tests
+        self._columns = {}
+        self._cache.clear()
+
+    def set_input(self, variable_name, period, values):
+        """Set a whole input column at once (columnar bulk load)."""
+        column = np.asarray(values, dtype=self._dtype(variable_name))
+        if self.persons:
+            raise ValueError("Use either add_person or set_input, not both")
+        if self._columns and len(column) != self.count:
+            raise ValueError(
+                f"{variable_name} has {len(column)} values, expected {self.count}"
+            )
+        self._columns[variable_name] = column
+        self._cache.clear()
+
+    @property
+    def count(self):
+        if self.persons:
+            return len(self.persons)
+        return len(next(iter(self._columns.values()))) if self._columns else 0
+
+    def _dtype(self, variable_name):
         variable = self.system.variables[variable_name]
+        return DTYPES.get(variable.value_type, np.float64)
+
+    def _input_column(self, variable_name):
+        column = self._columns.get(variable_name)
+        if column is None:
+            dtype = self._dtype(variable_name)
+            default = self.system.variables[variable_name].value_type()
+            if self.persons:
+                column = np.array(
+                    [
+                        data.get(variable_name, default)
+                        for data in self.persons.values()
+                    ],
+                    dtype=dtype,
+                )
+            else:
+                column = np.full(self.count, default, dtype=dtype)
+            self._columns[variable_name] = column
+        return column
+
+    # -- Evaluation ---------------------------------------------------------
+
+    def _compute(self, variable_name, period, requester=None):
+        if requester is not None:
+            self.dependencies.setdefault(requester, set()).add(variable_name)
+
+        key = (variable_name, period)
+        if key in self._cache:
+            return self._cache[key]
 
-        # Prepare inputs for formula
-        # In a real engine, this fetches from state. Here we mock it.
-        # We assume 1 person calculation for simplicity of the test
-
-        class MockPerson:
-            def __init__(self, data):
-                self.data = data
+        variable = self.system.variables[variable_name]
+        formula = getattr(variable, "formula", None)
+        if formula is None:
+            return self._input_column(variable_name)
+
+        if key in self._in_progress:
+            raise CircularDependencyError(
+                f"Circular dependency while computing {variable_name}"
+            )
+        self._in_progress.add(key)
+        try:
+            result = formula(
+                PopulationView(self, variable_name), period, self.system.parameters
+            )
+        finally:
+            self._in_progress.discard(key)
+
+        result = np.asarray(result, dtype=self._dtype(variable_name))
+        if result.shape != (self.count,):
+            raise ValueError(
+                f"{variable_name} returned shape {result.shape}, expected ({self.count},)"
+            )
+        self._cache[key] = result
+        return result
 
-            def __call__(self, var_name, period):
-                # If var_name is in input data, return it (vectorized as list)
-                if var_name in self.data:
-                    return [self.data[var_name]]
-                return [0]  # default
+    def calculate(self, variable_name, period):
+        """Compute one variable for every person, as a column array."""
+        return self._compute(variable_name, period)
 
-        results = {}
-        for name, data in self.persons.items():
-            person_obj = MockPerson(data)
-            # Call formula with the mock person
-            result = variable.formula(person_obj, period, None)
-            results[name] = result[0]
+    def calculate_many(self, variable_names, period):
+        """
+        Compute several variables in one pass.
 
-        return list(results.values())
+        Shared dependencies (income totals, tariff lookups) are evaluated once
+        and reused. Returns {variable_name: column}.
+        """
+        return {name: self._compute(name, period) for name in variable_names}
@@ -5,15 +5,18 @@ from engines.openfisca.variables import (
     income_cash,
     income_goods,
     is_resident,
+    isr_bracket,
     isr_breakdown_fixed_fee,
     isr_breakdown_lower_limit,
     isr_breakdown_rate,
+    isr_obligated,
     isr_obligation,
+    isr_taxable_income,
 )
 
 
 class MexicanTaxSystem(TaxBenefitSystem):
-    def __init__(self):
+    def __init__(self, parameters=None):
         super().__init__(
             [
                 isr_obligation,
@@ -25,7 +28,11 @@ class MexicanTaxSystem(TaxBenefitSystem):
                 isr_breakdown_lower_limit,
                 isr_breakdown_rate,
                 isr_breakdown_fixed_fee,
-            ]
+                isr_obligated,
+                isr_taxable_income,
+                isr_bracket,
+            ],
+            parameters=parameters,
         )
 
 
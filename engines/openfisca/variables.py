@@ -1,21 +1,13 @@
-from decimal import Decimal
+import numpy as np
 
 # from openfisca_core.variables import Variable
-from engines.catala.lisr_catala import Person as CatalaPerson
-from engines.catala.lisr_catala import PhysicalPersonTax, get_person_tax
+from engines.openfisca.isr_vectorized import ISR_2026, tax_obligation, to_cents
 from engines.openfisca.mock import Person, TaxBenefitSystem, Variable
 
 
-# Helper to process single person logic for vectorised OpenFisca
-def calculate_single(residence, source_mx, income_c, income_g, output_field=None):
-    p_catala = CatalaPerson(residence=residence, income_source_mx=source_mx)
-    result = get_person_tax(p_catala, Decimal(str(income_c)), Decimal(str(income_g)))
-
-    if output_field == "total":
-        return float(result.isr_monthly)
-    elif output_field in result.breakdown:
-        return float(result.breakdown[output_field])
-    return 0.0
+def _isr_table(parameters):
+    """Tariff in effect; a reform can pass {"isr_table": ISRTable(...)}."""
+    return (parameters or {}).get("isr_table", ISR_2026)
 
 
 class isr_obligation(Variable):
@@ -25,15 +17,56 @@ class isr_obligation(Variable):
     definition_period = "MONTH"
 
     def formula(person, period, parameters):
-        residence = person("is_resident", period)
-        source_mx = person("has_mexican_income_source", period)
-        cash = person("income_cash", period)
-        goods = person("income_goods", period)
+        income = person("isr_taxable_income", period)
+        bracket = person("isr_bracket", period)
+        return _isr_table(parameters).tax_cents(income, bracket) / 100
+
+
+# Intermediate Variables (shared by the obligation and breakdown formulas)
+
+
+class isr_obligated(Variable):
+    value_type = bool
+    entity = Person
+    label = "Sujeto al ISR (Art. 1)"
+    definition_period = "MONTH"
+
+    def formula(person, period, parameters):
+        return tax_obligation(
+            person("is_resident", period), person("has_mexican_income_source", period)
+        )
+
+
+class isr_taxable_income(Variable):
+    value_type = int
+    entity = Person
+    label = "Ingreso mensual gravable (centavos)"
+    definition_period = "MONTH"
+
+    def formula(person, period, parameters):
+        return to_cents(person("income_cash", period)) + to_cents(
+            person("income_goods", period)
+        )
+
+
+class isr_bracket(Variable):
+    value_type = int
+    entity = Person
+    label = "Renglón de la tarifa del Art. 96 (-1 si no aplica)"
+    definition_period = "MONTH"
+
+    def formula(person, period, parameters):
+        bracket = _isr_table(parameters).bracket_index(
+            person("isr_taxable_income", period)
+        )
+        return np.where(person("isr_obligated", period), bracket, -1)
+
 
-        return [
-            calculate_single(r, s, c, g, "total_tax")
-            for r, s, c, g in zip(residence, source_mx, cash, goods)
-        ]
+def _bracket_column(person, period, parameters, column):
+    """Look up a tariff column for each person's bracket (0 when untaxed)."""
+    bracket = person("isr_bracket", period)
+    values = getattr(_isr_table(parameters), column)
+    return np.where(bracket >= 0, values[np.maximum(bracket, 0)], 0)
 
 
 class gross_income(Variable):
@@ -58,15 +91,7 @@ class isr_breakdown_lower_limit(Variable):
     definition_period = "MONTH"
 
     def formula(person, period, parameters):
-        return [
-            calculate_single(r, s, c, g, "lower_limit")
-            for r, s, c, g in zip(
-                person("is_resident", period),
-                person("has_mexican_income_source", period),
-                person("income_cash", period),
-                person("income_goods", period),
-            )
-        ]
+        return _bracket_column(person, period, parameters, "lower_limits") / 100
 
 
 class isr_breakdown_fixed_fee(Variable):
@@ -76,15 +101,7 @@ class isr_breakdown_fixed_fee(Variable):
     definition_period = "MONTH"
 
     def formula(person, period, parameters):
-        return [
-            calculate_single(r, s, c, g, "fixed_fee")
-            for r, s, c, g in zip(
-                person("is_resident", period),
-                person("has_mexican_income_source", period),
-                person("income_cash", period),
-                person("income_goods", period),
-            )
-        ]
+        return _bracket_column(person, period, parameters, "fixed_fees") / 100
 
 
 class isr_breakdown_rate(Variable):
@@ -94,15 +111,8 @@ class isr_breakdown_rate(Variable):
     definition_period = "MONTH"
 
     def formula(person, period, parameters):
-        return [
-            calculate_single(r, s, c, g, "rate")
-            for r, s, c, g in zip(
-                person("is_resident", period),
-                person("has_mexican_income_source", period),
-                person("income_cash", period),
-                person("income_goods", period),
-            )
-        ]
+        # 1/10000 units -> percent
+        return _bracket_column(person, period, parameters, "rates") / 100
 
 
 # Input Variables
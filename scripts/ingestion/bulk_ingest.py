@@ -17,6 +17,10 @@ Usage:
 
     # Skip re-downloading PDFs
     python scripts/bulk_ingest.py --all --skip-download
+
+    # Per-stage report, with cProfile output for the 10 slowest laws
+    python scripts/bulk_ingest.py --all --trace-report data/logs/trace.json \
+        --profile cprofile --profile-top 10
 """
 
 import argparse
@@ -29,7 +33,9 @@ from pathlib import Path
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "apps"))
 
+from parsers.logger import StructuredLogger
 from parsers.pipeline import IngestionPipeline, IngestionResult
+from parsers.tracing import PROFILE_MODES, RunReport, Tracer
 from scraper.utils.law_registry import LawRegistry
 
 
@@ -38,15 +44,18 @@ def process_single_law(args_tuple):
     Process a single law (called by worker process).
 
     Args:
-        args_tuple: (law_metadata, skip_download)
+        args_tuple: (law_metadata, skip_download, profile, log_file)
 
     Returns:
         IngestionResult
     """
-    law_metadata, skip_download = args_tuple
+    law_metadata, skip_download, profile, log_file = args_tuple
 
     # Create pipeline in worker
-    pipeline = IngestionPipeline(skip_download=skip_download)
+    logger = StructuredLogger("ingestion", log_file=log_file) if log_file else None
+    pipeline = IngestionPipeline(
+        skip_download=skip_download, tracer=Tracer(logger=logger, profile=profile)
+    )
 
     # Ingest law
     result = pipeline.ingest_law(law_metadata)
@@ -89,6 +98,23 @@ def main():
         help="Use existing PDFs, skip downloading",
     )
     parser.add_argument("--output", type=str, help="Save results to JSON file")
+    parser.add_argument(
+        "--trace-report", type=str, help="Save the per-stage trace report to JSON"
+    )
+    parser.add_argument(
+        "--profile",
+        choices=PROFILE_MODES,
+        help="Profile every law and keep the slowest laws' profiles in the report",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=10,
+        help="Slowest laws listed in the trace report (default: 10)",
+    )
+    parser.add_argument(
+        "--log-file", type=Path, help="Write JSON stage logs to this file"
+    )
     parser.add_argument("--force", action="store_true", help="Skip confirmation prompt")
 
     args = parser.parse_args()
@@ -159,7 +185,9 @@ def main():
     print(f"Started: {start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
     # Prepare arguments for workers
-    worker_args = [(law, args.skip_download) for law in laws]
+    worker_args = [
+        (law, args.skip_download, args.profile, args.log_file) for law in laws
+    ]
 
     # Use multiprocessing pool
     if args.workers > 1:
@@ -216,8 +244,19 @@ def main():
         for result in failed:
             print(f"  • {result.law_id}: {result.error}")
 
+    # Where the time went
+    report = RunReport(top=args.profile_top)
+    for result in results:
+        report.add(result.trace)
+    print(f"\nStage breakdown:")
+    print(report.format())
+
     print(f"{'='*70}")
 
+    if args.trace_report:
+        report.write(Path(args.trace_report))
+        print(f"\n💾 Trace report saved to: {args.trace_report}")
+
     # Save results to JSON if requested
     if args.output:
         output_data = {
@@ -234,6 +273,7 @@ def main():
                     "error": r.error,
                     "grade": r.grade if r.success else None,
                     "duration_seconds": r.duration_seconds,
+                    "stages": r.trace.stage_seconds() if r.trace else {},
                     "xml_path": str(r.xml_path) if r.xml_path else None,
                 }
                 for r in results
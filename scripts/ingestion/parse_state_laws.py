@@ -20,6 +20,10 @@ Usage:
 
     # Parallel workers
     python scripts/ingestion/parse_state_laws.py --all --workers 4
+
+    # Per-stage report, with tracemalloc output for the 10 slowest laws
+    python scripts/ingestion/parse_state_laws.py --all \
+        --trace-report data/logs/trace_state.json --profile tracemalloc
 """
 
 import argparse
@@ -34,12 +38,13 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 
-def parse_single_law(law_metadata):
+def parse_single_law(law_metadata, profile=None):
     """Parse a single law (designed for process pool execution)."""
     # Must import inside function for multiprocessing
     from apps.parsers.state_parser import StateLawParser
+    from apps.parsers.tracing import Tracer
 
-    parser = StateLawParser(base_dir=PROJECT_ROOT)
+    parser = StateLawParser(base_dir=PROJECT_ROOT, tracer=Tracer(profile=profile))
     result = parser.parse_law(law_metadata)
 
     return {
@@ -50,6 +55,7 @@ def parse_single_law(law_metadata):
         "article_count": result.article_count,
         "duration": result.duration_seconds,
         "grade": (result.quality_metrics.grade if result.quality_metrics else "N/A"),
+        "trace": result.trace,
     }
 
 
@@ -97,6 +103,20 @@ def main():
     arg_parser.add_argument(
         "--force", action="store_true", help="Re-parse even if AKN XML already exists"
     )
+    arg_parser.add_argument(
+        "--trace-report", type=str, help="Save the per-stage trace report to JSON"
+    )
+    arg_parser.add_argument(
+        "--profile",
+        choices=("cprofile", "tracemalloc"),
+        help="Profile every law and keep the slowest laws' profiles in the report",
+    )
+    arg_parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=10,
+        help="Slowest laws listed in the trace report (default: 10)",
+    )
     arg_parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -181,6 +201,9 @@ def main():
     for i, law in enumerate(original_data.get("laws", [])):
         law_index_map[law.get("official_id", "")] = i
 
+    from apps.parsers.tracing import RunReport
+
+    report = RunReport(top=args.profile_top)
     start_time = time.time()
     success_count = 0
     fail_count = 0
@@ -189,10 +212,14 @@ def main():
     if args.workers > 1:
         # Parallel execution
         with ProcessPoolExecutor(max_workers=args.workers) as executor:
-            futures = {executor.submit(parse_single_law, law): law for law in parseable}
+            futures = {
+                executor.submit(parse_single_law, law, args.profile): law
+                for law in parseable
+            }
             for future in as_completed(futures):
                 result = future.result()
                 _print_result(result)
+                report.add(result["trace"])
 
                 if result["success"]:
                     success_count += 1
@@ -204,8 +231,9 @@ def main():
     else:
         # Sequential execution
         for law in parseable:
-            result = parse_single_law(law)
+            result = parse_single_law(law, args.profile)
             _print_result(result)
+            report.add(result["trace"])
 
             if result["success"]:
                 success_count += 1
@@ -232,6 +260,11 @@ def main():
     if success_count:
         print(f"Avg:      {elapsed / success_count:.1f}s per law")
     print("=" * 70)
+    print(report.format())
+
+    if args.trace_report:
+        report.write(Path(args.trace_report))
+        print(f"\nTrace report saved to {args.trace_report}")
 
 
 def _print_result(result):
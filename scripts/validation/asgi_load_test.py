@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""
+WSGI vs ASGI Load Test
+
+Sends search and law-read requests to running API servers at rising
+concurrency and reports throughput, latency and errors per level. Run it
+against one worker of each deployment, both pointed at the same
+Elasticsearch and database:
+
+    # WSGI: the production gthread worker (2 threads)
+    gunicorn apps.indigo.wsgi:application -w 1 --threads 2 -k gthread -b :8001
+    # ASGI: the async views under a uvicorn worker
+    API_ASYNC_VIEWS=true gunicorn apps.indigo.asgi:application -w 1 \\
+        -k uvicorn_worker.UvicornWorker -b :8002
+
+The gthread worker serves at most 2 requests at once; the rest queue, so
+its latency grows with concurrency while throughput stays flat. The ASGI
+worker keeps every request in flight while ES answers.
+
+Throttling keys on the client IP, so raise the `anon` and `search` rates
+(REST_FRAMEWORK in settings) on both servers for the run.
+
+Usage:
+    python scripts/validation/asgi_load_test.py \\
+        --target wsgi=http://localhost:8001 --target asgi=http://localhost:8002
+    python scripts/validation/asgi_load_test.py --target asgi=http://localhost:8002 \\
+        --concurrency 16,64,256 --duration 20 --law cpeum --json asgi.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# Search and law-read mix, {law} filled from --law
+PATHS = [
+    "/api/v1/search/?q=trabajo",
+    "/api/v1/search/?q=salario+minimo&page=2",
+    "/api/v1/laws/{law}/",
+    "/api/v1/laws/{law}/search/?q=trabajador",
+    "/api/v1/laws/{law}/articles/?page_size=50",
+    "/api/v1/laws/{law}/related/",
+]
+
+
+async def _request(host, port, path):
+    """One HTTP/1.1 GET on a fresh connection; returns the status code."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(
+            f"GET {path} HTTP/1.1\r\nHost: {host}\r\n"
+            "Connection: close\r\nAccept: application/json\r\n\r\n".encode()
+        )
+        await writer.drain()
+        status_line = await reader.readline()
+        await reader.read()  # drain the body
+        return int(status_line.split()[1])
+    finally:
+        writer.close()
+
+
+async def run_level(base_url, paths, concurrency, duration):
+    """Keep `concurrency` requests in flight for `duration` seconds."""
+    url = urlsplit(base_url)
+    host, port = url.hostname, url.port or 80
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def client(offset):
+        nonlocal errors
+        i = offset
+        while time.perf_counter() < deadline:
+            path = paths[i % len(paths)]
+            i += 1
+            start = time.perf_counter()
+            try:
+                status = await _request(host, port, path)
+            except (OSError, ValueError, IndexError):
+                status = None
+            if status is None or status >= 500 or status == 429:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(n) for n in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    ms = [s * 1000 for s in latencies]
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(ms), 1) if ms else None,
+        "p95_ms": round(ms[int(len(ms) * 0.95) - 1], 1) if ms else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--target",
+        action="append",
+        required=True,
+        help="name=base_url of a running API server (repeatable)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        default="2,8,32,128",
+        help="Comma-separated in-flight request levels",
+    )
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--law", default="lft", help="Law id for law-read paths")
+    parser.add_argument("--json", type=Path, help="Write results to this file")
+    args = parser.parse_args()
+
+    paths = [p.format(law=args.law) for p in PATHS]
+    levels = [int(c) for c in args.concurrency.split(",")]
+    results = {}
+    for target in args.target:
+        name, _, base_url = target.partition("=")
+        if not base_url:
+            sys.exit(f"--target must be name=url, got {target!r}")
+        results[name] = []
+        print(f"\n{name} ({base_url})")
+        print(
+            f"{'in flight':>10}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}"
+        )
+        for concurrency in levels:
+            level = asyncio.run(run_level(base_url, paths, concurrency, args.duration))
+            results[name].append(level)
+            print(
+                f"{concurrency:>10}{level['rps']:>10}{level['p50_ms'] or '-':>10}"
+                f"{level['p95_ms'] or '-':>10}{level['errors']:>8}"
+            )
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+"""
+Elasticsearch Query Builder Benchmark
+
+Times the single-law requests as they were written before apps.api.es_queries
+(`match_phrase` on law_id in scoring context, full `_source`) against the
+builder versions (`term` in bool.filter, limited `_source`, law_id
+routing), and reports median and p95 latency.
+
+The fixture index is built from the AKN files in data/federal into a
+throwaway index (--index, default "articles_bench") at ES_HOST and deleted
+afterwards unless --keep is given. It gets the production shard count
+(ES_ARTICLE_SHARDS) unless --shards says otherwise; with one shard, routing
+saves nothing and any gain comes from filter context and `_source`.
+Requires a reachable Elasticsearch.
+
+Usage:
+    python scripts/validation/es_query_benchmark.py
+    python scripts/validation/es_query_benchmark.py --limit 50 --repeat 50
+    python scripts/validation/es_query_benchmark.py --shards 10
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# ---------------------------------------------------------------------------
+# Path setup -- two levels up from scripts/validation/ reaches project root
+# ---------------------------------------------------------------------------
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "apps.indigo.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from elasticsearch import helpers  # noqa: E402
+
+from apps.api import es_queries  # noqa: E402
+from apps.api.config import ES_ARTICLE_SHARDS, es_client  # noqa: E402
+from apps.api.management.commands.index_laws import Command  # noqa: E402
+
+AKN_DIR = PROJECT_ROOT / "data" / "federal"
+
+# Routed by law_id like the real articles index; the legacy requests
+# search every shard, the builder requests only the law's shard
+MAPPING = {
+    "_routing": {"required": True},
+    "properties": {
+        "law_id": {"type": "keyword"},
+        "law_name": {"type": "text", "analyzer": "spanish"},
+        "article": {"type": "keyword"},
+        "text": {"type": "text", "analyzer": "spanish"},
+        "tier": {"type": "keyword"},
+        "hierarchy": {"type": "keyword"},
+        "tags": {"type": "keyword"},
+    },
+}
+
+
+# ---------------------------------------------------------------------------
+# Request bodies as the views built them before the builder module
+# ---------------------------------------------------------------------------
+
+
+def legacy_requests(law_id):
+    scoped = {"match_phrase": {"law_id": law_id}}
+    return {
+        "articles": (
+            "search",
+            {
+                "body": {
+                    "query": scoped,
+                    "sort": [{"article": {"order": "asc"}}],
+                    "size": 500,
+                }
+            },
+        ),
+        "structure": (
+            "search",
+            {
+                "body": {
+                    "query": scoped,
+                    "sort": [{"article": "asc"}],
+                    "_source": ["hierarchy", "text", "article"],
+                    "size": 10000,
+                }
+            },
+        ),
+        "law_search": (
+            "search",
+            {
+                "body": {
+                    "query": {
+                        "bool": {
+                            "must": [
+                                scoped,
+                                {"match": {"text": {"query": "derecho"}}},
+                            ]
+                        }
+                    },
+                    "highlight": {"fields": {"text": {"fragment_size": 200}}},
+                    "size": 50,
+                }
+            },
+        ),
+    }
+
+
+def builder_requests(law_id):
+    return {
+        "articles": ("search", es_queries.law_articles(law_id, 500)),
+        "structure": ("search", es_queries.law_hierarchy(law_id)),
+        "law_search": ("search", es_queries.law_text_search(law_id, "derecho")),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+
+def build_fixture(index, limit, shards):
+    files = sorted(AKN_DIR.glob("*.xml"))[:limit]
+    command = Command()
+    command.stderr = sys.stderr
+
+    def actions():
+        for xml_path in files:
+            with open(xml_path, "rb") as f:
+                for art in command.iter_articles(f):
+                    yield {
+                        "_index": index,
+                        "_id": f"{xml_path.stem}-{art['article_id']}",
+                        "_routing": xml_path.stem,
+                        "_source": {
+                            "law_id": xml_path.stem,
+                            "law_name": xml_path.stem,
+                            "article": art["article_id"],
+                            "text": art["text"],
+                            "tier": "federal",
+                            "hierarchy": [
+                                level["heading"]
+                                for level in (art["book"], art["title"], art["chapter"])
+                                if level
+                            ],
+                            "tags": ["federal"],
+                        },
+                    }
+
+    es_client.indices.delete(index=index, ignore_unavailable=True)
+    es_client.indices.create(
+        index=index,
+        body={"settings": {"number_of_shards": shards}, "mappings": MAPPING},
+    )
+    indexed, _ = helpers.bulk(es_client, actions(), chunk_size=1000)
+    es_client.indices.refresh(index=index)
+    return [f.stem for f in files], indexed
+
+
+def measure(requests, index, law_ids, repeat):
+    samples = []
+    for _ in range(repeat):
+        for law_id in law_ids:
+            method, kwargs = requests(law_id)
+            kwargs = {**kwargs, "index": index}
+            start = time.perf_counter()
+            getattr(es_client, method)(**kwargs)
+            samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--index", default="articles_bench")
+    parser.add_argument("--limit", type=int, default=30, help="Laws to index")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=ES_ARTICLE_SHARDS,
+        help="Fixture shards (default: ES_ARTICLE_SHARDS, as in production)",
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep the index")
+    args = parser.parse_args()
+
+    try:
+        es_up = es_client.ping()
+    except Exception:
+        es_up = False
+    if not es_up:
+        sys.exit("Elasticsearch unreachable; start one and set ES_HOST")
+
+    law_ids, articles = build_fixture(args.index, args.limit, args.shards)
+    print(
+        f"Fixture index {args.index}: {len(law_ids)} laws, {articles} articles, "
+        f"{args.shards} shard(s)\n"
+    )
+
+    try:
+        print(f"{'request':<12}{'legacy ms':>22}{'builder ms':>22}")
+        print(f"{'':<12}{'median':>11}{'p95':>11}{'median':>11}{'p95':>11}")
+        for name in ("articles", "structure", "law_search"):
+            # Warm both variants once so neither pays for cold segments
+            for build in (legacy_requests, builder_requests):
+                measure(lambda law_id: build(law_id)[name], args.index, law_ids, 1)
+            legacy = measure(
+                lambda law_id: legacy_requests(law_id)[name],
+                args.index,
+                law_ids,
+                args.repeat,
+            )
+            builder = measure(
+                lambda law_id: builder_requests(law_id)[name],
+                args.index,
+                law_ids,
+                args.repeat,
+            )
+            print(
+                f"{name:<12}{legacy[0]:>11.2f}{legacy[1]:>11.2f}"
+                f"{builder[0]:>11.2f}{builder[1]:>11.2f}"
+            )
+    finally:
+        if not args.keep:
+            es_client.indices.delete(index=args.index, ignore_unavailable=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""
+ISR Engine Throughput Benchmark
+
+Compares per-person cost of the scalar ISR path (one call per person, as
+OpenFisca variables used to do) against the vectorized NumPy tariff in
+engines/openfisca/isr_vectorized.py.
+
+The scalar baseline is the generated Catala module when the Catala runtime
+is installed, otherwise an equivalent Decimal if/else bracket chain.
+
+Usage:
+    python scripts/validation/isr_benchmark.py
+    python scripts/validation/isr_benchmark.py --population 5000000 --scalar 20000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+
+# ---------------------------------------------------------------------------
+# Path setup -- two levels up from scripts/validation/ reaches project root
+# ---------------------------------------------------------------------------
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np  # noqa: E402
+
+from engines.openfisca.isr_vectorized import BRACKETS_2026, ISR_2026  # noqa: E402
+
+
+def _catala_scalar():
+    """Per-person Catala evaluation, or None if the runtime is missing."""
+    try:
+        from catala.runtime import money_of_cents_string
+
+        from engines.catala.lisr_catala import TaxCalculation2026In, tax_calculation2026
+    except ImportError:
+        return None
+
+    def tax(income_cents):
+        money = money_of_cents_string(str(income_cents))
+        return tax_calculation2026(TaxCalculation2026In(monthly_income_in=money))
+
+    return tax
+
+
+_DECIMAL_BRACKETS = [
+    (Decimal(lo) / 100, Decimal(fee) / 100, Decimal(rate) / 10000)
+    for lo, fee, rate in BRACKETS_2026
+]
+
+
+def decimal_scalar(income_cents):
+    """Decimal bracket chain, the shape of the generated Catala code."""
+    income = Decimal(income_cents) / 100
+    for lower, fee, rate in reversed(_DECIMAL_BRACKETS):
+        if income >= lower:
+            marginal = ((income - lower) * rate).quantize(
+                Decimal("0.01"), rounding=ROUND_HALF_UP
+            )
+            return fee + marginal
+    return Decimal("0")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--population", type=int, default=1_000_000)
+    parser.add_argument(
+        "--scalar", type=int, default=20_000, help="Persons for the scalar path"
+    )
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(2026)
+    # Log-normal monthly incomes around ~$15k, in cents
+    incomes = np.rint(rng.lognormal(mean=9.6, sigma=0.9, size=args.population) * 100)
+    incomes = np.maximum(incomes, 1).astype(np.int64)
+
+    scalar = _catala_scalar()
+    scalar_label = "Catala (generated)"
+    if scalar is None:
+        scalar = decimal_scalar
+        scalar_label = "Decimal bracket chain"
+
+    sample = incomes[: args.scalar].tolist()
+    start = time.perf_counter()
+    for income in sample:
+        scalar(income)
+    scalar_ns = (time.perf_counter() - start) * 1e9 / len(sample)
+
+    # Median of several passes; the first one pays for page-faulting the
+    # temporaries in
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        ISR_2026.tax_cents(incomes)
+        timings.append(time.perf_counter() - start)
+    vector_ns = statistics.median(timings) * 1e9 / len(incomes)
+
+    print(f"{'Engine':<32} {'persons':>10} {'ns/person':>12}")
+    print("-" * 56)
+    print(f"{scalar_label:<32} {len(sample):>10} {scalar_ns:>12.1f}")
+    print(f"{'NumPy searchsorted (int64)':<32} {len(incomes):>10} {vector_ns:>12.1f}")
+    print(f"\nSpeedup: {scalar_ns / vector_ns:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+"""
+LawListView Query Benchmark
+
+Builds a throwaway test database (``test_<NAME>``, never the configured
+database) with a synthetic 30k-law corpus and compares the legacy listing
+queries (``Count("versions")`` annotation, join-based date sort, OFFSET
+pagination) against the denormalized fields and keyset cursors.
+
+Run against PostgreSQL (DATABASE_URL / DB_ENGINE) to exercise the pg_trgm
+and LOWER() indexes; SQLite works for a quick relative comparison.
+
+Usage:
+    python scripts/validation/law_list_benchmark.py
+    python scripts/validation/law_list_benchmark.py --laws 30000 --repeat 5
+    python scripts/validation/law_list_benchmark.py --json results.json
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# ---------------------------------------------------------------------------
+# Path setup -- two levels up from scripts/validation/ reaches project root
+# ---------------------------------------------------------------------------
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "apps.indigo.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.db.models import Count  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+from apps.api.law_list_views import LawListView  # noqa: E402
+from apps.api.models import Law, LawVersion  # noqa: E402
+
+STATES = [
+    "Aguascalientes",
+    "Baja California",
+    "Chihuahua",
+    "Colima",
+    "Jalisco",
+    "Nuevo León",
+    "Oaxaca",
+    "Querétaro",
+    "Yucatán",
+    "Zacatecas",
+]
+CATEGORIES = ["ley", "codigo", "reglamento", "decreto", "acuerdo"]
+SUBJECTS = ["Ingresos", "Hacienda", "Salud", "Educación", "Aguas", "Tránsito"]
+PAGE_SIZE = 50
+DEEP_PAGE = 400  # ~20k rows in at 50 per page
+
+
+def build_fixture(n_laws: int, seed: int = 7):
+    """Bulk-insert n_laws laws with 1-4 versions each."""
+    rng = random.Random(seed)
+    laws = [
+        Law(
+            official_id=f"bench_{i:06d}",
+            name=f"Ley de {rng.choice(SUBJECTS)} del Estado {i}",
+            tier="state",
+            state=rng.choice(STATES),
+            category=rng.choice(CATEGORIES),
+        )
+        for i in range(n_laws)
+    ]
+    Law.objects.bulk_create(laws, batch_size=2000)
+
+    base = date(1990, 1, 1)
+    versions = []
+    for law_id in Law.objects.values_list("pk", flat=True):
+        for _ in range(rng.randint(1, 4)):
+            versions.append(
+                LawVersion(
+                    law_id=law_id,
+                    publication_date=base + timedelta(days=rng.randint(0, 12000)),
+                )
+            )
+    LawVersion.objects.bulk_create(versions, batch_size=5000)
+    # bulk_create skips signals, so sync the denormalized fields in one pass
+    Law.refresh_version_stats()
+    return len(laws), len(versions)
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def legacy_page(sort, page, **filters):
+    """The pre-denormalization query LawListView used to run."""
+    qs = Law.objects.annotate(n_versions=Count("versions")).order_by(sort)
+    if "state" in filters:
+        qs = qs.filter(state__iexact=filters["state"])
+    if "q" in filters:
+        qs = qs.filter(name__icontains=filters["q"])
+    qs.count()
+    offset = (page - 1) * PAGE_SIZE
+    return list(qs[offset : offset + PAGE_SIZE])
+
+
+def view_get(params):
+    request = APIRequestFactory().get("/api/v1/laws/", params)
+    # No throttling: the benchmark issues hundreds of requests back to back
+    response = LawListView.as_view(throttle_classes=[])(request)
+    assert response.status_code == 200, response.data
+    return response.data
+
+
+def keyset_to(params, pages):
+    """Walk `pages` keyset pages (what a client scrolling that deep pays)."""
+    cursor = ""
+    for _ in range(pages):
+        data = view_get({**params, "cursor": cursor, "page_size": PAGE_SIZE})
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    return cursor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--laws", type=int, default=30000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", type=Path, help="Write results to this file")
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        start = time.perf_counter()
+        n_laws, n_versions = build_fixture(args.laws)
+        print(
+            f"Fixture: {n_laws} laws, {n_versions} versions "
+            f"({time.perf_counter() - start:.1f}s, {connection.vendor})\n"
+        )
+
+        # One keyset page at depth: walk once to get the cursor, then time
+        # only the final page request.
+        deep_cursor = keyset_to({"sort": "date_desc"}, DEEP_PAGE - 1)
+
+        cases = [
+            (
+                "first page, name sort",
+                lambda: legacy_page("official_id", 1),
+                lambda: view_get({}),
+            ),
+            (
+                "first page, date sort",
+                lambda: legacy_page("-versions__publication_date", 1),
+                lambda: view_get({"sort": "date_desc"}),
+            ),
+            (
+                f"page {DEEP_PAGE}, date sort",
+                lambda: legacy_page("-versions__publication_date", DEEP_PAGE),
+                lambda: view_get(
+                    {"sort": "date_desc", "cursor": deep_cursor, "page_size": PAGE_SIZE}
+                ),
+            ),
+            (
+                "state filter",
+                lambda: legacy_page("official_id", 1, state="jalisco"),
+                lambda: view_get({"state": "jalisco"}),
+            ),
+            (
+                "name search",
+                lambda: legacy_page("official_id", 1, q="hacienda"),
+                lambda: view_get({"q": "hacienda"}),
+            ),
+        ]
+
+        results = []
+        print(f"{'Case':<28} {'legacy ms':>10} {'new ms':>10} {'speedup':>9}")
+        print("-" * 60)
+        for label, legacy, new in cases:
+            legacy_ms = timed(legacy, args.repeat)
+            new_ms = timed(new, args.repeat)
+            speedup = legacy_ms / new_ms if new_ms else float("inf")
+            results.append(
+                {
+                    "case": label,
+                    "legacy_ms": round(legacy_ms, 2),
+                    "new_ms": round(new_ms, 2),
+                    "speedup": round(speedup, 2),
+                }
+            )
+            print(f"{label:<28} {legacy_ms:>10.2f} {new_ms:>10.2f} {speedup:>8.1f}x")
+
+        if args.json:
+            args.json.write_text(
+                json.dumps(
+                    {
+                        "vendor": connection.vendor,
+                        "laws": n_laws,
+                        "versions": n_versions,
+                        "results": results,
+                    },
+                    indent=2,
+                )
+            )
+            print(f"\nResults written to {args.json}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,380 @@
+#!/usr/bin/env python
+"""
+Parser Throughput Benchmark
+
+Runs each stage of the parsing pipeline over a fixed corpus sample and
+reports MB/s, articles/s and peak RSS per stage:
+
+    parse     AkomaNtosoGeneratorV2.parse_structure_v2
+    generate  AkomaNtosoGeneratorV2.generate_xml
+    quality   QualityCalculator.calculate
+    xrefs     CrossReferenceDetector.detect
+    extract   index_laws.Command.extract_articles_from_xml
+
+The sample is every k-th file (sorted by name) of data/raw/*_extracted.txt
+plus pre-extracted state texts under data/state_laws_processed/ when that
+directory exists. Each stage runs in a fresh interpreter so its peak RSS is
+not inflated by the stages before it.
+
+Results are written to JSON. With a stored baseline, the run fails (exit 1)
+when any stage's throughput drops, or its peak RSS grows, by more than
+--max-regression percent.
+
+Usage:
+    python scripts/validation/parser_throughput_benchmark.py
+    python scripts/validation/parser_throughput_benchmark.py --federal 40 --state 20
+    python scripts/validation/parser_throughput_benchmark.py --update-baseline
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# ---------------------------------------------------------------------------
+# Path setup -- two levels up from scripts/validation/ reaches project root
+# ---------------------------------------------------------------------------
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+RAW_DIR = PROJECT_ROOT / "data" / "raw"
+STATE_DIR = PROJECT_ROOT / "data" / "state_laws_processed"
+RESULTS_PATH = PROJECT_ROOT / "data" / "parser_throughput_results.json"
+BASELINE_PATH = PROJECT_ROOT / "data" / "parser_throughput_baseline.json"
+STAGES = ["parse", "generate", "quality", "xrefs", "extract"]
+MAX_REGRESSION_PCT = 25.0
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+def _every_kth(paths: List[Path], n: int) -> List[Path]:
+    """Deterministic spread of n paths across the sorted list."""
+    paths = sorted(paths)
+    if n <= 0 or not paths:
+        return []
+    if n >= len(paths):
+        return paths
+    step = len(paths) / n
+    return [paths[int(i * step)] for i in range(n)]
+
+
+def select_corpus(n_federal: int, n_state: int) -> List[Path]:
+    federal = _every_kth(list(RAW_DIR.glob("*_extracted.txt")), n_federal)
+    state = _every_kth(list(STATE_DIR.glob("**/*.txt")), n_state)
+    return federal + state
+
+
+def corpus_fingerprint(docs: List[Dict]) -> str:
+    digest = hashlib.sha256()
+    for doc in docs:
+        digest.update(f"{doc['name']}:{doc['text_bytes']}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def prepare_corpus(paths: List[Path], workdir: Path) -> List[Dict]:
+    """
+    Generate the AKN XML that the quality and extract stages read, and count
+    articles per document. Runs once, untimed, in the parent process.
+    """
+    from apps.parsers.akn_generator_v2 import AkomaNtosoGeneratorV2
+
+    generator = AkomaNtosoGeneratorV2()
+    docs = []
+    for i, path in enumerate(paths):
+        text = path.read_text(encoding="utf-8", errors="replace")
+        slug = f"doc{i:03d}"
+        xml_path = workdir / f"{slug}.xml"
+        metadata = generator.create_frbr_metadata("ley", "2026-01-01", slug, slug)
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, result = generator.generate_xml(text, metadata, xml_path)
+        docs.append(
+            {
+                "name": str(path.relative_to(PROJECT_ROOT)),
+                "slug": slug,
+                "text_path": str(path),
+                "xml_path": str(xml_path),
+                "text_bytes": len(text.encode("utf-8")),
+                "xml_bytes": xml_path.stat().st_size,
+                "articles": result.metadata.get("articles", 0),
+            }
+        )
+    return docs
+
+
+# ---------------------------------------------------------------------------
+# Stages (each runs in a spawned child process)
+# ---------------------------------------------------------------------------
+def _stage_parse(docs, texts, xmls, workdir):
+    from apps.parsers.akn_generator_v2 import AkomaNtosoGeneratorV2
+
+    generator = AkomaNtosoGeneratorV2()
+    return lambda: [generator.parse_structure_v2(t) for t in texts]
+
+
+def _stage_generate(docs, texts, xmls, workdir):
+    from apps.parsers.akn_generator_v2 import AkomaNtosoGeneratorV2
+
+    generator = AkomaNtosoGeneratorV2()
+    out_dir = Path(workdir) / "generate"
+    out_dir.mkdir(exist_ok=True)
+    jobs = [
+        (
+            text,
+            generator.create_frbr_metadata(
+                "ley", "2026-01-01", doc["slug"], doc["slug"]
+            ),
+            out_dir / f"{doc['slug']}.xml",
+        )
+        for doc, text in zip(docs, texts)
+    ]
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for text, metadata, path in jobs:
+                generator.generate_xml(text, metadata, path)
+
+    return run
+
+
+def _stage_quality(docs, texts, xmls, workdir):
+    from apps.parsers.quality import QualityCalculator
+
+    calculator = QualityCalculator()
+
+    def run():
+        for doc in docs:
+            calculator.calculate(
+                doc["xml_path"],
+                law_name=doc["slug"],
+                law_slug=doc["slug"],
+                articles_expected=doc["articles"],
+            )
+
+    return run
+
+
+def _stage_xrefs(docs, texts, xmls, workdir):
+    from apps.parsers.cross_references import CrossReferenceDetector
+
+    detector = CrossReferenceDetector()
+    return lambda: [detector.detect(t) for t in texts]
+
+
+def _stage_extract(docs, texts, xmls, workdir):
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "apps.indigo.settings")
+    django.setup()
+    from apps.api.management.commands.index_laws import Command
+
+    command = Command()
+    return lambda: [
+        command.extract_articles_from_xml(x, d["slug"]) for d, x in zip(docs, xmls)
+    ]
+
+
+STAGE_SETUP = {
+    "parse": _stage_parse,
+    "generate": _stage_generate,
+    "quality": _stage_quality,
+    "xrefs": _stage_xrefs,
+    "extract": _stage_extract,
+}
+XML_STAGES = {"quality", "extract"}
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_stage(stage: str, docs: List[Dict], workdir: str, repeat: int) -> Dict:
+    """Time one stage over the corpus. Meant to run in a fresh process."""
+    sys.path.insert(0, str(PROJECT_ROOT))
+    texts = [
+        Path(d["text_path"]).read_text(encoding="utf-8", errors="replace") for d in docs
+    ]
+    xmls = [Path(d["xml_path"]).read_text(encoding="utf-8") for d in docs]
+    run = STAGE_SETUP[stage](docs, texts, xmls, workdir)
+
+    # One untimed warm-up pass, then best of `repeat`: the minimum is the
+    # least noisy estimate on a shared machine, which keeps the gate stable
+    run()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    seconds = min(timings)
+
+    key = "xml_bytes" if stage in XML_STAGES else "text_bytes"
+    n_bytes = sum(d[key] for d in docs)
+    n_articles = sum(d["articles"] for d in docs)
+    return {
+        "seconds": round(seconds, 4),
+        "input": "xml" if stage in XML_STAGES else "text",
+        "mb": round(n_bytes / 1e6, 3),
+        "mb_per_s": round(n_bytes / 1e6 / seconds, 3),
+        "articles_per_s": round(n_articles / seconds, 1),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Baseline comparison
+# ---------------------------------------------------------------------------
+def compare_to_baseline(
+    current: Dict[str, Dict], baseline: Dict[str, Dict], max_regression_pct: float
+) -> List[str]:
+    """
+    Return one message per regression: throughput (MB/s) that dropped, or
+    peak RSS that grew, by more than max_regression_pct. Stages missing from
+    either side are ignored.
+    """
+    regressions = []
+    for stage, result in current.items():
+        base = baseline.get(stage)
+        if not base:
+            continue
+        if base.get("mb_per_s"):
+            drop = (base["mb_per_s"] - result["mb_per_s"]) / base["mb_per_s"] * 100
+            if drop > max_regression_pct:
+                regressions.append(
+                    f"{stage}: throughput {result['mb_per_s']:.2f} MB/s is "
+                    f"{drop:.1f}% below baseline {base['mb_per_s']:.2f} MB/s"
+                )
+        if base.get("peak_rss_mb"):
+            growth = (
+                (result["peak_rss_mb"] - base["peak_rss_mb"])
+                / base["peak_rss_mb"]
+                * 100
+            )
+            if growth > max_regression_pct:
+                regressions.append(
+                    f"{stage}: peak RSS {result['peak_rss_mb']:.0f} MB is "
+                    f"{growth:.1f}% above baseline {base['peak_rss_mb']:.0f} MB"
+                )
+    return regressions
+
+
+def format_table(stages: Dict[str, Dict], baseline: Dict[str, Dict]) -> str:
+    header = (
+        f"{'Stage':<10} {'Input':>6} {'MB':>8} {'sec':>8} {'MB/s':>8} "
+        f"{'art/s':>10} {'RSS MB':>8} {'vs base':>8}"
+    )
+    lines = ["-" * len(header), header, "-" * len(header)]
+    for stage, r in stages.items():
+        base = baseline.get(stage, {}).get("mb_per_s")
+        delta = f"{(r['mb_per_s'] - base) / base:+.1%}" if base else "--"
+        lines.append(
+            f"{stage:<10} {r['input']:>6} {r['mb']:>8.2f} {r['seconds']:>8.3f} "
+            f"{r['mb_per_s']:>8.2f} {r['articles_per_s']:>10.0f} "
+            f"{r['peak_rss_mb']:>8.0f} {delta:>8}"
+        )
+    lines.append("-" * len(header))
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--federal", type=int, default=25, help="Federal texts")
+    parser.add_argument("--state", type=int, default=25, help="State texts")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=MAX_REGRESSION_PCT,
+        help="Allowed regression per stage, in percent",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store this run as the new baseline instead of comparing",
+    )
+    args = parser.parse_args()
+
+    paths = select_corpus(args.federal, args.state)
+    if not paths:
+        print(f"No corpus texts found under {RAW_DIR} or {STATE_DIR}")
+        return 1
+    n_state = sum(1 for p in paths if STATE_DIR in p.parents)
+    if args.state and not n_state:
+        print(f"Note: no state texts under {STATE_DIR}; federal sample only")
+
+    baseline = {}
+    if args.baseline.exists() and not args.update_baseline:
+        baseline = json.loads(args.baseline.read_text())
+
+    with tempfile.TemporaryDirectory(prefix="throughput-") as workdir:
+        print(f"Preparing {len(paths)} documents ({n_state} state) ...", flush=True)
+        docs = prepare_corpus(paths, Path(workdir))
+        fingerprint = corpus_fingerprint(docs)
+        if baseline and baseline.get("corpus_fingerprint") != fingerprint:
+            print("Warning: baseline was recorded on a different corpus sample")
+
+        stages = {}
+        ctx = multiprocessing.get_context("spawn")
+        for stage in args.stages:
+            print(f"Running {stage} ...", flush=True)
+            with ctx.Pool(1) as pool:
+                stages[stage] = pool.apply(
+                    run_stage, (stage, docs, workdir, args.repeat)
+                )
+
+    payload = {
+        "benchmark": "parser_throughput",
+        "corpus_fingerprint": fingerprint,
+        "documents": [d["name"] for d in docs],
+        "repeat": args.repeat,
+        "stages": stages,
+    }
+    print()
+    print(format_table(stages, baseline.get("stages", {})))
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+        print(f"\nBaseline written to: {args.baseline}")
+        return 0
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+    print(f"\nResults written to: {args.output}")
+
+    if not baseline:
+        print("No baseline to compare against (run with --update-baseline)")
+        return 0
+    regressions = compare_to_baseline(
+        stages, baseline.get("stages", {}), args.max_regression
+    )
+    if regressions:
+        print(f"\nREGRESSIONS (>{args.max_regression:.0f}%):")
+        for message in regressions:
+            print(f"  -> {message}")
+        return 1
+    print(f"\nNo stage regressed more than {args.max_regression:.0f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
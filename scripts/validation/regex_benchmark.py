@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+"""
+Regex Registry Microbenchmark
+
+Times the regex-heavy helpers on the parsing and indexing hot paths in two
+forms: the previous inline form (`re.search(literal, ...)` or `re.compile`
+per call, which goes through the `re` module cache every time) and the
+registry form that uses precompiled patterns from
+apps.parsers.patterns.registry.
+
+    reforms       extract_reforms on every article of the sample
+    derogated     is_derogated on every article
+    confidence    AkomaNtosoGeneratorV2._article_confidence on every article
+    transitorios  AkomaNtosoGeneratorV2._find_transitorios on every law
+    clean_text    index_laws paragraph clean-up on every article
+
+Usage:
+    python scripts/validation/regex_benchmark.py
+    python scripts/validation/regex_benchmark.py --laws 40 --repeat 7
+"""
+
+import argparse
+import os
+import re
+import sys
+import timeit
+from pathlib import Path
+
+# ---------------------------------------------------------------------------
+# Path setup -- two levels up from scripts/validation/ reaches project root
+# ---------------------------------------------------------------------------
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from apps.parsers.akn_generator_v2 import AkomaNtosoGeneratorV2  # noqa: E402
+from apps.parsers.patterns.articles import (  # noqa: E402
+    DEROGATION_PATTERNS,
+    is_derogated,
+)
+from apps.parsers.patterns.metadata import REFORM_PATTERN, extract_reforms  # noqa: E402
+from apps.parsers.patterns.structure import (  # noqa: E402
+    ORDINAL_PATTERNS,
+    compile_transitorios_patterns,
+)
+
+RAW_DIR = PROJECT_ROOT / "data" / "raw"
+
+
+# ---------------------------------------------------------------------------
+# Inline forms, as the hot paths were written before the registry
+# ---------------------------------------------------------------------------
+
+
+def inline_reforms(text):
+    pattern = re.compile(REFORM_PATTERN, re.IGNORECASE)
+    reforms = [m.groups() for m in pattern.finditer(text)]
+    return pattern.sub("", text), reforms
+
+
+def inline_derogated(text):
+    if len(text.strip()) < 100:
+        for pattern in DEROGATION_PATTERNS:
+            if re.search(pattern, text, re.IGNORECASE | re.MULTILINE):
+                return True
+    return False
+
+
+def inline_confidence(content):
+    score = 1.0
+    if len(content) < 50:
+        score -= 0.1
+    if not re.search(r"[.;:]", content):
+        score -= 0.2
+    if re.search(
+        r"(en términos|conforme|de acuerdo|lo dispuesto)", content, re.IGNORECASE
+    ):
+        score += 0.05
+    return max(0.0, min(1.0, score))
+
+
+def inline_transitorios(text):
+    # The header lookup was already precompiled; only the entries were not
+    for header in compile_transitorios_patterns()["header"]:
+        match = header.search(text)
+        if match:
+            break
+    else:
+        return []
+    text = text[match.end() :]
+
+    found = []
+    for ordinal_pattern in ORDINAL_PATTERNS:
+        pattern = re.compile(
+            f"^({ordinal_pattern})\\.-\\s+(.+?)(?=^[A-ZÚÉÍÓÁ]+\\.-|\\Z)",
+            re.MULTILINE | re.DOTALL | re.IGNORECASE,
+        )
+        found.extend(m.group(1) for m in pattern.finditer(text))
+    return found
+
+
+def inline_clean_text(raw):
+    cleaned = re.sub(r"^(?:Art[ií]culo|ARTÍCULO)\s+\d+[\w\s]*\.\s*", "", raw)
+    cleaned = re.sub(
+        r"(?<=[a-záéíóúñü,;])\n(?=[a-záéíóúñü])", " ", cleaned, flags=re.IGNORECASE
+    )
+    return re.sub(r" {2,}", " ", cleaned)
+
+
+def registry_clean_text():
+    """index_laws' clean-up with its registered patterns (needs Django)."""
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "apps.indigo.settings")
+    django.setup()
+    from apps.api.management.commands import index_laws
+
+    def clean(raw):
+        cleaned = index_laws._ARTICLE_PREFIX_RE.sub("", raw, count=1)
+        cleaned = index_laws._SOFT_BREAK_RE.sub(" ", cleaned)
+        return index_laws._MULTI_SPACE_RE.sub(" ", cleaned)
+
+    return clean
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+
+def load_sample(laws):
+    files = sorted(RAW_DIR.glob("*_extracted.txt"))
+    step = max(1, len(files) // laws) if laws else 1
+    texts = [f.read_text(encoding="utf-8", errors="ignore") for f in files[::step]]
+    generator = AkomaNtosoGeneratorV2()
+    articles = [
+        a["content"]
+        for text in texts
+        for a in generator._find_articles(text.split("\n"))
+    ]
+    return texts, articles, generator
+
+
+def best_of(fn, items, repeat):
+    return min(timeit.repeat(lambda: [fn(x) for x in items], number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--laws", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    texts, articles, generator = load_sample(args.laws)
+    print(f"Sample: {len(texts)} laws, {len(articles)} articles\n")
+
+    cases = [
+        ("reforms", articles, inline_reforms, extract_reforms),
+        ("derogated", articles, inline_derogated, is_derogated),
+        ("confidence", articles, inline_confidence, generator._article_confidence),
+        ("transitorios", texts, inline_transitorios, generator._find_transitorios),
+        ("clean_text", articles, inline_clean_text, registry_clean_text()),
+    ]
+
+    print(f"{'case':<14}{'inline ms':>12}{'registry ms':>14}{'speedup':>10}")
+    for name, items, inline, compiled in cases:
+        before = best_of(inline, items, args.repeat) * 1000
+        after = best_of(compiled, items, args.repeat) * 1000
+        print(f"{name:<14}{before:>12.1f}{after:>14.1f}{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
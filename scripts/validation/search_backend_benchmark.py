@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+"""
+Search Backend Latency Benchmark
+
+Runs the same queries through SearchView against Elasticsearch and against
+the SQLite FTS5 fallback index (apps.api.fts_index), and reports median
+and p95 latency per query.
+
+The SQLite index is built from the AKN files in data/federal into a
+temporary file unless --index points at an existing one (e.g. the
+FTS_INDEX_PATH index_laws wrote). Elasticsearch is used at ES_HOST when it
+answers a ping; otherwise only SQLite is measured.
+
+Usage:
+    python scripts/validation/search_backend_benchmark.py
+    python scripts/validation/search_backend_benchmark.py --repeat 20 --limit 100
+    python scripts/validation/search_backend_benchmark.py --index data/search/articles.db
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# ---------------------------------------------------------------------------
+# Path setup -- two levels up from scripts/validation/ reaches project root
+# ---------------------------------------------------------------------------
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "apps.indigo.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+from apps.api import fts_index  # noqa: E402
+from apps.api.config import es_client  # noqa: E402
+from apps.api.management.commands.index_laws import Command  # noqa: E402
+from apps.api.search_views import SearchView  # noqa: E402
+
+AKN_DIR = PROJECT_ROOT / "data" / "federal"
+
+# (label, query params): plain terms, phrases with stopwords, filters, sorts
+QUERIES = [
+    ("single term", {"q": "salario"}),
+    ("accented", {"q": "artículo constitución"}),
+    ("plural", {"q": "trabajadores extranjeros"}),
+    ("stopwords", {"q": "de la propiedad de los bienes"}),
+    ("rare term", {"q": "hidrocarburos"}),
+    ("category filter", {"q": "responsabilidad", "category": "ley"}),
+    ("tier filter", {"q": "impuesto", "jurisdiction": "federal"}),
+    ("date sort", {"q": "contrato", "sort": "date_desc"}),
+    ("deep page", {"q": "ley", "page": 20, "page_size": 50}),
+]
+
+
+def build_index(path, limit=None):
+    """Index the AKN files under data/federal into `path`."""
+    files = sorted(AKN_DIR.glob("*.xml"))[:limit]
+    command = Command()
+    command.stderr = sys.stderr
+    conn = fts_index.connect_writer(path)
+    articles = 0
+    for xml_path in files:
+        law = SimpleNamespace(
+            official_id=xml_path.stem, status="vigente", law_type="legislative"
+        )
+        with open(xml_path, "rb") as f:
+            sources = [
+                {
+                    "law_name": xml_path.stem,
+                    "article": art["article_id"],
+                    "text": art["text"],
+                    "category": "ley",
+                    "tier": "federal",
+                    "state": "",
+                    "municipality": "",
+                    "book": art["book"]["heading"] if art["book"] else None,
+                    "title": art["title"]["heading"] if art["title"] else None,
+                    "chapter": art["chapter"]["heading"] if art["chapter"] else None,
+                    "hierarchy": [],
+                    "publication_date": None,
+                    "tags": ["federal", "ley"],
+                }
+                for art in command.iter_articles(f)
+            ]
+        fts_index.index_law(law, sources, conn=conn)
+        articles += len(sources)
+    fts_index.optimize(conn)
+    conn.close()
+    return len(files), articles
+
+
+def run_query(params):
+    request = APIRequestFactory().get("/api/v1/search/", params)
+    # No throttling: the benchmark issues hundreds of requests back to back
+    response = SearchView.as_view(throttle_classes=[])(request)
+    assert response.status_code == 200, response.data
+    return response
+
+
+def measure(params, repeat):
+    run_query(params)  # warm caches and connections
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = run_query(params)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(samples[max(0, int(len(samples) * 0.95) - 1)], 2),
+        "total": response.data["total"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--limit", type=int, help="Index only the first N laws")
+    parser.add_argument("--index", type=Path, help="Use an existing SQLite index")
+    parser.add_argument("--json", type=Path, help="Write results to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.index:
+            if not args.index.exists():
+                sys.exit(f"No SQLite index at {args.index}")
+            fts_index.FTS_INDEX_PATH = args.index
+        else:
+            fts_index.FTS_INDEX_PATH = Path(tmp) / "articles.db"
+            start = time.perf_counter()
+            n_laws, n_articles = build_index(fts_index.FTS_INDEX_PATH, args.limit)
+            size_mb = fts_index.FTS_INDEX_PATH.stat().st_size / 1e6
+            print(
+                f"SQLite index: {n_laws} laws, {n_articles} articles, "
+                f"{size_mb:.1f} MB ({time.perf_counter() - start:.1f}s)\n"
+            )
+
+        try:
+            es_up = es_client.ping()
+        except Exception:
+            es_up = False
+        if not es_up:
+            print("Elasticsearch unreachable; measuring SQLite only\n")
+
+        results = []
+        print(
+            f"{'Query':<18} {'engine':<8} {'hits':>7} {'median ms':>10} {'p95 ms':>8}"
+        )
+        print("-" * 55)
+        for label, params in QUERIES:
+            engines = ["sqlite"] + (["es"] if es_up else [])
+            for engine in engines:
+                fts_index.SEARCH_BACKEND = (
+                    "sqlite" if engine == "sqlite" else "elasticsearch"
+                )
+                row = {"query": label, "engine": engine, **measure(params, args.repeat)}
+                results.append(row)
+                print(
+                    f"{label:<18} {engine:<8} {row['total']:>7} "
+                    f"{row['median_ms']:>10.2f} {row['p95_ms']:>8.2f}"
+                )
+        fts_index.close()
+
+    if args.json:
+        args.json.write_text(json.dumps({"results": results}, indent=2))
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Microsimulation Benchmark
+
+Builds a synthetic population, loads it into the columnar mock Simulation
+and computes every ISR output with calculate_many(), for the 2026 tariff and
+a reform (bracket lower limits indexed by --indexation). Prints timings and
+the aggregate revenue difference.
+
+Usage:
+    python scripts/validation/simulation_benchmark.py
+    python scripts/validation/simulation_benchmark.py --population 1000000 --indexation 0.05
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# ---------------------------------------------------------------------------
+# Path setup -- two levels up from scripts/validation/ reaches project root
+# ---------------------------------------------------------------------------
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np  # noqa: E402
+
+from engines.openfisca.isr_vectorized import BRACKETS_2026, ISRTable  # noqa: E402
+from engines.openfisca.system import MexicanTaxSystem  # noqa: E402
+
+PERIOD = "2026-01"
+OUTPUTS = [
+    "isr_obligation",
+    "gross_income",
+    "isr_breakdown_lower_limit",
+    "isr_breakdown_fixed_fee",
+    "isr_breakdown_rate",
+]
+
+
+def synthetic_population(n: int, seed: int = 2026) -> dict:
+    rng = np.random.default_rng(seed)
+    return {
+        "is_resident": rng.random(n) < 0.97,
+        "has_mexican_income_source": rng.random(n) < 0.6,
+        "income_cash": np.round(rng.lognormal(mean=9.6, sigma=0.9, size=n), 2),
+        "income_goods": np.round(rng.exponential(400.0, size=n), 2),
+    }
+
+
+def indexed_table(indexation: float) -> ISRTable:
+    return ISRTable(
+        [
+            (lower if lower == 1 else round(lower * (1 + indexation)), fee, rate)
+            for lower, fee, rate in BRACKETS_2026
+        ]
+    )
+
+
+def run(system, population):
+    start = time.perf_counter()
+    sim = system.new_simulation()
+    for name, values in population.items():
+        sim.set_input(name, PERIOD, values)
+    outputs = sim.calculate_many(OUTPUTS, PERIOD)
+    return outputs, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--population", type=int, default=1_000_000)
+    parser.add_argument("--indexation", type=float, default=0.05)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    population = synthetic_population(args.population)
+    print(
+        f"Synthetic population: {args.population:,} persons "
+        f"({time.perf_counter() - start:.2f}s)\n"
+    )
+
+    baseline, base_s = run(MexicanTaxSystem(), population)
+    reform, reform_s = run(
+        MexicanTaxSystem(parameters={"isr_table": indexed_table(args.indexation)}),
+        population,
+    )
+
+    base_total = baseline["isr_obligation"].sum()
+    reform_total = reform["isr_obligation"].sum()
+    print(f"{'Scenario':<28} {'seconds':>9} {'ns/person':>10} {'monthly ISR':>18}")
+    print("-" * 68)
+    for label, seconds, total in (
+        ("Tarifa 2026", base_s, base_total),
+        (f"Indexed +{args.indexation:.0%}", reform_s, reform_total),
+    ):
+        ns = seconds * 1e9 / args.population
+        print(f"{label:<28} {seconds:>9.3f} {ns:>10.1f} {total:>18,.2f}")
+
+    diff = reform_total - base_total
+    print(f"\nRevenue change: {diff:,.2f} MXN/month ({diff / base_total:+.2%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+"""
+Startup Import Profile
+
+Imports each entry point in a fresh interpreter under `python -X importtime`
+and reports the total cold-import time plus the slowest modules by
+cumulative time:
+
+    wsgi    apps.indigo.wsgi (Django setup, app registry, signals)
+    urls    wsgi plus the URLconf, i.e. every API view module
+    celery  the Celery app with its task modules
+
+Each target is imported --repeat times and the fastest run is kept. The
+report is written to data/startup_import_profile.json so changes in
+startup cost show up in review.
+
+Heavy optional dependencies (elasticsearch, export libraries, torch) must
+not appear in these profiles: they are imported on first use. Modules
+listed in HEAVY_MODULES that are imported anyway are flagged.
+
+Usage:
+    python scripts/validation/startup_profile.py
+    python scripts/validation/startup_profile.py --targets wsgi --top 40
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+# ---------------------------------------------------------------------------
+# Path setup -- two levels up from scripts/validation/ reaches project root
+# ---------------------------------------------------------------------------
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+PROFILE_PATH = PROJECT_ROOT / "data" / "startup_import_profile.json"
+TARGETS = {
+    "wsgi": "import apps.indigo.wsgi",
+    "urls": (
+        "import apps.indigo.wsgi; "
+        "from django.urls import get_resolver; get_resolver().url_patterns"
+    ),
+    "celery": (
+        "import django; django.setup(); "
+        "from apps.indigo.celery import app; app.loader.import_default_modules()"
+    ),
+}
+# Imported on first use only; seeing one at startup is a regression
+HEAVY_MODULES = [
+    "elasticsearch",
+    "weasyprint",
+    "docx",
+    "ebooklib",
+    "sentence_transformers",
+    "torch",
+]
+# Cold import budget for apps.indigo.wsgi, enforced by
+# tests/api/test_startup_imports.py
+WSGI_BUDGET_MS = 1000
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """Parse `-X importtime` output into [{module, self_us, cumulative_us, depth}]."""
+    rows = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append(
+                {
+                    "module": module,
+                    "self_us": int(self_us),
+                    "cumulative_us": int(cumulative_us),
+                    "depth": len(indent) // 2,
+                }
+            )
+    return rows
+
+
+def profile(code: str) -> List[Dict]:
+    """Run `code` in a fresh interpreter and return its import timings."""
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE="apps.indigo.settings")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return parse_importtime(result.stderr)
+
+
+def total_ms(rows: List[Dict]) -> float:
+    """Total import time: the sum of cumulative time over top-level imports."""
+    return sum(r["cumulative_us"] for r in rows if r["depth"] == 0) / 1000
+
+
+def heavy_imports(rows: List[Dict]) -> List[str]:
+    loaded = {r["module"].split(".")[0] for r in rows}
+    return [name for name in HEAVY_MODULES if name in loaded]
+
+
+def summarize(rows: List[Dict], top: int) -> Dict:
+    slowest = sorted(rows, key=lambda r: r["cumulative_us"], reverse=True)[:top]
+    return {
+        "total_ms": round(total_ms(rows), 1),
+        "modules": len(rows),
+        "heavy_imports": heavy_imports(rows),
+        "slowest": [
+            {
+                "module": r["module"],
+                "cumulative_ms": round(r["cumulative_us"] / 1000, 1),
+                "self_ms": round(r["self_us"] / 1000, 1),
+            }
+            for r in slowest
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--targets", nargs="+", choices=list(TARGETS), default=list(TARGETS)
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--output", type=Path, default=PROFILE_PATH)
+    args = parser.parse_args()
+
+    report = {}
+    for name in args.targets:
+        runs = [profile(TARGETS[name]) for _ in range(args.repeat)]
+        best = min(runs, key=total_ms)
+        report[name] = summarize(best, args.top)
+        heavy = report[name]["heavy_imports"]
+        print(
+            f"{name:<8} {report[name]['total_ms']:>8.1f} ms  "
+            f"{report[name]['modules']:>5} modules"
+            + (f"  HEAVY: {', '.join(heavy)}" if heavy else "")
+        )
+
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Profile written to {args.output}")
+
+    if any(entry["heavy_imports"] for entry in report.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Tests for the batched multi-article endpoint."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from elasticsearch.exceptions import ConnectionError as ESConnectionError
+from rest_framework.test import APIClient
+
+from apps.api import es_queries, fts_index
+from apps.api.article_batch_views import ARTICLE_BATCH_LIMIT
+from apps.api.article_packs import write_pack
+from apps.api.models import Law
+
+
+def _refs(*pairs):
+    return {"articles": [{"law_id": law, "article_id": art} for law, art in pairs]}
+
+
+@pytest.mark.django_db
+class TestArticleBatch:
+    def setup_method(self):
+        self.client = APIClient()
+        self.url = reverse("article-batch")
+        Law.objects.create(official_id="lft", name="Ley Federal del Trabajo")
+        Law.objects.create(official_id="lss", name="Ley del Seguro Social")
+
+    def post(self, body):
+        return self.client.post(self.url, body, format="json")
+
+    @patch("apps.api.article_batch_views.es_client")
+    def test_packs_answer_without_es(self, mock_es):
+        write_pack(
+            "lft",
+            [
+                {"article_id": "1", "text": "Uno"},
+                {"article_id": "2", "text": "Dos"},
+            ],
+        )
+
+        response = self.post(_refs(("lft", "2"), ("lft", "1"), ("lft", "99")))
+
+        data = response.json()
+        assert response.status_code == 200
+        assert [r["text"] for r in data["results"]] == ["Dos", "Uno", None]
+        assert data["results"][0]["law_name"] == "Ley Federal del Trabajo"
+        # A law's pack holds all of its articles: no ES fallback for misses
+        assert data["missing"] == [{"law_id": "lft", "article_id": "99"}]
+        mock_es.mget.assert_not_called()
+
+    @patch("apps.api.article_batch_views.es_client")
+    def test_one_mget_in_request_order(self, mock_es):
+        mock_es.mget.return_value = {
+            "docs": [
+                {"_id": "lss-5", "found": True, "_source": {"text": "Cinco"}},
+                {"_id": "lft-3", "found": False},
+            ]
+        }
+
+        response = self.post(_refs(("lss", "5"), ("lft", "3"), ("lss", "5")))
+
+        data = response.json()
+        assert [(r["law_id"], r["found"]) for r in data["results"]] == [
+            ("lss", True),
+            ("lft", False),
+            ("lss", True),
+        ]
+        assert data["missing"] == [{"law_id": "lft", "article_id": "3"}]
+        # Duplicates are fetched once
+        mock_es.mget.assert_called_once()
+        docs = mock_es.mget.call_args.kwargs["body"]["docs"]
+        assert [doc["_id"] for doc in docs] == ["lss-5", "lft-3"]
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {},
+            {"articles": []},
+            {"articles": [{"law_id": "lft"}]},
+            {"articles": ["lft-1"]},
+            _refs(*[("lft", str(i)) for i in range(ARTICLE_BATCH_LIMIT + 1)]),
+        ],
+    )
+    def test_rejects_malformed_bodies(self, body):
+        response = self.post(body)
+
+        assert response.status_code == 400
+        assert "error" in response.json()
+
+    @patch("apps.api.article_batch_views.es_client")
+    def test_es_down_reads_sqlite_index(self, mock_es):
+        mock_es.mget.side_effect = ESConnectionError("N/A", "refused", None)
+        fts_index.index_law(
+            SimpleNamespace(official_id="lss", status="vigente", law_type="ley"),
+            [{"law_id": "lss", "article": "5", "text": "Cinco"}],
+        )
+
+        response = self.post(_refs(("lss", "5"), ("lss", "6")))
+
+        data = response.json()
+        assert response.status_code == 200
+        assert [r["text"] for r in data["results"]] == ["Cinco", None]
+
+    @patch("apps.api.article_batch_views.es_client")
+    def test_es_down_without_index_is_503(self, mock_es):
+        mock_es.mget.side_effect = ESConnectionError("N/A", "refused", None)
+
+        response = self.post(_refs(("lss", "5")))
+
+        assert response.status_code == 503
+
+
+class TestArticlesMget:
+    def test_docs_are_routed_by_law(self):
+        request = es_queries.articles_mget([("lft", "Artículo 1"), ("lss", "2")])
+
+        docs = request["body"]["docs"]
+        assert docs[0]["_id"] == "lft-Artículo 1"
+        assert docs[0]["routing"] == "lft"
+        assert docs[1]["routing"] == "lss"
@@ -0,0 +1,133 @@
+"""Tests for per-law article packs and the API reads they serve."""
+
+import zlib
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.api.article_packs import (
+    CODEC_ZLIB,
+    ArticlePack,
+    InvalidPack,
+    build_pack,
+    get_pack,
+    write_pack,
+)
+from apps.api.cursors import encode_cursor
+from apps.api.models import Law
+
+ARTICLES = [
+    {"article_id": str(i), "text": f"Texto del artículo {i}. " * (i % 7 + 1)}
+    for i in range(1, 41)
+] + [
+    {"article_id": "Transitorio Primero", "text": "Entrará en vigor al día siguiente."}
+]
+
+
+class TestPackFormat:
+    def test_round_trip_in_document_order(self):
+        pack = ArticlePack(build_pack(ARTICLES, version_id=7))
+
+        assert len(pack) == 41
+        assert pack.version_id == 7
+        assert pack.articles() == ARTICLES
+        assert pack.articles(39, 100)[-1]["article_id"] == "Transitorio Primero"
+
+    def test_ranges_decompress_only_their_articles(self, monkeypatch):
+        pack = ArticlePack(build_pack(ARTICLES, codec=CODEC_ZLIB))
+        calls = []
+        monkeypatch.setattr(
+            pack, "_decompress", lambda b: calls.append(1) or zlib.decompress(b)
+        )
+
+        pack.articles(10, 13)
+
+        assert len(calls) == 3
+
+    def test_repeated_ids_keep_first_position_last_text(self):
+        pack = ArticlePack(
+            build_pack(
+                [
+                    {"article_id": "1", "text": "viejo"},
+                    {"article_id": "2", "text": "dos"},
+                    {"article_id": "1", "text": "nuevo"},
+                ]
+            )
+        )
+
+        assert pack.articles() == [
+            {"article_id": "1", "text": "nuevo"},
+            {"article_id": "2", "text": "dos"},
+        ]
+
+    def test_rejects_foreign_bytes(self):
+        with pytest.raises(InvalidPack):
+            ArticlePack(b"<akomaNtoso/>" * 4)
+
+    def test_local_packs_are_memory_mapped_and_reloaded(self):
+        write_pack("lft", ARTICLES[:2])
+        first = get_pack("lft")
+        assert get_pack("lft") is first
+        assert type(first._buffer).__name__ == "mmap"
+
+        write_pack("lft", ARTICLES[:3])
+
+        assert len(get_pack("lft")) == 3
+        assert len(first) == 2  # the old mapping stays readable
+
+    def test_missing_pack(self):
+        assert get_pack("nope") is None
+
+
+@pytest.mark.django_db
+class TestPackReads:
+    def setup_method(self):
+        self.client = APIClient()
+        Law.objects.create(official_id="lft", name="Ley Federal del Trabajo")
+
+    @patch("apps.api.law_views.es_client")
+    def test_law_articles_served_without_es(self, mock_es):
+        write_pack("lft", ARTICLES)
+
+        response = self.client.get(
+            reverse("law-articles", args=["lft"]), {"page": 2, "page_size": 10}
+        )
+
+        assert response.status_code == 200
+        ids = [a["article_id"] for a in response.json()["articles"]]
+        assert ids == [str(i) for i in range(11, 21)]
+        mock_es.search.assert_not_called()
+
+    @patch("apps.api.law_views.es_client")
+    def test_cursor_walk(self, mock_es):
+        write_pack("lft", ARTICLES)
+        url = reverse("law-articles", args=["lft"])
+        ids, cursor = [], ""
+        while cursor is not None:
+            data = self.client.get(url, {"cursor": cursor, "page_size": 15}).json()
+            ids.extend(a["article_id"] for a in data["articles"])
+            cursor = data["next_cursor"]
+
+        assert ids == [a["article_id"] for a in ARTICLES]
+
+    @patch("apps.api.law_views.es_client")
+    def test_unknown_cursor_article(self, mock_es):
+        write_pack("lft", ARTICLES)
+
+        response = self.client.get(
+            reverse("law-articles", args=["lft"]),
+            {"cursor": encode_cursor(["999"])},
+        )
+
+        assert response.status_code == 400
+
+    @patch("apps.api.export_views.es_client")
+    def test_exports_read_the_pack(self, mock_es):
+        from apps.api.export_views import _get_articles
+
+        write_pack("lft", ARTICLES)
+
+        assert _get_articles("lft", max_articles=5) == ARTICLES[:5]
+        mock_es.search.assert_not_called()
@@ -0,0 +1,206 @@
+"""Tests for the async search and law-read views (ASGI deployments)."""
+
+import json
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+from elasticsearch.exceptions import ConnectionError as ESConnectionError
+from rest_framework.test import APIClient
+
+from apps.api import async_views
+from apps.api.es_circuit import (
+    OPEN,
+    SearchUnavailable,
+    call_es_async,
+    es_circuit,
+    ping_es_async,
+)
+from apps.api.middleware.metrics import MetricsMiddleware
+from apps.api.models import Law, LawVersion, RelatedLaws
+
+ARTICLE_HITS = {
+    "hits": {
+        "total": {"value": 2},
+        "hits": [
+            {
+                "_id": "lft-10",
+                "_score": 2.0,
+                "_source": {"law_id": "lft", "article": "10", "text": "Diez"},
+                "highlight": {"text": ["<em>Diez</em>"]},
+                "sort": ["10"],
+            },
+            {
+                "_id": "lft-2",
+                "_score": 1.0,
+                "_source": {"law_id": "lft", "article": "2", "text": "Dos"},
+                "sort": ["2"],
+            },
+        ],
+    }
+}
+
+
+def _get(view, path, **kwargs):
+    request = RequestFactory().get(path)
+    response = async_to_sync(view)(request, **kwargs)
+    return response, json.loads(response.content)
+
+
+def _aes(search=ARTICLE_HITS):
+    aes = MagicMock()
+    aes.ping = AsyncMock(return_value=True)
+    aes.search = AsyncMock(return_value=search)
+    aes.close_point_in_time = AsyncMock()
+    return aes
+
+
+@pytest.mark.django_db
+class TestAsyncViews:
+    def setup_method(self):
+        self.law = Law.objects.create(
+            official_id="lft",
+            name="Ley Federal del Trabajo",
+            tier="federal",
+            category="laboral",
+            article_count=2,
+        )
+        LawVersion.objects.create(law=self.law, publication_date=date(2019, 5, 1))
+        LawVersion.objects.create(law=self.law, publication_date=date(2024, 1, 2))
+
+    def test_law_detail_matches_sync_view(self):
+        response, data = _get(async_views.law_detail, "/", law_id="lft")
+
+        sync = APIClient().get(reverse("law-detail", args=["lft"]))
+        assert response.status_code == 200
+        assert data == sync.json()
+        assert [v["publication_date"] for v in data["versions"]] == [
+            "2024-01-02",
+            "2019-05-01",
+        ]
+        assert response["Cache-Control"] == "public, max-age=3600"
+
+    def test_not_found_uses_drf_error_body(self):
+        response, data = _get(async_views.law_detail, "/", law_id="missing")
+
+        assert response.status_code == 404
+        assert "detail" in data
+
+    def test_law_search_queries_es_alongside_law_lookup(self):
+        aes = _aes()
+        with patch("apps.api.async_views.aes_client", aes):
+            response, data = _get(async_views.law_search, "/?q=diez", law_id="lft")
+
+        assert response.status_code == 200
+        assert data["total"] == 2
+        assert data["results"][0] == {
+            "article_id": "10",
+            "snippet": "<em>Diez</em>",
+            "score": 2.0,
+        }
+        aes.search.assert_awaited_once()
+
+    def test_law_search_unknown_law_is_404_even_if_es_answers(self):
+        with patch("apps.api.async_views.aes_client", _aes()):
+            response, _ = _get(async_views.law_search, "/?q=diez", law_id="missing")
+
+        assert response.status_code == 404
+
+    def test_law_search_es_down_is_503_without_fallback_index(self):
+        aes = _aes()
+        aes.search.side_effect = ESConnectionError("N/A", "refused", None)
+        with patch("apps.api.async_views.aes_client", aes):
+            response, data = _get(async_views.law_search, "/?q=diez", law_id="lft")
+
+        assert response.status_code == 503
+        assert "error" in data
+
+    def test_law_articles_from_es_in_natural_order(self):
+        with patch("apps.api.async_views.aes_client", _aes()):
+            response, data = _get(async_views.law_articles, "/", law_id="lft")
+
+        assert response.status_code == 200
+        assert [a["article_id"] for a in data["articles"]] == ["2", "10"]
+        assert data["law_name"] == "Ley Federal del Trabajo"
+
+    def test_search_returns_page_and_facets(self):
+        res = dict(ARTICLE_HITS, aggregations={"tier": {"buckets": []}})
+        aes = _aes(res)
+        with patch("apps.api.async_views.aes_client", aes):
+            response, data = _get(async_views.search, "/?q=trabajo")
+
+        assert response.status_code == 200
+        assert data["total"] == 2
+        assert data["results"][0]["id"] == "lft-10"
+        assert data["facets"] == {"tier": []}
+        assert response["Cache-Control"] == "public, max-age=300"
+
+    def test_search_throttle_returns_429(self):
+        with patch(
+            "apps.api.throttles.SearchRateThrottle.allow_request", return_value=False
+        ), patch("apps.api.throttles.SearchRateThrottle.wait", return_value=30):
+            response, data = _get(async_views.search, "/?q=trabajo")
+
+        assert response.status_code == 429
+        assert response["Retry-After"] == "30"
+        assert "throttled" in data["detail"]
+
+    def test_only_get_is_allowed(self):
+        request = RequestFactory().post("/")
+        response = async_to_sync(async_views.law_detail)(request, law_id="lft")
+
+        assert response.status_code == 405
+
+    def test_related_reads_stored_list_without_es(self):
+        stored = [{"law_id": "lss", "name": "LSS", "score": 3.0}]
+        RelatedLaws.objects.create(law_slug="lft", related=stored)
+        aes = _aes()
+        with patch("apps.api.async_views.aes_client", aes):
+            response, data = _get(async_views.related_laws, "/", law_id="lft")
+
+        assert data == {"law_id": "lft", "related": stored}
+        aes.ping.assert_not_called()
+
+    def test_related_falls_back_to_same_category_laws(self):
+        Law.objects.create(
+            official_id="lss",
+            name="Ley del Seguro Social",
+            tier="federal",
+            category="laboral",
+        )
+        aes = _aes()
+        aes.ping.return_value = False
+        with patch("apps.api.async_views.aes_client", aes):
+            _, data = _get(async_views.related_laws, "/", law_id="lft")
+
+        assert [r["law_id"] for r in data["related"]] == ["lss"]
+
+
+class TestAsyncCircuit:
+    def test_connection_failures_open_the_circuit(self):
+        failing = AsyncMock(side_effect=ESConnectionError("N/A", "refused", None))
+
+        for _ in range(es_circuit.failure_threshold):
+            with pytest.raises(SearchUnavailable):
+                async_to_sync(call_es_async)(failing)
+
+        assert es_circuit.state == OPEN
+        es = MagicMock(ping=AsyncMock(return_value=True))
+        assert async_to_sync(ping_es_async)(es) is False
+        es.ping.assert_not_called()
+
+
+class TestAsyncMiddleware:
+    def test_times_async_requests(self):
+        async def get_response(request):
+            return HttpResponse("ok")
+
+        middleware = MetricsMiddleware(get_response)
+        response = async_to_sync(middleware)(RequestFactory().get("/x"))
+
+        assert iscoroutinefunction(middleware)
+        assert "total;dur=" in response["Server-Timing"]
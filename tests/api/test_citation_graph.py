@@ -0,0 +1,184 @@
+"""Tests for the precomputed citation graph (CSR build, PageRank, consumers)."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.api.citation_graph import CSRGraph, pagerank, rebuild_citation_graph
+from apps.api.models import ArticleAuthority, CrossReference, Law
+
+
+def _ref(src_law, src_art, dst_law, dst_art=None):
+    return CrossReference(
+        source_law_slug=src_law,
+        source_article_id=src_art,
+        target_law_slug=dst_law,
+        target_article_num=dst_art,
+        reference_text="...",
+        confidence=0.9,
+        start_position=0,
+        end_position=3,
+    )
+
+
+class TestCSRGraph:
+    def test_parallel_edges_are_merged(self):
+        graph = CSRGraph([0, 0, 0, 2], [1, 1, 2, 0], 3)
+
+        assert graph.indptr.tolist() == [0, 2, 2, 3]
+        assert graph.indices.tolist() == [1, 2, 0]
+        assert graph.data.tolist() == [2.0, 1.0, 1.0]
+
+    def test_empty_graph(self):
+        graph = CSRGraph([], [], 2)
+
+        assert graph.indptr.tolist() == [0, 0, 0]
+        assert pagerank(graph).tolist() == [0.5, 0.5]
+
+
+class TestPageRank:
+    def test_cycle_is_uniform(self):
+        rank = pagerank(CSRGraph([0, 1, 2], [1, 2, 0], 3))
+
+        assert np.allclose(rank, 1 / 3)
+
+    def test_star_center_dominates(self):
+        # Every leaf cites node 0; node 0 cites nothing (dangling)
+        rank = pagerank(CSRGraph([1, 2, 3, 4], [0, 0, 0, 0], 5))
+
+        assert rank.sum() == pytest.approx(1.0)
+        assert rank[0] > 3 * rank[1]
+        assert np.allclose(rank[1:], rank[1])
+
+    def test_matches_dense_power_iteration(self):
+        rng = np.random.default_rng(7)
+        n = 30
+        src, dst = rng.integers(0, n, 200), rng.integers(0, n, 200)
+
+        rank = pagerank(CSRGraph(src, dst, n))
+
+        adjacency = np.zeros((n, n))
+        np.add.at(adjacency, (src, dst), 1.0)
+        out = adjacency.sum(axis=1)
+        transition = np.where(
+            out[:, None] > 0, adjacency / np.maximum(out, 1)[:, None], 1.0 / n
+        )
+        dense = np.full(n, 1.0 / n)
+        for _ in range(200):
+            dense = 0.15 / n + 0.85 * dense @ transition
+        assert np.allclose(rank, dense / dense.sum(), atol=1e-8)
+
+
+@pytest.mark.django_db
+class TestRebuild:
+    def setup_method(self):
+        for slug in ("cpeum", "amparo", "lft", "isolated"):
+            Law.objects.create(official_id=slug, name=slug.upper())
+        CrossReference.objects.bulk_create(
+            [
+                _ref("amparo", "1", "cpeum", "103"),
+                _ref("amparo", "2", "cpeum", "107"),
+                _ref("lft", "1", "cpeum", "123"),
+                _ref("lft", "5", "amparo"),
+                _ref("lft", "6", "lft", "5"),  # self-citation
+                _ref("lft", "7", None),  # unresolved target
+            ]
+        )
+
+    def test_scores_and_degrees_are_stored(self):
+        stats = rebuild_citation_graph()
+
+        assert stats["edges"] == 5
+        laws = {law.official_id: law for law in Law.objects.all()}
+        assert laws["cpeum"].citations_in == 3
+        assert laws["lft"].citations_out == 3
+        assert laws["cpeum"].authority_score > laws["amparo"].authority_score
+        assert laws["amparo"].authority_score > laws["lft"].authority_score
+        assert laws["isolated"].authority_score == 0.0
+
+        article = ArticleAuthority.objects.get(law_slug="cpeum", article_id="107")
+        assert article.citations_in == 1
+        assert ArticleAuthority.objects.filter(law_slug="lft", article_id="5").exists()
+
+    def test_top_laws_are_stored(self):
+        rebuild_citation_graph()
+
+        lft = Law.objects.get(official_id="lft")
+        assert lft.most_referenced_laws == [
+            {"slug": "amparo", "count": 1},
+            {"slug": "cpeum", "count": 1},
+            {"slug": "lft", "count": 1},
+        ]
+        cpeum = Law.objects.get(official_id="cpeum")
+        assert cpeum.most_citing_laws == [
+            {"slug": "amparo", "count": 2},
+            {"slug": "lft", "count": 1},
+        ]
+        assert Law.objects.get(official_id="isolated").most_citing_laws == []
+
+    def test_references_view_reads_the_stored_graph(self):
+        rebuild_citation_graph()
+        # Live rows are not aggregated per request
+        CrossReference.objects.all().delete()
+
+        response = APIClient().get(reverse("law-references", args=["cpeum"]))
+
+        stats = response.json()["statistics"]
+        assert stats["total_incoming"] == 3
+        assert stats["most_citing_laws"][0] == {"slug": "amparo", "count": 2}
+        assert stats["authority_score"] > 1.0
+
+    def test_rebuild_replaces_previous_scores(self):
+        rebuild_citation_graph()
+        CrossReference.objects.all().delete()
+
+        rebuild_citation_graph()
+
+        assert not ArticleAuthority.objects.exists()
+        cpeum = Law.objects.get(official_id="cpeum")
+        assert cpeum.authority_score == 0.0
+        assert cpeum.most_citing_laws == []
+
+
+@pytest.mark.django_db
+class TestConsumers:
+    def setup_method(self):
+        self.client = APIClient()
+
+    @patch("apps.api.law_views.es_client")
+    def test_related_fallback_prefers_authority(self, mock_es):
+        mock_es.ping.return_value = False
+        for slug, score in (("a", 0.5), ("b", 3.0), ("c", 1.0)):
+            Law.objects.create(
+                official_id=f"ley_{slug}",
+                name=f"Ley {slug}",
+                category="civil",
+                tier="federal",
+                authority_score=score,
+            )
+        Law.objects.create(
+            official_id="ley_x", name="Ley x", category="civil", tier="federal"
+        )
+
+        response = self.client.get(reverse("law-related", args=["ley_x"]))
+
+        ids = [r["law_id"] for r in response.json()["related"]]
+        assert ids == ["ley_b", "ley_c", "ley_a"]
+
+    @patch("apps.api.search_views.es_client")
+    def test_relevance_search_is_authority_boosted(self, mock_es):
+        mock_es.ping.return_value = True
+        mock_es.search.return_value = {"hits": {"total": {"value": 0}, "hits": []}}
+
+        self.client.get(reverse("search"), {"q": "amparo"})
+        body = mock_es.search.call_args.kwargs["body"]
+        assert body["query"]["function_score"]["field_value_factor"]["field"] == (
+            "authority"
+        )
+
+        self.client.get(reverse("search"), {"q": "amparo", "sort": "date_desc"})
+        body = mock_es.search.call_args.kwargs["body"]
+        assert "bool" in body["query"]
@@ -0,0 +1,188 @@
+"""Tests for ETag / Last-Modified conditional GET on law endpoints."""
+
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.api import async_views
+from apps.api.article_packs import write_pack
+from apps.api.citation_graph import rebuild_citation_graph
+from apps.api.conditional import export_state, law_validators
+from apps.api.models import CrossReference, Law, LawVersion
+
+
+class _NextDay(date):
+    @classmethod
+    def today(cls):
+        return date.today() + timedelta(days=1)
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    def setup_method(self):
+        self.client = APIClient()
+        self.law = Law.objects.create(
+            official_id="lft", name="Ley Federal del Trabajo", tier="federal"
+        )
+        LawVersion.objects.create(law=self.law, publication_date=date(2024, 1, 2))
+
+    def get(self, name, **headers):
+        return self.client.get(reverse(name, args=["lft"]), **headers)
+
+    def test_detail_sends_validators_and_304s_on_match(self):
+        first = self.get("law-detail")
+
+        assert first.status_code == 200
+        etag = first["ETag"]
+        assert etag.startswith('"') and not etag.startswith('W/"')
+        assert "Last-Modified" in first
+
+        again = self.get("law-detail", HTTP_IF_NONE_MATCH=etag)
+        assert again.status_code == 304
+        assert again["ETag"] == etag
+        assert again.content == b""
+
+        since = self.get("law-detail", HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+        assert since.status_code == 304
+
+    @patch("apps.api.law_views.es_client")
+    def test_articles_304_does_not_touch_es(self, mock_es):
+        write_pack("lft", [{"article_id": "1", "text": "Uno"}])
+        etag = self.get("law-articles")["ETag"]
+
+        response = self.get("law-articles", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        mock_es.search.assert_not_called()
+
+    def test_new_version_and_reindex_change_the_etag(self):
+        etag = self.get("law-detail")["ETag"]
+
+        LawVersion.objects.create(law=self.law, publication_date=date(2025, 3, 4))
+        after_version = self.get("law-detail", HTTP_IF_NONE_MATCH=etag)
+        assert after_version.status_code == 200
+        assert after_version["ETag"] != etag
+
+        Law.objects.filter(pk=self.law.pk).update(index_generation=7)
+        after_index = self.get("law-detail", HTTP_IF_NONE_MATCH=after_version["ETag"])
+        assert after_index.status_code == 200
+
+    def test_endpoints_have_distinct_etags(self):
+        write_pack("lft", [{"article_id": "1", "text": "Uno"}])
+
+        assert self.get("law-detail")["ETag"] != self.get("law-articles")["ETag"]
+
+    def _reference(self, source, target="lft", article=None):
+        return CrossReference.objects.create(
+            source_law_slug=source,
+            source_article_id="5",
+            target_law_slug=target,
+            target_article_num=article,
+            reference_text="Ley Federal del Trabajo",
+            confidence=0.9,
+            start_position=0,
+            end_position=10,
+        )
+
+    def test_graph_rebuild_changes_the_references_validators(self):
+        rebuild_citation_graph()
+        first = self.get("law-references")
+        self._reference("lss")
+        self._reference("lss", target="lss")
+
+        # Statistics only move when the graph is rebuilt
+        unchanged = self.get("law-references", HTTP_IF_NONE_MATCH=first["ETag"])
+        assert unchanged.status_code == 304
+
+        later = timezone.now() + timedelta(hours=1)
+        with patch("apps.api.citation_graph.timezone.now", return_value=later):
+            rebuild_citation_graph()
+
+        by_etag = self.get("law-references", HTTP_IF_NONE_MATCH=first["ETag"])
+        assert by_etag.status_code == 200
+        assert by_etag.json()["statistics"]["total_incoming"] == 1
+        assert by_etag.json()["statistics"]["authority_score"] > 0
+        by_date = self.get(
+            "law-references", HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]
+        )
+        assert by_date.status_code == 200
+
+    def test_deleted_references_change_the_article_etag(self):
+        older = self._reference("lss", article="5")
+        self._reference("lisr", article="5")
+        url = reverse("article-references", args=["lft", "5"])
+        etag = self.client.get(url)["ETag"]
+
+        # A re-ingest of lss that finds no references: delete, no insert
+        older.delete()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.json()["total_incoming"] == 1
+
+    @patch(
+        "apps.api.export_views._get_articles",
+        return_value=[{"article_id": "Artículo 1", "text": "Uno"}],
+    )
+    def test_export_etag_changes_daily(self, _):
+        etag = self.get("law-export-txt")["ETag"]
+
+        assert self.get("law-export-txt", HTTP_IF_NONE_MATCH=etag).status_code == 304
+        with patch("apps.api.conditional.date", _NextDay):
+            response = self.get("law-export-txt", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize("tier", ["anon", "free"])
+    def test_export_validators_do_not_skip_the_tier_check(self, tier):
+        etag, last_modified = law_validators("lft", "export-epub", export_state)
+
+        with patch(
+            "apps.api.export_views._get_user_tier", return_value=(tier, "u1")
+        ), patch("apps.api.export_views.log_export") as log:
+            by_etag = self.get("law-export-epub", HTTP_IF_NONE_MATCH=etag)
+            by_date = self.get(
+                "law-export-epub",
+                HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2999 00:00:00 GMT",
+            )
+
+        assert by_etag.status_code == 403
+        assert by_date.status_code == 403
+        assert "ETag" not in by_etag
+        log.assert_not_called()
+
+    @patch(
+        "apps.api.export_views._get_articles",
+        return_value=[{"article_id": "Artículo 1", "text": "Uno"}],
+    )
+    def test_premium_exports_are_private(self, _):
+        with patch(
+            "apps.api.export_views._get_user_tier", return_value=("premium", "u1")
+        ):
+            response = self.get("law-export-json")
+
+        assert response.status_code == 200
+        assert response["Cache-Control"].startswith("private")
+        assert self.get("law-export-txt")["Cache-Control"].startswith("public")
+
+    def test_errors_carry_no_validators(self):
+        response = self.client.get(reverse("law-detail", args=["missing"]))
+
+        assert response.status_code == 404
+        assert "ETag" not in response
+
+    def test_async_detail(self):
+        first = async_to_sync(async_views.law_detail)(
+            RequestFactory().get("/"), law_id="lft"
+        )
+        request = RequestFactory().get("/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        response = async_to_sync(async_views.law_detail)(request, law_id="lft")
+
+        assert first["ETag"] == self.get("law-detail")["ETag"]
+        assert response.status_code == 304
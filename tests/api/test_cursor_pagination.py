@@ -0,0 +1,157 @@
+"""Tests for search_after cursor pagination on /search/ and law articles."""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.api.cursors import InvalidCursor, decode_cursor, encode_cursor
+from apps.api.models import Law, LawVersion
+
+
+def _hit(doc_id, article, sort):
+    return {
+        "_id": doc_id,
+        "_score": 1.0,
+        "sort": sort,
+        "_source": {
+            "law_id": "ley_test",
+            "law_name": "Ley de Prueba",
+            "article": article,
+            "text": f"Texto del artículo {article}",
+        },
+    }
+
+
+class TestCursorCodec:
+    def test_round_trip(self):
+        cursor = encode_cursor([1.5, "ley_test-10"], "pit-abc")
+        assert decode_cursor(cursor) == ([1.5, "ley_test-10"], "pit-abc")
+
+    def test_round_trip_without_pit(self):
+        assert decode_cursor(encode_cursor(["10"])) == (["10"], None)
+
+    def test_malformed_cursor_raises(self):
+        with pytest.raises(InvalidCursor):
+            decode_cursor("not-a-cursor!!")
+
+    def test_non_cursor_json_raises(self):
+        # valid base64 JSON that is not a cursor payload
+        with pytest.raises(InvalidCursor):
+            decode_cursor("WzFd")  # "[1]"
+
+
+@pytest.mark.django_db
+class TestSearchCursorPagination:
+    def setup_method(self):
+        self.client = APIClient()
+
+    @patch("apps.api.search_views.es_client")
+    def test_first_cursor_page_opens_pit(self, mock_es):
+        mock_es.ping.return_value = True
+        mock_es.open_point_in_time.return_value = {"id": "pit-1"}
+        mock_es.search.return_value = {
+            "pit_id": "pit-2",
+            "hits": {
+                "total": {"value": 50},
+                "hits": [_hit("a", "1", [3.0, 7]), _hit("b", "2", [2.0, 9])],
+            },
+            "aggregations": {
+                "by_tier": {"buckets": [{"key": "federal", "doc_count": 50}]}
+            },
+        }
+
+        response = self.client.get(
+            reverse("search"), {"q": "ley", "cursor": "", "page_size": 2}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["results"]) == 2
+        assert data["facets"]["by_tier"][0]["count"] == 50
+        assert decode_cursor(data["next_cursor"]) == ([2.0, 9], "pit-2")
+
+        body = mock_es.search.call_args.kwargs["body"]
+        assert body["pit"]["id"] == "pit-1"
+        assert "from" not in body
+        assert "search_after" not in body
+        assert "index" not in mock_es.search.call_args.kwargs
+
+    @patch("apps.api.search_views.es_client")
+    def test_next_page_uses_search_after_without_aggs(self, mock_es):
+        mock_es.ping.return_value = True
+        mock_es.search.return_value = {
+            "pit_id": "pit-2",
+            "hits": {"total": {"value": 3}, "hits": [_hit("c", "3", [1.0, 11])]},
+        }
+
+        cursor = encode_cursor([2.0, 9], "pit-2")
+        response = self.client.get(
+            reverse("search"), {"q": "ley", "cursor": cursor, "page_size": 2}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["next_cursor"] is None
+        assert "facets" not in data
+
+        body = mock_es.search.call_args.kwargs["body"]
+        assert body["search_after"] == [2.0, 9]
+        assert "aggs" not in body
+        mock_es.open_point_in_time.assert_not_called()
+        mock_es.close_point_in_time.assert_called_once_with(body={"id": "pit-2"})
+
+    @patch("apps.api.search_views.es_client")
+    def test_invalid_cursor_is_bad_request(self, mock_es):
+        mock_es.ping.return_value = True
+        response = self.client.get(reverse("search"), {"q": "ley", "cursor": "%%%"})
+        assert response.status_code == 400
+
+    @patch("apps.api.search_views.es_client")
+    def test_offset_beyond_window_is_rejected(self, mock_es):
+        mock_es.ping.return_value = True
+        response = self.client.get(
+            reverse("search"), {"q": "ley", "page": 200, "page_size": 100}
+        )
+        assert response.status_code == 400
+        assert "cursor" in response.json()["error"]
+        mock_es.search.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestLawArticlesCursorPagination:
+    def setup_method(self):
+        self.client = APIClient()
+        self.law = Law.objects.create(
+            official_id="ley_test", name="Ley de Prueba", tier="federal"
+        )
+        LawVersion.objects.create(law=self.law, publication_date=date(2024, 1, 1))
+
+    @patch("apps.api.law_views.es_client")
+    def test_cursor_pages(self, mock_es):
+        mock_es.search.return_value = {
+            "hits": {"hits": [_hit("a", "1", ["1"]), _hit("b", "2", ["2"])]}
+        }
+        url = reverse("law-articles", args=["ley_test"])
+
+        response = self.client.get(url, {"cursor": "", "page_size": 2})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [a["article_id"] for a in data["articles"]] == ["1", "2"]
+        assert decode_cursor(data["next_cursor"]) == (["2"], None)
+
+        response = self.client.get(url, {"cursor": data["next_cursor"], "page_size": 2})
+        body = mock_es.search.call_args.kwargs["body"]
+        assert body["search_after"] == ["2"]
+        assert "from" not in body
+
+    @patch("apps.api.law_views.es_client")
+    def test_page_mode_has_no_cursor(self, mock_es):
+        mock_es.search.return_value = {"hits": {"hits": [_hit("a", "1", ["1"])]}}
+        response = self.client.get(reverse("law-articles", args=["ley_test"]))
+        assert response.status_code == 200
+        assert "next_cursor" not in response.json()
+        assert mock_es.search.call_args.kwargs["body"]["from"] == 0
@@ -0,0 +1,118 @@
+"""Tests for the Elasticsearch request builders."""
+
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.api import es_queries
+from apps.api.models import Law
+
+LAW_FILTER = {"term": {"law_id": "lft"}}
+
+
+class TestBuilders:
+    @pytest.mark.parametrize(
+        "request_kwargs",
+        [
+            es_queries.law_articles("lft", 10),
+            es_queries.law_seed_texts("lft"),
+            es_queries.law_hierarchy("lft"),
+            es_queries.law_text_search("lft", "salario"),
+        ],
+    )
+    def test_law_scope_is_an_unscored_term_filter(self, request_kwargs):
+        query = request_kwargs["body"]["query"]["bool"]
+
+        assert query["filter"] == [LAW_FILTER]
+        assert "match_phrase" not in str(request_kwargs)
+
+    def test_single_law_requests_are_routed(self, monkeypatch):
+        assert es_queries.law_articles("lft", 10)["routing"] == "lft"
+        assert es_queries.law_text_search("lft", "salario")["routing"] == "lft"
+        assert "routing" not in es_queries.search("salario", {})
+        assert "routing" not in es_queries.related_laws("lft", "salario")
+
+        monkeypatch.setattr(es_queries, "ES_ROUTE_BY_LAW", False)
+        assert "routing" not in es_queries.law_hierarchy("lft")
+
+    def test_aggregation_only_requests_are_cached(self):
+        related = es_queries.related_laws("lft", "salario")
+
+        assert related["request_cache"] is True
+        assert related["body"]["size"] == 0
+
+    def test_source_is_limited(self):
+        assert es_queries.law_hierarchy("lft")["body"]["_source"] == ["hierarchy"]
+        assert es_queries.law_articles("lft", 10)["body"]["_source"] == [
+            "article",
+            "text",
+        ]
+        body = es_queries.search("salario", {})["body"]
+        assert "tags" not in body["_source"]
+        assert "authority" not in body["_source"]
+
+    def test_search_filters(self):
+        clauses = es_queries.search_filters(
+            {
+                "jurisdiction": "federal,state",
+                "category": "ley",
+                "status": "all",
+                "state": "Colima",
+                "date_range": "older",
+            }
+        )
+
+        assert {"term": {"category": "ley"}} in clauses
+        assert {"terms": {"tier": ["federal", "state"]}} in clauses
+        assert {"prefix": {"law_id": "colima_"}} in clauses
+        assert (
+            "lt"
+            in next(c for c in clauses if "range" in c)["range"]["publication_date"]
+        )
+        assert not any("status" in c.get("term", {}) for c in clauses)
+
+    def test_search_pagination(self):
+        offset = es_queries.search("salario", {}, "date_desc", 10, offset=20)
+        first = es_queries.search("salario", {}, pit_id="pit-1")
+        later = es_queries.search("salario", {}, search_after=[1.0, 3], pit_id="p")
+
+        assert offset["index"] == "articles"
+        assert offset["body"]["from"] == 20
+        assert offset["body"]["sort"] == [{"publication_date": {"order": "desc"}}]
+        assert "index" not in first
+        assert first["body"]["sort"] == [{"_score": {"order": "desc"}}]
+        assert "aggs" in first["body"]
+        assert "aggs" not in later["body"]
+        assert later["body"]["search_after"] == [1.0, 3]
+
+
+@pytest.mark.django_db
+class TestViewsUseBuilders:
+    def setup_method(self):
+        self.client = APIClient()
+        Law.objects.create(official_id="lft", name="Ley Federal del Trabajo")
+
+    @patch("apps.api.law_views.es_client")
+    def test_law_articles(self, mock_es):
+        mock_es.search.return_value = {"hits": {"hits": []}}
+
+        self.client.get(reverse("law-articles", args=["lft"]))
+
+        body = mock_es.search.call_args.kwargs["body"]
+        assert body["query"]["bool"]["filter"] == [LAW_FILTER]
+
+    @patch("apps.api.export_views.es_client")
+    def test_export_reads_the_article_field(self, mock_es):
+        from apps.api.export_views import _get_articles
+
+        mock_es.ping.return_value = True
+        mock_es.search.return_value = {
+            "hits": {"hits": [{"_source": {"article": "1", "text": "Uno"}}]}
+        }
+
+        assert _get_articles("lft") == [{"article_id": "1", "text": "Uno"}]
+        assert mock_es.search.call_args.kwargs["body"]["sort"] == [
+            {"article": {"order": "asc"}}
+        ]
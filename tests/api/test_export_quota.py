@@ -0,0 +1,256 @@
+"""Tests for sliding-window export quotas and batched ExportLog writes."""
+
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from unittest.mock import patch
+
+import pytest
+import redis
+from django.db import DatabaseError
+
+from apps.api import export_throttles
+from apps.api.export_throttles import (
+    WINDOW_SECONDS,
+    check_export_quota,
+    flush_pending_export_logs,
+    get_export_count,
+    log_export,
+)
+from apps.api.models import ExportLog
+
+# Ten minutes into an hour window
+T0 = 1_000 * WINDOW_SECONDS + 600
+
+
+class FakeRedis:
+    """Just enough of redis.Redis for the quota store and log queue."""
+
+    def __init__(self):
+        self.data = {}
+        self.lists = {}
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def incr(self, key):
+        self.data[key] = self.data.get(key, 0) + 1
+        return self.data[key]
+
+    def expire(self, key, ttl):
+        return True
+
+    def mget(self, keys):
+        return [str(self.data[k]).encode() if k in self.data else None for k in keys]
+
+    def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(value.encode())
+
+    def lrange(self, key, start, end):
+        return self.lists.get(key, [])[start : end + 1]
+
+    def ltrim(self, key, start, end):
+        self.lists[key] = self.lists.get(key, [])[start:]
+
+    def lock(self, key, timeout):
+        return FakeLock(self, key)
+
+
+class FakeLock:
+    def __init__(self, client, key):
+        self.client, self.key = client, key
+        self.token = object()
+
+    def acquire(self, blocking):
+        if self.key in self.client.data:
+            return False
+        self.client.data[self.key] = self.token
+        return True
+
+    def reacquire(self):
+        if self.client.data.get(self.key) is not self.token:
+            raise redis.exceptions.LockNotOwnedError("expired")
+
+    def release(self):
+        self.reacquire()
+        del self.client.data[self.key]
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def incr(self, key):
+        self.calls.append(("incr", key))
+
+    def expire(self, key, ttl):
+        self.calls.append(("expire", key, ttl))
+
+    def rpush(self, key, value):
+        self.calls.append(("rpush", key, value))
+
+    def execute(self):
+        return [getattr(self.client, c[0])(*c[1:]) for c in self.calls]
+
+
+class DownRedis(FakeRedis):
+    def pipeline(self):
+        raise redis.ConnectionError("down")
+
+    def mget(self, keys):
+        raise redis.ConnectionError("down")
+
+    def rpush(self, key, value):
+        raise redis.ConnectionError("down")
+
+
+@pytest.fixture
+def fake_redis():
+    fake = FakeRedis()
+    with patch("apps.api.export_throttles._get_redis", return_value=fake):
+        yield fake
+
+
+def _log(n, ip="10.0.0.1", user_id=""):
+    for _ in range(n):
+        log_export(user_id, ip, "lft", "txt", "anon")
+
+
+@pytest.mark.django_db
+class TestLoggedQuota:
+    """Without Redis, quotas are counted from ExportLog rows."""
+
+    def test_blocks_at_limit(self):
+        _log(9)
+        assert check_export_quota("anon", "", "10.0.0.1") == (True, 0)
+
+        _log(1)
+        allowed, retry_after = check_export_quota("anon", "", "10.0.0.1")
+
+        assert not allowed
+        assert WINDOW_SECONDS - 5 <= retry_after <= WINDOW_SECONDS
+
+    def test_identities_are_independent(self):
+        _log(10, ip="10.0.0.1")
+        _log(10, ip="10.0.0.2", user_id="user-1")
+
+        assert check_export_quota("anon", "", "10.0.0.3")[0]
+        assert check_export_quota("free", "user-1", "10.0.0.9")[0]
+        assert get_export_count(user_id="user-1") == 10
+        assert get_export_count(ip_address="10.0.0.2") == 0
+
+    def test_log_writes_audit_row_synchronously(self):
+        _log(2)
+
+        assert ExportLog.objects.filter(ip_address="10.0.0.1").count() == 2
+
+
+class TestRetryAfter:
+    def test_previous_window_decay_frees_a_slot(self):
+        # prev=10, curr=5, limit=10 at the start of the window: weighted 15,
+        # drops below 10 once half of the previous window has aged out
+        wait = export_throttles._seconds_until_below(10, 5, 0, 10)
+        assert wait == pytest.approx(WINDOW_SECONDS / 2)
+
+    def test_current_window_over_limit_waits_for_next(self):
+        wait = export_throttles._seconds_until_below(0, 20, 600, 10)
+        assert wait == pytest.approx(WINDOW_SECONDS - 600 + WINDOW_SECONDS / 2)
+
+
+@pytest.mark.django_db
+class TestRedisQuota:
+    @patch("apps.api.export_throttles._now", return_value=T0)
+    def test_counters_and_audit_queue_use_redis(self, _, fake_redis):
+        _log(10)
+
+        assert not check_export_quota("anon", "", "10.0.0.1")[0]
+        assert ExportLog.objects.count() == 0
+        assert len(fake_redis.lists[export_throttles.PENDING_LOG_KEY]) == 10
+
+        assert flush_pending_export_logs() == 10
+        assert ExportLog.objects.count() == 10
+        assert flush_pending_export_logs() == 0
+
+    @patch("apps.api.export_throttles._now", return_value=T0)
+    def test_retry_after_from_window(self, _, fake_redis):
+        _log(10)
+
+        allowed, retry_after = check_export_quota("anon", "", "10.0.0.1")
+
+        assert not allowed
+        # All hits are in the current window; they start aging out (and free
+        # a slot) as soon as the next window begins
+        assert retry_after == WINDOW_SECONDS - 600
+
+    def test_previous_window_decays(self, fake_redis):
+        with patch("apps.api.export_throttles._now", return_value=T0):
+            _log(10)
+
+        # Halfway through the next window, half of the previous count remains
+        half = (T0 // WINDOW_SECONDS + 1) * WINDOW_SECONDS + WINDOW_SECONDS / 2
+        with patch("apps.api.export_throttles._now", return_value=half):
+            assert get_export_count(ip_address="10.0.0.1") == 5
+            assert check_export_quota("anon", "", "10.0.0.1") == (True, 0)
+
+    def test_check_does_not_query_db(self, fake_redis, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            check_export_quota("anon", "", "10.0.0.1")
+
+    def test_flush_keeps_request_time(self, fake_redis):
+        requested_at = datetime(2026, 1, 5, 12, 0, tzinfo=dt_timezone.utc)
+        with patch("django.utils.timezone.now", return_value=requested_at):
+            _log(1)
+        flush_pending_export_logs()
+
+        assert ExportLog.objects.get().created_at == requested_at
+
+    def test_failed_flush_keeps_rows_queued(self, fake_redis):
+        _log(3)
+
+        with patch(
+            "apps.api.models.ExportLog.objects.bulk_create",
+            side_effect=DatabaseError("down"),
+        ):
+            with pytest.raises(DatabaseError):
+                flush_pending_export_logs()
+
+        assert len(fake_redis.lists[export_throttles.PENDING_LOG_KEY]) == 3
+        assert flush_pending_export_logs() == 3
+
+    def test_malformed_rows_are_dropped(self, fake_redis):
+        _log(1)
+        fake_redis.rpush(export_throttles.PENDING_LOG_KEY, "{not json")
+
+        assert flush_pending_export_logs() == 1
+        assert fake_redis.lists[export_throttles.PENDING_LOG_KEY] == []
+
+    def test_overlapping_flush_is_skipped(self, fake_redis):
+        _log(1)
+        fake_redis.data[export_throttles.FLUSH_LOCK_KEY] = 1
+
+        assert flush_pending_export_logs() == 0
+        assert ExportLog.objects.count() == 0
+
+    def test_flush_that_outlives_its_lock_stops(self, fake_redis, monkeypatch):
+        monkeypatch.setattr(export_throttles, "FLUSH_BATCH_SIZE", 1)
+        _log(3)
+        ltrim = fake_redis.ltrim
+
+        def ltrim_then_expire(key, start, end):
+            ltrim(key, start, end)
+            # The lock timed out during the batch and another run took it
+            fake_redis.data[export_throttles.FLUSH_LOCK_KEY] = "other"
+
+        fake_redis.ltrim = ltrim_then_expire
+
+        assert flush_pending_export_logs() == 1
+        assert len(fake_redis.lists[export_throttles.PENDING_LOG_KEY]) == 2
+        assert fake_redis.data[export_throttles.FLUSH_LOCK_KEY] == "other"
+
+    def test_counts_export_logs_when_redis_down(self):
+        with patch("apps.api.export_throttles._get_redis", return_value=DownRedis()):
+            _log(10)
+
+            assert not check_export_quota("anon", "", "10.0.0.1")[0]
+
+        assert ExportLog.objects.count() == 10
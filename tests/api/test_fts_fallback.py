@@ -0,0 +1,290 @@
+"""Tests for the SQLite FTS5 fallback index and the ES circuit breaker."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from elasticsearch.exceptions import ConnectionError as ESConnectionError
+from rest_framework.test import APIClient
+
+from apps.api import fts_index
+from apps.api.cursors import encode_cursor
+from apps.api.es_circuit import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    SearchUnavailable,
+    call_es,
+    es_circuit,
+)
+from apps.api.models import Law
+
+
+def _law(official_id, **fields):
+    fields.setdefault("status", "vigente")
+    fields.setdefault("law_type", "legislative")
+    return SimpleNamespace(official_id=official_id, **fields)
+
+
+def _source(law_id, article, text, tier="federal", **fields):
+    source = {
+        "law_id": law_id,
+        "law_name": f"Ley {law_id}",
+        "article": article,
+        "text": text,
+        "category": "laboral",
+        "tier": tier,
+        "state": "",
+        "municipality": "",
+        "book": None,
+        "title": None,
+        "chapter": None,
+        "hierarchy": [],
+        "publication_date": "2020-01-01",
+        "tags": [tier, "laboral"],
+        "authority": 0.0,
+    }
+    source.update(fields)
+    return source
+
+
+LFT = [
+    _source("lft", "1", "Los trabajadores tienen derecho al salario mínimo."),
+    _source("lft", "2", "El patrón pagará la jornada extraordinaria."),
+    _source("lft", "3", "Código de conducta del trabajador."),
+]
+COLIMA = [
+    _source(
+        "colima_ley_trabajo",
+        "1",
+        "El salario se pagará en moneda de curso legal.",
+        tier="state",
+        state="Colima",
+    ),
+]
+
+
+@pytest.fixture
+def index():
+    fts_index.index_law(_law("lft"), LFT)
+    fts_index.index_law(_law("colima_ley_trabajo"), COLIMA)
+
+
+class TestFtsIndex:
+    def test_match_expression(self):
+        assert fts_index.match_expression("Los Trabajadores y el salario") == (
+            '"trabajador"* OR "salario"*'
+        )
+        assert fts_index.match_expression("de la") == '"de" OR "la"'
+        assert fts_index.match_expression("¿?") is None
+
+    def test_accents_and_plurals_fold(self, index):
+        res = fts_index.search("codigo trabajadores")
+
+        assert {h["article"] for h in res["hits"]} == {"1", "3"}
+        assert "<em>Código</em>" in next(
+            h["snippet"] for h in res["hits"] if h["article"] == "3"
+        )
+
+    def test_filters(self, index):
+        state = fts_index.search("salario", {"jurisdiction": "state"})
+        by_prefix = fts_index.search("salario", {"state": "Colima"})
+        federal = fts_index.search("salario", {"jurisdiction": "federal"})
+
+        assert [h["law_id"] for h in state["hits"]] == ["colima_ley_trabajo"]
+        assert [h["law_id"] for h in by_prefix["hits"]] == ["colima_ley_trabajo"]
+        assert [h["law_id"] for h in federal["hits"]] == ["lft"]
+        assert state["facets"]["by_state"] == [{"key": "Colima", "count": 1}]
+
+    def test_cursor_walk_matches_offset_pages(self, index):
+        offset_ids = [
+            h["id"] for h in fts_index.search("salario pagar", size=10)["hits"]
+        ]
+        walked, after = [], None
+        while True:
+            res = fts_index.search("salario pagar", size=1, after=after)
+            # Facets come with the first page only
+            assert bool(res["facets"]) is (after is None)
+            if not res["hits"]:
+                break
+            walked.extend(h["id"] for h in res["hits"])
+            after = res["hits"][-1]["sort"]
+
+        assert walked == offset_ids
+        assert len(walked) == 3
+
+    def test_reindexing_a_law_replaces_its_rows(self, index):
+        fts_index.index_law(
+            _law("lft"),
+            [
+                _source("lft", "1", "viejo"),
+                _source("lft", "2", "dos"),
+                _source("lft", "1", "nuevo"),
+            ],
+        )
+
+        assert fts_index.law_articles("lft") == [
+            {"article_id": "1", "text": "nuevo"},
+            {"article_id": "2", "text": "dos"},
+        ]
+        assert fts_index.search("salario", {"jurisdiction": "federal"})["total"] == 0
+
+    def test_law_articles_after(self, index):
+        assert fts_index.law_articles("lft", limit=1, after="1") == [
+            {"article_id": "2", "text": LFT[1]["text"]}
+        ]
+
+    def test_missing_index(self):
+        assert not fts_index.available()
+        assert fts_index.search("salario")["total"] == 0
+        assert fts_index.law_articles("lft") == []
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_probes_after_cool_down(self):
+        now = [0.0]
+        breaker = CircuitBreaker(2, 30, clock=lambda: now[0])
+
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+
+        now[0] = 31
+        assert breaker.allow()
+        assert breaker.state == HALF_OPEN
+        assert not breaker.allow()  # one probe at a time
+
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        now[0] = 62
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CLOSED
+
+    def test_query_errors_do_not_trip_the_circuit(self):
+        def bad_request():
+            raise ValueError("bad query")
+
+        for _ in range(5):
+            with pytest.raises(ValueError):
+                call_es(bad_request)
+
+        assert es_circuit.state == CLOSED
+
+    def test_connection_errors_open_the_circuit(self):
+        def down():
+            raise ESConnectionError("N/A", "refused", None)
+
+        for _ in range(es_circuit.failure_threshold):
+            with pytest.raises(SearchUnavailable):
+                call_es(down)
+
+        assert es_circuit.state == OPEN
+        with pytest.raises(SearchUnavailable):
+            call_es(lambda: pytest.fail("ES called with the circuit open"))
+
+
+@pytest.mark.django_db
+class TestSearchFallback:
+    def setup_method(self):
+        self.client = APIClient()
+        Law.objects.create(official_id="lft", name="Ley Federal del Trabajo")
+
+    @patch("apps.api.search_views.es_client")
+    def test_search_falls_back_when_es_is_down(self, mock_es, index):
+        mock_es.ping.return_value = True
+        mock_es.search.side_effect = ESConnectionError("N/A", "refused", None)
+
+        response = self.client.get(reverse("search"), {"q": "salario"})
+
+        assert response.status_code == 200
+        assert response["X-Search-Engine"] == "sqlite"
+        assert response["Cache-Control"] == "no-store"
+        data = response.json()
+        assert data["total"] == 2
+        assert data["results"][0]["article"] == "Art. 1"
+        assert data["facets"]["by_tier"]
+
+    @patch("apps.api.search_views.es_client")
+    def test_open_circuit_skips_es(self, mock_es, index):
+        mock_es.ping.return_value = False
+        for _ in range(es_circuit.failure_threshold):
+            self.client.get(reverse("search"), {"q": "salario"})
+        mock_es.reset_mock()
+
+        response = self.client.get(reverse("search"), {"q": "salario"})
+
+        assert response.status_code == 200
+        mock_es.ping.assert_not_called()
+        mock_es.search.assert_not_called()
+
+    @patch("apps.api.search_views.es_client")
+    def test_search_without_index_is_unavailable(self, mock_es):
+        mock_es.ping.return_value = False
+
+        response = self.client.get(reverse("search"), {"q": "salario"})
+
+        assert response.status_code == 503
+
+    @patch("apps.api.search_views.es_client")
+    def test_sqlite_cursor_walk(self, mock_es, index, monkeypatch):
+        monkeypatch.setattr(fts_index, "SEARCH_BACKEND", "sqlite")
+        ids, cursor = [], ""
+        while cursor is not None:
+            data = self.client.get(
+                reverse("search"),
+                {"q": "salario pagar", "cursor": cursor, "page_size": 2},
+            ).json()
+            ids.extend(r["id"] for r in data["results"])
+            cursor = data["next_cursor"]
+
+        assert len(ids) == 3
+        mock_es.ping.assert_not_called()
+
+    @patch("apps.api.search_views.es_client")
+    def test_es_cursor_is_rejected_by_sqlite(self, mock_es, index, monkeypatch):
+        monkeypatch.setattr(fts_index, "SEARCH_BACKEND", "sqlite")
+
+        response = self.client.get(
+            reverse("search"), {"q": "salario", "cursor": encode_cursor([1.0], "pit")}
+        )
+
+        assert response.status_code == 400
+
+    @patch("apps.api.law_views.es_client")
+    def test_law_search_fallback(self, mock_es, index):
+        mock_es.search.side_effect = ESConnectionError("N/A", "refused", None)
+
+        response = self.client.get(reverse("law-search", args=["lft"]), {"q": "patron"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["results"][0]["article_id"] == "2"
+        assert "<em>patrón</em>" in data["results"][0]["snippet"]
+
+    @patch("apps.api.law_views.es_client")
+    def test_law_articles_fallback(self, mock_es, index):
+        mock_es.search.side_effect = ESConnectionError("N/A", "refused", None)
+        url = reverse("law-articles", args=["lft"])
+
+        first = self.client.get(url, {"cursor": "", "page_size": 2}).json()
+        second = self.client.get(
+            url, {"cursor": first["next_cursor"], "page_size": 2}
+        ).json()
+
+        assert [a["article_id"] for a in first["articles"]] == ["1", "2"]
+        assert [a["article_id"] for a in second["articles"]] == ["3"]
+        assert second["next_cursor"] is None
+
+    @patch("apps.api.export_views.es_client")
+    def test_exports_read_the_index_when_es_is_down(self, mock_es, index):
+        from apps.api.export_views import _get_articles
+
+        mock_es.ping.return_value = False
+
+        assert [a["article_id"] for a in _get_articles("lft")] == ["1", "2", "3"]
@@ -9,6 +9,7 @@ import pytest
 from django.urls import reverse
 from rest_framework.test import APIClient
 
+from apps.api.citation_graph import rebuild_citation_graph
 from apps.api.models import CrossReference, Law, LawVersion
 
 
@@ -50,6 +51,16 @@ class TestLawApi:
             == "http://dof.gob.mx/nota_detalle.php?codigo=123"
         )
 
+    @patch("apps.api.law_views.es_client")
+    def test_law_detail_reads_stored_article_count(self, mock_es):
+        Law.objects.filter(pk=self.law_federal.pk).update(article_count=137)
+
+        response = self.client.get(reverse("law-detail", args=[self.fed_id]))
+
+        assert response.data["articles"] == 137
+        mock_es.ping.assert_not_called()
+        mock_es.search.assert_not_called()
+
     def test_law_detail_not_found(self):
         """Test 404 for non-existent law."""
         url = reverse("law-detail", args=["nonexistent"])
@@ -391,9 +402,8 @@ class TestLawApi:
         assert incoming[0]["sourceArticle"] == "103"
         assert incoming[0]["confidence"] == 0.90
 
-    @patch("apps.api.law_views.es_client")
     @patch("apps.api.law_views.REGISTRY_PATH")
-    def test_stats_coverage_field(self, mock_registry_path, mock_es):
+    def test_stats_coverage_field(self, mock_registry_path):
         """Test that /stats/ returns the coverage breakdown from universe registry."""
         # Create a temp registry file
         registry = {
@@ -431,9 +441,6 @@ class TestLawApi:
             lv._registry_cache["data"] = None
             lv._registry_cache["mtime"] = 0
 
-            mock_es.ping.return_value = True
-            mock_es.count.return_value = {"count": 500000}
-
             url = reverse("law-stats")
             response = self.client.get(url)
 
@@ -528,6 +535,7 @@ class TestLawApi:
             end_position=22,
         )
 
+        rebuild_citation_graph()
         url = reverse("law-references", args=["amparo_stats"])
         response = self.client.get(url)
 
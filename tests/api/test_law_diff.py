@@ -0,0 +1,154 @@
+"""Tests for article-level version diffs (apps.api.diffs and /laws/<id>/diff/)."""
+
+from datetime import date
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.api.diffs import diff_articles, extract_articles, word_diff
+from apps.api.models import Law, LawVersion, LawVersionDiff
+
+AKN = "http://docs.oasis-open.org/legaldocml/ns/akn/3.0"
+
+
+def _xml(articles):
+    body = "".join(
+        f'<article eId="art_{num}"><num>Artículo {num}.</num><content>'
+        + "".join(f"<p>{p}</p>" for p in paragraphs)
+        + "</content></article>"
+        for num, paragraphs in articles
+    )
+    return f'<akomaNtoso xmlns="{AKN}"><act><body>{body}</body></act></akomaNtoso>'
+
+
+V1 = [
+    ("1", ["Esta ley es de orden público."]),
+    ("2", ["El salario mínimo se fija cada año."]),
+    ("3", ["Se deroga."]),
+]
+V2 = [
+    ("1", ["Esta ley es de orden público."]),
+    ("2", ["El salario mínimo se revisa y fija cada año."]),
+    ("4", ["Las plataformas digitales quedan sujetas a esta ley."]),
+]
+
+
+class TestDiffEngine:
+    def test_word_diff_round_trips(self):
+        old = "El salario mínimo se fija cada año."
+        new = "El salario mínimo se revisa y fija cada año."
+
+        ops = word_diff(old, new)
+
+        assert "".join(t for op, t in ops if op != "+") == old
+        assert "".join(t for op, t in ops if op != "-") == new
+        assert ["+", "revisa y "] in ops
+
+    def test_unchanged_articles_are_only_counted(self):
+        result = diff_articles(extract_articles(_xml(V1)), extract_articles(_xml(V2)))
+
+        assert result["summary"] == {
+            "added": 1,
+            "removed": 1,
+            "modified": 1,
+            "unchanged": 1,
+        }
+        statuses = {a["eId"]: a["status"] for a in result["articles"]}
+        assert statuses == {"art_2": "modified", "art_4": "added", "art_3": "removed"}
+
+    def test_notes_are_ignored(self):
+        plain = _xml([("1", ["Texto."])])
+        noted = plain.replace(
+            "</content>", "</content><note><p>Reformado DOF 01-01-2024</p></note>"
+        )
+
+        result = diff_articles(extract_articles(plain), extract_articles(noted))
+
+        assert result["summary"]["unchanged"] == 1
+
+
+@pytest.fixture
+def law_versions(tmp_path):
+    law = Law.objects.create(official_id="lft", name="Ley Federal del Trabajo")
+    paths = []
+    for i, articles in enumerate((V1, V2)):
+        path = tmp_path / f"lft-v{i}.xml"
+        path.write_text(_xml(articles), encoding="utf-8")
+        paths.append(path)
+    v1 = LawVersion.objects.create(
+        law=law, publication_date=date(2019, 5, 1), xml_file_path=str(paths[0])
+    )
+    v2 = LawVersion.objects.create(
+        law=law, publication_date=date(2024, 1, 10), xml_file_path=str(paths[1])
+    )
+    return law, v1, v2
+
+
+@pytest.mark.django_db
+class TestLawDiffEndpoint:
+    def setup_method(self):
+        self.client = APIClient()
+        self.url = reverse("law-diff", args=["lft"])
+
+    def test_defaults_to_latest_two_versions(self, law_versions):
+        response = self.client.get(self.url)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["from_date"] == "2019-05-01"
+        assert data["to_date"] == "2024-01-10"
+        assert data["summary"]["modified"] == 1
+        assert len(data["articles"]) == 3
+
+    def test_diff_is_persisted_per_pair(self, law_versions, monkeypatch):
+        _, v1, v2 = law_versions
+        self.client.get(self.url, {"from": "2019-05-01", "to": "2024-01-10"})
+        assert LawVersionDiff.objects.filter(from_version=v1, to_version=v2).exists()
+
+        def fail(*args):
+            raise AssertionError("diff recomputed")
+
+        monkeypatch.setattr("apps.api.diffs.compute_version_diff", fail)
+        response = self.client.get(self.url, {"from": "2019-05-01", "to": "2024-01-10"})
+
+        assert response.status_code == 200
+
+    def test_saving_a_version_drops_its_diffs(self, law_versions):
+        _, _, v2 = law_versions
+        self.client.get(self.url)
+
+        v2.change_summary = "Reforma laboral"
+        v2.save()
+
+        assert not LawVersionDiff.objects.exists()
+
+    def test_reverse_direction(self, law_versions):
+        response = self.client.get(self.url, {"from": "2024-01-10", "to": "2019-05-01"})
+
+        summary = response.json()["summary"]
+        assert (summary["added"], summary["removed"]) == (1, 1)
+
+    def test_invalid_date(self, law_versions):
+        response = self.client.get(self.url, {"from": "ayer"})
+
+        assert response.status_code == 400
+
+    def test_unknown_version(self, law_versions):
+        response = self.client.get(self.url, {"to": "2000-01-01"})
+
+        assert response.status_code == 404
+
+    def test_single_version_has_nothing_to_compare(self, law_versions):
+        response = self.client.get(self.url, {"to": "2019-05-01"})
+
+        assert response.status_code == 404
+
+    def test_missing_xml(self, law_versions):
+        _, v1, _ = law_versions
+        LawVersion.objects.filter(pk=v1.pk).update(xml_file_path=None)
+
+        response = self.client.get(self.url)
+
+        assert response.status_code == 404
+        assert "No XML" in response.json()["error"]
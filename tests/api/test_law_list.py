@@ -0,0 +1,132 @@
+"""Tests for the LawListView listing path (denormalized fields, keyset cursors)."""
+
+from datetime import date
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.api.models import Law, LawVersion
+
+
+def _walk(client, params):
+    """Follow next_cursor until exhausted and return every id in order."""
+    url = reverse("law-list")
+    ids, cursor = [], ""
+    while cursor is not None:
+        response = client.get(url, {**params, "cursor": cursor})
+        assert response.status_code == 200
+        data = response.json()
+        ids.extend(item["id"] for item in data["results"])
+        cursor = data["next_cursor"]
+    return ids
+
+
+@pytest.mark.django_db
+class TestVersionStats:
+    def test_saving_versions_updates_law(self):
+        law = Law.objects.create(official_id="lft", name="Ley Federal del Trabajo")
+        LawVersion.objects.create(law=law, publication_date=date(2019, 5, 1))
+        v2 = LawVersion.objects.create(law=law, publication_date=date(2024, 1, 10))
+
+        law.refresh_from_db()
+        assert law.version_count == 2
+        assert law.latest_publication_date == date(2024, 1, 10)
+
+        v2.delete()
+        law.refresh_from_db()
+        assert law.version_count == 1
+        assert law.latest_publication_date == date(2019, 5, 1)
+
+    def test_refresh_does_not_touch_updated_at(self):
+        law = Law.objects.create(official_id="lft", name="Ley Federal del Trabajo")
+        before = law.updated_at
+        LawVersion.objects.create(law=law, publication_date=date(2024, 1, 10))
+
+        law.refresh_from_db()
+        assert law.updated_at == before
+
+    def test_refresh_whole_table(self):
+        law = Law.objects.create(official_id="lft", name="Ley Federal del Trabajo")
+        LawVersion.objects.create(law=law, publication_date=date(2024, 1, 10))
+        Law.objects.update(version_count=0, latest_publication_date=None)
+
+        Law.refresh_version_stats()
+
+        law.refresh_from_db()
+        assert law.version_count == 1
+        assert law.latest_publication_date == date(2024, 1, 10)
+
+
+@pytest.mark.django_db
+class TestLawListView:
+    def setup_method(self):
+        self.client = APIClient()
+        self.url = reverse("law-list")
+        for i, (state, pub) in enumerate(
+            [
+                ("Jalisco", date(2020, 1, 1)),
+                ("jalisco", date(2023, 6, 1)),
+                ("Colima", date(2023, 6, 1)),
+                ("Colima", None),
+                ("Jalisco", date(2018, 3, 3)),
+            ]
+        ):
+            law = Law.objects.create(
+                official_id=f"law_{i}", name=f"Ley {i}", tier="state", state=state
+            )
+            if pub:
+                LawVersion.objects.create(law=law, publication_date=pub)
+
+    def test_state_filter_is_case_insensitive(self):
+        response = self.client.get(self.url, {"state": "JALISCO"})
+
+        assert response.json()["count"] == 3
+
+    def test_date_sort_uses_latest_publication_date(self):
+        response = self.client.get(self.url, {"sort": "date_desc"})
+
+        ids = [item["id"] for item in response.json()["results"]]
+        # Ties broken by official_id, laws without versions last
+        assert ids == ["law_1", "law_2", "law_0", "law_4", "law_3"]
+
+    @pytest.mark.parametrize(
+        "sort", ["name_asc", "name_desc", "date_desc", "date_asc", "article_count"]
+    )
+    def test_keyset_walk_matches_offset_listing(self, sort):
+        expected = [
+            item["id"]
+            for item in self.client.get(self.url, {"sort": sort}).json()["results"]
+        ]
+
+        walked = _walk(self.client, {"sort": sort, "page_size": 2})
+
+        assert walked == expected
+
+    def test_keyset_respects_filters(self):
+        walked = _walk(self.client, {"state": "colima", "page_size": 1})
+
+        assert walked == ["law_2", "law_3"]
+
+    def test_keyset_response_has_no_count(self):
+        data = self.client.get(self.url, {"cursor": ""}).json()
+
+        assert "count" not in data
+        assert data["next_cursor"] is None
+        assert len(data["results"]) == 5
+
+    def test_invalid_cursor_returns_400(self):
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+
+    def test_cursor_from_other_sort_returns_400(self):
+        first = self.client.get(
+            self.url, {"sort": "name_asc", "cursor": "", "page_size": 1}
+        ).json()
+
+        response = self.client.get(
+            self.url, {"sort": "date_desc", "cursor": first["next_cursor"]}
+        )
+
+        assert response.status_code == 400
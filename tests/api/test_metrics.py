@@ -0,0 +1,173 @@
+"""Tests for the Prometheus metrics and Server-Timing instrumentation."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+
+from apps.api import metrics
+from apps.api.models import Law, StatsSnapshot
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def _count(metric, **labels):
+    return _sample(f"{metric._name}_count", **labels)
+
+
+def _value(metric, **labels):
+    return _sample(f"{metric._name}_total", **labels)
+
+
+class TestRegistry:
+    def test_multiprocess_render_sums_workers(self, tmp_path, monkeypatch):
+        # Two "workers" record into the shared directory and exit
+        script = (
+            "from apps.api import metrics; "
+            "metrics.record_cache('pack', True); "
+            "metrics.REQUEST_SECONDS.labels(view='a', method='GET', status=200)"
+            ".observe(0.05)"
+        )
+        env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=str(tmp_path))
+        for _ in range(2):
+            subprocess.run(
+                [sys.executable, "-c", script], env=env, cwd=ROOT, check=True
+            )
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+        text = metrics.render().decode()
+
+        assert 'tezca_cache_lookups_total{cache="pack",result="hit"} 2.0' in text
+        assert (
+            'tezca_http_request_duration_seconds_count{method="GET",status="200",'
+            'view="a"} 2.0'
+        ) in text
+
+    def test_es_operation(self):
+        assert metrics.es_operation("/articles/_search") == "search"
+        assert metrics.es_operation("/_msearch?typed_keys=true") == "msearch"
+        assert metrics.es_operation("/") == "info"
+        assert metrics.es_operation("/articles") == "index"
+
+
+class TestInstrumentedTransport:
+    def test_records_wall_time_and_took(self):
+        from elasticsearch import Transport
+
+        transport = metrics.instrumented_transport()([{"host": "localhost"}])
+        before = _count(metrics.ES_TOOK_SECONDS, operation="search")
+
+        with patch.object(Transport, "perform_request", return_value={"took": 7}):
+            result = transport.perform_request("POST", "/articles/_search")
+
+        assert result == {"took": 7}
+        assert _count(metrics.ES_TOOK_SECONDS, operation="search") == before + 1
+
+    def test_records_failures(self):
+        from elasticsearch import Transport
+        from elasticsearch.exceptions import ConnectionError as ESConnectionError
+
+        transport = metrics.instrumented_transport()([{"host": "localhost"}])
+        before = _value(metrics.ES_REQUESTS, operation="count", outcome="error")
+
+        with patch.object(
+            Transport, "perform_request", side_effect=ESConnectionError("down")
+        ):
+            with pytest.raises(ESConnectionError):
+                transport.perform_request("GET", "/articles/_count")
+
+        assert _value(metrics.ES_REQUESTS, operation="count", outcome="error") == (
+            before + 1
+        )
+
+
+@pytest.mark.django_db
+class TestMiddleware:
+    def setup_method(self):
+        self.client = APIClient()
+        Law.objects.create(
+            official_id="lft", name="Ley Federal del Trabajo", tier="federal"
+        )
+
+    def test_request_is_timed_per_view(self):
+        before = _count(
+            metrics.REQUEST_SECONDS, view="law-detail", method="GET", status="200"
+        )
+        queries = _value(metrics.DB_QUERIES, view="law-detail")
+
+        response = self.client.get(reverse("law-detail", args=["lft"]))
+
+        assert response.status_code == 200
+        assert (
+            _count(
+                metrics.REQUEST_SECONDS, view="law-detail", method="GET", status="200"
+            )
+            == before + 1
+        )
+        assert _value(metrics.DB_QUERIES, view="law-detail") > queries
+        timing = response["Server-Timing"]
+        assert timing.startswith("db;dur=")
+        assert "total;dur=" in timing
+
+    def test_unmatched_paths_share_a_series(self):
+        before = _count(
+            metrics.REQUEST_SECONDS, view="unmatched", method="GET", status="404"
+        )
+
+        self.client.get("/no/such/path/")
+        self.client.get("/another/missing/path/")
+
+        assert (
+            _count(
+                metrics.REQUEST_SECONDS, view="unmatched", method="GET", status="404"
+            )
+            == before + 2
+        )
+
+    def test_cache_lookups_reach_server_timing(self):
+        StatsSnapshot.objects.create(key="law_stats", data={"total_laws": 1})
+        before = _value(metrics.CACHE_LOOKUPS, cache="snapshot", result="hit")
+
+        response = self.client.get(reverse("law-stats"))
+
+        assert _value(metrics.CACHE_LOOKUPS, cache="snapshot", result="hit") == (
+            before + 1
+        )
+        assert 'cache;desc="1 hit 0 miss"' in response["Server-Timing"]
+
+    @patch(
+        "apps.api.export_views._get_articles",
+        return_value=[{"article_id": "Artículo 1", "text": "Uno"}],
+    )
+    def test_export_render_time_per_format(self, _):
+        before = _count(metrics.EXPORT_RENDER_SECONDS, format="txt")
+
+        response = self.client.get(reverse("law-export-txt", args=["lft"]))
+
+        assert response.status_code == 200
+        assert _count(metrics.EXPORT_RENDER_SECONDS, format="txt") == before + 1
+        assert "render;dur=" in response["Server-Timing"]
+
+    def test_metrics_endpoint(self):
+        self.client.get(reverse("law-detail", args=["lft"]))
+
+        response = self.client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == metrics.CONTENT_TYPE
+        body = response.content.decode()
+        assert (
+            'tezca_http_request_duration_seconds_count{method="GET",status="200",'
+            'view="law-detail"}'
+        ) in body
+        assert "# TYPE tezca_es_took_seconds histogram" in body
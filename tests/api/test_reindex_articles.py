@@ -0,0 +1,69 @@
+"""Tests for the reindex_articles management command."""
+
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+from apps.api.config import ES_ARTICLE_SHARDS
+
+
+@pytest.fixture
+def es():
+    with patch("apps.api.management.commands.reindex_articles.Elasticsearch") as es_cls:
+        es = es_cls.return_value
+        es.ping.return_value = True
+        es.reindex.return_value = {"failures": []}
+        es.count.return_value = {"count": 10}
+        yield es
+
+
+def _alias_actions(es):
+    return es.indices.update_aliases.call_args.kwargs["body"]["actions"]
+
+
+class TestReindexArticles:
+    def test_migrates_a_concrete_index_to_a_routed_alias(self, es):
+        es.indices.exists_alias.return_value = False
+        es.indices.exists.return_value = True
+
+        call_command("reindex_articles")
+
+        target = es.indices.create.call_args.kwargs["index"]
+        body = es.indices.create.call_args.kwargs["body"]
+        assert target.startswith("articles_")
+        assert body["mappings"]["_routing"] == {"required": True}
+        assert body["settings"]["number_of_shards"] == ES_ARTICLE_SHARDS
+        reindex = es.reindex.call_args.kwargs["body"]
+        assert reindex["source"]["index"] == ["articles"]
+        assert "law_id" in reindex["script"]["source"]
+        assert _alias_actions(es) == [
+            {"remove_index": {"index": "articles"}},
+            {"add": {"index": target, "alias": "articles"}},
+        ]
+        es.indices.delete.assert_not_called()
+
+    def test_moves_the_alias_and_drops_the_old_index(self, es):
+        es.indices.exists_alias.return_value = True
+        es.indices.get_alias.return_value = {"articles_20240101000000": {}}
+
+        call_command("reindex_articles")
+
+        target = es.indices.create.call_args.kwargs["index"]
+        assert _alias_actions(es) == [
+            {"remove": {"index": "articles_20240101000000", "alias": "articles"}},
+            {"add": {"index": target, "alias": "articles"}},
+        ]
+        es.indices.delete.assert_called_once_with(index="articles_20240101000000")
+
+    def test_incomplete_copy_keeps_the_alias(self, es, capsys):
+        es.indices.exists_alias.return_value = True
+        es.indices.get_alias.return_value = {"articles_20240101000000": {}}
+        es.count.side_effect = [{"count": 10}, {"count": 9}]
+
+        call_command("reindex_articles")
+
+        es.indices.update_aliases.assert_not_called()
+        target = es.indices.create.call_args.kwargs["index"]
+        es.indices.delete.assert_called_once_with(index=target)
+        assert "incomplete" in capsys.readouterr().err
@@ -0,0 +1,113 @@
+"""Tests for precomputed related laws."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.api.models import Law, RelatedLaws
+from apps.api.related_laws import rebuild_related_laws
+
+
+def _mlt_response(*law_ids):
+    return {
+        "aggregations": {
+            "by_law": {
+                "buckets": [
+                    {
+                        "key": law_id,
+                        "doc_count": 4,
+                        "top_hit": {
+                            "hits": {
+                                "hits": [
+                                    {
+                                        "_source": {
+                                            "law_name": f"Ley {law_id}",
+                                            "tier": "federal",
+                                            "category": "laboral",
+                                        }
+                                    }
+                                ]
+                            }
+                        },
+                    }
+                    for law_id in law_ids
+                ]
+            }
+        }
+    }
+
+
+@pytest.mark.django_db
+class TestRebuild:
+    def test_stores_ranked_lists_per_law(self):
+        Law.objects.create(official_id="lft", name="Ley Federal del Trabajo")
+        Law.objects.create(official_id="lss", name="Ley del Seguro Social")
+        Law.objects.create(official_id="cited", name="Ley citada", authority_score=5)
+        seeds = {"hits": {"hits": [{"_source": {"text": "salario"}}]}}
+        es = MagicMock()
+        es.msearch.side_effect = [
+            {"responses": [seeds, seeds, seeds]},
+            {
+                "responses": [
+                    _mlt_response("lss", "cited"),
+                    _mlt_response("lft"),
+                    {"error": {"type": "search_phase_execution_exception"}},
+                ]
+            },
+        ]
+
+        stats = rebuild_related_laws(es)
+
+        assert stats["laws"] == 2
+        assert stats["failed"] == 1
+        related = RelatedLaws.objects.get(law_slug="lft").related
+        # Equal MLT matches, the more cited law first
+        assert [r["law_id"] for r in related] == ["cited", "lss"]
+        assert not RelatedLaws.objects.filter(law_slug="cited").exists()
+        # Seed and MLT requests are routed / request-cached per law
+        seed_header, _ = es.msearch.call_args_list[0].kwargs["body"][:2]
+        mlt_header, mlt_body = es.msearch.call_args_list[1].kwargs["body"][:2]
+        assert seed_header["routing"] == "lft"
+        assert mlt_header["request_cache"] is True
+        assert "Ley Federal del Trabajo salario" in str(mlt_body)
+
+    def test_es_down_keeps_the_previous_lists(self):
+        RelatedLaws.objects.create(law_slug="lft", related=[{"law_id": "lss"}])
+        es = MagicMock()
+        es.ping.return_value = False
+
+        assert rebuild_related_laws(es)["laws"] == 0
+        assert RelatedLaws.objects.filter(law_slug="lft").exists()
+
+
+@pytest.mark.django_db
+class TestRelatedLawsView:
+    def setup_method(self):
+        self.client = APIClient()
+        Law.objects.create(official_id="lft", name="Ley Federal del Trabajo")
+
+    @patch("apps.api.law_views.es_client")
+    def test_reads_the_stored_list(self, mock_es):
+        stored = [{"law_id": "lss", "name": "Ley del Seguro Social", "score": 2.5}]
+        RelatedLaws.objects.create(law_slug="lft", related=stored)
+
+        response = self.client.get(reverse("law-related", args=["lft"]))
+
+        assert response.json()["related"] == stored
+        mock_es.ping.assert_not_called()
+        mock_es.search.assert_not_called()
+
+    @patch("apps.api.law_views.es_client")
+    def test_unlisted_law_is_queried_live(self, mock_es):
+        mock_es.ping.return_value = True
+        mock_es.search.side_effect = [
+            {"hits": {"hits": [{"_source": {"text": "salario"}}]}},
+            _mlt_response("lss"),
+        ]
+
+        response = self.client.get(reverse("law-related", args=["lft"]))
+
+        assert [r["law_id"] for r in response.json()["related"]] == ["lss"]
+        assert mock_es.search.call_count == 2
@@ -0,0 +1,76 @@
+"""Tests for materialized dashboard snapshots (homepage stats, coverage)."""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.api.models import Law, LawVersion, StatsSnapshot
+from apps.api.snapshots import get_snapshot, refresh_snapshots
+
+
+@pytest.mark.django_db
+class TestStatsSnapshot:
+    def setup_method(self):
+        self.client = APIClient()
+
+    def test_law_stats_reads_stored_snapshot(self, django_assert_num_queries):
+        """An existing snapshot is served with a single row lookup."""
+        StatsSnapshot.objects.create(
+            key="law_stats", data={"total_laws": 12345, "recent_laws": []}
+        )
+
+        with django_assert_num_queries(1):
+            response = self.client.get(reverse("law-stats"))
+
+        assert response.status_code == 200
+        assert response.json()["total_laws"] == 12345
+
+    @patch("apps.api.law_views.es_client")
+    def test_law_stats_builds_snapshot_on_first_read(self, mock_es):
+        law = Law.objects.create(
+            official_id="cpeum", name="Constitución", tier="federal", article_count=40
+        )
+        Law.objects.create(official_id="lft", name="LFT", article_count=2)
+        LawVersion.objects.create(law=law, publication_date=date(2024, 5, 1))
+
+        response = self.client.get(reverse("law-stats"))
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_laws"] == 2
+        assert data["total_articles"] == 42
+        assert data["recent_laws"][0]["date"] == "2024-05-01"
+        # Article totals come from Law rows, not ES
+        mock_es.search.assert_not_called()
+        assert StatsSnapshot.objects.filter(key="law_stats").exists()
+
+    def test_refresh_updates_existing_snapshot(self):
+        StatsSnapshot.objects.create(key="law_stats", data={"total_laws": 0})
+        Law.objects.create(official_id="lft", name="Ley Federal del Trabajo")
+
+        results = refresh_snapshots(["law_stats"])
+
+        assert results == {"law_stats": "ok"}
+        data = get_snapshot("law_stats")
+        assert data["total_laws"] == 1
+        assert data["total_articles"] == 0
+
+    @patch("apps.scraper.dataops.coverage_dashboard.CoverageDashboard")
+    def test_failing_builder_does_not_block_others(self, mock_class):
+        mock_class.return_value.full_report.side_effect = RuntimeError("boom")
+        mock_class.return_value.dashboard_report.return_value = {"tier_progress": []}
+
+        results = refresh_snapshots(["coverage_report", "coverage_dashboard"])
+
+        assert results == {"coverage_report": "error", "coverage_dashboard": "ok"}
+        assert not StatsSnapshot.objects.filter(key="coverage_report").exists()
+        assert get_snapshot("coverage_dashboard") == {"tier_progress": []}
+
+    def test_refresh_task_is_scheduled(self):
+        from django.conf import settings
+
+        tasks = {e["task"] for e in settings.CELERY_BEAT_SCHEDULE.values()}
+        assert "apps.api.tasks.refresh_stats_snapshot" in tasks
@@ -0,0 +1,52 @@
+"""Cold-import budget and lazy loading of heavy optional dependencies."""
+
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+SCRIPT = (
+    Path(__file__).resolve().parents[2]
+    / "scripts"
+    / "validation"
+    / "startup_profile.py"
+)
+
+
+@pytest.fixture(scope="module")
+def startup():
+    spec = importlib.util.spec_from_file_location("startup_profile", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_parse_importtime(startup):
+    rows = startup.parse_importtime(
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     json.decoder\n"
+        "import time:       300 |        420 |   json\n"
+        "import time:      1000 |       1500 | apps.indigo.wsgi\n"
+    )
+
+    assert [r["depth"] for r in rows] == [2, 1, 0]
+    assert startup.total_ms(rows) == 1.5
+
+
+def test_wsgi_cold_import_within_budget(startup):
+    budget = float(os.getenv("STARTUP_BUDGET_MS", startup.WSGI_BUDGET_MS))
+
+    # Best of three: the budget is about regressions, not machine noise
+    best = min(
+        startup.total_ms(startup.profile(startup.TARGETS["wsgi"])) for _ in range(3)
+    )
+
+    assert best < budget
+
+
+@pytest.mark.parametrize("target", ["urls", "celery"])
+def test_heavy_dependencies_are_not_imported_at_startup(startup, target):
+    rows = startup.profile(startup.TARGETS[target])
+
+    assert startup.heavy_imports(rows) == []
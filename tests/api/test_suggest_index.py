@@ -0,0 +1,95 @@
+"""Tests for the in-process law-name autocomplete index."""
+
+import time
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.api.models import Law
+from apps.api.suggest_index import SuggestIndex, normalize
+
+
+def _law(official_id, name, tier="federal"):
+    return {"official_id": official_id, "name": name, "tier": tier}
+
+
+class TestNormalize:
+    def test_strips_accents_and_case(self):
+        assert normalize("Código Civil de Nuevo LEÓN") == "codigo civil de nuevo leon"
+
+    def test_collapses_punctuation(self):
+        assert (
+            normalize("Ley  General (Reformada), 2024") == "ley general reformada 2024"
+        )
+
+
+class TestSuggestIndex:
+    def setup_method(self):
+        self.index = SuggestIndex(
+            [
+                _law("lft", "Ley Federal del Trabajo"),
+                _law("amparo", "Ley de Amparo"),
+                _law("ccf", "Código Civil Federal"),
+                _law("nl_civil", "Código Civil para el Estado de Nuevo León", "state"),
+            ]
+        )
+
+    def test_prefix_match(self):
+        ids = [r["id"] for r in self.index.search("ley f")]
+        assert ids == ["lft"]
+
+    def test_word_prefix_match(self):
+        ids = {r["id"] for r in self.index.search("trab")}
+        assert ids == {"lft"}
+
+    def test_accent_insensitive(self):
+        assert [r["id"] for r in self.index.search("leon")] == ["nl_civil"]
+        assert {r["id"] for r in self.index.search("codigo")} == {"ccf", "nl_civil"}
+
+    def test_multi_word_query_spans_consecutive_words(self):
+        assert [r["id"] for r in self.index.search("civil federal")] == ["ccf"]
+
+    def test_name_prefix_ranks_before_word_prefix(self):
+        index = SuggestIndex(
+            [_law("a", "Reglamento de la Ley Federal"), _law("b", "Federal Ley")]
+        )
+        assert [r["id"] for r in index.search("federal")] == ["b", "a"]
+
+    def test_popularity_breaks_ties(self):
+        index = SuggestIndex(
+            [_law("a", "Ley de Aguas"), _law("b", "Ley de Amparo")],
+            popularity={"a": 10, "b": 0},
+        )
+        assert [r["id"] for r in index.search("ley")] == ["a", "b"]
+
+    def test_no_substring_inside_word(self):
+        assert self.index.search("paro") == []
+
+    def test_lookup_is_fast_on_large_corpus(self):
+        laws = [
+            _law(f"law_{i}", f"Ley de Ingresos del Municipio {i} de Jalisco")
+            for i in range(20000)
+        ]
+        index = SuggestIndex(laws)
+
+        start = time.perf_counter()
+        for _ in range(100):
+            index.search("ley de ingresos del municipio 12")
+        per_query_ms = (time.perf_counter() - start) * 1000 / 100
+
+        assert per_query_ms < 10
+
+
+@pytest.mark.django_db
+class TestSuggestIndexRefresh:
+    def test_new_law_visible_after_save(self):
+        client = APIClient()
+        url = reverse("law-suggest")
+        Law.objects.create(official_id="ley_aguas", name="Ley de Aguas Nacionales")
+        assert len(client.get(url, {"q": "aguas"}).json()["suggestions"]) == 1
+
+        Law.objects.create(official_id="ley_aguas_2", name="Ley de Aguas de Colima")
+
+        data = client.get(url, {"q": "aguas"}).json()["suggestions"]
+        assert {d["id"] for d in data} == {"ley_aguas", "ley_aguas_2"}
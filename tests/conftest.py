@@ -14,6 +14,47 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "apps"))
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
+@pytest.fixture(autouse=True)
+def article_pack_storage(tmp_path_factory, monkeypatch):
+    """Keep article packs written by index_laws out of the real data/ dir."""
+    from apps.api import article_packs
+    from apps.api.storage import LocalStorageBackend
+
+    backend = LocalStorageBackend(base_dir=tmp_path_factory.mktemp("storage"))
+    monkeypatch.setattr(article_packs, "get_storage_backend", lambda: backend)
+    article_packs.clear_cache()
+    yield backend
+    article_packs.clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def search_fallback(tmp_path_factory, monkeypatch):
+    """Keep the SQLite search index out of data/ and reset the ES circuit."""
+    from apps.api import fts_index
+    from apps.api.es_circuit import es_circuit
+
+    path = tmp_path_factory.mktemp("search") / "articles.db"
+    monkeypatch.setattr(fts_index, "FTS_INDEX_PATH", path)
+    es_circuit.reset()
+    yield path
+    fts_index.close()
+    es_circuit.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_throttles():
+    """DRF throttles count requests in the default cache; start each test at 0."""
+    from django.core.cache import cache
+
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def export_quota_store(settings):
+    """Count export quotas from ExportLog rows instead of the broker's Redis."""
+    settings.EXPORT_QUOTA_REDIS_URL = ""
+
+
 @pytest.fixture
 def sample_law_text():
     """Sample law text with basic structure."""
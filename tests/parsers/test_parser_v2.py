@@ -652,6 +652,42 @@ class TestXMLGeneration:
         # 3 regular articles + 2 transitorios rendered as articles
         assert len(articles) >= 3
 
+    @pytest.mark.parametrize(
+        "text",
+        [
+            MINIMAL_LAW_TEXT,
+            MULTI_STRUCTURE_LAW_TEXT,
+            "Artículo 1. Texto con & <marcas> y \r retorno. "
+            "Artículo reformado DOF 01-02-2020\n",
+            "",
+        ],
+    )
+    def test_streaming_output_is_byte_identical(self, tmp_path, text):
+        parser = AkomaNtosoGeneratorV2()
+        metadata = parser.create_frbr_metadata("ley", "2024-01-01", "test", "Test")
+
+        tree_path, _ = parser.generate_xml(text, metadata, tmp_path / "tree.xml")
+        stream_path, _ = parser.generate_xml(
+            text, metadata, tmp_path / "stream.xml", streaming=True
+        )
+
+        assert stream_path.read_bytes() == tree_path.read_bytes()
+
+    def test_streaming_to_a_binary_stream(self):
+        import io
+
+        parser = AkomaNtosoGeneratorV2()
+        metadata = parser.create_frbr_metadata("ley", "2024-01-01", "test", "Test")
+        buffer = io.BytesIO()
+
+        out, result = parser.generate_xml(
+            MINIMAL_LAW_TEXT, metadata, buffer, streaming=True
+        )
+
+        assert out is buffer
+        assert result.metadata["articles"] == 3
+        assert buffer.getvalue().startswith(b"<?xml version='1.0' encoding='UTF-8'?>")
+
 
 # ===========================================================================
 # 9. Ordinal-to-number helper
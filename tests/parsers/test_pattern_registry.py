@@ -0,0 +1,100 @@
+"""
+Tests for the compiled pattern registry, plus a lint check that the parser,
+indexer and cross-reference modules do not compile regexes inline.
+"""
+
+import ast
+import re
+from pathlib import Path
+
+import pytest
+
+from apps.parsers.patterns import registry
+from apps.parsers.patterns.articles import compile_article_patterns
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Modules whose regexes must come from the registry
+REGISTRY_MODULES = [
+    "apps/parsers/akn_generator_v2.py",
+    "apps/parsers/cross_references.py",
+    "apps/parsers/patterns/articles.py",
+    "apps/parsers/patterns/metadata.py",
+    "apps/parsers/patterns/structure.py",
+    "apps/api/management/commands/index_laws.py",
+]
+
+RE_FUNCTIONS = {
+    "compile",
+    "search",
+    "match",
+    "fullmatch",
+    "sub",
+    "subn",
+    "split",
+    "findall",
+    "finditer",
+}
+
+
+def _inline_regex_calls(path):
+    """Yield (line, call) for re.<fn>(...) calls that bypass the registry."""
+    tree = ast.parse(path.read_text(), filename=str(path))
+    for node in ast.walk(tree):
+        if not (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "re"
+            and node.func.attr in RE_FUNCTIONS
+        ):
+            continue
+        first = node.args[0] if node.args else None
+        literal = isinstance(first, ast.JoinedStr) or (
+            isinstance(first, ast.Constant) and isinstance(first.value, str)
+        )
+        # re.compile is never needed outside the registry; other calls are
+        # flagged when their pattern is written inline
+        if node.func.attr == "compile" or literal:
+            yield node.lineno, f"re.{node.func.attr}"
+
+
+class TestRegistry:
+    def test_register_is_idempotent(self):
+        first = registry.register("test.idempotent", r"\d+")
+
+        assert registry.register("test.idempotent", r"\d+") is first
+        assert registry.get("test.idempotent") is first
+
+    def test_conflicting_registration_is_rejected(self):
+        registry.register("test.conflict", r"\d+")
+
+        with pytest.raises(ValueError):
+            registry.register("test.conflict", r"\d+", re.IGNORECASE)
+
+    def test_register_all_keeps_order(self):
+        patterns = registry.register_all("test.group", ["a", "b"])
+
+        assert [p.pattern for p in patterns] == ["a", "b"]
+        assert registry.get("test.group.1") is patterns[1]
+
+    def test_patterns_are_shared_across_callers(self):
+        assert compile_article_patterns()[0] is compile_article_patterns()[0]
+
+    def test_parser_modules_register_their_patterns(self):
+        import apps.parsers.akn_generator_v2  # noqa: F401
+        import apps.parsers.cross_references  # noqa: F401
+
+        prefixes = {name.split(".")[0] for name in registry.registered()}
+
+        assert {"akn", "articles", "metadata", "structure", "xref"} <= prefixes
+
+
+@pytest.mark.parametrize("module", REGISTRY_MODULES)
+def test_no_inline_regex_calls(module):
+    calls = list(_inline_regex_calls(ROOT / module))
+
+    assert calls == [], (
+        f"{module} compiles regexes inline at {calls}; register them with "
+        "apps.parsers.patterns.registry.register at module level instead"
+    )
@@ -0,0 +1,62 @@
+"""Tests for the regression gate of the parser throughput benchmark."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = (
+    Path(__file__).resolve().parents[2]
+    / "scripts"
+    / "validation"
+    / "parser_throughput_benchmark.py"
+)
+
+
+@pytest.fixture(scope="module")
+def bench():
+    spec = importlib.util.spec_from_file_location("parser_throughput_benchmark", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _stage(mb_per_s, peak_rss_mb=100.0):
+    return {"mb_per_s": mb_per_s, "peak_rss_mb": peak_rss_mb}
+
+
+class TestCompareToBaseline:
+    def test_within_threshold_passes(self, bench):
+        baseline = {"parse": _stage(10.0), "xrefs": _stage(20.0)}
+        current = {"parse": _stage(9.0), "xrefs": _stage(25.0, 110.0)}
+
+        assert bench.compare_to_baseline(current, baseline, 15.0) == []
+
+    def test_throughput_drop_is_reported(self, bench):
+        regressions = bench.compare_to_baseline(
+            {"parse": _stage(8.0)}, {"parse": _stage(10.0)}, 15.0
+        )
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("parse: throughput")
+
+    def test_memory_growth_is_reported(self, bench):
+        regressions = bench.compare_to_baseline(
+            {"extract": _stage(10.0, 130.0)}, {"extract": _stage(10.0, 100.0)}, 15.0
+        )
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("extract: peak RSS")
+
+    def test_stage_missing_from_baseline_is_ignored(self, bench):
+        assert bench.compare_to_baseline({"quality": _stage(1.0)}, {}, 15.0) == []
+
+
+def test_corpus_sample_is_deterministic(bench):
+    paths = [Path(f"{i:02d}.txt") for i in range(10)]
+
+    assert bench._every_kth(paths, 4) == [
+        Path(p) for p in ("00.txt", "02.txt", "05.txt", "07.txt")
+    ]
+    assert bench._every_kth(list(reversed(paths)), 4) == bench._every_kth(paths, 4)
+    assert bench._every_kth(paths, 20) == paths
@@ -1,3 +1,4 @@
+import io
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -122,6 +123,17 @@ class TestIndexLawsCommand:
         assert art1["chapter"]["num"] == "CAPÍTULO I"
         assert art1["chapter"]["heading"] == "Objeto de la Ley"
 
+    def test_transitorios_are_flagged(self, command):
+        xml = MINIMAL_V2_XML.replace(
+            "</body>",
+            '<article id="trans-1"><num>PRIMERO.</num>'
+            "<content><p>Entra en vigor.</p></content></article></body>",
+        )
+
+        articles = command.extract_articles_from_xml(xml, "test_law")
+
+        assert [a["transitorio"] for a in articles] == [False, False, True]
+
     def test_extract_articles_flat(self, command):
         """Verify extraction of an article with no hierarchy."""
         articles = command.extract_articles_from_xml(MINIMAL_V2_XML, "test_law")
@@ -133,7 +145,72 @@ class TestIndexLawsCommand:
         assert art2["title"] is None
         assert art2["chapter"] is None
 
-    def test_handle_indexing_municipality(self, command):
+    def test_iter_articles_streams_from_file(self, command, tmp_path):
+        """Streaming from a file yields the same articles, one at a time."""
+        xml_file = tmp_path / "law.xml"
+        xml_file.write_text(MINIMAL_V2_XML, encoding="utf-8")
+
+        with open(xml_file, "rb") as f:
+            stream = command.iter_articles(f)
+            first = next(stream)
+            assert first["chapter"]["heading"] == "Objeto de la Ley"
+            rest = list(stream)
+
+        assert [first] + rest == command.extract_articles_from_xml(
+            MINIMAL_V2_XML, "test_law"
+        )
+
+    def test_malformed_xml_yields_no_articles(self, command):
+        """A parse error anywhere discards the law's articles, as before."""
+        broken = MINIMAL_V2_XML.replace("</body>", "")
+
+        assert command.extract_articles_from_xml(broken, "test_law") == []
+        command.stderr.write.assert_called_once()
+
+    def test_legacy_concrete_index_is_written_unrouted(self, command, monkeypatch):
+        from apps.api.management.commands import index_laws
+
+        es = MagicMock()
+        es.indices.exists_alias.return_value = False
+        mock_helpers = MagicMock()
+        monkeypatch.setattr(index_laws, "helpers", mock_helpers)
+
+        command._route_by_law = command._articles_routed(es)
+        command._bulk(es, [{"_id": "lft-1", "_routing": "lft", "_source": {}}])
+
+        assert command._route_by_law is False
+        assert mock_helpers.bulk.call_args[0][1] == [{"_id": "lft-1", "_source": {}}]
+
+    def test_law_without_articles_replaces_pack_and_fts(self, command, monkeypatch):
+        from apps.api import fts_index
+        from apps.api.article_packs import get_pack, write_pack
+        from apps.api.management.commands import index_laws
+
+        law = MagicMock(
+            official_id="lft",
+            category="ley",
+            tier="federal",
+            status="vigente",
+            law_type="legislative",
+        )
+        law.name = "Ley Federal del Trabajo"
+        law.versions.last.return_value.xml_file_path = "lft.xml"
+        write_pack("lft", [{"article_id": "1", "text": "Uno"}])
+        fts_index.index_law(law, [{"article": "1", "text": "Uno"}])
+
+        # The new version no longer has any articles
+        start, end = MINIMAL_V2_XML.index("<body>"), MINIMAL_V2_XML.index("</body>")
+        empty = (MINIMAL_V2_XML[: start + 6] + MINIMAL_V2_XML[end:]).encode()
+        monkeypatch.setattr(
+            index_laws, "open_data_stream", lambda path: io.BytesIO(empty)
+        )
+
+        assert command.index_law(law, es=None) == 0
+        assert len(get_pack("lft")) == 0
+        assert fts_index.law_articles("lft") == []
+        assert law.article_count == 0
+
+    def test_handle_indexing_municipality(self, command, tmp_path):
         """Verify municipality field is added to ES document."""
         # Mock Law object
         mock_law = MagicMock()
@@ -142,13 +219,16 @@ class TestIndexLawsCommand:
         mock_law.category = "Reglamento"
         mock_law.tier = "municipal"
         mock_law.municipality = "Guadalajara"
+        mock_law.state = "Jalisco"
         mock_law.status = "active"
+        mock_law.law_type = "legislative"
 
         # Mock Version
         mock_version = MagicMock()
         mock_version.xml_file_path = "path/to/xml"
         mock_version.publication_date.isoformat.return_value = "2023-01-01"
         mock_law.versions.order_by.return_value.first.return_value = mock_version
+        mock_law.versions.last.return_value = mock_version
 
         # Use the mock Law bound in the Command module (not a fresh import)
         mock_qs = MagicMock()
@@ -159,9 +239,9 @@ class TestIndexLawsCommand:
         # Mock Path/File Operations
         with MagicMock() as mock_path_cls:
             mock_cwd = MagicMock()
-            mock_xml_file = MagicMock()
-            mock_xml_file.exists.return_value = True
-            mock_xml_file.read_text.return_value = MINIMAL_V2_XML
+            # index_laws streams the XML, so it needs a real file to open
+            mock_xml_file = tmp_path / "reglamento_gdl.xml"
+            mock_xml_file.write_text(MINIMAL_V2_XML, encoding="utf-8")
 
             mock_cwd.__truediv__.return_value = mock_xml_file
 
@@ -193,3 +273,24 @@ class TestIndexLawsCommand:
                 doc = actions[0]
                 assert doc["_source"]["municipality"] == "Guadalajara"
                 assert doc["_source"]["tier"] == "municipal"
+
+                # Article docs are routed by law_id
+                articles = mock_helpers.bulk.call_args_list[0][0][1]
+                assert {a["_routing"] for a in articles} == {"reglamento_gdl"}
+
+                # Counts are written back to the Law row in bulk
+                assert mock_law.article_count == len(articles)
+                assert mock_law.transitorio_count == 0
+                laws, fields = _MockLaw.objects.bulk_update.call_args[0]
+                assert laws == [mock_law]
+                assert "index_generation" in fields
+
+                # Articles are mirrored into the SQLite fallback index
+                from apps.api import fts_index
+
+                assert [
+                    a["article_id"] for a in fts_index.law_articles("reglamento_gdl")
+                ] == [
+                    art["_source"]["article"]
+                    for art in mock_helpers.bulk.call_args_list[0][0][1]
+                ]
@@ -0,0 +1,164 @@
+"""Tests for ingestion stage tracing and run reports."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from apps.parsers.pipeline import IngestionPipeline
+from apps.parsers.state_parser import StateLawParser
+from apps.parsers.tracing import RunReport, StageSpan, Tracer
+
+
+def _trace(tracer, law_id, stages):
+    with tracer.law(law_id) as trace:
+        for name, bytes_in in stages:
+            with tracer.stage(trace, name) as span:
+                span.bytes_in = bytes_in
+        trace.success = True
+    return trace
+
+
+class TestTracer:
+    def test_stage_spans_record_resources(self):
+        trace = _trace(Tracer(), "amparo", [("extract", 10), ("parse", 20)])
+
+        assert [s.stage for s in trace.spans] == ["extract", "parse"]
+        parse = trace.spans[1]
+        assert parse.bytes_in == 20
+        assert parse.wall_seconds >= 0
+        assert parse.cpu_seconds >= 0
+        assert parse.peak_rss_mb > 0
+        assert trace.profile is None
+
+    def test_failed_stage_keeps_error_and_logs(self):
+        logger = MagicMock()
+        tracer = Tracer(logger=logger)
+
+        with pytest.raises(ValueError):
+            with tracer.law("iva") as trace:
+                with tracer.stage(trace, "parse"):
+                    raise ValueError("bad xml")
+
+        assert trace.spans[0].error == "bad xml"
+        logger.log_stage_start.assert_called_once_with("iva", "parse")
+        logger.log_error.assert_called_once_with("iva", "parse", "bad xml")
+        logger.log_stage_complete.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "mode, marker", [("cprofile", "function calls"), ("tracemalloc", "Peak")]
+    )
+    def test_profiles_are_opt_in(self, mode, marker):
+        trace = _trace(Tracer(profile=mode), "lft", [("parse", 0)])
+
+        assert marker in trace.profile
+
+    def test_rejects_unknown_profile_mode(self):
+        with pytest.raises(ValueError):
+            Tracer(profile="perf")
+
+
+class TestRunReport:
+    def test_aggregates_stages_and_slowest_laws(self, tmp_path):
+        tracer = Tracer()
+        report = RunReport(top=1)
+        fast = _trace(tracer, "fast", [("parse", 5)])
+        slow = _trace(tracer, "slow", [("parse", 7), ("quality", 1)])
+        slow.wall_seconds = fast.wall_seconds + 10
+        slow.spans.append(StageSpan(stage="parse", wall_seconds=9.0, error="retry"))
+        report.add(fast)
+        report.add(slow)
+        report.add(None)
+
+        data = report.to_dict()
+
+        assert data["laws"] == 2
+        assert data["stages"]["parse"]["runs"] == 3
+        assert data["stages"]["parse"]["errors"] == 1
+        assert data["stages"]["parse"]["bytes_in"] == 12
+        assert data["stages"]["parse"]["max_law"] == "slow"
+        assert [law["law_id"] for law in data["slowest"]] == ["slow"]
+        assert data["slowest"][0]["stages"]["parse"] >= 9.0
+        assert "slow" in report.format()
+
+        path = tmp_path / "logs" / "trace.json"
+        report.write(path)
+        assert json.loads(path.read_text())["laws"] == 2
+
+
+class TestPipelineTracing:
+    def test_ingest_law_traces_each_stage(self, temp_data_dir):
+        pipeline = IngestionPipeline(
+            data_dir=temp_data_dir, skip_download=True, storage=MagicMock()
+        )
+        pipeline.db_saver = MagicMock()
+        pdf = temp_data_dir / "raw" / "pdfs" / "amparo.pdf"
+        pdf.write_bytes(b"%PDF" * 10)
+        text = temp_data_dir / "raw" / "amparo_extracted.txt"
+        text.write_text("Artículo 1. Texto.", encoding="utf-8")
+        xml = temp_data_dir / "federal" / "amparo.xml"
+        xml.write_text("<akn/>", encoding="utf-8")
+
+        with (
+            patch.object(pipeline, "_download_pdf", return_value=pdf),
+            patch.object(
+                pipeline, "_extract_text", return_value=(text, text.read_text())
+            ),
+            patch.object(pipeline, "_parse_to_xml", return_value=xml),
+            patch.object(
+                pipeline,
+                "_calculate_quality",
+                return_value=MagicMock(grade="A", overall_score=95.0),
+            ),
+            patch(
+                "apps.parsers.cross_reference_integration."
+                "detect_and_store_cross_references",
+                return_value=0,
+            ),
+        ):
+            result = pipeline.ingest_law(
+                {"id": "amparo", "name": "Ley de Amparo"}, max_retries=0
+            )
+
+        assert result.success
+        trace = result.trace
+        assert trace.success
+        assert [s.stage for s in trace.spans] == [
+            "download",
+            "extract",
+            "parse",
+            "quality",
+            "cross_references",
+            "db_save",
+            "storage_sync",
+        ]
+        spans = {s.stage: s for s in trace.spans}
+        assert spans["download"].bytes_out == 40
+        assert spans["parse"].bytes_out == len("<akn/>")
+
+
+class TestStateParserTracing:
+    def test_parse_law_traces_stages(self, tmp_path, sample_law_text):
+        text_file = tmp_path / "colima_ley.txt"
+        text_file.write_text(sample_law_text * 3, encoding="utf-8")
+        parser = StateLawParser(base_dir=tmp_path)
+
+        with patch(
+            "apps.parsers.cross_reference_integration."
+            "detect_and_store_cross_references",
+            return_value=0,
+        ):
+            result = parser.parse_law(
+                {
+                    "official_id": "colima_ley",
+                    "law_name": "Ley de Prueba",
+                    "state": "Colima",
+                    "text_file": str(text_file),
+                }
+            )
+
+        assert result.success, result.error
+        stages = [s.stage for s in result.trace.spans]
+        assert stages[:2] == ["extract", "parse"]
+        assert result.trace.spans[0].bytes_in == text_file.stat().st_size
+        assert result.trace.spans[1].bytes_out > 0
@@ -0,0 +1,51 @@
+"""
+Scalar ISR oracle read straight from engines/catala/lisr.catala_en.
+
+Evaluates the TaxCalculation2026 if/else chain with Catala semantics so the
+vectorized engine can be checked without the Catala runtime installed.
+"""
+
+import re
+from fractions import Fraction
+from pathlib import Path
+
+CATALA_SOURCE = Path(__file__).resolve().parents[2] / "engines/catala/lisr.catala_en"
+
+_BRANCH = re.compile(
+    r"monthly_income >= \$([\d.]+) and monthly_income <= \$([\d.]+) then\s+"
+    r"\$([\d.]+) \+ \(monthly_income - \$([\d.]+)\) \* ([\d.]+)"
+)
+_ELSE = re.compile(r"else\s+\$([\d.]+) \+ \(monthly_income - \$([\d.]+)\) \* ([\d.]+)")
+
+
+def _cents(amount: str) -> int:
+    return int(Fraction(amount) * 100)
+
+
+def _catala_branches():
+    """(low, high, fee, base, rate) per branch of TaxCalculation2026, in order."""
+    text = CATALA_SOURCE.read_text(encoding="utf-8")
+    branches = [
+        (_cents(lo), _cents(hi), _cents(fee), _cents(base), Fraction(rate))
+        for lo, hi, fee, base, rate in _BRANCH.findall(text)
+    ]
+    fee, base, rate = _ELSE.findall(text)[-1]
+    branches.append((None, None, _cents(fee), _cents(base), Fraction(rate)))
+    return branches
+
+
+CATALA_BRANCHES = _catala_branches()
+
+
+def catala_tax_cents(income: int) -> int:
+    """
+    Scalar oracle with Catala semantics: the first matching branch of the
+    if/else chain, money * decimal rounded to the nearest cent, halves away
+    from zero.
+    """
+    for low, high, fee, base, rate in CATALA_BRANCHES:
+        if low is None or low <= income <= high:
+            product = (income - base) * rate
+            magnitude = abs(product)
+            rounded = int(magnitude) + (magnitude - int(magnitude) >= Fraction(1, 2))
+            return fee + (rounded if product >= 0 else -rounded)
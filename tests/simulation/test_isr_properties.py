@@ -0,0 +1,44 @@
+"""Property-based equivalence of the vectorized ISR engine and Catala."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("hypothesis")
+
+from hypothesis import given, settings  # noqa: E402
+from hypothesis import strategies as st  # noqa: E402
+
+from engines.openfisca.isr_vectorized import ISR_2026  # noqa: E402
+
+from .catala_oracle import CATALA_BRANCHES, catala_tax_cents  # noqa: E402
+
+incomes = st.integers(min_value=1, max_value=10**10)
+
+
+@settings(max_examples=500)
+@given(st.lists(incomes, min_size=1, max_size=50))
+def test_matches_catala_semantics(values):
+    vectorized = ISR_2026.tax_cents(np.array(values)).tolist()
+    assert vectorized == [catala_tax_cents(v) for v in values]
+
+
+@given(st.sampled_from(CATALA_BRANCHES[:-1]), st.integers(-1, 1))
+def test_bracket_boundaries(branch, offset):
+    low, high = branch[0], branch[1]
+    for income in (low + offset, high + offset):
+        if income >= 1:
+            assert ISR_2026.tax_cents([income])[0] == catala_tax_cents(income)
+
+
+@settings(max_examples=200)
+@given(incomes)
+def test_matches_generated_catala_module(income):
+    runtime = pytest.importorskip("catala.runtime")
+    from engines.catala.lisr_catala import TaxCalculation2026In, tax_calculation2026
+
+    result = tax_calculation2026(
+        TaxCalculation2026In(
+            monthly_income_in=runtime.money_of_cents_string(str(income))
+        )
+    )
+    assert ISR_2026.tax_cents([income])[0] == int(result.tax_owed.value.value)
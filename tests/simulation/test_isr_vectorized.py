@@ -0,0 +1,75 @@
+"""Equivalence tests for the vectorized ISR engine against the Catala source."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engines.openfisca.isr_vectorized import (  # noqa: E402
+    BRACKETS_2026,
+    ISR_2026,
+    MAX_INCOME_CENTS,
+    isr_monthly_cents,
+    to_cents,
+)
+
+from .catala_oracle import CATALA_BRANCHES, catala_tax_cents  # noqa: E402
+
+
+class TestBracketTable:
+    def test_table_matches_catala_source(self):
+        expected = [
+            (base, fee, int(rate * 10000)) for _, _, fee, base, rate in CATALA_BRANCHES
+        ]
+        assert list(BRACKETS_2026) == expected
+
+    def test_catala_brackets_are_contiguous(self):
+        bounded = [b for b in CATALA_BRANCHES if b[0] is not None]
+        for (_, high, *_), (low, *_) in zip(bounded, bounded[1:]):
+            assert low == high + 1
+
+    @pytest.mark.parametrize(
+        "income,expected",
+        [
+            (1, 0),
+            (1500000, 50594),  # $194.59 + (15000 - 10135.12) * 0.064
+            (10000000, 657216),  # $5051.37 + (100000 - 86022.12) * 0.1088
+            (1013512, 19459),  # first cent of bracket 2
+        ],
+    )
+    def test_known_values(self, income, expected):
+        assert ISR_2026.tax_cents([income])[0] == expected
+
+    def test_below_first_bracket_is_untaxed(self):
+        assert ISR_2026.tax_cents([0, -500]).tolist() == [0, 0]
+
+    def test_rejects_income_outside_exact_range(self):
+        with pytest.raises(ValueError):
+            ISR_2026.tax_cents([MAX_INCOME_CENTS + 1])
+
+
+class TestEquivalence:
+    def test_random_population_matches_catala_semantics(self):
+        rng = np.random.default_rng(96)
+        values = np.concatenate(
+            [
+                rng.integers(1, 10**6, 5000),
+                rng.integers(1, 10**10, 5000),
+                np.rint(rng.lognormal(9.6, 0.9, 5000) * 100).astype(np.int64) + 1,
+            ]
+        )
+        vectorized = ISR_2026.tax_cents(values).tolist()
+        assert vectorized == [catala_tax_cents(int(v)) for v in values]
+
+
+class TestPopulation:
+    def test_obligation_and_income_sources(self):
+        tax = isr_monthly_cents(
+            residence=[True, False, False],
+            income_source_mx=[False, True, False],
+            income_cash=[10000.0, 10000.0, 10000.0],
+            income_goods=[5000.0, 5000.0, 5000.0],
+        )
+        assert tax.tolist() == [50594, 50594, 0]
+
+    def test_to_cents_rounds_to_nearest(self):
+        assert to_cents([0.1, 10135.12, 2.675]).tolist() == [10, 1013512, 268]
@@ -0,0 +1,160 @@
+"""Tests for the columnar mock Simulation (dependency graph, memoization)."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engines.openfisca.isr_vectorized import (  # noqa: E402
+    BRACKETS_2026,
+    ISR_2026,
+    ISRTable,
+    isr_monthly_cents,
+)
+from engines.openfisca.mock import (  # noqa: E402
+    CircularDependencyError,
+    Person,
+    TaxBenefitSystem,
+    Variable,
+)
+from engines.openfisca.system import MexicanTaxSystem  # noqa: E402
+
+PERIOD = "2026-01"
+OUTPUTS = [
+    "isr_obligation",
+    "gross_income",
+    "isr_breakdown_lower_limit",
+    "isr_breakdown_fixed_fee",
+    "isr_breakdown_rate",
+]
+
+
+def _population(sim, n, seed=0):
+    rng = np.random.default_rng(seed)
+    sim.set_input("is_resident", PERIOD, rng.random(n) < 0.9)
+    sim.set_input("has_mexican_income_source", PERIOD, rng.random(n) < 0.5)
+    sim.set_input("income_cash", PERIOD, np.round(rng.lognormal(9.6, 0.9, n), 2))
+    sim.set_input("income_goods", PERIOD, np.round(rng.random(n) * 2000, 2))
+    return sim
+
+
+class TestRowInput:
+    def test_add_person_still_works(self):
+        sim = MexicanTaxSystem().new_simulation()
+        sim.add_person("a", PERIOD, is_resident=True, income_cash=15000.0)
+        sim.add_person("b", PERIOD, is_resident=False, income_cash=15000.0)
+
+        tax = sim.calculate("isr_obligation", PERIOD)
+
+        assert tax.tolist() == [505.94, 0.0]
+
+    def test_breakdown_for_one_person(self):
+        sim = MexicanTaxSystem().new_simulation()
+        sim.add_person("a", PERIOD, is_resident=True, income_cash=100000.0)
+
+        out = sim.calculate_many(OUTPUTS, PERIOD)
+
+        assert out["isr_breakdown_lower_limit"][0] == 86022.12
+        assert out["isr_breakdown_fixed_fee"][0] == 5051.37
+        assert out["isr_breakdown_rate"][0] == pytest.approx(10.88)
+
+
+class TestColumnarSimulation:
+    def test_calculate_many_matches_direct_tariff(self):
+        sim = _population(MexicanTaxSystem().new_simulation(), 50_000)
+
+        out = sim.calculate_many(OUTPUTS, PERIOD)
+
+        expected = isr_monthly_cents(
+            sim.calculate("is_resident", PERIOD),
+            sim.calculate("has_mexican_income_source", PERIOD),
+            sim.calculate("income_cash", PERIOD),
+            sim.calculate("income_goods", PERIOD),
+        )
+        assert np.array_equal(np.rint(out["isr_obligation"] * 100), expected)
+        assert set(out) == set(OUTPUTS)
+        assert all(len(col) == 50_000 for col in out.values())
+
+    def test_shared_dependencies_are_computed_once(self, monkeypatch):
+        calls = []
+        original = ISR_2026.bracket_index
+
+        def counting(income):
+            calls.append(len(income))
+            return original(income)
+
+        monkeypatch.setattr(ISR_2026, "bracket_index", counting)
+        sim = _population(MexicanTaxSystem().new_simulation(), 1000)
+
+        sim.calculate_many(OUTPUTS, PERIOD)
+        sim.calculate("isr_obligation", PERIOD)
+
+        assert calls == [1000]
+
+    def test_dependency_graph_is_recorded(self):
+        sim = _population(MexicanTaxSystem().new_simulation(), 10)
+
+        sim.calculate("isr_obligation", PERIOD)
+
+        assert sim.dependencies["isr_obligation"] == {
+            "isr_taxable_income",
+            "isr_bracket",
+        }
+        assert sim.dependencies["isr_bracket"] == {
+            "isr_taxable_income",
+            "isr_obligated",
+        }
+
+    def test_new_input_invalidates_results(self):
+        sim = _population(MexicanTaxSystem().new_simulation(), 3)
+        sim.calculate("gross_income", PERIOD)
+
+        sim.set_input("income_goods", PERIOD, [0.0, 0.0, 0.0])
+
+        assert np.array_equal(
+            sim.calculate("gross_income", PERIOD), sim.calculate("income_cash", PERIOD)
+        )
+
+    def test_rejects_mismatched_column_length(self):
+        sim = _population(MexicanTaxSystem().new_simulation(), 3)
+
+        with pytest.raises(ValueError):
+            sim.set_input("income_goods", PERIOD, [1.0])
+
+    def test_reform_parameters(self):
+        # Bracket lower limits indexed 10%, fees unchanged
+        reform = ISRTable(
+            [
+                (lo if lo == 1 else round(lo * 1.1), fee, rate)
+                for lo, fee, rate in BRACKETS_2026
+            ]
+        )
+        baseline = _population(MexicanTaxSystem().new_simulation(), 10_000)
+        reformed = _population(
+            MexicanTaxSystem(parameters={"isr_table": reform}).new_simulation(), 10_000
+        )
+
+        base_tax = baseline.calculate("isr_obligation", PERIOD)
+        reform_tax = reformed.calculate("isr_obligation", PERIOD)
+
+        assert reform_tax.sum() < base_tax.sum()
+
+
+class TestDependencyErrors:
+    def test_circular_dependency(self):
+        class a(Variable):
+            entity = Person
+
+            def formula(person, period, parameters):
+                return person("b", period)
+
+        class b(Variable):
+            entity = Person
+
+            def formula(person, period, parameters):
+                return person("a", period)
+
+        sim = TaxBenefitSystem([a, b]).new_simulation()
+        sim.add_person("x", PERIOD)
+
+        with pytest.raises(CircularDependencyError):
+            sim.calculate("a", PERIOD)